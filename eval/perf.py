@@ -0,0 +1,395 @@
+"""Retrieval latency benchmarks — synthetic corpus, hash embeddings, no LLM.
+
+Builds journals, intel items and memory facts at a chosen scale in a scratch
+directory, then times the hot read/write paths and reports p50/p95/p99. The
+JSON written by ``write_baseline`` can be fed back to ``compare_to_baseline``
+to flag regressions between runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from advisor.rag import RAGRetriever
+from intelligence.embeddings import IntelEmbeddingManager
+from intelligence.scraper import BaseScraper, IntelItem, IntelStorage
+from intelligence.search import IntelSearch
+from journal.embeddings import EmbeddingManager
+from journal.fts import JournalFTSIndex
+from journal.search import JournalSearch
+from journal.storage import JournalStorage
+from memory.models import FactCategory, FactSource, StewardFact
+from memory.store import FactStore
+
+logger = logging.getLogger(__name__)
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+BASELINE_VERSION = 1
+HASH_EMBEDDINGS = {"embeddings": {"provider": "hash"}}
+SAVE_BATCH_SIZE = 10
+EMBED_BATCH_SIZE = 500
+
+# Assembly without repo/curriculum sources: those read the real coach home.
+ASSEMBLY_RAG_CONFIG = {
+    "inject_memory": True,
+    "inject_repo_context": False,
+    "inject_curriculum": False,
+}
+
+_TOPICS = [
+    "rust",
+    "python",
+    "kubernetes",
+    "llm",
+    "career",
+    "hiring",
+    "startup",
+    "databases",
+    "observability",
+    "security",
+    "mentoring",
+    "compilers",
+    "frontend",
+    "robotics",
+    "finance",
+    "writing",
+]
+_WORDS = [
+    "learning",
+    "project",
+    "deadline",
+    "team",
+    "review",
+    "design",
+    "latency",
+    "roadmap",
+    "interview",
+    "benchmark",
+    "release",
+    "migration",
+    "feedback",
+    "goal",
+    "research",
+    "prototype",
+    "promotion",
+    "conference",
+    "architecture",
+    "incident",
+]
+_QUERIES = [
+    "how is my rust learning going",
+    "kubernetes migration incident review",
+    "career goals and promotion feedback",
+    "llm research prototype latency",
+    "hiring interview design",
+    "python release roadmap",
+    "startup finance deadline",
+    "security architecture review",
+]
+
+
+def _sentence(rng: random.Random, topic: str, words: int = 12) -> str:
+    picked = [topic, *rng.choices(_WORDS, k=words - 1)]
+    rng.shuffle(picked)
+    return " ".join(picked).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, topic: str, sentences: int = 4) -> str:
+    return " ".join(_sentence(rng, topic) for _ in range(sentences))
+
+
+# ---------------------------------------------------------------------------
+# Timing helpers
+# ---------------------------------------------------------------------------
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0-100) of unsorted samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(samples_s: list[float]) -> dict:
+    """p50/p95/p99/mean in milliseconds."""
+    ms = [s * 1000 for s in samples_s]
+    return {
+        "n": len(ms),
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "mean_ms": round(sum(ms) / len(ms), 3) if ms else 0.0,
+    }
+
+
+def _time_calls(fn: Callable[[int], object], iterations: int, warmup: int = 1) -> list[float]:
+    for i in range(warmup):
+        fn(i)
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class PerfCorpus:
+    journal_search: JournalSearch
+    intel_search: IntelSearch
+    fact_store: FactStore
+    rag: RAGRetriever
+    scraper: BaseScraper
+    setup_seconds: dict = field(default_factory=dict)
+
+
+def _build_journal(root: Path, scale: int, rng: random.Random):
+    storage = JournalStorage(root / "journal")
+    entry_types = ["daily", "project", "goal", "reflection"]
+    for i in range(scale):
+        topic = rng.choice(_TOPICS)
+        storage.create(
+            content=_paragraph(rng, topic),
+            entry_type=entry_types[i % len(entry_types)],
+            title=f"{topic} note {i}",
+            tags=[topic],
+        )
+    embeddings = EmbeddingManager(root / "chroma", config=HASH_EMBEDDINGS)
+    search = JournalSearch(storage, embeddings, fts_index=JournalFTSIndex(storage.journal_dir))
+    search.sync_embeddings()
+    return search
+
+
+def _intel_item(rng: random.Random, i: int, source: str = "perf"):
+    topic = rng.choice(_TOPICS)
+    return IntelItem(
+        source=source,
+        title=f"{topic.title()} update {i}: {_sentence(rng, topic, 6)}",
+        url=f"https://example.com/{source}/{i}",
+        summary=_paragraph(rng, topic, 2),
+        published=datetime.now(),
+        tags=[topic],
+    )
+
+
+def _build_intel(root: Path, scale: int, rng: random.Random):
+    storage = IntelStorage(root / "intel.db")
+    embeddings = IntelEmbeddingManager(root / "intel_chroma", config=HASH_EMBEDDINGS)
+    batch: list[dict] = []
+    for i in range(scale):
+        item = _intel_item(rng, i)
+        row_id = storage.save(item)
+        if row_id:
+            batch.append(
+                {
+                    "id": str(row_id),
+                    "content": f"{item.title} {item.summary}",
+                    "metadata": {"source": item.source, "user_id": "__shared__"},
+                }
+            )
+        if len(batch) >= EMBED_BATCH_SIZE:
+            embeddings.add_items_batch(batch)
+            batch = []
+    embeddings.add_items_batch(batch)
+    return storage, embeddings, IntelSearch(storage, embeddings)
+
+
+def _build_facts(root: Path, scale: int, rng: random.Random):
+    store = FactStore(root / "memory.db", chroma_dir=root / "memory_chroma", config=HASH_EMBEDDINGS)
+    categories = list(FactCategory)
+    for i in range(scale):
+        topic = rng.choice(_TOPICS)
+        store.add(
+            StewardFact(
+                id=f"fact{i:06d}",
+                text=f"User is focused on {topic}: {_sentence(rng, topic, 8)}",
+                category=categories[i % len(categories)],
+                source_type=FactSource.JOURNAL,
+                source_id=f"perf-{i}",
+            )
+        )
+    return store
+
+
+class _SyntheticScraper(BaseScraper):
+    """Scraper whose items are generated by the benchmark."""
+
+    @property
+    def source_name(self) -> str:
+        return "perf"
+
+    async def scrape(self) -> list[IntelItem]:
+        return []
+
+
+def build_corpus(root: Path, scale: int, seed: int = 0) -> PerfCorpus:
+    """Generate ``scale`` journals, intel items and facts under ``root``."""
+    rng = random.Random(seed)
+    setup: dict[str, float] = {}
+
+    start = time.perf_counter()
+    journal_search = _build_journal(root, scale, rng)
+    setup["journal"] = round(time.perf_counter() - start, 3)
+
+    start = time.perf_counter()
+    intel_storage, intel_embeddings, intel_search = _build_intel(root, scale, rng)
+    setup["intel"] = round(time.perf_counter() - start, 3)
+
+    start = time.perf_counter()
+    fact_store = _build_facts(root, scale, rng)
+    setup["facts"] = round(time.perf_counter() - start, 3)
+
+    rag = RAGRetriever(
+        journal_search,
+        root / "intel.db",
+        intel_search=intel_search,
+        profile_path=str(root / "profile.yaml"),
+        fact_store=fact_store,
+    )
+    return PerfCorpus(
+        journal_search=journal_search,
+        intel_search=intel_search,
+        fact_store=fact_store,
+        rag=rag,
+        scraper=_SyntheticScraper(intel_storage, intel_embeddings),
+        setup_seconds=setup,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class PerfReport:
+    scale: int = 0
+    iterations: int = 0
+    setup_seconds: dict = field(default_factory=dict)
+    timings: dict = field(default_factory=dict)
+    summary: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": BASELINE_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "scale": self.scale,
+            "iterations": self.iterations,
+            "setup_seconds": self.setup_seconds,
+            "timings": self.timings,
+            "summary": self.summary,
+        }
+
+
+def run_perf_eval(
+    scale: int = SCALES["1k"],
+    iterations: int = 50,
+    seed: int = 0,
+    work_dir: str | Path | None = None,
+) -> PerfReport:
+    """Build a synthetic corpus and time the retrieval and save paths.
+
+    The corpus lives in a temporary directory unless ``work_dir`` (which
+    should be empty) is given, e.g. to inspect the generated data.
+    """
+    with tempfile.TemporaryDirectory(prefix="coach-perf-") as tmp:
+        root = Path(work_dir) if work_dir else Path(tmp)
+        root.mkdir(parents=True, exist_ok=True)
+        corpus = build_corpus(root, scale, seed=seed)
+        rng = random.Random(seed + 1)
+        next_item = [scale]
+
+        def query(i: int) -> str:
+            return _QUERIES[i % len(_QUERIES)]
+
+        def save_batch(_i: int) -> None:
+            items = []
+            for _ in range(SAVE_BATCH_SIZE):
+                items.append(_intel_item(rng, next_item[0], source="perf-live"))
+                next_item[0] += 1
+            asyncio.run(corpus.scraper.save_items(items))
+
+        operations: dict[str, Callable[[int], object]] = {
+            "journal_search": lambda i: corpus.journal_search.hybrid_search(query(i), n_results=10),
+            "intel_search": lambda i: corpus.intel_search.hybrid_search(query(i), n_results=10),
+            "fact_search": lambda i: corpus.fact_store.search(query(i), limit=10),
+            "context_assembly": lambda i: corpus.rag.build_context_for_ask(
+                query(i), rag_config=ASSEMBLY_RAG_CONFIG
+            ),
+            "scraper_save": save_batch,
+        }
+
+        report = PerfReport(scale=scale, iterations=iterations, setup_seconds=corpus.setup_seconds)
+        for name, fn in operations.items():
+            report.timings[name] = summarize_latencies(_time_calls(fn, iterations))
+            logger.info("perf %s: %s", name, report.timings[name])
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Baselines
+# ---------------------------------------------------------------------------
+
+
+def write_baseline(report: PerfReport, path: str | Path) -> Path:
+    """Write the report as a JSON baseline."""
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+    return out
+
+
+def load_baseline(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare_to_baseline(
+    report: PerfReport,
+    baseline: dict,
+    tolerance: float = 0.25,
+    metric: str = "p95_ms",
+) -> list[dict]:
+    """Operations whose ``metric`` grew by more than ``tolerance`` (0.25 = 25%).
+
+    Also records the outcome on ``report.summary``.
+    """
+    regressions = []
+    for name, current in report.timings.items():
+        previous = baseline.get("timings", {}).get(name)
+        if not previous or not previous.get(metric):
+            continue
+        ratio = current[metric] / previous[metric]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    "operation": name,
+                    "metric": metric,
+                    "baseline_ms": previous[metric],
+                    "current_ms": current[metric],
+                    "ratio": round(ratio, 2),
+                }
+            )
+    report.summary = {
+        "baseline_scale": baseline.get("scale"),
+        "tolerance": tolerance,
+        "regressions": regressions,
+        "passed": not regressions,
+    }
+    return regressions
@@ -2,13 +2,15 @@
 
 import concurrent.futures
 import json
+import time
 import uuid
 from collections.abc import Callable
 
 import structlog
 
-from llm.base import LLMProvider
+from llm.base import LLMProvider, ToolCall
 from services.tool_registry import ToolRegistry
+from thread_pools import shared_pool
 
 from .context_compressor import ContextCompressor
 from .trace import (
@@ -34,6 +36,8 @@ COLLECT_ONLY_TOOLSETS = {"context"}
 OUTBOUND_TOOLS = {"web_search", "intel_add_rss_feed"}
 # Minimum verbatim word span that trips the outbound guard.
 GUARD_SPAN_WORDS = 8
+# Shared across orchestrators so tool calls never pay for executor start-up.
+TOOL_WORKERS = 8
 
 
 def _is_tool_error(result_text: str) -> bool:
@@ -119,6 +123,50 @@ class AgenticOrchestrator:
             return wrap_untrusted(result_text, source=tool_name)
         return result_text
 
+    def _execute_tool_calls(self, tool_calls: list[ToolCall], skip: set[int]) -> dict[int, str]:
+        """Run one turn's tool calls on the shared pool, keyed by position.
+
+        Consecutive parallel-safe calls run concurrently; any other call is a
+        barrier that runs alone, so side effects keep the model's ordering.
+        Each call gets its registry timeout (default ``tool_timeout``),
+        measured from submission.
+        """
+        results: dict[int, str] = {}
+        batch: list[tuple[int, ToolCall]] = []
+        for i, tc in enumerate(tool_calls):
+            if i in skip:
+                continue
+            if self.registry.is_parallel_safe(tc.name):
+                batch.append((i, tc))
+                continue
+            if batch:
+                results.update(self._run_batch(batch))
+                batch = []
+            results.update(self._run_batch([(i, tc)]))
+        if batch:
+            results.update(self._run_batch(batch))
+        return results
+
+    def _run_batch(self, batch: list[tuple[int, ToolCall]]) -> dict[int, str]:
+        pool = shared_pool("advisor-tool", TOOL_WORKERS)
+        start = time.monotonic()
+        futures = [
+            (i, tc, pool.submit(self.registry.execute, tc.name, tc.arguments)) for i, tc in batch
+        ]
+        results: dict[int, str] = {}
+        for i, tc, future in futures:
+            timeout = self.registry.get_timeout(tc.name, self.tool_timeout)
+            remaining = max(0.0, timeout - (time.monotonic() - start))
+            try:
+                results[i] = future.result(timeout=remaining)
+            except concurrent.futures.TimeoutError:
+                # The worker cannot be interrupted; it finishes in the background
+                # and its result is discarded.
+                future.cancel()
+                logger.error("tool_timeout", tool=tc.name, timeout=timeout)
+                results[i] = json.dumps({"error": f"{tc.name}: timed out after {timeout}s"})
+        return results
+
     def _build_nudge(self, used_tools: set[str], available_tools: list[str]) -> str:
         unused = sorted(set(available_tools) - used_tools)
         return _NUDGE_TEMPLATE.format(
@@ -216,15 +264,22 @@ class AgenticOrchestrator:
                 assistant_msg["content"] = response.content
             messages.append(assistant_msg)
 
-            # Execute each tool call and append results
-            for tc in response.tool_calls:
+            # Announce every call up front, then execute and append results
+            # in the order the model requested them.
+            blocked: set[int] = set()
+            for i, tc in enumerate(response.tool_calls):
                 used_tools.add(tc.name)
                 logger.info("tool_call", tool=tc.name, args=list(tc.arguments.keys()))
                 if event_callback:
                     event_callback({"type": "tool_start", "tool": tc.name})
                 self._trace.append(make_tool_start_entry(tc.name, tc.id, list(tc.arguments.keys())))
-
                 if self._is_blocked_outbound_call(tc.name, tc.arguments):
+                    blocked.add(i)
+
+            results = self._execute_tool_calls(response.tool_calls, skip=blocked)
+
+            for i, tc in enumerate(response.tool_calls):
+                if i in blocked:
                     result_text = json.dumps(
                         {
                             "error": (
@@ -235,15 +290,7 @@ class AgenticOrchestrator:
                         }
                     )
                 else:
-                    try:
-                        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                            future = pool.submit(self.registry.execute, tc.name, tc.arguments)
-                            result_text = future.result(timeout=self.tool_timeout)
-                    except concurrent.futures.TimeoutError:
-                        logger.error("tool_timeout", tool=tc.name, timeout=self.tool_timeout)
-                        result_text = json.dumps(
-                            {"error": f"{tc.name}: timed out after {self.tool_timeout}s"}
-                        )
+                    result_text = results[i]
                 is_error = _is_tool_error(result_text)
                 result_text = self._track_untrusted_result(tc.name, result_text, is_error)
 
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import sqlite3
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -16,8 +20,12 @@ from advisor.retrievers.journal import JournalRetriever
 from advisor.retrievers.memory import MemoryRetriever
 from advisor.retrievers.profile import ProfileRetriever
 from advisor.retrievers.supplementary import SupplementaryRetriever
+from advisor.trace import make_retrieval_entry
 from advisor.untrusted import strip_untrusted_tags, wrap_untrusted
 from db import wal_connect
+from degradation_collector import record_degradation
+from observability import metrics
+from thread_pools import shared_pool
 
 if TYPE_CHECKING:
     from advisor.entity_retriever import EntityRetriever
@@ -26,6 +34,82 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Bounded pool shared by every assembler. Retrievers are I/O-bound (SQLite,
+# embedding APIs); one request fans out up to ~7 tasks, so this covers a few
+# concurrent requests. Threads are only spawned on demand.
+RETRIEVAL_WORKERS = 32
+DEFAULT_RETRIEVER_DEADLINE_S = 8.0
+
+
+def fan_out_retrievers(
+    tasks: dict[str, Callable[[], Any]],
+    deadlines: dict[str, float] | None = None,
+    default_deadline: float = DEFAULT_RETRIEVER_DEADLINE_S,
+) -> tuple[dict[str, Any], dict]:
+    """Run context retrievers concurrently with per-retriever deadlines.
+
+    Deadlines are measured from fan-out start. Retrievers that fail or miss
+    their deadline are left out of the results so callers fall back to empty
+    context, and are recorded as request degradations. A timed-out retriever
+    that is still queued is cancelled; one already running finishes in the
+    background. Each task runs in a copy of the caller's contextvars, so
+    degradations recorded inside retrievers reach the request collector.
+
+    Returns:
+        (results by name, ``context_retrieval`` trace entry with per-retriever
+        latency in ms)
+    """
+    deadlines = deadlines or {}
+    pool = shared_pool("context-retrieval", RETRIEVAL_WORKERS)
+    start = time.monotonic()
+    finished_at: dict[str, float] = {}
+
+    def _deadline(name: str) -> float:
+        return start + deadlines.get(name, default_deadline)
+
+    def _timed(name: str, fn: Callable[[], Any]) -> Any:
+        if time.monotonic() >= _deadline(name):
+            # Sat in the queue past its deadline; the caller has moved on
+            raise concurrent.futures.CancelledError()
+        try:
+            return fn()
+        finally:
+            finished_at[name] = time.monotonic()
+
+    futures = {
+        name: pool.submit(contextvars.copy_context().run, _timed, name, fn)
+        for name, fn in tasks.items()
+    }
+
+    results: dict[str, Any] = {}
+    timed_out: list[str] = []
+    failed: list[str] = []
+    for name, future in futures.items():
+        remaining = _deadline(name) - time.monotonic()
+        try:
+            results[name] = future.result(timeout=max(0.0, remaining))
+        except (concurrent.futures.TimeoutError, concurrent.futures.CancelledError):
+            future.cancel()
+            timed_out.append(name)
+            logger.warning("context_retriever_timeout", retriever=name)
+            metrics.counter("graceful.advisor.retriever_timeout", labels={"retriever": name})
+            record_degradation("graceful.advisor.retriever_timeout")
+        except Exception as exc:
+            failed.append(name)
+            logger.warning("context_retriever_failed", retriever=name, error=str(exc))
+            metrics.counter("graceful.advisor.retriever_failed", labels={"retriever": name})
+            record_degradation("graceful.advisor.retriever_failed")
+
+    now = time.monotonic()
+    latency_ms = {name: round((finished_at.get(name, now) - start) * 1000, 1) for name in futures}
+    entry = make_retrieval_entry(
+        latency_ms=latency_ms,
+        timed_out=timed_out,
+        failed=failed,
+        total_ms=round((now - start) * 1000, 1),
+    )
+    return results, entry
+
 
 @dataclass
 class AskContext:
@@ -42,6 +126,22 @@ class AskContext:
     curriculum_context: str = ""
 
 
+def assemble_ask_context(results: dict[str, Any]) -> AskContext:
+    """Build an ``AskContext`` from fan-out results, defaulting missing sources."""
+    enhanced = results.get("enhanced") or AskContext(journal="", intel="", profile="")
+    return AskContext(
+        journal=enhanced.journal,
+        intel=enhanced.intel,
+        profile=results.get("profile", ""),
+        memory=results.get("memory", ""),
+        thoughts=results.get("thoughts", ""),
+        documents=results.get("documents", ""),
+        entity_context=enhanced.entity_context,
+        repo_context=results.get("repo", ""),
+        curriculum_context=results.get("curriculum", ""),
+    )
+
+
 class ContextAssembler:
     """Orchestrates multiple retrievers into unified context for LLM prompts."""
 
@@ -79,6 +179,7 @@ class ContextAssembler:
         self.entity_retriever = entity_retriever
         self.reranker = reranker
         self.cache = cache
+        self.last_retrieval_trace: dict | None = None
 
     # ── High-level assembly ──────────────────────────────────────────
 
@@ -88,47 +189,38 @@ class ContextAssembler:
         rag_config: dict | None = None,
         attachment_ids: list[str] | None = None,
     ) -> AskContext:
-        """Build consolidated context for ask() calls."""
-        cfg = rag_config or {}
+        """Build consolidated context for ask() calls.
 
-        enhanced = self.get_enhanced_context(query)
-        profile_ctx = self._profile.get_profile_context(
-            structured=cfg.get("structured_profile", False)
-        )
+        Sources run concurrently via ``fan_out_retrievers``; the per-retriever
+        latency breakdown is kept on ``last_retrieval_trace``.
+        """
+        cfg = rag_config or {}
 
-        memory_ctx = ""
+        tasks: dict[str, Callable[[], Any]] = {
+            "enhanced": lambda: self.get_enhanced_context(query),
+            "profile": lambda: self._profile.get_profile_context(
+                structured=cfg.get("structured_profile", False)
+            ),
+        }
         if cfg.get("inject_memory", False) and self._memory:
-            memory_ctx = self._memory.get_memory_context(query)
-
-        thoughts_ctx = ""
+            tasks["memory"] = lambda: self._memory.get_memory_context(query)
         if cfg.get("inject_recurring_thoughts", False) and self._memory:
-            thoughts_ctx = self._memory.get_recurring_thoughts_context()
-
-        documents_ctx = ""
+            tasks["thoughts"] = self._memory.get_recurring_thoughts_context
         if (cfg.get("inject_documents", False) or attachment_ids) and self._supplementary:
-            documents_ctx = self._supplementary.get_document_context(
+            tasks["documents"] = lambda: self._supplementary.get_document_context(
                 query, attachment_ids=attachment_ids
             )
-
-        repo_ctx = ""
         if cfg.get("inject_repo_context", True) and self._supplementary:
-            repo_ctx = self._supplementary.get_repo_context(query)
-
-        curriculum_ctx = ""
+            tasks["repo"] = lambda: self._supplementary.get_repo_context(query)
         if cfg.get("inject_curriculum", True) and self._supplementary:
-            curriculum_ctx = self._supplementary.get_curriculum_context(query)
+            tasks["curriculum"] = lambda: self._supplementary.get_curriculum_context(query)
 
-        return AskContext(
-            journal=enhanced.journal,
-            intel=enhanced.intel,
-            profile=profile_ctx,
-            memory=memory_ctx,
-            thoughts=thoughts_ctx,
-            documents=documents_ctx,
-            entity_context=enhanced.entity_context,
-            repo_context=repo_ctx,
-            curriculum_context=curriculum_ctx,
+        results, self.last_retrieval_trace = fan_out_retrievers(
+            tasks,
+            deadlines=cfg.get("retriever_deadlines"),
+            default_deadline=cfg.get("retriever_deadline_s", DEFAULT_RETRIEVER_DEADLINE_S),
         )
+        return assemble_ask_context(results)
 
     def get_enhanced_context(self, query: str) -> AskContext:
         """Get text and optional entity context for advisor prompts."""
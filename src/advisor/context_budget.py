@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
 from advisor.untrusted import ensure_closed
 from services.tokens import count_tokens
 
@@ -11,33 +13,95 @@ def tokens_to_chars(tokens: int) -> int:
     return tokens * 4
 
 
+class TokenBudget:
+    """Token accounting for a sequence of text segments joined by a separator.
+
+    When truncation is needed, each segment is tokenized once and prefix sums
+    of those counts locate the cut with a binary search, instead of
+    re-tokenizing the growing candidate string per segment. Per-segment sums
+    only approximate the joined count (BPE merges and the len//4 fallback both
+    round), so the chosen prefix is verified with a single exact count and
+    narrowed by bisection if needed. Text that already fits costs one count.
+    """
+
+    def __init__(self, segments: list[str], separator: str = "\n", total: int | None = None):
+        self.segments = segments
+        self.separator = separator
+        self._total = total
+        self._prefix: list[int] | None = None
+
+    @classmethod
+    def from_text(cls, text: str, separator: str = "\n", total: int | None = None) -> TokenBudget:
+        """Split ``text`` into line (or ``separator``) segments.
+
+        ``total`` may pass in an exact count of ``text`` already taken.
+        """
+        return cls(text.split(separator) if text else [], separator, total)
+
+    @property
+    def total(self) -> int:
+        """Exact token count of all segments joined (computed once)."""
+        if self._total is None:
+            self._total = count_tokens(self.separator.join(self.segments))
+        return self._total
+
+    def _prefix_sums(self) -> list[int]:
+        if self._prefix is None:
+            sep_cost = count_tokens(self.separator) if self.separator else 0
+            prefix = [0]
+            for i, segment in enumerate(self.segments):
+                prefix.append(prefix[-1] + count_tokens(segment) + (sep_cost if i else 0))
+            self._prefix = prefix
+        return self._prefix
+
+    def fit_count(self, token_budget: int) -> int:
+        """Number of leading segments that fit in ``token_budget``."""
+        if self.total <= token_budget:
+            return len(self.segments)
+        estimate = max(0, bisect_right(self._prefix_sums(), token_budget) - 1)
+        if self._fits(estimate, token_budget):
+            return estimate
+        lo, hi = 0, estimate  # lo always fits, hi never does
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self._fits(mid, token_budget):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def truncate(self, token_budget: int) -> str:
+        """Join the longest prefix of segments that fits in ``token_budget``."""
+        return self.separator.join(self.segments[: self.fit_count(token_budget)])
+
+    def _fits(self, count: int, token_budget: int) -> bool:
+        return count_tokens(self.separator.join(self.segments[:count])) <= token_budget
+
+
 def truncate_lines_to_tokens(text: str, token_budget: int) -> str:
     """Truncate text at line boundaries to fit within a token budget."""
-    if count_tokens(text) <= token_budget:
+    total = count_tokens(text)
+    if total <= token_budget:
         return text
-    lines = text.split("\n")
-    kept: list[str] = []
-    for line in lines:
-        candidate = "\n".join([*kept, line]) if kept else line
-        if count_tokens(candidate) > token_budget:
-            break
-        kept.append(line)
-    return "\n".join(kept) if kept else ""
+    return TokenBudget.from_text(text, total=total).truncate(token_budget)
 
 
 def truncate_to_token_budget(
     journal_ctx: str, intel_ctx: str, weight: float, max_tokens: int
 ) -> tuple[str, str]:
     """Ensure combined context fits within max_tokens."""
-    total_tokens = count_tokens(journal_ctx) + count_tokens(intel_ctx)
-    if total_tokens <= max_tokens:
+    journal_tokens = count_tokens(journal_ctx)
+    intel_tokens = count_tokens(intel_ctx)
+    if journal_tokens + intel_tokens <= max_tokens:
         return journal_ctx, intel_ctx
 
     journal_budget = int(max_tokens * weight)
     intel_budget = max_tokens - journal_budget
 
-    journal_ctx = truncate_lines_to_tokens(journal_ctx, journal_budget)
+    journal_ctx = TokenBudget.from_text(journal_ctx, total=journal_tokens).truncate(journal_budget)
     # Truncation can drop the untrusted-content closing tag — repair it so
     # trusted prompt text after the intel slot never lands inside the wrapper.
-    intel_ctx = ensure_closed(truncate_lines_to_tokens(intel_ctx, intel_budget))
+    intel_ctx = ensure_closed(
+        TokenBudget.from_text(intel_ctx, total=intel_tokens).truncate(intel_budget)
+    )
     return journal_ctx, intel_ctx
@@ -1,18 +1,112 @@
-"""SQLite-backed context cache with TTL for RAG retrieval results."""
+"""SQLite-backed context cache with TTL for RAG retrieval results.
+
+Two tiers: a process-local LRU, shared by every ``ContextCache`` on the same
+database file, answers repeat lookups without touching SQLite; the SQLite
+table is the durable, cross-process store. Rows carry a ``context_type`` and
+a ``scope`` (the user id) so a write can invalidate one logical group, e.g.
+every journal-derived context for a user. Memory entries are re-read from
+SQLite after ``MEMORY_REVALIDATE_S`` so invalidations made by other
+processes are picked up.
+"""
 
 import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import NamedTuple
 
 from db import wal_connect
+from observability import metrics
+
+# Context types built from journal entries; a journal write invalidates these
+JOURNAL_CONTEXT_TYPES = ("journal", "combined")
+
+MEMORY_MAX_ENTRIES = 512
+MEMORY_REVALIDATE_S = 30.0
+
+
+class _Entry(NamedTuple):
+    value: str
+    created_at: float
+    context_type: str | None
+    scope: str | None
+    loaded_at: float
+
+
+class _MemoryTier:
+    """Bounded LRU of recently read or written cache rows."""
+
+    def __init__(self, max_entries: int):
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            metrics.counter("context_cache.eviction", evicted)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def drop(self, predicate) -> None:
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if predicate(k, entry)]:
+                del self._entries[key]
+
+
+_tiers: dict[str, _MemoryTier] = {}
+_tiers_lock = threading.Lock()
+
+
+def _memory_tier(db_path) -> _MemoryTier:
+    key = str(db_path)
+    with _tiers_lock:
+        tier = _tiers.get(key)
+        if tier is None:
+            tier = _tiers[key] = _MemoryTier(MEMORY_MAX_ENTRIES)
+        return tier
+
+
+def _tags_from_key(cache_key: str) -> tuple[str | None, str | None]:
+    """Recover (context_type, scope) from a key built by ``make_key``."""
+    parts = cache_key.split(":", 2)
+    if len(parts) != 3:
+        return None, None
+    return parts[0], parts[1] or None
 
 
 class ContextCache:
-    """Cache RAG context payloads in SQLite with TTL."""
+    """Cache RAG context payloads in SQLite with TTL.
 
-    def __init__(self, db_path, default_ttl: int = 86400):
+    Args:
+        db_path: SQLite file holding the ``context_cache`` table.
+        default_ttl: Seconds before an entry expires.
+        scope: Partition for keys built by ``make_key`` (normally the user
+            id), so users sharing a cache file never see each other's context.
+    """
+
+    def __init__(self, db_path, default_ttl: int = 86400, scope: str | None = None):
         self.db_path = db_path
         self.default_ttl = default_ttl
+        self.scope = scope
+        self._memory = _memory_tier(db_path)
         self._init_db()
         # Keys are query hashes, so expired rows are only ever re-read by the
         # exact same query — sweep on construction or the DB grows forever.
@@ -27,9 +121,19 @@ class ContextCache:
                 """CREATE TABLE IF NOT EXISTS context_cache (
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL,
-                    created_at REAL NOT NULL
+                    created_at REAL NOT NULL,
+                    context_type TEXT,
+                    scope TEXT
                 )"""
             )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(context_cache)")}
+            for column in ("context_type", "scope"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE context_cache ADD COLUMN {column} TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_context_cache_tags "
+                "ON context_cache(scope, context_type)"
+            )
 
     def get(self, cache_key: str, ttl: int | None = None) -> str | None:
         """Return cached value if not expired, else None.
@@ -38,40 +142,75 @@ class ContextCache:
             cache_key: Cache key to look up.
             ttl: Override default TTL for this lookup (seconds).
         """
+        effective_ttl = ttl if ttl is not None else self.default_ttl
+        now = time.time()
+        entry = self._memory.get(cache_key)
+        if entry is not None and now - entry.loaded_at <= MEMORY_REVALIDATE_S:
+            if now - entry.created_at <= effective_ttl:
+                metrics.counter("context_cache.hit", labels={"tier": "memory"})
+                return entry.value
+
         with wal_connect(self.db_path) as conn:
             row = conn.execute(
-                "SELECT value, created_at FROM context_cache WHERE key = ?",
+                "SELECT value, created_at, context_type, scope FROM context_cache WHERE key = ?",
                 (cache_key,),
             ).fetchone()
         if row is None:
+            self._memory.discard(cache_key)
+            metrics.counter("context_cache.miss")
             return None
-        value, created_at = row
-        effective_ttl = ttl if ttl is not None else self.default_ttl
-        if time.time() - created_at > effective_ttl:
+        value, created_at, context_type, scope = row
+        if now - created_at > effective_ttl:
             self._delete(cache_key)
+            metrics.counter("context_cache.miss")
             return None
+        self._memory.put(cache_key, _Entry(value, created_at, context_type, scope, now))
+        metrics.counter("context_cache.hit", labels={"tier": "sqlite"})
         return value
 
-    def set(self, cache_key: str, value: str):
-        """Upsert cache entry with current timestamp."""
+    def set(
+        self,
+        cache_key: str,
+        value: str,
+        *,
+        context_type: str | None = None,
+        scope: str | None = None,
+    ):
+        """Upsert cache entry with current timestamp.
+
+        ``context_type``/``scope`` tag the row for ``invalidate_tags``; keys
+        from ``make_key`` carry their tags, so callers only pass them for
+        hand-built keys.
+        """
+        if context_type is None and scope is None:
+            context_type, scope = _tags_from_key(cache_key)
+        now = time.time()
         with wal_connect(self.db_path) as conn:
             conn.execute(
-                """INSERT INTO context_cache (key, value, created_at)
-                   VALUES (?, ?, ?)
-                   ON CONFLICT(key) DO UPDATE SET value=excluded.value, created_at=excluded.created_at""",
-                (cache_key, value, time.time()),
+                """INSERT INTO context_cache (key, value, created_at, context_type, scope)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(key) DO UPDATE SET value=excluded.value,
+                       created_at=excluded.created_at,
+                       context_type=excluded.context_type, scope=excluded.scope""",
+                (cache_key, value, now, context_type, scope),
             )
+        self._memory.put(cache_key, _Entry(value, now, context_type, scope, now))
 
     def make_key(self, context_type: str, query: str, **params) -> str:
-        """SHA256 hash of context_type + query + sorted params."""
-        payload = json.dumps({"type": context_type, "query": query, **params}, sort_keys=True)
-        return hashlib.sha256(payload.encode()).hexdigest()
+        """``<context_type>:<scope>:<sha256 of type + scope + query + sorted params>``."""
+        payload = json.dumps(
+            {"type": context_type, "scope": self.scope, "query": query, **params},
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+        return f"{context_type}:{self.scope or ''}:{digest}"
 
     def clear_expired(self):
         """Delete entries older than TTL."""
         cutoff = time.time() - self.default_ttl
         with wal_connect(self.db_path) as conn:
             conn.execute("DELETE FROM context_cache WHERE created_at < ?", (cutoff,))
+        self._memory.drop(lambda _key, entry: entry.created_at < cutoff)
 
     def invalidate(self, cache_key: str):
         """Delete a specific cache entry."""
@@ -84,7 +223,40 @@ class ContextCache:
                 "DELETE FROM context_cache WHERE key LIKE ?",
                 (prefix + "%",),
             )
+        self._memory.drop(lambda key, _entry: key.startswith(prefix))
+
+    def invalidate_tags(
+        self,
+        *,
+        scope: str | None = None,
+        context_types: Iterable[str] | None = None,
+    ) -> None:
+        """Delete every entry in ``scope`` and/or of the given context types.
+
+        ``invalidate_tags(scope=user_id, context_types=JOURNAL_CONTEXT_TYPES)``
+        drops all journal-derived contexts for one user.
+        """
+        types = list(context_types) if context_types is not None else None
+        if scope is None and types is None:
+            raise ValueError("invalidate_tags needs a scope or context_types")
+        sql = "DELETE FROM context_cache WHERE 1 = 1"
+        params: list[str] = []
+        if scope is not None:
+            sql += " AND scope = ?"
+            params.append(scope)
+        if types is not None:
+            sql += f" AND context_type IN ({','.join('?' * len(types))})"
+            params.extend(types)
+        with wal_connect(self.db_path) as conn:
+            conn.execute(sql, params)
+        self._memory.drop(
+            lambda _key, entry: (
+                (scope is None or entry.scope == scope)
+                and (types is None or entry.context_type in types)
+            )
+        )
 
     def _delete(self, cache_key: str):
         with wal_connect(self.db_path) as conn:
             conn.execute("DELETE FROM context_cache WHERE key = ?", (cache_key,))
+        self._memory.discard(cache_key)
@@ -8,6 +8,8 @@ import structlog
 
 from llm.base import LLMProvider
 
+from .context_budget import TokenBudget
+
 logger = structlog.get_logger()
 
 
@@ -21,12 +23,14 @@ class ContextCompressor:
         protect_first_n: int = 2,
         protect_last_n: int = 3,
         summary_target_chars: int = 2000,
+        summary_prompt_tokens: int = 12_000,
     ) -> None:
         self.cheap_llm = cheap_llm
         self.token_threshold = token_threshold
         self.protect_first_n = protect_first_n
         self.protect_last_n = protect_last_n
         self.summary_target_chars = summary_target_chars
+        self.summary_prompt_tokens = summary_prompt_tokens
 
     def compress_if_needed(self, messages: list[dict], current_input_tokens: int) -> list[dict]:
         """Return a compressed message list when the token budget is exceeded."""
@@ -117,9 +121,11 @@ class ContextCompressor:
                 content = str(message.get("content", ""))[:1000]
                 rendered.append(f"[{role}] {content}")
 
+        # Keep the oldest turns that fit; one tokenization pass over the transcript
+        transcript = TokenBudget(rendered).truncate(self.summary_prompt_tokens)
         prompt = (
             "Summarize this conversation segment concisely, preserving key facts, tool results, and "
-            "decisions.\n\n" + "\n".join(rendered)
+            "decisions.\n\n" + transcript
         )
         try:
             summary = self.cheap_llm.generate(
@@ -1,5 +1,6 @@
 """LLM orchestration for advice generation."""
 
+import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,6 +22,7 @@ from .rag import RAGRetriever
 from .recommendation_storage import RecommendationStorage
 from .recommendations import RecommendationEngine
 from .tools import build_tool_registry
+from .trace import make_answer_entry, make_session_entry
 
 logger = structlog.get_logger()
 
@@ -100,7 +102,8 @@ class AdvisorEngine:
             with graceful_context("graceful.advisor.cache_init"):
                 cache_path = get_coach_home() / "context_cache.db"
                 cache_path.parent.mkdir(parents=True, exist_ok=True)
-                rag.cache = ContextCache(cache_path)
+                # Scoped per user: the file is shared by every user of this home
+                rag.cache = ContextCache(cache_path, scope=getattr(rag, "user_id", None))
 
         try:
             self.llm = create_llm_provider(
@@ -117,6 +120,11 @@ class AdvisorEngine:
         except BaseLLMError as e:
             raise APIKeyMissingError(str(e)) from e
 
+        # Trace of the most recent ask_result() run (persisted by services.advice)
+        self._session_id: str = ""
+        self._trace: list[dict] = []
+        self._last_retrieval_trace: dict | None = None
+
         self._orchestrator = None
         if use_tools and components:
             registry = build_tool_registry(components)
@@ -255,6 +263,8 @@ class AdvisorEngine:
             self._rag_config,
             attachment_ids=attachment_ids,
         )
+        retrieval_trace = getattr(self.rag, "last_retrieval_trace", None)
+        self._last_retrieval_trace = retrieval_trace if isinstance(retrieval_trace, dict) else None
 
         system_prompt = PromptTemplates.SYSTEM
         if ctx.entity_context:
@@ -309,6 +319,10 @@ class AdvisorEngine:
         Returns:
             LLM-generated advice
         """
+        self._session_id = uuid.uuid4().hex[:16]
+        self._trace = [make_session_entry(self._session_id, question)]
+        self._last_retrieval_trace = None
+
         if self._should_use_council(question, advice_type):
             system_prompt, user_prompt = self._build_advice_prompt(
                 question,
@@ -341,6 +355,7 @@ class AdvisorEngine:
                         "used": council_result.used,
                     }
                 )
+            self._finish_trace(council_result.answer)
             return AdviceResult(
                 answer=council_result.answer,
                 council_used=council_result.used,
@@ -352,26 +367,33 @@ class AdvisorEngine:
 
         # Agentic mode: LLM decides what to look up via tool calls
         if self._orchestrator and not attachment_ids:
-            return AdviceResult(
-                answer=self._orchestrator.run(
-                    question,
-                    conversation_history=conversation_history,
-                    event_callback=event_callback,
-                )
+            answer = self._orchestrator.run(
+                question,
+                conversation_history=conversation_history,
+                event_callback=event_callback,
             )
+            self._session_id = self._orchestrator._session_id
+            self._trace = self._orchestrator._trace
+            return AdviceResult(answer=answer)
         system_prompt, user_prompt = self._build_advice_prompt(
             question,
             advice_type,
             include_research,
             attachment_ids,
         )
-        return AdviceResult(
-            answer=self._call_llm(
-                system_prompt,
-                user_prompt,
-                conversation_history=conversation_history,
-            )
+        answer = self._call_llm(
+            system_prompt,
+            user_prompt,
+            conversation_history=conversation_history,
         )
+        self._finish_trace(answer)
+        return AdviceResult(answer=answer)
+
+    def _finish_trace(self, answer: str) -> None:
+        """Close a single-shot (non-agentic) trace with retrieval timings and answer."""
+        if self._last_retrieval_trace:
+            self._trace.append(self._last_retrieval_trace)
+        self._trace.append(make_answer_entry(0, len(answer or "")))
 
     def weekly_review(self, journal_storage=None) -> str:
         """Generate weekly review from recent entries.
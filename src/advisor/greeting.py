@@ -82,7 +82,7 @@ def get_cached_greeting(user_id: str, cache: ContextCache) -> str | None:
 
 def cache_greeting(user_id: str, cache: ContextCache, text: str):
     key = make_greeting_cache_key(user_id)
-    cache.set(key, text)
+    cache.set(key, text, context_type="greeting", scope=user_id)
 
 
 def invalidate_greeting(user_id: str, cache: ContextCache):
@@ -88,40 +88,58 @@ class InsightStore:
 
     def save(self, insight: Insight) -> bool:
         """Save insight, skip if duplicate hash exists within TTL window."""
-        h = insight.insight_hash or insight.compute_hash()
         try:
             with wal_connect(self.db_path) as conn:
-                # Check for existing unexpired insight with same hash
-                existing = conn.execute(
-                    "SELECT id FROM insights WHERE insight_hash = ? AND (expires_at IS NULL OR expires_at > ?)",
-                    (h, datetime.now().isoformat()),
-                ).fetchone()
-                if existing:
-                    return False
+                return self._insert(conn, insight)
+        except sqlite3.Error as e:
+            logger.error("insight_save_error", error=str(e))
+            return False
 
-                conn.execute(
-                    """INSERT INTO insights
-                    (type, severity, title, detail, evidence_json, actions_json,
-                     source_url, created_at, expires_at, insight_hash)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        insight.type.value,
-                        insight.severity,
-                        insight.title,
-                        insight.detail,
-                        json.dumps(insight.evidence),
-                        json.dumps(insight.suggested_actions),
-                        insight.source_url,
-                        insight.created_at.isoformat(),
-                        insight.expires_at.isoformat() if insight.expires_at else None,
-                        h,
-                    ),
-                )
-                return True
+    def save_many(self, insights: list[Insight], conn: sqlite3.Connection | None = None) -> int:
+        """Save several insights in one transaction; returns how many were new.
+
+        Pass ``conn`` to join a transaction the caller already holds.
+        """
+        if conn is not None:
+            return sum(self._insert(conn, insight) for insight in insights)
+        try:
+            with wal_connect(self.db_path) as own:
+                return sum(self._insert(own, insight) for insight in insights)
         except sqlite3.Error as e:
             logger.error("insight_save_error", error=str(e))
+            return 0
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, insight: Insight) -> bool:
+        h = insight.insight_hash or insight.compute_hash()
+        # Check for existing unexpired insight with same hash
+        existing = conn.execute(
+            "SELECT id FROM insights WHERE insight_hash = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (h, datetime.now().isoformat()),
+        ).fetchone()
+        if existing:
             return False
 
+        conn.execute(
+            """INSERT INTO insights
+            (type, severity, title, detail, evidence_json, actions_json,
+             source_url, created_at, expires_at, insight_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                insight.type.value,
+                insight.severity,
+                insight.title,
+                insight.detail,
+                json.dumps(insight.evidence),
+                json.dumps(insight.suggested_actions),
+                insight.source_url,
+                insight.created_at.isoformat(),
+                insight.expires_at.isoformat() if insight.expires_at else None,
+                h,
+            ),
+        )
+        return True
+
     def upsert(self, insight: Insight) -> bool:
         """Insert or update insight by hash. Updates detail/actions/severity/expires if match exists."""
         h = insight.insight_hash or insight.compute_hash()
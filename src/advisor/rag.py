@@ -5,7 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from advisor.context_assembler import AskContext, ContextAssembler
+from advisor.context_assembler import (
+    DEFAULT_RETRIEVER_DEADLINE_S,
+    AskContext,
+    ContextAssembler,
+    assemble_ask_context,
+    fan_out_retrievers,
+)
 from advisor.retrievers.intel import IntelRetriever
 from advisor.retrievers.journal import JournalRetriever
 from advisor.retrievers.memory import MemoryRetriever
@@ -80,10 +86,12 @@ class RAGRetriever:
         )
 
         # Public attrs accessed directly by callers
+        self.user_id = user_id
         self.entity_store = entity_store
         self.query_analyzer = query_analyzer
         self.entity_retriever = entity_retriever
         self.reranker = reranker
+        self.last_retrieval_trace: dict | None = None
 
     # ── Cache property (engine.py mutates post-construction) ─────────
 
@@ -294,40 +302,31 @@ class RAGRetriever:
         """Facade version — calls self.get_* so facade-level mocks work."""
         cfg = rag_config or {}
 
-        enhanced = self.get_enhanced_context(query)
-        profile_ctx = self.get_profile_context(structured=cfg.get("structured_profile", False))
-
-        memory_ctx = ""
+        tasks = {
+            "enhanced": lambda: self.get_enhanced_context(query),
+            "profile": lambda: self.get_profile_context(
+                structured=cfg.get("structured_profile", False)
+            ),
+        }
         if cfg.get("inject_memory", False):
-            memory_ctx = self.get_memory_context(query)
-
-        thoughts_ctx = ""
+            tasks["memory"] = lambda: self.get_memory_context(query)
         if cfg.get("inject_recurring_thoughts", False):
-            thoughts_ctx = self.get_recurring_thoughts_context()
-
-        documents_ctx = ""
+            tasks["thoughts"] = self.get_recurring_thoughts_context
         if cfg.get("inject_documents", False) or attachment_ids:
-            documents_ctx = self.get_document_context(query, attachment_ids=attachment_ids)
-
-        repo_ctx = ""
+            tasks["documents"] = lambda: self.get_document_context(
+                query, attachment_ids=attachment_ids
+            )
         if cfg.get("inject_repo_context", True):
-            repo_ctx = self.get_repo_context(query)
-
-        curriculum_ctx = ""
+            tasks["repo"] = lambda: self.get_repo_context(query)
         if cfg.get("inject_curriculum", True):
-            curriculum_ctx = self.get_curriculum_context(query)
-
-        return AskContext(
-            journal=enhanced.journal,
-            intel=enhanced.intel,
-            profile=profile_ctx,
-            memory=memory_ctx,
-            thoughts=thoughts_ctx,
-            documents=documents_ctx,
-            entity_context=enhanced.entity_context,
-            repo_context=repo_ctx,
-            curriculum_context=curriculum_ctx,
+            tasks["curriculum"] = lambda: self.get_curriculum_context(query)
+
+        results, self.last_retrieval_trace = fan_out_retrievers(
+            tasks,
+            deadlines=cfg.get("retriever_deadlines"),
+            default_deadline=cfg.get("retriever_deadline_s", DEFAULT_RETRIEVER_DEADLINE_S),
         )
+        return assemble_ask_context(results)
 
     def get_full_context(
         self,
@@ -2,53 +2,46 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import structlog
 
 if TYPE_CHECKING:
-    from profile.storage import UserProfile
+    from profile.storage import ProfileStorage, UserProfile
 
 logger = structlog.get_logger()
 
 
 class ProfileRetriever:
-    """Loads and caches user profile for LLM context injection."""
+    """Serves the user profile for LLM context injection.
 
-    def __init__(self, profile_path: str = "~/coach/profile.yaml"):
-        self._profile_path = profile_path
-        self._cached_profile: UserProfile | None = None
-        self._cached_profile_mtime: float = 0.0
+    Parsing and both summaries are cached by :class:`ProfileStorage`, keyed on
+    the file's mtime and size, so repeat calls only stat the file.
+    """
+
+    def __init__(self, profile: str | ProfileStorage = "~/coach/profile.yaml"):
+        from profile.storage import ProfileStorage
+
+        if not isinstance(profile, ProfileStorage):
+            profile = ProfileStorage(profile)
+        self._storage = profile
 
     def load(self) -> UserProfile | None:
-        """Load profile with mtime-gated instance cache."""
-        path = Path(self._profile_path).expanduser()
-        try:
-            mtime = path.stat().st_mtime
-        except OSError:
-            return None
-        if self._cached_profile is not None and mtime == self._cached_profile_mtime:
-            return self._cached_profile
+        """Load the profile (a fresh copy from the storage cache)."""
         try:
-            from profile.storage import ProfileStorage
-
-            profile = ProfileStorage(self._profile_path).load()
+            return self._storage.load()
         except Exception as e:
             logger.debug("profile_load_failed", error=str(e))
             return None
-        self._cached_profile = profile
-        self._cached_profile_mtime = mtime
-        return profile
 
     def get_profile_context(self, structured: bool = False) -> str:
         """Return compact or multi-section XML profile summary."""
         try:
-            profile = self.load()
-            if profile:
-                if structured:
-                    return f"\n{profile.structured_summary()}\n"
-                return f"\nUSER PROFILE: {profile.summary()}\n"
+            if structured:
+                text = self._storage.structured_summary()
+                return f"\n{text}\n" if text else ""
+            text = self._storage.summary()
+            return f"\nUSER PROFILE: {text}\n" if text else ""
         except Exception as e:
             logger.debug("profile_load_skipped", error=str(e))
         return ""
@@ -3,6 +3,7 @@
 import hashlib
 import json
 import sqlite3
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -11,9 +12,14 @@ from pathlib import Path
 import structlog
 
 from db import wal_connect
+from observability import metrics
+from thread_pools import shared_pool
 
 logger = structlog.get_logger()
 
+# Detectors only read, so a run fans them out; shared across detector instances.
+DETECTOR_WORKERS = 4
+
 
 class SignalType(str, Enum):
     TOPIC_EMERGENCE = "topic_emergence"
@@ -48,6 +54,30 @@ class Signal:
         return hashlib.sha256(text.encode()).hexdigest()[:16]
 
 
+@dataclass
+class RepoState:
+    """One monitored repo with its latest snapshot and 30-day history."""
+
+    repo: object
+    latest: object | None
+    history: list = field(default_factory=list)
+
+
+@dataclass
+class DetectionSnapshot:
+    """Journal, goal and repo data read once per ``detect_all`` run.
+
+    A field is None when its source could not be read, so detectors can tell
+    "no data" from "failed to load".
+    """
+
+    entries: list[dict] | None = None  # newest 50 journal entries
+    research_entries: list[dict] | None = None
+    goals: list[dict] | None = None  # active goals, as GoalTracker.get_goals()
+    goal_progress: dict[str, dict] = field(default_factory=dict)  # str(path) -> progress
+    repos: list[RepoState] = field(default_factory=list)
+
+
 class SignalStore:
     """SQLite persistence for signals in existing intel.db."""
 
@@ -81,42 +111,60 @@ class SignalStore:
 
     def save(self, signal: Signal) -> bool:
         """Save signal, skip if duplicate hash exists and is unacknowledged."""
-        h = signal.signal_hash()
         try:
             with wal_connect(self.db_path) as conn:
-                # Check for existing unacknowledged signal with same hash
-                existing = conn.execute(
-                    "SELECT id FROM signals WHERE signal_hash = ? AND acknowledged = 0",
-                    (h,),
-                ).fetchone()
-                if existing:
-                    return False
-
-                # Delete old acknowledged version if any, then insert fresh
-                conn.execute("DELETE FROM signals WHERE signal_hash = ?", (h,))
-                conn.execute(
-                    """INSERT INTO signals
-                    (type, severity, title, detail, evidence_json, actions_json,
-                     created_at, expires_at, acknowledged, signal_hash)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        signal.type.value,
-                        signal.severity,
-                        signal.title,
-                        signal.detail,
-                        json.dumps(signal.evidence),
-                        json.dumps(signal.suggested_actions),
-                        signal.created_at.isoformat(),
-                        signal.expires_at.isoformat() if signal.expires_at else None,
-                        0,
-                        h,
-                    ),
-                )
-                return True
+                return self._insert(conn, signal)
         except sqlite3.Error as e:
             logger.error("signal_save_error", error=str(e))
             return False
 
+    def save_many(self, signals: list[Signal], conn: sqlite3.Connection | None = None) -> int:
+        """Save several signals in one transaction; returns how many were new.
+
+        Pass ``conn`` to join a transaction the caller already holds.
+        """
+        if conn is not None:
+            return sum(self._insert(conn, signal) for signal in signals)
+        try:
+            with wal_connect(self.db_path) as own:
+                return sum(self._insert(own, signal) for signal in signals)
+        except sqlite3.Error as e:
+            logger.error("signal_save_error", error=str(e))
+            return 0
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, signal: Signal) -> bool:
+        h = signal.signal_hash()
+        # Check for existing unacknowledged signal with same hash
+        existing = conn.execute(
+            "SELECT id FROM signals WHERE signal_hash = ? AND acknowledged = 0",
+            (h,),
+        ).fetchone()
+        if existing:
+            return False
+
+        # Delete old acknowledged version if any, then insert fresh
+        conn.execute("DELETE FROM signals WHERE signal_hash = ?", (h,))
+        conn.execute(
+            """INSERT INTO signals
+            (type, severity, title, detail, evidence_json, actions_json,
+             created_at, expires_at, acknowledged, signal_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                signal.type.value,
+                signal.severity,
+                signal.title,
+                signal.detail,
+                json.dumps(signal.evidence),
+                json.dumps(signal.suggested_actions),
+                signal.created_at.isoformat(),
+                signal.expires_at.isoformat() if signal.expires_at else None,
+                0,
+                h,
+            ),
+        )
+        return True
+
     def get_active(
         self,
         signal_type: str | None = None,
@@ -172,8 +220,13 @@ class SignalDetector:
         self.insight_store = InsightStore(self.db_path)
 
     def detect_all(self) -> list[Signal]:
-        """Run all detectors, persist new signals, return active list."""
-        signals = []
+        """Run all detectors, persist new signals, return active list.
+
+        Journal, goal and repo data are read once into a ``DetectionSnapshot``
+        shared by every detector; detectors run concurrently and each one's
+        wall time is recorded under ``signals.detector``.
+        """
+        snapshot = self.build_snapshot()
         detectors = [
             self._detect_goal_staleness,
             self._detect_goal_completion,
@@ -192,21 +245,86 @@ class SignalDetector:
                     self._detect_repo_ci_failure,
                 ]
             )
-        for detector in detectors:
+
+        pool = shared_pool("signal-detector", DETECTOR_WORKERS)
+        futures = [(d.__name__, pool.submit(self._run_detector, d, snapshot)) for d in detectors]
+        signals: list[Signal] = []
+        timings: dict[str, float] = {}
+        for name, future in futures:
+            found, elapsed = future.result()
+            signals.extend(found)
+            timings[name.removeprefix("_detect_")] = round(elapsed * 1000, 1)
+        logger.info("signal_detection_timings", timings_ms=timings, signals=len(signals))
+
+        self._persist(signals)
+        return sorted(signals, key=lambda s: s.severity, reverse=True)
+
+    @staticmethod
+    def _run_detector(detector, snapshot: DetectionSnapshot) -> tuple[list[Signal], float]:
+        name = detector.__name__.removeprefix("_detect_")
+        start = time.perf_counter()
+        try:
+            return detector(snapshot), time.perf_counter() - start
+        except Exception as e:
+            logger.warning("signal_detector_error", detector=detector.__name__, error=str(e))
+            return [], time.perf_counter() - start
+        finally:
+            metrics.observe(
+                "signals.detector", time.perf_counter() - start, labels={"detector": name}
+            )
+
+    def build_snapshot(self) -> DetectionSnapshot:
+        """Read the journal, goal and repo state every detector draws from."""
+        snapshot = DetectionSnapshot()
+        try:
+            snapshot.entries = self.storage.list_entries(limit=50)
+            snapshot.research_entries = self.storage.list_entries(entry_type="research", limit=50)
+        except Exception as e:
+            logger.debug("signal_snapshot_journal_failed", error=str(e))
+
+        try:
+            from advisor.goals import GoalTracker
+
+            tracker = GoalTracker(self.storage)
+            snapshot.goals = tracker.get_goals(include_inactive=False)
+            for goal in snapshot.goals:
+                if goal["status"] == "active":
+                    snapshot.goal_progress[str(goal["path"])] = tracker.get_progress(goal["path"])
+        except Exception as e:
+            logger.debug("signal_snapshot_goals_failed", error=str(e))
+
+        if self.repo_store:
             try:
-                signals.extend(detector())
+                for user_id in self.repo_store.get_all_user_ids_with_repos():
+                    for repo in self.repo_store.list_repos(user_id):
+                        snapshot.repos.append(
+                            RepoState(
+                                repo=repo,
+                                latest=self.repo_store.get_latest_snapshot(repo.id),
+                                history=self.repo_store.get_snapshot_history(repo.id, days=30),
+                            )
+                        )
             except Exception as e:
-                logger.warning("signal_detector_error", detector=detector.__name__, error=str(e))
+                logger.debug("signal_snapshot_repos_failed", error=str(e))
+        return snapshot
 
-        # Persist to both SignalStore (for scheduler/autonomous) and InsightStore
-        for s in signals:
-            self.store.save(s)
-            self._persist_as_insight(s)
-
-        return sorted(signals, key=lambda s: s.severity, reverse=True)
+    def _persist(self, signals: list[Signal]) -> None:
+        """Save signals to SignalStore (scheduler/autonomous) and InsightStore in one transaction."""
+        if not signals:
+            return
+        insights = [i for i in (self._to_insight(s) for s in signals) if i is not None]
+        try:
+            with wal_connect(self.db_path) as conn:
+                new_signals = self.store.save_many(signals, conn=conn)
+                new_insights = self.insight_store.save_many(insights, conn=conn)
+        except sqlite3.Error as e:
+            logger.error("signal_save_error", error=str(e))
+            return
+        logger.debug("signals_persisted", signals=new_signals, insights=new_insights)
 
-    def _persist_as_insight(self, signal: Signal):
-        """Convert Signal → Insight and save to InsightStore."""
+    @staticmethod
+    def _to_insight(signal: Signal):
+        """Convert Signal → Insight (None for types with no insight equivalent)."""
         from advisor.insights import Insight, InsightType
 
         type_map = {
@@ -225,9 +343,9 @@ class SignalDetector:
         }
         insight_type = type_map.get(signal.type)
         if not insight_type:
-            return
+            return None
         try:
-            insight = Insight(
+            return Insight(
                 type=insight_type,
                 severity=signal.severity,
                 title=signal.title,
@@ -237,21 +355,22 @@ class SignalDetector:
                 created_at=signal.created_at,
                 expires_at=signal.expires_at,
             )
-            self.insight_store.save(insight)
         except Exception as e:
             logger.debug("signal_to_insight_error", error=str(e))
+            return None
 
     # --- Detectors ---
 
-    def _detect_goal_staleness(self) -> list[Signal]:
+    def _detect_goal_staleness(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect goals with no check-in past threshold."""
-        try:
-            from advisor.goals import GoalTracker
+        from advisor.goals import GoalTracker
 
-            tracker = GoalTracker(self.storage)
-            stale = tracker.get_stale_goals()
-        except Exception:
+        goals = (snapshot or self.build_snapshot()).goals
+        if goals is None:
             return []
+        # Same filter as GoalTracker.get_stale_goals()
+        threshold = GoalTracker.DEFAULT_CHECK_IN_DAYS
+        stale = [g for g in goals if g.get("days_since_check", 0) >= threshold]
 
         signals = []
         for goal in stale:
@@ -272,23 +391,23 @@ class SignalDetector:
             )
         return signals
 
-    def _detect_goal_completion(self) -> list[Signal]:
+    def _detect_goal_completion(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect goals where all milestones are done but status != completed."""
-        try:
-            from advisor.goals import GoalTracker
-
-            tracker = GoalTracker(self.storage)
-            goals = tracker.get_goals(include_inactive=False)
-        except Exception:
+        snapshot = snapshot or self.build_snapshot()
+        if snapshot.goals is None:
             return []
 
         signals = []
-        for goal in goals:
+        for goal in snapshot.goals:
             if goal["status"] != "active":
                 continue
             try:
-                progress = tracker.get_progress(goal["path"])
-                if progress["total"] > 0 and progress["completed"] == progress["total"]:
+                progress = snapshot.goal_progress.get(str(goal["path"]))
+                if (
+                    progress
+                    and progress["total"] > 0
+                    and progress["completed"] == progress["total"]
+                ):
                     signals.append(
                         Signal(
                             type=SignalType.GOAL_COMPLETE_CANDIDATE,
@@ -306,11 +425,10 @@ class SignalDetector:
                 continue
         return signals
 
-    def _detect_journal_gap(self) -> list[Signal]:
+    def _detect_journal_gap(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect no journal entries in 7+ days."""
-        try:
-            entries = self.storage.list_entries(limit=5)
-        except Exception:
+        entries = (snapshot or self.build_snapshot()).entries
+        if entries is None:
             return []
 
         if not entries:
@@ -354,7 +472,7 @@ class SignalDetector:
             ]
         return []
 
-    def _detect_topic_emergence(self) -> list[Signal]:
+    def _detect_topic_emergence(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect emerging topics (high growth rate) not in active goals."""
         try:
             from pathlib import Path as P
@@ -378,12 +496,8 @@ class SignalDetector:
             return []
 
         # Get active goal titles for filtering
-        try:
-            from advisor.goals import GoalTracker
-
-            goal_titles = {g["title"].lower() for g in GoalTracker(self.storage).get_goals()}
-        except Exception:
-            goal_titles = set()
+        goals = (snapshot or self.build_snapshot()).goals or []
+        goal_titles = {g["title"].lower() for g in goals}
 
         signals = []
         for topic in emerging[:3]:
@@ -407,7 +521,7 @@ class SignalDetector:
             )
         return signals
 
-    def _detect_deadlines(self) -> list[Signal]:
+    def _detect_deadlines(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect upcoming events/CFPs within 14 days."""
         try:
             from advisor.events import get_upcoming_events
@@ -446,11 +560,11 @@ class SignalDetector:
                     pass
         return signals
 
-    def _detect_research_triggers(self) -> list[Signal]:
+    def _detect_research_triggers(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect topics mentioned 3+ times in 7 days with no existing research."""
-        try:
-            entries = self.storage.list_entries(limit=50)
-        except Exception:
+        snapshot = snapshot or self.build_snapshot()
+        entries = snapshot.entries
+        if entries is None:
             return []
 
         threshold = self.agent_config.get("topic_mention_threshold", 3)
@@ -466,9 +580,8 @@ class SignalDetector:
                 tag_counts[tag_lower] = tag_counts.get(tag_lower, 0) + 1
 
         # Check for existing research on these topics
-        research_entries = self.storage.list_entries(entry_type="research", limit=50)
         researched_topics = set()
-        for r in research_entries:
+        for r in snapshot.research_entries or []:
             researched_topics.add(r.get("title", "").lower())
             for t in r.get("tags", []):
                 researched_topics.add(t.lower())
@@ -492,12 +605,13 @@ class SignalDetector:
                 )
         return signals[:3]
 
-    def _detect_recurring_blockers(self) -> list[Signal]:
+    def _detect_recurring_blockers(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect same negative keywords appearing in 3+ entries within 14 days."""
+        entries = (snapshot or self.build_snapshot()).entries
+        if entries is None:
+            return []
         try:
             from journal.sentiment import analyze_sentiment
-
-            entries = self.storage.list_entries(limit=50)
         except Exception:
             return []
 
@@ -562,132 +676,130 @@ class SignalDetector:
     def _week_bucket(self) -> str:
         return datetime.now().strftime("%Y-W%W")
 
-    def _detect_repo_stale(self) -> list[Signal]:
+    def _detect_repo_stale(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect monitored repos with no commits past stale threshold."""
         if not self.repo_store:
             return []
         threshold_days = self.gh_config.get("stale_threshold_days", 14)
         signals = []
-        for user_id in self.repo_store.get_all_user_ids_with_repos():
-            for repo in self.repo_store.list_repos(user_id):
-                snapshot = self.repo_store.get_latest_snapshot(repo.id)
-                if not snapshot:
-                    continue
-                if snapshot.pushed_at:
-                    age = (datetime.now() - snapshot.pushed_at.replace(tzinfo=None)).days
-                    if age < threshold_days:
-                        continue
-                elif snapshot.commits_30d > 0:
+        for state in (snapshot or self.build_snapshot()).repos:
+            repo, latest = state.repo, state.latest
+            if not latest:
+                continue
+            if latest.pushed_at:
+                age = (datetime.now() - latest.pushed_at.replace(tzinfo=None)).days
+                if age < threshold_days:
                     continue
-                severity = 6 if repo.linked_goal_path else 4
-                wb = self._week_bucket()
-                signals.append(
-                    Signal(
-                        type=SignalType.REPO_STALE,
-                        severity=severity,
-                        title=f"repo_stale|{repo.repo_full_name}|{wb}",
-                        detail=f"No commits in {threshold_days}+ days on {repo.repo_full_name}.",
-                        suggested_actions=[
-                            f"Check on {repo.repo_full_name}",
-                            "Update linked goal if project is paused",
-                        ],
-                        evidence=[repo.repo_full_name],
-                        expires_at=datetime.now() + timedelta(days=7),
-                    )
+            elif latest.commits_30d > 0:
+                continue
+            severity = 6 if repo.linked_goal_path else 4
+            wb = self._week_bucket()
+            signals.append(
+                Signal(
+                    type=SignalType.REPO_STALE,
+                    severity=severity,
+                    title=f"repo_stale|{repo.repo_full_name}|{wb}",
+                    detail=f"No commits in {threshold_days}+ days on {repo.repo_full_name}.",
+                    suggested_actions=[
+                        f"Check on {repo.repo_full_name}",
+                        "Update linked goal if project is paused",
+                    ],
+                    evidence=[repo.repo_full_name],
+                    expires_at=datetime.now() + timedelta(days=7),
                 )
+            )
         return signals
 
-    def _detect_repo_velocity_change(self) -> list[Signal]:
+    def _detect_repo_velocity_change(
+        self, snapshot: DetectionSnapshot | None = None
+    ) -> list[Signal]:
         """Detect >50% change in commit velocity vs 4-week baseline."""
         if not self.repo_store:
             return []
         threshold = self.gh_config.get("velocity_change_threshold", 0.5)
         signals = []
-        for user_id in self.repo_store.get_all_user_ids_with_repos():
-            for repo in self.repo_store.list_repos(user_id):
-                snapshot = self.repo_store.get_latest_snapshot(repo.id)
-                if not snapshot or len(snapshot.weekly_commits) < 8:
-                    continue
-                wc = snapshot.weekly_commits
-                recent_mean = sum(wc[-4:]) / 4.0
-                prior_mean = sum(wc[-8:-4]) / 4.0
-                baseline = max(prior_mean, 1.0)
-                delta = (recent_mean - prior_mean) / baseline
-                if abs(delta) < threshold:
-                    continue
-                direction = "increased" if delta > 0 else "decreased"
-                severity = 5 if delta > 0 else (7 if repo.linked_goal_path else 5)
-                wb = self._week_bucket()
-                signals.append(
-                    Signal(
-                        type=SignalType.REPO_VELOCITY_CHANGE,
-                        severity=severity,
-                        title=f"repo_velocity|{repo.repo_full_name}|{wb}",
-                        detail=f"Commit velocity {direction} by {abs(delta):.0%} on {repo.repo_full_name} (recent {recent_mean:.1f}/wk vs prior {prior_mean:.1f}/wk).",
-                        suggested_actions=[
-                            f"Review activity on {repo.repo_full_name}",
-                        ],
-                        evidence=[repo.repo_full_name, f"delta={delta:+.0%}"],
-                        expires_at=datetime.now() + timedelta(days=7),
-                    )
+        for state in (snapshot or self.build_snapshot()).repos:
+            repo, latest = state.repo, state.latest
+            if not latest or len(latest.weekly_commits) < 8:
+                continue
+            wc = latest.weekly_commits
+            recent_mean = sum(wc[-4:]) / 4.0
+            prior_mean = sum(wc[-8:-4]) / 4.0
+            baseline = max(prior_mean, 1.0)
+            delta = (recent_mean - prior_mean) / baseline
+            if abs(delta) < threshold:
+                continue
+            direction = "increased" if delta > 0 else "decreased"
+            severity = 5 if delta > 0 else (7 if repo.linked_goal_path else 5)
+            wb = self._week_bucket()
+            signals.append(
+                Signal(
+                    type=SignalType.REPO_VELOCITY_CHANGE,
+                    severity=severity,
+                    title=f"repo_velocity|{repo.repo_full_name}|{wb}",
+                    detail=f"Commit velocity {direction} by {abs(delta):.0%} on {repo.repo_full_name} (recent {recent_mean:.1f}/wk vs prior {prior_mean:.1f}/wk).",
+                    suggested_actions=[
+                        f"Review activity on {repo.repo_full_name}",
+                    ],
+                    evidence=[repo.repo_full_name, f"delta={delta:+.0%}"],
+                    expires_at=datetime.now() + timedelta(days=7),
                 )
+            )
         return signals
 
-    def _detect_repo_issue_spike(self) -> list[Signal]:
+    def _detect_repo_issue_spike(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
         """Detect >2x open issues vs previous snapshot."""
         if not self.repo_store:
             return []
         signals = []
-        for user_id in self.repo_store.get_all_user_ids_with_repos():
-            for repo in self.repo_store.list_repos(user_id):
-                history = self.repo_store.get_snapshot_history(repo.id, days=30)
-                if len(history) < 2:
-                    continue
-                current = history[0]
-                previous = history[1]
-                if previous.open_issues == 0:
-                    continue
-                if current.open_issues > previous.open_issues * 2:
-                    wb = self._week_bucket()
-                    signals.append(
-                        Signal(
-                            type=SignalType.REPO_ISSUE_SPIKE,
-                            severity=5,
-                            title=f"repo_issue_spike|{repo.repo_full_name}|{wb}",
-                            detail=f"Open issues spiked from {previous.open_issues} to {current.open_issues} on {repo.repo_full_name}.",
-                            suggested_actions=[
-                                f"Triage open issues on {repo.repo_full_name}",
-                            ],
-                            evidence=[repo.repo_full_name],
-                            expires_at=datetime.now() + timedelta(days=7),
-                        )
-                    )
-        return signals
-
-    def _detect_repo_ci_failure(self) -> list[Signal]:
-        """Detect CI failure on latest snapshot."""
-        if not self.repo_store:
-            return []
-        signals = []
-        for user_id in self.repo_store.get_all_user_ids_with_repos():
-            for repo in self.repo_store.list_repos(user_id):
-                snapshot = self.repo_store.get_latest_snapshot(repo.id)
-                if not snapshot or snapshot.ci_status != "failure":
-                    continue
-                severity = 7 if repo.linked_goal_path else 5
+        for state in (snapshot or self.build_snapshot()).repos:
+            repo, history = state.repo, state.history
+            if len(history) < 2:
+                continue
+            current = history[0]
+            previous = history[1]
+            if previous.open_issues == 0:
+                continue
+            if current.open_issues > previous.open_issues * 2:
                 wb = self._week_bucket()
                 signals.append(
                     Signal(
-                        type=SignalType.REPO_CI_FAILURE,
-                        severity=severity,
-                        title=f"repo_ci_failure|{repo.repo_full_name}|{wb}",
-                        detail=f"CI is failing on {repo.repo_full_name}.",
+                        type=SignalType.REPO_ISSUE_SPIKE,
+                        severity=5,
+                        title=f"repo_issue_spike|{repo.repo_full_name}|{wb}",
+                        detail=f"Open issues spiked from {previous.open_issues} to {current.open_issues} on {repo.repo_full_name}.",
                         suggested_actions=[
-                            f"Fix CI on {repo.repo_full_name}",
-                            "Check latest workflow run for errors",
+                            f"Triage open issues on {repo.repo_full_name}",
                         ],
                         evidence=[repo.repo_full_name],
                         expires_at=datetime.now() + timedelta(days=7),
                     )
                 )
         return signals
+
+    def _detect_repo_ci_failure(self, snapshot: DetectionSnapshot | None = None) -> list[Signal]:
+        """Detect CI failure on latest snapshot."""
+        if not self.repo_store:
+            return []
+        signals = []
+        for state in (snapshot or self.build_snapshot()).repos:
+            repo, latest = state.repo, state.latest
+            if not latest or latest.ci_status != "failure":
+                continue
+            severity = 7 if repo.linked_goal_path else 5
+            wb = self._week_bucket()
+            signals.append(
+                Signal(
+                    type=SignalType.REPO_CI_FAILURE,
+                    severity=severity,
+                    title=f"repo_ci_failure|{repo.repo_full_name}|{wb}",
+                    detail=f"CI is failing on {repo.repo_full_name}.",
+                    suggested_actions=[
+                        f"Fix CI on {repo.repo_full_name}",
+                        "Check latest workflow run for errors",
+                    ],
+                    evidence=[repo.repo_full_name],
+                    expires_at=datetime.now() + timedelta(days=7),
+                )
+            )
+        return signals
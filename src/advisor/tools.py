@@ -73,6 +73,7 @@ def _register_journal_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=journal_search,
         check_fn=search_check,
+        parallel_safe=True,
     )
 
     def journal_list(args: dict) -> dict:
@@ -123,6 +124,7 @@ def _register_journal_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=journal_list,
         check_fn=storage_check,
+        parallel_safe=True,
     )
 
     def journal_read(args: dict) -> dict:
@@ -161,6 +163,7 @@ def _register_journal_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=journal_read,
         check_fn=storage_check,
+        parallel_safe=True,
     )
 
     def journal_create(args: dict) -> dict:
@@ -263,6 +266,7 @@ def _register_goal_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=goals_list,
         check_fn=check_fn,
+        parallel_safe=True,
     )
 
     def goals_add(args: dict) -> dict:
@@ -437,6 +441,7 @@ def _register_goal_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=goal_next_steps,
         check_fn=check_fn,
+        parallel_safe=True,
     )
 
 
@@ -489,6 +494,7 @@ def _register_curriculum_tools(registry: ToolRegistry, components: dict) -> None
         },
         handler=curriculum_list_guides,
         check_fn=check_fn,
+        parallel_safe=True,
     )
 
     def curriculum_generate_guide(args: dict) -> dict:
@@ -677,6 +683,7 @@ def _register_intel_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=intel_search,
         check_fn=check_fn,
+        parallel_safe=True,
     )
 
     def intel_get_recent(args: dict) -> dict:
@@ -718,6 +725,7 @@ def _register_intel_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=intel_get_recent,
         check_fn=check_fn,
+        parallel_safe=True,
     )
 
 
@@ -755,6 +763,7 @@ def _register_entity_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=intel_entity_search,
         check_fn=lambda: components.get("entity_store") is not None,
+        parallel_safe=True,
     )
 
 
@@ -780,6 +789,7 @@ def _register_rss_tools(registry: ToolRegistry, components: dict) -> None:
         schema={"type": "object", "properties": {}, "required": []},
         handler=intel_list_rss_feeds,
         check_fn=rss_check,
+        parallel_safe=True,
     )
 
     def intel_add_rss_feed(args: dict) -> dict:
@@ -895,6 +905,7 @@ def _register_web_search_tools(registry: ToolRegistry) -> None:
         },
         handler=web_search,
         check_fn=web_search_check,
+        parallel_safe=True,
     )
 
 
@@ -952,6 +963,7 @@ def _register_misc_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=recommendations_list,
         check_fn=lambda: components.get("recommendations_dir") is not None,
+        parallel_safe=True,
     )
 
     def profile_get(args: dict) -> dict:
@@ -961,7 +973,7 @@ def _register_misc_tools(registry: ToolRegistry, components: dict) -> None:
         profile = ps.load()
         if not profile:
             return {"exists": False, "profile": None}
-        return {"exists": True, "summary": profile.summary(), "is_stale": profile.is_stale()}
+        return {"exists": True, "summary": ps.summary(), "is_stale": profile.is_stale()}
 
     registry.register(
         name="profile_get",
@@ -969,6 +981,7 @@ def _register_misc_tools(registry: ToolRegistry, components: dict) -> None:
         description="Get the user's professional profile including skills, interests, career stage, and aspirations.",
         schema={"type": "object", "properties": {}, "required": []},
         handler=profile_get,
+        parallel_safe=True,
     )
 
     def get_context(args: dict) -> dict:
@@ -994,4 +1007,5 @@ def _register_misc_tools(registry: ToolRegistry, components: dict) -> None:
         },
         handler=get_context,
         check_fn=lambda: components.get("rag") is not None,
+        parallel_safe=True,
     )
@@ -64,6 +64,23 @@ def make_tool_done_entry(
     }
 
 
+def make_retrieval_entry(
+    latency_ms: dict[str, float],
+    timed_out: list[str],
+    failed: list[str],
+    total_ms: float,
+) -> dict:
+    return {
+        "v": _VERSION,
+        "type": "context_retrieval",
+        "ts": time.time(),
+        "latency_ms": latency_ms,
+        "timed_out": timed_out,
+        "failed": failed,
+        "total_ms": total_ms,
+    }
+
+
 def make_nudge_entry(used_count: int, min_required: int) -> dict:
     return {
         "v": _VERSION,
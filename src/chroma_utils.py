@@ -132,11 +132,22 @@ class LocalCollection:
     def count(self) -> int:
         return len(self._records)
 
-    def get(self, *, ids: list[str] | None = None, include: list[str] | None = None) -> dict:
+    def get(
+        self,
+        *,
+        ids: list[str] | None = None,
+        where: dict | None = None,
+        include: list[str] | None = None,
+    ) -> dict:
         requested_ids = (
             [str(item_id) for item_id in ids] if ids is not None else list(self._records.keys())
         )
-        record_ids = [item_id for item_id in requested_ids if item_id in self._records]
+        record_ids = [
+            item_id
+            for item_id in requested_ids
+            if item_id in self._records
+            and self._matches_where(self._records[item_id].get("metadata", {}), where)
+        ]
         include = include or ["documents", "metadatas"]
 
         result = {"ids": record_ids}
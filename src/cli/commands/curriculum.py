@@ -141,3 +141,59 @@ def audit_curriculum(content_path: Path, output_format: str):
             f"- {guide.guide_id} ({guide.total_word_count} words)"
             + (f" -> programs: {', '.join(guide.program_ids)}" if guide.program_ids else "")
         )
+
+
+def _resolve_curriculum_db(db_path: Path | None, user_id: str | None) -> Path:
+    if db_path is not None:
+        return db_path
+    if user_id:
+        from storage_paths import get_user_paths
+
+        return Path(get_user_paths(user_id)["data_dir"]) / "curriculum.db"
+
+    from cli.config import get_paths, load_config
+    from storage_paths import get_coach_home
+
+    data_dir = get_paths(load_config()).get("data_dir", get_coach_home())
+    return Path(data_dir) / "curriculum.db"
+
+
+@curriculum.command("snapshot")
+@click.option(
+    "--db",
+    "db_path",
+    default=None,
+    type=click.Path(path_type=Path),
+    help="Curriculum database (defaults to the configured data dir).",
+)
+@click.option("--user", "user_id", default=None, help="Web user whose database to check.")
+@click.option(
+    "--verify-only",
+    is_flag=True,
+    help="Report snapshot drift without rebuilding.",
+)
+def snapshot_curriculum(db_path: Path | None, user_id: str | None, verify_only: bool):
+    """Rebuild the per-guide progress snapshot and verify it against live data."""
+    from curriculum.store import CurriculumStore
+
+    path = _resolve_curriculum_db(db_path, user_id)
+    if not path.exists():
+        console.print(f"[red]No curriculum database at {path}[/]")
+        raise SystemExit(1)
+    store = CurriculumStore(path)
+
+    if not verify_only:
+        rows = store.rebuild_progress_snapshot()
+        console.print(f"Rebuilt {rows} progress snapshot rows in {path}.")
+
+    mismatches = store.verify_progress_snapshot()
+    if not mismatches:
+        console.print("[green]Progress snapshot matches live progress data.[/]")
+        return
+    console.print(f"[red]{len(mismatches)} snapshot mismatches:[/]")
+    for mismatch in mismatches[:50]:
+        console.print(
+            f"- {mismatch['user_id']} {mismatch['guide_id']} {mismatch['field']}: "
+            f"snapshot={mismatch['snapshot']!r} live={mismatch['live']!r}"
+        )
+    raise SystemExit(1)
@@ -13,7 +13,7 @@ console = Console()
 
 @click.group("eval")
 def eval_cmd():
-    """Run retrieval, response, intel, radar, and grounding evaluations."""
+    """Run retrieval, response, intel, radar, grounding, and perf evaluations."""
 
 
 @eval_cmd.command("run")
@@ -359,3 +359,67 @@ def grounding(dataset, as_json):
                 console.print(f"  {key}: {val:.2f}")
             else:
                 console.print(f"  {key}: {val}")
+
+
+@eval_cmd.command("perf")
+@click.option(
+    "--scale",
+    type=click.Choice(["1k", "10k", "100k"]),
+    default="1k",
+    help="Synthetic corpus size (journals, intel items and facts each)",
+)
+@click.option("--iterations", default=50, help="Timed calls per operation")
+@click.option("--seed", default=0, help="Corpus generator seed")
+@click.option("--out", type=click.Path(), default=None, help="Write the JSON baseline here")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True),
+    default=None,
+    help="Compare against a previous baseline; exits 1 on regression",
+)
+@click.option("--tolerance", default=0.25, help="Allowed p95 growth vs baseline (0.25 = 25%)")
+@click.option("--json", "as_json", is_flag=True, help="Output raw JSON")
+def perf(scale, iterations, seed, out, baseline, tolerance, as_json):
+    """Benchmark retrieval latency on a synthetic corpus (no LLM, no API key)."""
+    from eval.perf import (
+        SCALES,
+        compare_to_baseline,
+        load_baseline,
+        run_perf_eval,
+        write_baseline,
+    )
+
+    with console.status(f"Building {scale} corpus and timing retrieval..."):
+        report = run_perf_eval(scale=SCALES[scale], iterations=iterations, seed=seed)
+
+    regressions = []
+    if baseline:
+        regressions = compare_to_baseline(report, load_baseline(baseline), tolerance=tolerance)
+    if out:
+        write_baseline(report, out)
+
+    if as_json:
+        console.print(json_mod.dumps(report.to_dict(), indent=2))
+    else:
+        table = Table(title=f"Latency ({scale}, {iterations} calls)", show_header=True)
+        table.add_column("Operation")
+        table.add_column("p50 ms", justify="right")
+        table.add_column("p95 ms", justify="right")
+        table.add_column("p99 ms", justify="right")
+        for name, t in report.timings.items():
+            table.add_row(name, f"{t['p50_ms']:.1f}", f"{t['p95_ms']:.1f}", f"{t['p99_ms']:.1f}")
+        console.print(table)
+        setup = ", ".join(f"{k} {v:.1f}s" for k, v in report.setup_seconds.items())
+        console.print(f"  Setup: {setup}")
+        if out:
+            console.print(f"  Baseline written to {out}")
+
+    if regressions:
+        for r in regressions:
+            console.print(
+                f"[red]REGRESSION[/] {r['operation']}: {r['metric']} "
+                f"{r['baseline_ms']:.1f} -> {r['current_ms']:.1f} ms (x{r['ratio']})"
+            )
+        sys.exit(1)
+    elif baseline:
+        console.print("\n[green]PASS[/] (within tolerance of baseline)")
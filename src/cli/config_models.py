@@ -7,6 +7,7 @@ from pathlib import Path
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 VALID_LLM_PROVIDERS = {"auto", "claude", "openai", "gemini"}
+VALID_RATE_LIMIT_BACKENDS = {"memory", "sqlite"}
 
 
 class LLMConfig(BaseModel):
@@ -104,6 +105,9 @@ class RAGConfig(BaseModel):
     inject_memory: bool = False
     inject_recurring_thoughts: bool = False
     xml_delimiters: bool = False
+    rerank: bool = False  # cross-encoder rerank of intel context (stewardme[reranking])
+    rerank_threads: int | None = None  # CPU threads for the reranker model
+    rerank_budget_ms: int = 500  # past this, keep the pre-rerank order
 
     @field_validator("journal_weight")
     @classmethod
@@ -221,6 +225,17 @@ class WebRateLimitConfig(BaseModel):
     enabled: bool = True
     llm_per_minute: int = Field(default=20, ge=1)
     general_per_minute: int = Field(default=120, ge=1)
+    backend: str = "memory"
+
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        v_lower = v.lower()
+        if v_lower not in VALID_RATE_LIMIT_BACKENDS:
+            raise ValueError(
+                f"Invalid rate limit backend: {v}. Must be one of {VALID_RATE_LIMIT_BACKENDS}"
+            )
+        return v_lower
 
 
 class WebConfig(BaseModel):
@@ -330,6 +345,10 @@ class GitHubMonitoringConfig(BaseModel):
     velocity_change_threshold: float = 0.5
     api_base_url: str = "https://api.github.com"
     request_timeout_s: int = 15
+    poll_workers: int = Field(default=4, ge=1)  # users polled concurrently
+    poll_user_timeout_s: int = Field(default=120, ge=1)  # per-user deadline for one poll
+    # Skip users whose last poll succeeded this recently; default is half the cron cadence
+    poll_min_interval_s: int | None = Field(default=None, ge=0)
 
     @field_validator("poll_cron")
     @classmethod
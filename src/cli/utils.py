@@ -84,6 +84,15 @@ def get_components(skip_advisor: bool = False):
         intel_storage, intel_embeddings if intel_embeddings.is_available else None
     )
 
+    reranker = None
+    if config_model.rag.rerank:
+        from services.reranker import get_reranker
+
+        reranker = get_reranker(
+            threads=config_model.rag.rerank_threads,
+            latency_budget=config_model.rag.rerank_budget_ms / 1000,
+        )
+
     profile_path = get_profile_path(config, storage_paths=storage_paths)
     rag = RAGRetriever(
         search,
@@ -92,6 +101,7 @@ def get_components(skip_advisor: bool = False):
         max_context_chars=config_model.rag.max_context_chars,
         journal_weight=config_model.rag.journal_weight,
         profile_path=profile_path,
+        reranker=reranker,
     )
 
     advisor = None
@@ -1,6 +1,8 @@
 """Lazy component initialization for MCP server."""
 
 import contextvars
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 import structlog
@@ -21,6 +23,8 @@ logger = structlog.get_logger()
 _components_var: contextvars.ContextVar[dict | None] = contextvars.ContextVar(
     "mcp_components", default=None
 )
+# Tool calls run on worker threads, so store construction is serialized.
+_stores_lock = threading.Lock()
 
 
 def set_components(components: dict) -> contextvars.Token:
@@ -83,36 +87,47 @@ def get_storage_paths() -> StoragePaths:
     return storage_paths
 
 
+def _cached_store(name: str, factory: Callable[[StoragePaths], object]):
+    """Build a store once per component set and reuse it across tool calls."""
+    components = get_components()
+    with _stores_lock:
+        stores = components.setdefault("mcp_stores", {})
+        store = stores.get(name)
+        if store is None:
+            store = stores[name] = factory(get_storage_paths())
+        return store
+
+
 def get_profile_storage():
-    """Construct the profile store for MCP tools."""
-    return create_profile_storage(get_storage_paths())
+    """Return the profile store for MCP tools."""
+    return _cached_store("profile", create_profile_storage)
 
 
 def get_memory_store():
-    """Construct the single-user memory store for MCP tools."""
-    return create_memory_store(get_storage_paths())
+    """Return the single-user memory store for MCP tools."""
+    return _cached_store("memory", create_memory_store)
 
 
 def get_thread_store():
-    """Construct the single-user thread store for MCP tools."""
-    return create_thread_store(get_storage_paths())
+    """Return the single-user thread store for MCP tools."""
+    return _cached_store("threads", create_thread_store)
 
 
 def get_watchlist_store():
-    """Construct the single-user watchlist store for MCP tools."""
-    return create_watchlist_store(get_storage_paths())
+    """Return the single-user watchlist store for MCP tools."""
+    return _cached_store("watchlist", create_watchlist_store)
 
 
 def get_intel_storage():
-    """Construct the shared intel store for MCP tools."""
-    return create_intel_storage(get_storage_paths())
+    """Return the shared intel store for MCP tools."""
+    return _cached_store("intel", create_intel_storage)
 
 
 def get_recommendation_storage():
-    """Construct the recommendation store for MCP tools."""
-    return create_recommendation_storage(get_storage_paths())
+    """Return the recommendation store for MCP tools."""
+    return _cached_store("recommendations", create_recommendation_storage)
 
 
 def get_insight_store():
-    """Construct the insight store for MCP tools."""
-    return create_insight_store(get_storage_paths())
+    """Return the insight store for MCP tools."""
+    return _cached_store("insights", create_insight_store)
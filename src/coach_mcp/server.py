@@ -1,5 +1,9 @@
 """MCP server entry point — stdio transport, tool routing by prefix."""
 
+import asyncio
+import contextvars
+import json
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -10,9 +14,24 @@ from mcp.types import TextContent, Tool
 
 from coach_mcp.bootstrap import get_components
 from coach_mcp.tools import build_tool_registry
+from observability import metrics
+from thread_pools import shared_pool
 
 logger = structlog.get_logger()
 
+# Tools hit SQLite, Chroma and LLMs; they run on a bounded pool so the stdio
+# event loop keeps reading requests and observing cancellations.
+TOOL_WORKERS = 4
+DEFAULT_TOOL_TIMEOUT = 120.0
+
+
+def _result_status(text: str) -> str:
+    try:
+        parsed = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return "ok"
+    return "error" if isinstance(parsed, dict) and "error" in parsed else "ok"
+
 
 @asynccontextmanager
 async def _lifespan(server: Server) -> AsyncIterator[dict]:
@@ -33,7 +52,34 @@ async def list_tools() -> list[Tool]:
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     registry = app.request_context.lifespan_context["registry"]
-    text = registry.execute(name, arguments)
+    timeout = registry.get_timeout(name, DEFAULT_TOOL_TIMEOUT)
+    # Carry the bootstrap ContextVar (components) into the worker thread
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    status = "cancelled"
+    try:
+        text = await asyncio.wait_for(
+            loop.run_in_executor(
+                shared_pool("mcp-tool", TOOL_WORKERS),
+                context.run,
+                registry.execute,
+                name,
+                arguments,
+            ),
+            timeout=timeout,
+        )
+        status = _result_status(text)
+    except TimeoutError:
+        # A call still queued is dropped; one already running finishes in the
+        # background and its result is discarded.
+        status = "timeout"
+        logger.error("mcp_tool_timeout", tool=name, timeout=timeout)
+        text = json.dumps({"error": f"{name}: timed out after {timeout}s"})
+    finally:
+        labels = {"tool": name, "status": status}
+        metrics.observe("mcp_tool_latency", time.perf_counter() - start, labels=labels)
+        metrics.counter("mcp_tool_calls", labels=labels)
     return [TextContent(type="text", text=text)]
 
 
@@ -43,8 +89,6 @@ async def run():
 
 
 def main():
-    import asyncio
-
     asyncio.run(run())
 
 
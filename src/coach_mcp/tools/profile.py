@@ -20,7 +20,7 @@ def _profile_update_field(args: dict) -> dict:
 
     try:
         profile, _updated_fields = update_profile_fields(ps, {field: value})
-        return {"success": True, "profile": serialize_profile(profile)}
+        return {"success": True, "profile": serialize_profile(profile, ps.summary())}
     except ValueError as e:
         return {"success": False, "error": str(e)}
 
@@ -11,14 +11,19 @@ the deck opens in any Anki version.
 import hashlib
 import io
 import json
+import os
 import re
+import shutil
 import sqlite3
 import tempfile
 import time
 import zipfile
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
 
 import structlog
 from bs4 import BeautifulSoup
@@ -140,116 +145,211 @@ def _render_cloze(text: str, ordinal: int) -> tuple[str, str]:
 
 # --- Import -----------------------------------------------------------------
 
+COPY_CHUNK_BYTES = 1024 * 1024
+IMPORT_CHUNK_SIZE = 500
 
-def parse_apkg(data: bytes) -> AnkiImportResult:
-    """Parse an .apkg archive into normalized cards.
+ApkgSource = str | Path | BinaryIO
+ProgressCallback = Callable[[int, int], None]
+
+
+def _select_member(names: set[str]) -> str:
+    for candidate in ("collection.anki21", "collection.anki2"):
+        if candidate in names:
+            return candidate
+    if "collection.anki21b" in names:
+        raise AnkiFormatError(
+            "This deck uses Anki's newest export format. Re-export it from Anki "
+            'with "Support older Anki versions" enabled and try again.'
+        )
+    raise AnkiFormatError("No Anki collection found inside the archive.")
+
+
+class ApkgReader:
+    """Streaming reader over an .apkg archive.
+
+    Accepts a path or a seekable binary file (e.g. a spooled upload). The
+    collection member is copied to a temp file in ``COPY_CHUNK_BYTES`` pieces
+    and cards come from a lazy cursor over cards joined to their notes, so
+    memory is bounded by the caller's chunk size rather than the deck or its
+    media. ``skipped_empty``/``skipped_media``/``imported`` fill in as cards
+    are consumed.
 
     Raises:
         AnkiFormatError: if the archive or its collection cannot be read.
     """
-    try:
-        archive = zipfile.ZipFile(io.BytesIO(data))
-        names = set(archive.namelist())
-    except zipfile.BadZipFile as exc:
-        raise AnkiFormatError("Not a valid .apkg file (corrupt or not a zip archive).") from exc
 
-    member = None
-    for candidate in ("collection.anki21", "collection.anki2"):
-        if candidate in names:
-            member = candidate
-            break
-    if member is None:
-        if "collection.anki21b" in names:
-            raise AnkiFormatError(
-                "This deck uses Anki's newest export format. Re-export it from Anki "
-                'with "Support older Anki versions" enabled and try again.'
-            )
-        raise AnkiFormatError("No Anki collection found inside the archive.")
+    def __init__(self, source: ApkgSource):
+        self._source = source
+        self._archive: zipfile.ZipFile | None = None
+        self._db_path: Path | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._crt = 0
+        self._models: dict = {}
+        self._decks: dict = {}
+        self.deck_name = "Imported deck"
+        self.total_cards = 0
+        self.imported = 0
+        self.skipped_empty = 0
+        self.skipped_media = 0
+
+    def __enter__(self) -> "ApkgReader":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def open(self) -> None:
+        try:
+            self._open()
+        except BaseException:
+            self.close()
+            raise
 
-    with tempfile.NamedTemporaryFile(suffix=".anki2") as tmp:
-        tmp.write(archive.read(member))
-        tmp.flush()
-        conn = sqlite3.connect(tmp.name)
+    def _open(self) -> None:
         try:
-            return _parse_collection(conn)
+            self._archive = zipfile.ZipFile(self._source)
+            member = _select_member(set(self._archive.namelist()))
+            fd, name = tempfile.mkstemp(suffix=".anki2")
+            self._db_path = Path(name)
+            with os.fdopen(fd, "wb") as out, self._archive.open(member) as src:
+                shutil.copyfileobj(src, out, COPY_CHUNK_BYTES)
+        except (zipfile.BadZipFile, zlib.error, EOFError) as exc:
+            raise AnkiFormatError("Not a valid .apkg file (corrupt or not a zip archive).") from exc
+        # The archive (and any media in it) is no longer needed
+        self._archive.close()
+        self._archive = None
+
+        self._conn = sqlite3.connect(str(self._db_path))
+        try:
+            self._load_metadata()
         except sqlite3.DatabaseError as exc:
             raise AnkiFormatError(f"Could not read the Anki collection: {exc}") from exc
-        finally:
-            conn.close()
 
+    def _load_metadata(self) -> None:
+        row = self._conn.execute("SELECT crt, models, decks FROM col LIMIT 1").fetchone()
+        if row is None:
+            raise AnkiFormatError("The Anki collection is empty.")
+        crt, models_json, decks_json = row
+        try:
+            self._models = json.loads(models_json or "{}")
+            self._decks = json.loads(decks_json or "{}")
+        except json.JSONDecodeError as exc:
+            raise AnkiFormatError("The Anki collection metadata is malformed.") from exc
+        self._crt = crt
+
+        # The deck holding most cards names the import; known before streaming
+        # so callers can create the target deck up front.
+        deck_counts = self._conn.execute(
+            "SELECT c.did, COUNT(*) FROM cards c JOIN notes n ON n.id = c.nid "
+            "GROUP BY c.did ORDER BY COUNT(*) DESC, c.did LIMIT 1"
+        ).fetchall()
+        if deck_counts:
+            name = _deck_name(self._decks, deck_counts[0][0])
+            self.deck_name = name.split("::")[0].strip() or self.deck_name
+        self.total_cards = self._conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        if self._db_path is not None:
+            self._db_path.unlink(missing_ok=True)
+            self._db_path = None
+
+    def iter_cards(self) -> Iterator[AnkiCard]:
+        """Yield normalized cards in collection order, skipping empty fronts."""
+        if self._conn is None:
+            raise RuntimeError("ApkgReader is not open")
+        cursor = self._conn.execute(
+            "SELECT c.did, c.ord, c.type, c.due, c.ivl, c.factor, c.reps, "
+            "n.guid, n.mid, n.flds, n.tags "
+            "FROM cards c JOIN notes n ON n.id = c.nid ORDER BY c.id"
+        )
+        try:
+            for row in cursor:
+                card = self._to_card(*row)
+                if card is not None:
+                    self.imported += 1
+                    yield card
+        except sqlite3.DatabaseError as exc:
+            raise AnkiFormatError(f"Could not read the Anki collection: {exc}") from exc
 
-def _parse_collection(conn: sqlite3.Connection) -> AnkiImportResult:
-    row = conn.execute("SELECT crt, models, decks FROM col LIMIT 1").fetchone()
-    if row is None:
-        raise AnkiFormatError("The Anki collection is empty.")
-    crt, models_json, decks_json = row
-    try:
-        models = json.loads(models_json or "{}")
-        decks = json.loads(decks_json or "{}")
-    except json.JSONDecodeError as exc:
-        raise AnkiFormatError("The Anki collection metadata is malformed.") from exc
-
-    notes: dict[int, tuple[int, list[str], list[str], str]] = {}
-    for nid, guid, mid, flds, tags in conn.execute("SELECT id, guid, mid, flds, tags FROM notes"):
-        notes[nid] = (mid, flds.split(FIELD_SEPARATOR), tags.split(), guid)
-
-    deck_card_counts: dict[int, int] = {}
-    cards: list[AnkiCard] = []
-    skipped_empty = 0
-    skipped_media = 0
-
-    card_rows = conn.execute(
-        "SELECT nid, did, ord, type, due, ivl, factor, reps FROM cards ORDER BY id"
-    ).fetchall()
-    for nid, did, ordinal, ctype, due, ivl, factor, reps in card_rows:
-        note = notes.get(nid)
-        if note is None:
-            continue
-        mid, field_values, tags, guid = note
-        model = models.get(str(mid), {})
-        front_html, back_html = _render_note(model, field_values, ordinal)
+    def iter_chunks(
+        self,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
+    ) -> Iterator[list[AnkiCard]]:
+        """Yield cards in lists of at most ``chunk_size``.
+
+        ``progress(processed, total)`` is called after each chunk, counting
+        skipped cards as processed.
+        """
+        chunk: list[AnkiCard] = []
+        for card in self.iter_cards():
+            chunk.append(card)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+                if progress:
+                    progress(self.imported + self.skipped_empty, self.total_cards)
+        if chunk:
+            yield chunk
+        if progress:
+            progress(self.total_cards, self.total_cards)
+
+    def _to_card(self, did, ordinal, ctype, due, ivl, factor, reps, guid, mid, flds, tags):
+        model = self._models.get(str(mid), {})
+        front_html, back_html = _render_note(model, flds.split(FIELD_SEPARATOR), ordinal)
 
         front, media_front = html_to_text(front_html)
         back, media_back = html_to_text(back_html)
-        skipped_media += media_front + media_back
+        self.skipped_media += media_front + media_back
         if not front.strip():
-            skipped_empty += 1
-            continue
+            self.skipped_empty += 1
+            return None
 
-        deck_card_counts[did] = deck_card_counts.get(did, 0) + 1
-        card_tags = list(tags)
-        deck_name = _deck_name(decks, did)
+        card_tags = tags.split()
+        deck_name = _deck_name(self._decks, did)
         if deck_name and "::" in deck_name:
             card_tags.append(deck_name.split("::")[-1].strip().replace(" ", "_"))
 
-        cards.append(
-            AnkiCard(
-                front=front,
-                back=back,
-                tags=card_tags,
-                guid=guid,
-                easiness_factor=max(MIN_EASINESS, factor / 1000) if factor > 0 else 2.5,
-                interval_days=max(1, ivl),
-                repetitions=max(0, reps),
-                due_at=(
-                    datetime.fromtimestamp(crt) + timedelta(days=due)
-                    if ctype == CARD_TYPE_REVIEW
-                    else None
-                ),
-            )
+        return AnkiCard(
+            front=front,
+            back=back,
+            tags=card_tags,
+            guid=guid,
+            easiness_factor=max(MIN_EASINESS, factor / 1000) if factor > 0 else 2.5,
+            interval_days=max(1, ivl),
+            repetitions=max(0, reps),
+            due_at=(
+                datetime.fromtimestamp(self._crt) + timedelta(days=due)
+                if ctype == CARD_TYPE_REVIEW
+                else None
+            ),
         )
 
-    deck_name = "Imported deck"
-    if deck_card_counts:
-        main_did = max(deck_card_counts, key=lambda did: deck_card_counts[did])
-        deck_name = _deck_name(decks, main_did) or deck_name
-        deck_name = deck_name.split("::")[0].strip() or "Imported deck"
 
+def parse_apkg(data: bytes | ApkgSource) -> AnkiImportResult:
+    """Parse an .apkg archive into normalized cards held in memory.
+
+    Convenience wrapper over :class:`ApkgReader` for small decks; imports
+    should stream with ``ApkgReader.iter_chunks`` instead.
+
+    Raises:
+        AnkiFormatError: if the archive or its collection cannot be read.
+    """
+    source = io.BytesIO(data) if isinstance(data, bytes | bytearray) else data
+    with ApkgReader(source) as reader:
+        cards = list(reader.iter_cards())
     return AnkiImportResult(
-        deck_name=deck_name,
+        deck_name=reader.deck_name,
         cards=cards,
-        skipped_empty=skipped_empty,
-        skipped_media=skipped_media,
+        skipped_empty=reader.skipped_empty,
+        skipped_media=reader.skipped_media,
     )
 
 
@@ -358,8 +458,24 @@ def _text_to_html(text: str) -> str:
     return escape(text).replace("\n", "<br>")
 
 
-def build_apkg(deck_name: str, cards: list[AnkiCard]) -> bytes:
-    """Build an .apkg archive containing the given cards as new cards."""
+EXPORT_CHUNK_SIZE = 500
+
+
+def build_apkg(deck_name: str, cards: Iterable[AnkiCard]) -> bytes:
+    """Build an .apkg archive in memory (see :func:`write_apkg` for large decks)."""
+    buffer = io.BytesIO()
+    write_apkg(buffer, deck_name, cards)
+    return buffer.getvalue()
+
+
+def write_apkg(dest: ApkgSource, deck_name: str, cards: Iterable[AnkiCard]) -> int:
+    """Write an .apkg archive containing the given cards as new cards.
+
+    ``cards`` may be any iterable (a generator keeps memory flat): rows are
+    inserted into the temp collection ``EXPORT_CHUNK_SIZE`` at a time and the
+    collection is streamed from disk into the zip written to ``dest``.
+    Returns the number of cards written.
+    """
     now = int(time.time())
     now_ms = now * 1000
     model_id = now_ms
@@ -503,63 +619,74 @@ def build_apkg(deck_name: str, cards: list[AnkiCard]) -> bytes:
                     "{}",
                 ),
             )
+            note_rows: list[tuple] = []
+            card_rows: list[tuple] = []
+            count = 0
             for index, card in enumerate(cards):
-                note_id = now_ms + 2 + index * 2
-                card_id = note_id + 1
-                front_html = _text_to_html(card.front)
-                back_html = _text_to_html(card.back)
-                fields = f"{front_html}{FIELD_SEPARATOR}{back_html}"
-                guid = card.guid or _guid_for(f"{deck_name}:{card.front}:{card.back}")
-                tags = " ".join(tag.replace(" ", "_") for tag in card.tags)
-                if tags:
-                    tags = f" {tags} "
-                conn.execute(
-                    "INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        note_id,
-                        guid,
-                        model_id,
-                        now,
-                        -1,
-                        tags,
-                        fields,
-                        card.front,
-                        _checksum(front_html),
-                        0,
-                        "",
-                    ),
-                )
-                conn.execute(
-                    "INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        card_id,
-                        note_id,
-                        deck_id,
-                        0,
-                        now,
-                        -1,
-                        0,
-                        0,
-                        index,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        0,
-                        "",
-                    ),
+                note_row, card_row = _export_rows(
+                    card, index, deck_name, model_id, deck_id, now, now_ms
                 )
+                note_rows.append(note_row)
+                card_rows.append(card_row)
+                count += 1
+                if len(note_rows) >= EXPORT_CHUNK_SIZE:
+                    _insert_export_rows(conn, note_rows, card_rows)
+                    note_rows, card_rows = [], []
+            _insert_export_rows(conn, note_rows, card_rows)
             conn.commit()
         finally:
             conn.close()
 
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        with zipfile.ZipFile(dest, "w", zipfile.ZIP_DEFLATED) as archive:
             archive.write(db_path, "collection.anki2")
             archive.writestr("media", "{}")
-        return buffer.getvalue()
+        return count
     finally:
         db_path.unlink(missing_ok=True)
+
+
+def _export_rows(
+    card: AnkiCard,
+    index: int,
+    deck_name: str,
+    model_id: int,
+    deck_id: int,
+    now: int,
+    now_ms: int,
+) -> tuple[tuple, tuple]:
+    note_id = now_ms + 2 + index * 2
+    card_id = note_id + 1
+    front_html = _text_to_html(card.front)
+    back_html = _text_to_html(card.back)
+    fields = f"{front_html}{FIELD_SEPARATOR}{back_html}"
+    guid = card.guid or _guid_for(f"{deck_name}:{card.front}:{card.back}")
+    tags = " ".join(tag.replace(" ", "_") for tag in card.tags)
+    if tags:
+        tags = f" {tags} "
+    note_row = (
+        note_id,
+        guid,
+        model_id,
+        now,
+        -1,
+        tags,
+        fields,
+        card.front,
+        _checksum(front_html),
+        0,
+        "",
+    )
+    card_row = (card_id, note_id, deck_id, 0, now, -1, 0, 0, index, 0, 0, 0, 0, 0, 0, 0, 0, "")
+    return note_row, card_row
+
+
+def _insert_export_rows(
+    conn: sqlite3.Connection, note_rows: list[tuple], card_rows: list[tuple]
+) -> None:
+    if not note_rows:
+        return
+    conn.executemany("INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", note_rows)
+    conn.executemany(
+        "INSERT INTO cards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        card_rows,
+    )
@@ -239,7 +239,7 @@ def generate_guide_for_user(
     )
 
     scanner = curriculum_routes._get_scanner(user_id, store)
-    curriculum_routes._sync_catalog(store, user_id=user_id, scanner=scanner)
+    curriculum_routes._sync_catalog(store, user_id=user_id)
     program_lookup = curriculum_routes._build_program_lookup(scanner.get_learning_programs())
     created_guide = store.get_guide(artifact["guide_id"], user_id=user_id)
     if not created_guide:
@@ -316,7 +316,7 @@ def extend_guide_for_user(
         )
     )
 
-    curriculum_routes._sync_catalog(store, user_id=user_id, scanner=scanner)
+    curriculum_routes._sync_catalog(store, user_id=user_id)
     program_lookup = curriculum_routes._build_program_lookup(scanner.get_learning_programs())
     created_guide = store.get_guide(artifact["guide_id"], user_id=user_id)
     if not created_guide:
@@ -0,0 +1,264 @@
+"""Process-wide curriculum catalog snapshots.
+
+Scanning the curriculum (parsing every chapter, the manifest and the skill-tree
+layout) is far more expensive than serving it, and the built-in content is the
+same for every user. Shared content directories are therefore scanned once per
+process into a :class:`CatalogSnapshot`; each user's own active directory is
+layered on top as a small overlay that reuses the shared manifest.
+
+Freshness is checked by stat-ing only the directories and metadata files seen
+at build time: adding, removing or renaming a guide or chapter bumps its parent
+directory's mtime, and manifest/``guide.yaml`` edits are stamped directly.
+In-place chapter edits do not touch directory mtimes, so a full content
+fingerprint is recomputed at most every ``FULL_RECHECK_S`` seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import structlog
+
+from .models import Chapter, Guide
+from .scanner import (
+    _CATALOG_METADATA_FILENAMES,
+    CurriculumScanner,
+    _compute_catalog_fingerprint,
+    _guide_order,
+    build_tree_layout,
+)
+
+logger = structlog.get_logger()
+
+FULL_RECHECK_S = 300.0
+MAX_OVERLAYS = 256
+
+_MISSING = -1
+
+
+def build_program_lookup(programs: list[dict]) -> dict[str, list[dict]]:
+    """Map guide_id -> curated learning programs containing that guide."""
+    lookup: dict[str, list[dict]] = {}
+    for program in programs:
+        summary = {
+            "id": program["id"],
+            "title": program["title"],
+            "audience": program.get("audience", ""),
+            "description": program.get("description", ""),
+            "color": program.get("color", "#6b7280"),
+            "outcomes": list(program.get("outcomes", [])),
+            "guide_ids": list(program.get("guide_ids", [])),
+            "applied_module_ids": list(program.get("applied_module_ids", [])),
+        }
+        for guide_id in [*summary["guide_ids"], *summary["applied_module_ids"]]:
+            lookup.setdefault(guide_id, []).append(summary)
+    return lookup
+
+
+def _stat_mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return _MISSING
+
+
+def _collect_stamps(content_dirs: list[Path]) -> dict[str, int]:
+    """Record mtimes of every directory and metadata file under ``content_dirs``."""
+    stamps: dict[str, int] = {}
+    for root in content_dirs:
+        stamps[str(root)] = _stat_mtime(str(root))
+        if stamps[str(root)] == _MISSING:
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            stamps[dirpath] = _stat_mtime(dirpath)
+            for name in filenames:
+                if name in _CATALOG_METADATA_FILENAMES:
+                    path = os.path.join(dirpath, name)
+                    stamps[path] = _stat_mtime(path)
+    return stamps
+
+
+def _stamps_changed(stamps: dict[str, int]) -> bool:
+    return any(_stat_mtime(path) != mtime for path, mtime in stamps.items())
+
+
+@dataclass
+class CatalogSnapshot:
+    """Parsed catalog for a set of content directories, ready to serve."""
+
+    content_dirs: tuple[Path, ...]
+    scanner: CurriculumScanner
+    fingerprint: str
+    guides: list[Guide]
+    chapters: list[Chapter]
+    tree_layout: dict[str, dict]
+    program_lookup: dict[str, list[dict]]
+    # Change detection covers only the dirs this snapshot scanned itself;
+    # an overlay's shared base is validated separately.
+    watch_dirs: tuple[Path, ...] = field(default=(), repr=False)
+    watch_fingerprint: str = field(default="", repr=False)
+    stamps: dict[str, int] = field(default_factory=dict, repr=False)
+    checked_at: float = field(default=0.0, repr=False)
+
+    def get_track_metadata(self) -> dict[str, dict]:
+        return self.scanner.get_track_metadata()
+
+    def get_guide_aliases(self) -> dict[str, str]:
+        return self.scanner.get_guide_aliases()
+
+    def get_learning_programs(self) -> list[dict]:
+        return self.scanner.get_learning_programs()
+
+    def is_stale(self) -> bool:
+        """Cheap change check; falls back to a full fingerprint periodically."""
+        if _stamps_changed(self.stamps):
+            return True
+        if time.monotonic() - self.checked_at < FULL_RECHECK_S:
+            return False
+        self.checked_at = time.monotonic()
+        return _compute_catalog_fingerprint(list(self.watch_dirs)) != self.watch_fingerprint
+
+
+def _build_snapshot(
+    scanner: CurriculumScanner,
+    guides: list[Guide],
+    chapters: list[Chapter],
+    fingerprint: str,
+    watch_dirs: list[Path],
+    watch_fingerprint: str,
+    stamps: dict[str, int],
+) -> CatalogSnapshot:
+    return CatalogSnapshot(
+        content_dirs=tuple(scanner.content_dirs),
+        scanner=scanner,
+        fingerprint=fingerprint,
+        guides=guides,
+        chapters=chapters,
+        tree_layout=build_tree_layout(scanner._skill_tree),
+        program_lookup=build_program_lookup(scanner.get_learning_programs()),
+        watch_dirs=tuple(watch_dirs),
+        watch_fingerprint=watch_fingerprint,
+        stamps=stamps,
+        checked_at=time.monotonic(),
+    )
+
+
+def _scan_shared(content_dirs: list[Path]) -> CatalogSnapshot:
+    # Stamp before scanning so edits made mid-scan show up as stale next time
+    stamps = _collect_stamps(content_dirs)
+    scanner = CurriculumScanner(content_dirs)
+    guides, chapters = scanner.scan()
+    fingerprint = _compute_catalog_fingerprint(content_dirs)
+    logger.info("curriculum.catalog_built", dirs=len(content_dirs), guides=len(guides))
+    return _build_snapshot(
+        scanner, guides, chapters, fingerprint, content_dirs, fingerprint, stamps
+    )
+
+
+def _scan_overlay(shared: CatalogSnapshot, overlay_dir: Path) -> CatalogSnapshot:
+    """Merge one user's active directory over the shared snapshot.
+
+    Mirrors ``CurriculumScanner.scan``: shared guides win on id collisions and
+    the merged list keeps the scanner's ordering.
+    """
+    stamps = _collect_stamps([overlay_dir])
+    content_dirs = [*shared.content_dirs, overlay_dir]
+    if shared.scanner.has_manifest_data():
+        scanner = shared.scanner.with_content_dirs(content_dirs)
+        guides = list(shared.guides)
+        chapters = list(shared.chapters)
+        if overlay_dir.exists():
+            seen = {guide.id for guide in guides}
+            user_guides, user_chapters = shared.scanner.with_content_dirs([overlay_dir]).scan()
+            kept = {guide.id for guide in user_guides if guide.id not in seen}
+            guides.extend(guide for guide in user_guides if guide.id in kept)
+            chapters.extend(chapter for chapter in user_chapters if chapter.guide_id in kept)
+            guides.sort(key=lambda g: (_guide_order(g.id), g.title))
+    else:
+        # No shared manifest: the overlay may supply one, so scan everything
+        scanner = CurriculumScanner(content_dirs)
+        guides, chapters = scanner.scan()
+
+    overlay_fingerprint = _compute_catalog_fingerprint([overlay_dir])
+    digest = hashlib.sha256(shared.fingerprint.encode("utf-8"))
+    digest.update(overlay_fingerprint.encode("utf-8"))
+    return _build_snapshot(
+        scanner,
+        guides,
+        chapters,
+        digest.hexdigest(),
+        [overlay_dir],
+        overlay_fingerprint,
+        stamps,
+    )
+
+
+class CatalogRegistry:
+    """Shared snapshots keyed by content-dir set, plus per-user overlays."""
+
+    def __init__(self, max_overlays: int = MAX_OVERLAYS):
+        self._shared: dict[tuple[str, ...], CatalogSnapshot] = {}
+        self._overlays: OrderedDict[tuple[tuple[str, ...], str], tuple[str, CatalogSnapshot]] = (
+            OrderedDict()
+        )
+        self._max_overlays = max_overlays
+        self._lock = threading.Lock()
+
+    def get(self, content_dirs: list[Path], overlay_dir: Path | None = None) -> CatalogSnapshot:
+        """Return the catalog for ``content_dirs`` (+ optional user overlay)."""
+        dirs = [Path(d).expanduser().resolve() for d in content_dirs]
+        key = tuple(str(d) for d in dirs)
+        with self._lock:
+            shared = self._shared.get(key)
+            if shared is None or shared.is_stale():
+                shared = _scan_shared(dirs)
+                self._shared[key] = shared
+            if overlay_dir is None:
+                return shared
+
+            overlay_path = Path(overlay_dir).expanduser().resolve()
+            overlay_key = (key, str(overlay_path))
+            cached = self._overlays.get(overlay_key)
+            if cached is not None:
+                base_fingerprint, overlay = cached
+                if base_fingerprint == shared.fingerprint and not overlay.is_stale():
+                    self._overlays.move_to_end(overlay_key)
+                    return overlay
+
+            overlay = _scan_overlay(shared, overlay_path)
+            self._overlays[overlay_key] = (shared.fingerprint, overlay)
+            self._overlays.move_to_end(overlay_key)
+            while len(self._overlays) > self._max_overlays:
+                self._overlays.popitem(last=False)
+            return overlay
+
+    def invalidate(self, overlay_dir: Path | None = None) -> None:
+        """Drop one user's overlay, or every snapshot when ``overlay_dir`` is None."""
+        with self._lock:
+            if overlay_dir is None:
+                self._shared.clear()
+                self._overlays.clear()
+                return
+            overlay_path = str(Path(overlay_dir).expanduser().resolve())
+            for key in [k for k in self._overlays if k[1] == overlay_path]:
+                del self._overlays[key]
+
+
+_registry = CatalogRegistry()
+
+
+def get_catalog(content_dirs: list[Path], overlay_dir: Path | None = None) -> CatalogSnapshot:
+    """Return the process-wide catalog snapshot for these content directories."""
+    return _registry.get(content_dirs, overlay_dir)
+
+
+def invalidate_catalog(overlay_dir: Path | None = None) -> None:
+    """Force the next :func:`get_catalog` call to rescan."""
+    _registry.invalidate(overlay_dir)
@@ -2,6 +2,7 @@
 
 import json
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -249,6 +250,32 @@ class FlashcardStore:
             ).fetchall()
             return [self._row_to_card(dict(row)) for row in rows]
 
+    def iter_card_pages(
+        self, user_id: str, deck_id: str, page_size: int = 500
+    ) -> Iterator[list[Flashcard]]:
+        """Yield a deck's cards in ``list_cards`` order, ``page_size`` at a time.
+
+        Each page resumes after the last (created_at, id) seen instead of using
+        an OFFSET, so a large export never rescans the pages before it.
+        """
+        after: tuple[str, str] | None = None
+        while True:
+            query = "SELECT * FROM flashcards WHERE user_id = ? AND deck_id = ?"
+            params: list[object] = [user_id, deck_id]
+            if after is not None:
+                query += " AND (created_at > ? OR (created_at = ? AND id > ?))"
+                params += [after[0], after[0], after[1]]
+            query += " ORDER BY created_at ASC, id ASC LIMIT ?"
+            params.append(page_size)
+            with wal_connect(self.db_path, row_factory=True) as conn:
+                rows = [dict(row) for row in conn.execute(query, tuple(params)).fetchall()]
+            if not rows:
+                return
+            yield [self._row_to_card(row) for row in rows]
+            if len(rows) < page_size:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
     # --- Review ---
 
     def get_due_cards(
@@ -0,0 +1,201 @@
+"""Denormalized per-user, per-guide progress snapshot for CurriculumStore.
+
+``user_guide_progress`` holds one row per (user, guide) with enrollment,
+completed-chapter and review aggregates so the skill tree, track list and
+stats read a single indexed table instead of re-aggregating progress and
+review rows per request. Every store mutation refreshes the affected row
+inside its own transaction; :func:`verify` diffs the table against a live
+recomputation and :func:`rebuild` repairs it.
+
+Due-review counts depend on the current time, so they stay live queries.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime
+
+FIELDS = (
+    "enrolled",
+    "guide_completed_at",
+    "chapters_completed",
+    "reviews_done",
+    "easiness_sum",
+    "mastery_avg_easiness",
+)
+
+
+def create_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS user_guide_progress (
+            user_id TEXT NOT NULL,
+            guide_id TEXT NOT NULL,
+            enrolled INTEGER NOT NULL DEFAULT 0,
+            guide_completed_at TEXT,
+            chapters_completed INTEGER NOT NULL DEFAULT 0,
+            reviews_done INTEGER NOT NULL DEFAULT 0,
+            easiness_sum REAL NOT NULL DEFAULT 0.0,
+            mastery_avg_easiness REAL,
+            updated_at TEXT,
+            PRIMARY KEY (user_id, guide_id)
+        )
+    """)
+
+
+def live_rows(
+    conn: sqlite3.Connection,
+    user_id: str | None = None,
+    guide_id: str | None = None,
+) -> dict[tuple[str, str], dict]:
+    """Compute snapshot rows from the live enrollment, progress and review tables."""
+    clauses: list[str] = []
+    params: list[str] = []
+    if user_id is not None:
+        clauses.append("user_id=?")
+        params.append(user_id)
+    if guide_id is not None:
+        clauses.append("guide_id=?")
+        params.append(guide_id)
+    scope = "".join(f" AND {clause}" for clause in clauses)
+
+    rows: dict[tuple[str, str], dict] = {}
+
+    def entry(uid: str, gid: str) -> dict:
+        return rows.setdefault(
+            (uid, gid),
+            {
+                "enrolled": 0,
+                "guide_completed_at": None,
+                "chapters_completed": 0,
+                "reviews_done": 0,
+                "easiness_sum": 0.0,
+                "mastery_avg_easiness": None,
+            },
+        )
+
+    for uid, gid, completed_at in conn.execute(
+        f"SELECT user_id, guide_id, completed_at FROM user_guide_enrollment WHERE 1=1{scope}",
+        params,
+    ):
+        row = entry(uid, gid)
+        row["enrolled"] = 1
+        row["guide_completed_at"] = completed_at
+    for uid, gid, count in conn.execute(
+        "SELECT user_id, guide_id, COUNT(*) FROM user_chapter_progress "
+        f"WHERE status='completed'{scope} GROUP BY user_id, guide_id",
+        params,
+    ):
+        entry(uid, gid)["chapters_completed"] = count
+    # Mastery ignores pre-reading items; overall review stats do not
+    for uid, gid, count, easiness_sum, mastery_avg in conn.execute(
+        "SELECT user_id, guide_id, COUNT(*), SUM(easiness_factor), "
+        "AVG(CASE WHEN item_type != 'pre_reading' THEN easiness_factor END) "
+        f"FROM review_items WHERE last_reviewed IS NOT NULL{scope} "
+        "GROUP BY user_id, guide_id",
+        params,
+    ):
+        row = entry(uid, gid)
+        row["reviews_done"] = count
+        row["easiness_sum"] = easiness_sum or 0.0
+        row["mastery_avg_easiness"] = mastery_avg
+    return rows
+
+
+def _write(conn: sqlite3.Connection, rows: dict[tuple[str, str], dict]) -> None:
+    now = datetime.utcnow().isoformat()
+    columns = ", ".join(FIELDS)
+    placeholders = ", ".join("?" for _ in FIELDS)
+    updates = ", ".join(f"{name}=excluded.{name}" for name in FIELDS)
+    conn.executemany(
+        f"""INSERT INTO user_guide_progress (user_id, guide_id, {columns}, updated_at)
+            VALUES (?, ?, {placeholders}, ?)
+            ON CONFLICT(user_id, guide_id) DO UPDATE SET {updates},
+            updated_at=excluded.updated_at""",
+        [(uid, gid, *(row[name] for name in FIELDS), now) for (uid, gid), row in rows.items()],
+    )
+
+
+def refresh_guide(conn: sqlite3.Connection, user_id: str, guide_id: str) -> None:
+    """Recompute one (user, guide) row inside the caller's transaction."""
+    rows = live_rows(conn, user_id, guide_id)
+    if rows:
+        _write(conn, rows)
+    else:
+        conn.execute(
+            "DELETE FROM user_guide_progress WHERE user_id=? AND guide_id=?",
+            (user_id, guide_id),
+        )
+
+
+def refresh_guides(
+    conn: sqlite3.Connection, user_ids: Iterable[str], guide_ids: Iterable[str]
+) -> None:
+    """Recompute every (user, guide) pair in ``user_ids`` x ``guide_ids``."""
+    guide_ids = tuple(guide_ids)
+    for user_id in user_ids:
+        for guide_id in guide_ids:
+            refresh_guide(conn, user_id, guide_id)
+
+
+def guide_user_ids(conn: sqlite3.Connection, guide_id: str) -> list[str]:
+    """Users with enrollment, progress or review rows under ``guide_id``."""
+    chapter_prefix = f"{guide_id}/%"
+    rows = conn.execute(
+        """SELECT user_id FROM user_guide_enrollment WHERE guide_id=?
+           UNION SELECT user_id FROM user_chapter_progress
+                 WHERE guide_id=? OR chapter_id LIKE ?
+           UNION SELECT user_id FROM review_items WHERE guide_id=? OR chapter_id LIKE ?""",
+        (guide_id, guide_id, chapter_prefix, guide_id, chapter_prefix),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def rebuild(conn: sqlite3.Connection, user_id: str | None = None) -> int:
+    """Replace snapshot rows (all users, or one) with a live recomputation."""
+    rows = live_rows(conn, user_id)
+    if user_id is None:
+        conn.execute("DELETE FROM user_guide_progress")
+    else:
+        conn.execute("DELETE FROM user_guide_progress WHERE user_id=?", (user_id,))
+    _write(conn, rows)
+    return len(rows)
+
+
+def _same(expected: object, actual: object) -> bool:
+    if isinstance(expected, float) and isinstance(actual, float):
+        # SUM/AVG can differ in the last bits depending on row order
+        return abs(expected - actual) <= 1e-9
+    return expected == actual
+
+
+def verify(conn: sqlite3.Connection, user_id: str | None = None) -> list[dict]:
+    """Return per-field differences between the snapshot and live data."""
+    live = live_rows(conn, user_id)
+    query = f"SELECT user_id, guide_id, {', '.join(FIELDS)} FROM user_guide_progress"
+    params: tuple = ()
+    if user_id is not None:
+        query += " WHERE user_id=?"
+        params = (user_id,)
+    stored = {
+        (row[0], row[1]): dict(zip(FIELDS, row[2:], strict=True))
+        for row in conn.execute(query, params).fetchall()
+    }
+
+    mismatches: list[dict] = []
+    for key in sorted(set(live) | set(stored)):
+        live_row = live.get(key, {})
+        stored_row = stored.get(key, {})
+        for name in FIELDS:
+            expected, actual = live_row.get(name), stored_row.get(name)
+            if not _same(expected, actual):
+                mismatches.append(
+                    {
+                        "user_id": key[0],
+                        "guide_id": key[1],
+                        "field": name,
+                        "snapshot": actual,
+                        "live": expected,
+                    }
+                )
+    return mismatches
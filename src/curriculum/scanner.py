@@ -1,5 +1,6 @@
 """Scan content directories to discover guides and chapters."""
 
+import copy
 import hashlib
 import re
 from pathlib import Path
@@ -436,6 +437,21 @@ class CurriculumScanner:
                 self._guide_titles = guide_titles
                 break
 
+    def has_manifest_data(self) -> bool:
+        """Whether a content dir supplied a manifest (tree, programs, aliases or titles)."""
+        return bool(
+            self._skill_tree is not None
+            or self._learning_programs
+            or self._guide_aliases
+            or self._guide_titles
+        )
+
+    def with_content_dirs(self, content_dirs: list[Path]) -> "CurriculumScanner":
+        """Copy of this scanner over ``content_dirs`` reusing the parsed manifest."""
+        clone = copy.copy(self)
+        clone.content_dirs = [Path(d).expanduser().resolve() for d in content_dirs]
+        return clone
+
     def get_track_metadata(self) -> dict[str, dict]:
         """Return track id -> {title, description, color} from manifest."""
         if self._skill_tree is None:
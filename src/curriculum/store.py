@@ -10,6 +10,7 @@ import structlog
 
 from db import ensure_schema_version, wal_connect
 
+from . import progress_snapshot
 from .models import (
     Chapter,
     Guide,
@@ -20,7 +21,7 @@ from .spaced_repetition import sm2_update
 
 logger = structlog.get_logger()
 
-SCHEMA_VERSION = 8
+SCHEMA_VERSION = 9
 
 
 class CurriculumStore:
@@ -142,6 +143,7 @@ class CurriculumStore:
                 CREATE INDEX IF NOT EXISTS idx_review_chapter
                 ON review_items(user_id, chapter_id)
             """)
+            progress_snapshot.create_table(conn)
             # --- v1 → v2 migration: add item_type column ---
             current_ver = conn.execute("PRAGMA user_version").fetchone()[0]
             if current_ver < 2:
@@ -211,6 +213,10 @@ class CurriculumStore:
 
                 create_flashcard_tables(conn)
 
+            # --- v8 -> v9 migration: backfill the per-guide progress snapshot ---
+            if current_ver < 9:
+                progress_snapshot.rebuild(conn)
+
             ensure_schema_version(conn, SCHEMA_VERSION)
             conn.commit()
 
@@ -414,15 +420,18 @@ class CurriculumStore:
                 if alias_id == canonical_id:
                     continue
                 stats["aliases_processed"] += 1
-                stats["enrollments_merged"] += self._merge_alias_enrollments(
-                    conn, alias_id, canonical_id
-                )
-                stats["progress_rows_migrated"] += self._merge_alias_progress(
-                    conn, alias_id, canonical_id
-                )
-                stats["review_items_migrated"] += self._migrate_alias_review_items(
-                    conn, alias_id, canonical_id
+                affected_users = progress_snapshot.guide_user_ids(conn, alias_id)
+                moved = (
+                    self._merge_alias_enrollments(conn, alias_id, canonical_id),
+                    self._merge_alias_progress(conn, alias_id, canonical_id),
+                    self._migrate_alias_review_items(conn, alias_id, canonical_id),
                 )
+                stats["enrollments_merged"] += moved[0]
+                stats["progress_rows_migrated"] += moved[1]
+                stats["review_items_migrated"] += moved[2]
+                if any(moved):
+                    # Only the users whose rows moved have a stale snapshot
+                    progress_snapshot.refresh_guides(conn, affected_users, (alias_id, canonical_id))
                 stats["chapters_deleted"] += conn.execute(
                     "DELETE FROM chapters WHERE guide_id=?",
                     (alias_id,),
@@ -825,6 +834,7 @@ class CurriculumStore:
                    ON CONFLICT(user_id, guide_id) DO UPDATE SET linked_goal_id=excluded.linked_goal_id""",
                 (user_id, guide_id, linked_goal_id),
             )
+            progress_snapshot.refresh_guide(conn, user_id, guide_id)
             conn.commit()
 
     def is_enrolled(self, user_id: str, guide_id: str) -> bool:
@@ -932,11 +942,14 @@ class CurriculumStore:
                         now,
                     ),
                 )
-            conn.commit()
 
             # Check if guide completed
             if status == "completed":
                 self._check_guide_completion(conn, user_id, guide_id)
+            progress_snapshot.refresh_guide(conn, user_id, guide_id)
+            if existing and dict(existing)["guide_id"] != guide_id:
+                progress_snapshot.refresh_guide(conn, user_id, dict(existing)["guide_id"])
+            conn.commit()
 
             row = conn.execute(
                 "SELECT * FROM user_chapter_progress WHERE user_id=? AND chapter_id=?",
@@ -964,7 +977,6 @@ class CurriculumStore:
                 "UPDATE user_guide_enrollment SET completed_at=? WHERE user_id=? AND guide_id=?",
                 (datetime.utcnow().isoformat(), user_id, guide_id),
             )
-            conn.commit()
 
     def get_chapter_progress(self, user_id: str, chapter_id: str) -> dict | None:
         with wal_connect(self.db_path, row_factory=True) as conn:
@@ -993,6 +1005,7 @@ class CurriculumStore:
 
     def add_review_items(self, items: list[ReviewItem]) -> None:
         with wal_connect(self.db_path) as conn:
+            touched: set[tuple[str, str]] = set()
             for item in items:
                 item_id = item.id or uuid.uuid4().hex[:16]
                 conn.execute(
@@ -1024,6 +1037,10 @@ class CurriculumStore:
                         else datetime.utcnow().isoformat(),
                     ),
                 )
+                if item.last_reviewed:
+                    touched.add((item.user_id, item.guide_id))
+            for user_id, guide_id in touched:
+                progress_snapshot.refresh_guide(conn, user_id, guide_id)
             conn.commit()
 
     def get_due_reviews(
@@ -1206,6 +1223,7 @@ class CurriculumStore:
                     review_id,
                 ),
             )
+            progress_snapshot.refresh_guide(conn, item["user_id"], item["guide_id"])
             conn.commit()
 
             updated = conn.execute("SELECT * FROM review_items WHERE id=?", (review_id,)).fetchone()
@@ -1229,6 +1247,13 @@ class CurriculumStore:
     ) -> int:
         """Delete cached review items for a chapter, optionally filtered by item type."""
         with wal_connect(self.db_path) as conn:
+            guide_ids = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT guide_id FROM review_items WHERE user_id=? AND chapter_id=?",
+                    (user_id, chapter_id),
+                )
+            ]
             if item_types:
                 normalized = tuple(item_types)
                 placeholders = ",".join("?" for _ in normalized)
@@ -1242,6 +1267,8 @@ class CurriculumStore:
                     "DELETE FROM review_items WHERE user_id=? AND chapter_id=?",
                     (user_id, chapter_id),
                 )
+            for guide_id in guide_ids:
+                progress_snapshot.refresh_guide(conn, user_id, guide_id)
             conn.commit()
             return result.rowcount
 
@@ -1285,17 +1312,20 @@ class CurriculumStore:
 
     def get_stats(self, user_id: str) -> LearningStats:
         with wal_connect(self.db_path, row_factory=True) as conn:
-            # Batch 1: enrollment counts (1 query instead of 2)
-            enroll_row = conn.execute(
-                "SELECT COUNT(*) as enrolled, "
-                "SUM(CASE WHEN uge.completed_at IS NOT NULL THEN 1 ELSE 0 END) as completed "
-                "FROM user_guide_enrollment uge "
-                "JOIN guides g ON g.id = uge.guide_id "
-                "WHERE uge.user_id=? AND g.archived_at IS NULL",
+            # Batch 1: enrollment + review totals from the progress snapshot
+            snapshot_row = conn.execute(
+                "SELECT COALESCE(SUM(ugp.enrolled), 0) as enrolled, "
+                "SUM(CASE WHEN ugp.enrolled=1 AND ugp.guide_completed_at IS NOT NULL "
+                "THEN 1 ELSE 0 END) as completed, "
+                "COALESCE(SUM(ugp.reviews_done), 0) as reviews_done, "
+                "SUM(ugp.easiness_sum) as easiness_sum "
+                "FROM user_guide_progress ugp "
+                "JOIN guides g ON g.id = ugp.guide_id "
+                "WHERE ugp.user_id=? AND g.archived_at IS NULL",
                 (user_id,),
             ).fetchone()
-            enrolled = enroll_row["enrolled"]
-            guide_completed = enroll_row["completed"] or 0
+            enrolled = snapshot_row["enrolled"]
+            guide_completed = snapshot_row["completed"] or 0
 
             # Batch 2: chapter progress (1 query instead of 2)
             progress_row = conn.execute(
@@ -1320,15 +1350,10 @@ class CurriculumStore:
                 (user_id,),
             ).fetchone()[0]
 
-            # Batch 3: review stats (1 query instead of 2)
-            review_row = conn.execute(
-                "SELECT COUNT(*) as done, AVG(ri.easiness_factor) as avg_ef "
-                "FROM review_items ri JOIN guides g ON g.id = ri.guide_id "
-                "WHERE ri.user_id=? AND ri.last_reviewed IS NOT NULL AND g.archived_at IS NULL",
-                (user_id,),
-            ).fetchone()
-            reviews_done = review_row["done"]
-            avg_grade = round(review_row["avg_ef"], 2) if review_row["avg_ef"] else 0.0
+            reviews_done = snapshot_row["reviews_done"]
+            avg_grade = (
+                round(snapshot_row["easiness_sum"] / reviews_done, 2) if reviews_done else 0.0
+            )
 
             # Due reviews (inline instead of separate connection)
             now = datetime.utcnow().isoformat()
@@ -1424,6 +1449,21 @@ class CurriculumStore:
                 daily_activity=daily,
             )
 
+    # --- Progress snapshot ---
+
+    def rebuild_progress_snapshot(self, user_id: str | None = None) -> int:
+        """Recompute the progress snapshot from live tables; returns rows written."""
+        with wal_connect(self.db_path) as conn:
+            count = progress_snapshot.rebuild(conn, user_id)
+            conn.commit()
+        logger.info("curriculum.progress_snapshot_rebuilt", user_id=user_id, rows=count)
+        return count
+
+    def verify_progress_snapshot(self, user_id: str | None = None) -> list[dict]:
+        """Compare the snapshot against a live recomputation; returns mismatches."""
+        with wal_connect(self.db_path) as conn:
+            return progress_snapshot.verify(conn, user_id)
+
     @staticmethod
     def _compute_mastery(
         conn: sqlite3.Connection,
@@ -1475,31 +1515,18 @@ class CurriculumStore:
 
         if user_id:
             for r in conn.execute(
-                "SELECT ucp.guide_id, COUNT(*) as cnt FROM user_chapter_progress ucp "
-                "JOIN guides g ON g.id = ucp.guide_id "
-                "WHERE ucp.user_id=? AND ucp.status='completed' AND g.archived_at IS NULL "
-                "GROUP BY ucp.guide_id",
-                (user_id,),
-            ):
-                completed_counts[r[0]] = r[1]
-
-            for r in conn.execute(
-                "SELECT uge.guide_id, uge.completed_at FROM user_guide_enrollment uge "
-                "JOIN guides g ON g.id = uge.guide_id "
-                "WHERE uge.user_id=? AND g.archived_at IS NULL",
-                (user_id,),
-            ):
-                enrollment_map[r[0]] = r[1]
-
-            for r in conn.execute(
-                "SELECT ri.guide_id, AVG(ri.easiness_factor) FROM review_items ri "
-                "JOIN guides g ON g.id = ri.guide_id "
-                "WHERE ri.user_id=? AND ri.last_reviewed IS NOT NULL "
-                "AND ri.item_type != 'pre_reading' AND g.archived_at IS NULL "
-                "GROUP BY ri.guide_id",
+                "SELECT ugp.guide_id, ugp.chapters_completed, ugp.enrolled, "
+                "ugp.guide_completed_at, ugp.mastery_avg_easiness "
+                "FROM user_guide_progress ugp JOIN guides g ON g.id = ugp.guide_id "
+                "WHERE ugp.user_id=? AND g.archived_at IS NULL",
                 (user_id,),
             ):
-                avg_ef_map[r[0]] = r[1]
+                if r[1]:
+                    completed_counts[r[0]] = r[1]
+                if r[2]:
+                    enrollment_map[r[0]] = r[3]
+                if r[4] is not None:
+                    avg_ef_map[r[0]] = r[4]
 
         return chapter_counts, completed_counts, enrollment_map, avg_ef_map
 
@@ -1736,6 +1763,7 @@ class CurriculumStore:
                     (user_id, ch_id, guide_id, now, now, now),
                 )
 
+            progress_snapshot.refresh_guide(conn, user_id, guide_id)
             conn.commit()
             return {
                 "guide_id": guide_id,
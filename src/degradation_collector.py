@@ -8,6 +8,8 @@ _collector: ContextVar[list[dict] | None] = ContextVar("degradation_collector",
 _MESSAGES: dict[str, str] = {
     "graceful.advisor.cache_init": "Context cache unavailable",
     "graceful.advisor.rag_retrieval": "Some context retrieval failed",
+    "graceful.advisor.retriever_timeout": "Some context sources were too slow and were skipped",
+    "graceful.advisor.retriever_failed": "Some context retrieval failed",
     "graceful.advisor.memory_inject": "Memory context unavailable",
     "graceful.advisor.thread_inject": "Thread context unavailable",
     "graceful.advisor.entity_init": "Entity graph unavailable",
@@ -1,11 +1,15 @@
 """Configurable embedding provider system."""
 
+from .cache import CachedEmbeddingFunction, EmbeddingCache, get_embedding_cache
 from .factory import create_embedding_function
 from .versioning import auto_migrate_collection, model_tag, versioned_name
 
 __all__ = [
+    "CachedEmbeddingFunction",
+    "EmbeddingCache",
     "auto_migrate_collection",
     "create_embedding_function",
+    "get_embedding_cache",
     "model_tag",
     "versioned_name",
 ]
@@ -0,0 +1,198 @@
+"""Persistent embedding cache shared by every embedding manager.
+
+Vectors are stored in SQLite as float32 blobs keyed by ``(model, sha256(text))``
+with a small in-memory LRU in front, so identical texts (repeated queries,
+dedup probes, scheduled re-syncs) never hit the provider API twice.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import structlog
+
+from db import wal_connect
+from observability import metrics
+
+from .base import EmbeddingFunction
+
+logger = structlog.get_logger()
+
+DEFAULT_MEMORY_ITEMS = 2048
+
+_caches: dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed vector cache with an in-memory LRU tier."""
+
+    def __init__(self, db_path: str | Path, max_memory_items: int = DEFAULT_MEMORY_ITEMS):
+        self.db_path = Path(db_path).expanduser()
+        self.max_memory_items = max_memory_items
+        self._lru: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _ensure_db(self) -> None:
+        # Created lazily so constructing a provider never touches disk
+        if self._initialized:
+            return
+        with wal_connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                )
+            """)
+        self._initialized = True
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors for the given text hashes (misses are omitted)."""
+        found: dict[str, list[float]] = {}
+        missing: list[str] = []
+        with self._lock:
+            for h in hashes:
+                vector = self._lru.get((model, h))
+                if vector is None:
+                    missing.append(h)
+                else:
+                    self._lru.move_to_end((model, h))
+                    found[h] = vector
+        if not missing:
+            return found
+
+        try:
+            self._ensure_db()
+            with wal_connect(self.db_path) as conn:
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i : i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT text_hash, vector FROM embedding_cache "
+                        f"WHERE model = ? AND text_hash IN ({placeholders})",
+                        [model, *chunk],
+                    ).fetchall()
+                    for h, blob in rows:
+                        found[h] = np.frombuffer(blob, dtype=np.float32).tolist()
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_read_failed", error=str(e))
+            return found
+
+        self._remember(model, {h: found[h] for h in missing if h in found})
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Persist freshly computed vectors keyed by text hash."""
+        if not vectors:
+            return
+        self._remember(model, vectors)
+        try:
+            self._ensure_db()
+            with wal_connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache(model, text_hash, vector) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (model, h, np.asarray(v, dtype=np.float32).tobytes())
+                        for h, v in vectors.items()
+                    ],
+                )
+        except sqlite3.Error as e:
+            logger.warning("embedding_cache_write_failed", error=str(e))
+
+    def _remember(self, model: str, vectors: dict[str, list[float]]) -> None:
+        with self._lock:
+            for h, vector in vectors.items():
+                self._lru[(model, h)] = vector
+                self._lru.move_to_end((model, h))
+            while len(self._lru) > self.max_memory_items:
+                self._lru.popitem(last=False)
+
+
+def get_embedding_cache(db_path: str | Path) -> EmbeddingCache:
+    """Return the process-wide cache for ``db_path`` so all managers share one LRU."""
+    key = str(Path(db_path).expanduser())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = EmbeddingCache(key)
+            _caches[key] = cache
+        return cache
+
+
+def _namespace(inner, dimensions: int) -> str:
+    """``<provider>:<full model name>:<dims>``.
+
+    Uses the untruncated model name: ``model_tag`` cuts names to 16 chars, so
+    e.g. two ``gemini-embedding-*`` models would share one namespace.
+    """
+    model = getattr(inner, "_model", None)
+    if model is None:
+        name_attr = getattr(inner, "name", None)
+        model = name_attr() if callable(name_attr) else "unknown"
+    provider = getattr(inner, "provider_name", type(inner).__name__)
+    return f"{provider}:{model}:{dimensions}"
+
+
+class CachedEmbeddingFunction(EmbeddingFunction):
+    """Memoizing wrapper around a provider embedding function.
+
+    Looks every text up in the cache first and sends all misses to the
+    provider in a single call. Exposes the wrapped provider's ``_model``,
+    ``dimensions`` and ``name()`` so collection versioning is unchanged.
+    """
+
+    provider_name = "cached"
+
+    def __init__(self, inner, cache: EmbeddingCache):
+        self._inner = inner
+        self._cache = cache
+        self.provider_name = getattr(inner, "provider_name", self.provider_name)
+        self.dimensions = getattr(inner, "dimensions", 0)
+        if getattr(inner, "_model", None) is not None:
+            self._model = inner._model
+        self._cache_key: str | None = None
+
+    def __call__(self, input: Iterable[str]) -> list[list[float]]:
+        texts = list(input)
+        if not texts:
+            return []
+
+        if self._cache_key is None:
+            self._cache_key = _namespace(self._inner, self.dimensions)
+
+        hashes = [_text_hash(text) for text in texts]
+        found = self._cache.get_many(self._cache_key, list(dict.fromkeys(hashes)))
+
+        misses: dict[str, str] = {}
+        for text, h in zip(texts, hashes, strict=True):
+            if h not in found and h not in misses:
+                misses[h] = text
+
+        metrics.counter("embedding.cache_hit", len(texts) - len(misses))
+        if misses:
+            metrics.counter("embedding.cache_miss", len(misses))
+            metrics.counter("embedding.api_calls")
+            fresh = self._inner(list(misses.values()))
+            computed = dict(zip(misses.keys(), fresh, strict=True))
+            self._cache.put_many(self._cache_key, computed)
+            found.update(computed)
+
+        return [found[h] for h in hashes]
+
+    def name(self) -> str:
+        name_attr = getattr(self._inner, "name", None)
+        return name_attr() if callable(name_attr) else self.provider_name
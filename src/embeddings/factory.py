@@ -30,7 +30,10 @@ def create_embedding_function(
         provider: "gemini", "openai", "hash", "auto", or None (auto-detect)
         model: Model name override
         dimensions: Embedding dimensions override
-        config: Full app config dict — reads ``embeddings.*`` keys
+        config: Full app config dict — reads ``embeddings.*`` keys.
+            ``embeddings.cache`` (default true) wraps real providers in a
+            persistent ``CachedEmbeddingFunction``; ``embeddings.cache_path``
+            overrides the default ``~/coach/embedding_cache.db``.
 
     Returns:
         Callable matching ``__call__(Iterable[str]) -> list[list[float]]``
@@ -69,7 +72,7 @@ def create_embedding_function(
             kwargs["model"] = model
         if dimensions:
             kwargs["dimensions"] = dimensions
-        return GeminiEmbeddingFunction(**kwargs)
+        return _with_cache(GeminiEmbeddingFunction(**kwargs), emb_config)
 
     if resolved == "openai":
         from .openai import OpenAIEmbeddingFunction
@@ -79,7 +82,7 @@ def create_embedding_function(
             kwargs["model"] = model
         if dimensions:
             kwargs["dimensions"] = dimensions
-        return OpenAIEmbeddingFunction(**kwargs)
+        return _with_cache(OpenAIEmbeddingFunction(**kwargs), emb_config)
 
     # Unknown provider — return None
     logger.warning("unknown_embedding_provider", provider=resolved)
@@ -87,6 +90,19 @@ def create_embedding_function(
     return None
 
 
+def _with_cache(embedding_fn, emb_config: dict):
+    """Wrap a paid provider in the shared on-disk embedding cache unless disabled."""
+    if not emb_config.get("cache", True):
+        return embedding_fn
+
+    from storage_paths import get_coach_home
+
+    from .cache import CachedEmbeddingFunction, get_embedding_cache
+
+    cache_path = emb_config.get("cache_path") or get_coach_home() / "embedding_cache.db"
+    return CachedEmbeddingFunction(embedding_fn, get_embedding_cache(cache_path))
+
+
 def _auto_detect_provider() -> str:
     """Detect best available embedding provider from env vars."""
     for name in _AUTO_DETECT_ORDER:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -11,7 +14,7 @@ import structlog
 from intelligence.scraper import IntelStorage
 from llm.base import LLMProvider
 
-from .entity_store import EntityStore, normalize_entity_name
+from .entity_store import EntityStore
 
 logger = structlog.get_logger()
 
@@ -24,6 +27,7 @@ DEFAULT_RELATIONSHIP_TYPES = [
     "PARTNERS_WITH",
     "FUNDS",
 ]
+DEFAULT_MAX_CONCURRENCY = 4
 
 
 @dataclass
@@ -41,6 +45,8 @@ class ExtractionResult:
     entities_merged: int = 0
     relationships_created: int = 0
     errors: int = 0
+    duration_s: float = 0.0
+    items_per_second: float = 0.0
 
 
 class EntityExtractor:
@@ -55,6 +61,7 @@ class EntityExtractor:
         max_content_chars: int = 2000,
         entity_types: list[str] | None = None,
         relationship_types: list[str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         self.llm = llm
         self.storage = storage
@@ -63,37 +70,49 @@ class EntityExtractor:
         self.max_content_chars = max_content_chars
         self.entity_types = entity_types or DEFAULT_ENTITY_TYPES
         self.relationship_types = relationship_types or DEFAULT_RELATIONSHIP_TYPES
+        self.max_concurrency = max(1, max_concurrency)
+        # SQLite has one writer; serializing persists avoids busy-lock retries
+        # while the LLM calls for other items are still in flight. A thread
+        # lock (taken in the worker thread) because the extractor outlives the
+        # event loop of any single asyncio.run().
+        self._write_lock = threading.Lock()
 
     async def extract_batch(self, items: list[dict]) -> ExtractionResult:
+        """Extract up to ``batch_size`` items, ``max_concurrency`` LLM calls at a time."""
+        pending = [
+            item
+            for item in items[: self.batch_size]
+            if item and not self.entity_store.is_item_processed(int(item["id"]))
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(item: dict) -> ItemExtractionResult:
+            async with semaphore:
+                return await self.extract_item(item)
+
+        results = await asyncio.gather(*(_bounded(item) for item in pending))
+
         summary = ExtractionResult()
-        for item in items[: self.batch_size]:
-            if not item or self.entity_store.is_item_processed(int(item["id"])):
-                continue
-            result = await self.extract_item(item)
+        for result in results:
+            summary.processed += 1
             if result.error:
                 self.entity_store.mark_item_processed(
-                    int(item["id"]),
-                    status="failed",
-                    last_error=result.error[:500],
+                    result.item_id, status="failed", last_error=result.error[:500]
                 )
-            elif result.entities or result.relationships:
-                self.entity_store.mark_item_processed(int(item["id"]), status="succeeded")
-            else:
-                self.entity_store.mark_item_processed(int(item["id"]), status="empty")
-            summary.processed += 1
-            if result.error:
                 summary.errors += 1
                 continue
-
             summary.entities_created += len(result.entities)
             summary.relationships_created += len(result.relationships)
 
         return summary
 
     async def extract_item(self, item: dict) -> ItemExtractionResult:
+        """Extract one item and persist it (marking it processed) in one transaction."""
+        item_id = int(item["id"])
         prompt = self._build_prompt(item)
         try:
-            raw = self.llm.generate(
+            raw = await asyncio.to_thread(
+                self.llm.generate,
                 messages=[{"role": "user", "content": prompt}],
                 system=self._system_prompt(),
                 max_tokens=1200,
@@ -102,78 +121,63 @@ class EntityExtractor:
         except Exception as exc:
             logger.warning("entity_extraction_failed", item_id=item.get("id"), error=str(exc))
             return ItemExtractionResult(
-                item_id=int(item["id"]),
+                item_id=item_id,
+                entities=[],
+                relationships=[],
+                error=str(exc),
+            )
+
+        entities, relationships = self._validate(parsed)
+        try:
+            created_entities, created_relationships = await asyncio.to_thread(
+                self._save_extraction, item_id, entities, relationships
+            )
+        except Exception as exc:
+            logger.warning("entity_persist_failed", item_id=item_id, error=str(exc))
+            return ItemExtractionResult(
+                item_id=item_id,
                 entities=[],
                 relationships=[],
                 error=str(exc),
             )
 
-        created_entities = []
-        entity_lookup: dict[str, dict] = {}
+        return ItemExtractionResult(
+            item_id=item_id,
+            entities=created_entities,
+            relationships=created_relationships,
+        )
+
+    def _save_extraction(self, item_id: int, entities: list[dict], relationships: list[dict]):
+        with self._write_lock:
+            return self.entity_store.save_item_extraction(item_id, entities, relationships)
+
+    def _validate(self, parsed: dict) -> tuple[list[dict], list[dict]]:
+        """Drop entities and relationships with missing fields or unknown types."""
+        entities = []
         for entity in parsed.get("entities", []):
             entity_name = (entity.get("name") or "").strip()
             entity_type = self._normalize_entity_type(entity.get("type"))
             if not entity_name or not entity_type:
                 continue
             aliases = [alias for alias in entity.get("aliases", []) if isinstance(alias, str)]
-            existing = self.entity_store.get_entity_by_name(entity_name, entity_type)
-            entity_id = self.entity_store.save_entity(entity_name, entity_type, aliases=aliases)
-            if existing:
-                entity_lookup[normalize_entity_name(entity_name)] = {
-                    "id": entity_id,
-                    "type": entity_type,
-                }
-            else:
-                created_entities.append(
-                    {
-                        "entity_id": entity_id,
-                        "name": entity_name,
-                        "type": entity_type,
-                        "aliases": aliases,
-                    }
-                )
-                entity_lookup[normalize_entity_name(entity_name)] = {
-                    "id": entity_id,
-                    "type": entity_type,
-                }
-            self.entity_store.link_item(int(item["id"]), entity_id)
+            entities.append({"name": entity_name, "type": entity_type, "aliases": aliases})
 
-        created_relationships = []
+        relationships = []
         for relationship in parsed.get("relationships", []):
             source_name = relationship.get("source")
             target_name = relationship.get("target")
             rel_type = relationship.get("type")
             if not source_name or not target_name or rel_type not in self.relationship_types:
                 continue
-            source = entity_lookup.get(
-                normalize_entity_name(source_name)
-            ) or self.entity_store.get_entity_by_name(source_name)
-            target = entity_lookup.get(
-                normalize_entity_name(target_name)
-            ) or self.entity_store.get_entity_by_name(target_name)
-            if not source or not target:
-                continue
-            relationship_id = self.entity_store.save_relationship(
-                int(source["id"]),
-                int(target["id"]),
-                rel_type,
-                evidence=(relationship.get("evidence") or "")[:500],
-                item_id=int(item["id"]),
-            )
-            created_relationships.append(
+            relationships.append(
                 {
-                    "id": relationship_id,
-                    "source_id": int(source["id"]),
-                    "target_id": int(target["id"]),
+                    "source": source_name,
+                    "target": target_name,
                     "type": rel_type,
+                    "evidence": relationship.get("evidence") or "",
                 }
             )
-
-        return ItemExtractionResult(
-            item_id=int(item["id"]),
-            entities=created_entities,
-            relationships=created_relationships,
-        )
+        return entities, relationships
 
     async def backfill(self, since_days: int = 90, limit: int = 500) -> ExtractionResult:
         cutoff = datetime.now() - timedelta(days=since_days)
@@ -239,6 +243,17 @@ class ExtractionScheduler:
         self.batch_size = batch_size
 
     async def run_extraction(self) -> ExtractionResult:
+        started = time.monotonic()
         item_ids = self.entity_store.get_unprocessed_items(limit=self.batch_size)
         items = [self.entity_extractor.storage.get_item_by_id(item_id) for item_id in item_ids]
-        return await self.entity_extractor.extract_batch([item for item in items if item])
+        result = await self.entity_extractor.extract_batch([item for item in items if item])
+        result.duration_s = round(time.monotonic() - started, 3)
+        if result.duration_s > 0:
+            result.items_per_second = round(result.processed / result.duration_s, 2)
+        logger.info(
+            "entity_extraction_throughput",
+            processed=result.processed,
+            duration_s=result.duration_s,
+            items_per_second=result.items_per_second,
+        )
+        return result
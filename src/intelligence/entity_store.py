@@ -6,9 +6,17 @@ import json
 import sqlite3
 from pathlib import Path
 
+import structlog
+
 from db import ensure_schema_version, wal_connect
 
-SCHEMA_VERSION = 6
+logger = structlog.get_logger()
+
+SCHEMA_VERSION = 7
+# Trigram overlap (Jaccard) a fuzzy name match must reach to resolve
+FUZZY_MIN_SIMILARITY = 0.5
+# Max bound parameters per IN (...) lookup
+_LOOKUP_CHUNK = 500
 
 
 def normalize_entity_name(name: str) -> str:
@@ -16,11 +24,20 @@ def normalize_entity_name(name: str) -> str:
     return " ".join((name or "").lower().strip().split())
 
 
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
 class EntityStore:
     """Persistence layer for extracted entities and relationships."""
 
     def __init__(self, db_path: str | Path):
         self.db_path = Path(db_path).expanduser()
+        self._fts_enabled = False
         self._init_db()
 
     def _init_db(self) -> None:
@@ -95,8 +112,93 @@ class EntityStore:
                 )
                 """
             )
+            self._init_name_index(conn)
             ensure_schema_version(conn, SCHEMA_VERSION)
 
+    def _init_name_index(self, conn: sqlite3.Connection) -> None:
+        """Create the normalized name/alias table and its trigram FTS index.
+
+        ``entity_names`` holds one row per (normalized name or alias, entity)
+        so exact lookups hit a unique index instead of scanning alias JSON.
+        The FTS5 trigram table mirrors it for substring and fuzzy matching;
+        on SQLite builds without the trigram tokenizer, substring search falls
+        back to LIKE over ``entity_names``.
+        """
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entity_names (
+                id INTEGER PRIMARY KEY,
+                entity_id INTEGER NOT NULL REFERENCES entities(id),
+                normalized TEXT NOT NULL,
+                is_alias INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_entity_names_normalized "
+            "ON entity_names(normalized, entity_id)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entity_names_entity ON entity_names(entity_id)"
+        )
+        try:
+            conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS entity_names_fts USING fts5(
+                    normalized,
+                    content='entity_names',
+                    content_rowid='id',
+                    tokenize='trigram'
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS entity_names_fts_insert
+                AFTER INSERT ON entity_names BEGIN
+                    INSERT INTO entity_names_fts(rowid, normalized)
+                    VALUES (new.id, new.normalized);
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS entity_names_fts_delete
+                AFTER DELETE ON entity_names BEGIN
+                    INSERT INTO entity_names_fts(entity_names_fts, rowid, normalized)
+                    VALUES ('delete', old.id, old.normalized);
+                END
+                """
+            )
+            self._fts_enabled = True
+        except sqlite3.OperationalError as exc:
+            logger.warning("entity_name_fts_unavailable", error=str(exc))
+
+        # Databases created before the name index existed: index existing rows once
+        needs_backfill = conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM entities) AND NOT EXISTS(SELECT 1 FROM entity_names)"
+        ).fetchone()[0]
+        if needs_backfill:
+            rows = conn.execute("SELECT id, normalized_name, aliases FROM entities").fetchall()
+            for entity_id, normalized_name, aliases in rows:
+                self._index_names(conn, entity_id, normalized_name, self._decode_aliases(aliases))
+            logger.info("entity_name_index_backfilled", entities=len(rows))
+
+    @staticmethod
+    def _index_names(
+        conn: sqlite3.Connection, entity_id: int, normalized_name: str, aliases
+    ) -> None:
+        rows = [(entity_id, normalized_name, 0)]
+        rows.extend(
+            (entity_id, normalized, 1)
+            for normalized in {normalize_entity_name(alias) for alias in aliases}
+            if normalized and normalized != normalized_name
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO entity_names (entity_id, normalized, is_alias) VALUES (?, ?, ?)",
+            rows,
+        )
+
     @staticmethod
     def _decode_aliases(aliases: str | None) -> list[str]:
         if not aliases:
@@ -108,46 +210,56 @@ class EntityStore:
             return []
 
     def save_entity(self, name: str, entity_type: str, aliases: list[str] | None = None) -> int:
+        with wal_connect(self.db_path, row_factory=True) as conn:
+            return self._upsert_entity(conn, name, entity_type, aliases)
+
+    def _upsert_entity(
+        self,
+        conn: sqlite3.Connection,
+        name: str,
+        entity_type: str,
+        aliases: list[str] | None = None,
+    ) -> int:
         normalized_name = normalize_entity_name(name)
         alias_values = {
             alias.strip()
             for alias in (aliases or [])
             if alias and normalize_entity_name(alias) != normalized_name
         }
-
-        with wal_connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            try:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO entities (name, normalized_name, type, aliases)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        name.strip(),
-                        normalized_name,
-                        entity_type,
-                        json.dumps(sorted(alias_values)) if alias_values else None,
-                    ),
-                )
-                return int(cursor.lastrowid)
-            except sqlite3.IntegrityError:
-                row = conn.execute(
-                    "SELECT id, name, aliases FROM entities WHERE normalized_name = ? AND type = ?",
-                    (normalized_name, entity_type),
-                ).fetchone()
-                if not row:
-                    raise
-                merged_aliases = set(self._decode_aliases(row["aliases"]))
-                merged_aliases.update(alias_values)
-                # Add incoming name as alias when it differs from the stored display name
-                if name.strip() and name.strip() != row["name"]:
-                    merged_aliases.add(name.strip())
-                conn.execute(
-                    "UPDATE entities SET aliases = ? WHERE id = ?",
-                    (json.dumps(sorted(merged_aliases)) if merged_aliases else None, row["id"]),
-                )
-                return int(row["id"])
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO entities (name, normalized_name, type, aliases)
+                VALUES (?, ?, ?, ?)
+                """,
+                (
+                    name.strip(),
+                    normalized_name,
+                    entity_type,
+                    json.dumps(sorted(alias_values)) if alias_values else None,
+                ),
+            )
+            entity_id = int(cursor.lastrowid)
+            self._index_names(conn, entity_id, normalized_name, alias_values)
+            return entity_id
+        except sqlite3.IntegrityError:
+            row = conn.execute(
+                "SELECT id, name, aliases FROM entities WHERE normalized_name = ? AND type = ?",
+                (normalized_name, entity_type),
+            ).fetchone()
+            if not row:
+                raise
+            merged_aliases = set(self._decode_aliases(row["aliases"]))
+            merged_aliases.update(alias_values)
+            # Add incoming name as alias when it differs from the stored display name
+            if name.strip() and name.strip() != row["name"]:
+                merged_aliases.add(name.strip())
+            conn.execute(
+                "UPDATE entities SET aliases = ? WHERE id = ?",
+                (json.dumps(sorted(merged_aliases)) if merged_aliases else None, row["id"]),
+            )
+            self._index_names(conn, int(row["id"]), normalized_name, merged_aliases)
+            return int(row["id"])
 
     def save_relationship(
         self,
@@ -157,47 +269,130 @@ class EntityStore:
         evidence: str = "",
         item_id: int | None = None,
     ) -> int:
-        with wal_connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            try:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO entity_relationships (source_id, target_id, type, evidence, item_id)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (source_id, target_id, rel_type, evidence, item_id),
-                )
-                return int(cursor.lastrowid)
-            except sqlite3.IntegrityError:
-                row = conn.execute(
-                    """
-                    SELECT id, evidence, item_id
-                    FROM entity_relationships
-                    WHERE source_id = ? AND target_id = ? AND type = ?
-                    """,
-                    (source_id, target_id, rel_type),
-                ).fetchone()
-                if not row:
-                    raise
-                next_evidence = evidence or row["evidence"] or ""
-                next_item_id = item_id if item_id is not None else row["item_id"]
-                conn.execute(
-                    "UPDATE entity_relationships SET evidence = ?, item_id = ? WHERE id = ?",
-                    (next_evidence, next_item_id, row["id"]),
-                )
-                return int(row["id"])
+        with wal_connect(self.db_path, row_factory=True) as conn:
+            return self._upsert_relationship(
+                conn, source_id, target_id, rel_type, evidence, item_id
+            )
+
+    @staticmethod
+    def _upsert_relationship(
+        conn: sqlite3.Connection,
+        source_id: int,
+        target_id: int,
+        rel_type: str,
+        evidence: str = "",
+        item_id: int | None = None,
+    ) -> int:
+        try:
+            cursor = conn.execute(
+                """
+                INSERT INTO entity_relationships (source_id, target_id, type, evidence, item_id)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (source_id, target_id, rel_type, evidence, item_id),
+            )
+            return int(cursor.lastrowid)
+        except sqlite3.IntegrityError:
+            row = conn.execute(
+                """
+                SELECT id, evidence, item_id
+                FROM entity_relationships
+                WHERE source_id = ? AND target_id = ? AND type = ?
+                """,
+                (source_id, target_id, rel_type),
+            ).fetchone()
+            if not row:
+                raise
+            next_evidence = evidence or row["evidence"] or ""
+            next_item_id = item_id if item_id is not None else row["item_id"]
+            conn.execute(
+                "UPDATE entity_relationships SET evidence = ?, item_id = ? WHERE id = ?",
+                (next_evidence, next_item_id, row["id"]),
+            )
+            return int(row["id"])
 
     def link_item(self, item_id: int, entity_id: int) -> None:
         with wal_connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "INSERT OR IGNORE INTO entity_item_links (entity_id, item_id) VALUES (?, ?)",
-                (entity_id, item_id),
+            self._link_item(conn, item_id, entity_id)
+
+    @staticmethod
+    def _link_item(conn: sqlite3.Connection, item_id: int, entity_id: int) -> None:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO entity_item_links (entity_id, item_id) VALUES (?, ?)",
+            (entity_id, item_id),
+        )
+        if cursor.rowcount:
+            conn.execute(
+                "UPDATE entities SET item_count = item_count + 1 WHERE id = ?",
+                (entity_id,),
             )
-            if cursor.rowcount:
-                conn.execute(
-                    "UPDATE entities SET item_count = item_count + 1 WHERE id = ?",
-                    (entity_id,),
+
+    def save_item_extraction(
+        self,
+        item_id: int,
+        entities: list[dict],
+        relationships: list[dict],
+    ) -> tuple[list[dict], list[dict]]:
+        """Persist one item's extraction atomically and mark it processed.
+
+        ``entities`` are ``{"name", "type", "aliases"}`` dicts and
+        ``relationships`` are ``{"source", "target", "type", "evidence"}`` dicts
+        naming entities by display name or alias. Entities, aliases, item
+        links, relationships and the processing status share one transaction.
+        Returns (newly created entities, saved relationships).
+        """
+        created_entities: list[dict] = []
+        saved_relationships: list[dict] = []
+        with wal_connect(self.db_path, row_factory=True) as conn:
+            entity_lookup: dict[str, int] = {}
+            for entity in entities:
+                name, entity_type = entity["name"], entity["type"]
+                aliases = entity.get("aliases") or []
+                existing = self._entity_by_name(conn, name, entity_type)
+                entity_id = self._upsert_entity(conn, name, entity_type, aliases)
+                if not existing:
+                    created_entities.append(
+                        {
+                            "entity_id": entity_id,
+                            "name": name,
+                            "type": entity_type,
+                            "aliases": aliases,
+                        }
+                    )
+                entity_lookup[normalize_entity_name(name)] = entity_id
+                self._link_item(conn, item_id, entity_id)
+
+            for relationship in relationships:
+                ids = []
+                for name in (relationship["source"], relationship["target"]):
+                    entity_id = entity_lookup.get(normalize_entity_name(name))
+                    if entity_id is None:
+                        found = self._entity_by_name(conn, name)
+                        entity_id = int(found["id"]) if found else None
+                    ids.append(entity_id)
+                source_id, target_id = ids
+                if source_id is None or target_id is None:
+                    continue
+                relationship_id = self._upsert_relationship(
+                    conn,
+                    source_id,
+                    target_id,
+                    relationship["type"],
+                    evidence=(relationship.get("evidence") or "")[:500],
+                    item_id=item_id,
                 )
+                saved_relationships.append(
+                    {
+                        "id": relationship_id,
+                        "source_id": source_id,
+                        "target_id": target_id,
+                        "type": relationship["type"],
+                    }
+                )
+
+            status = "succeeded" if entity_lookup or saved_relationships else "empty"
+            self._mark_item_processed(conn, item_id, status)
+        return created_entities, saved_relationships
 
     def get_entity(self, entity_id: int) -> dict | None:
         with wal_connect(self.db_path, row_factory=True) as conn:
@@ -209,41 +404,100 @@ class EntityStore:
         return entity
 
     def get_entity_by_name(self, name: str, entity_type: str | None = None) -> dict | None:
-        normalized_name = normalize_entity_name(name)
         with wal_connect(self.db_path, row_factory=True) as conn:
-            if entity_type:
-                row = conn.execute(
-                    """
-                    SELECT * FROM entities
-                    WHERE normalized_name = ? AND type = ?
-                    """,
-                    (normalized_name, entity_type),
-                ).fetchone()
-                if row:
-                    entity = dict(row)
-                    entity["aliases"] = self._decode_aliases(entity.get("aliases"))
-                    return entity
+            return self._entity_by_name(conn, name, entity_type)
 
-            rows = conn.execute(
-                "SELECT * FROM entities WHERE normalized_name = ?", (normalized_name,)
-            ).fetchall()
-            if rows:
-                entity = dict(rows[0])
-                entity["aliases"] = self._decode_aliases(entity.get("aliases"))
-                return entity
+    def _entity_by_name(
+        self, conn: sqlite3.Connection, name: str, entity_type: str | None = None
+    ) -> dict | None:
+        normalized_name = normalize_entity_name(name)
+        return self._resolve_normalized(conn, [normalized_name], entity_type).get(normalized_name)
+
+    def resolve_names(
+        self,
+        names: list[str],
+        entity_type: str | None = None,
+        fuzzy: bool = False,
+    ) -> dict[str, dict]:
+        """Resolve many names to entities in one pass, keyed by the input name.
+
+        Exact matches on a normalized name or alias come from the unique index,
+        preferring primary names over aliases and then ``entity_type``. With
+        ``fuzzy``, names left unresolved fall back to the closest trigram match
+        scoring at least ``FUZZY_MIN_SIMILARITY``. Unresolved names are omitted.
+        """
+        normalized = {name: normalize_entity_name(name) for name in names if name}
+        wanted = [value for value in dict.fromkeys(normalized.values()) if value]
+        with wal_connect(self.db_path, row_factory=True) as conn:
+            found = self._resolve_normalized(conn, wanted, entity_type)
+            if fuzzy and self._fts_enabled:
+                for value in wanted:
+                    if value not in found:
+                        match = self._fuzzy_match(conn, value, entity_type)
+                        if match is not None:
+                            found[value] = match
+        return {name: found[value] for name, value in normalized.items() if value in found}
 
+    def _resolve_normalized(
+        self,
+        conn: sqlite3.Connection,
+        normalized_names: list[str],
+        entity_type: str | None = None,
+    ) -> dict[str, dict]:
+        best: dict[str, tuple[tuple, dict]] = {}
+        for start in range(0, len(normalized_names), _LOOKUP_CHUNK):
+            chunk = normalized_names[start : start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" for _ in chunk)
             rows = conn.execute(
-                "SELECT * FROM entities WHERE COALESCE(aliases, '') LIKE ?",
-                (f"%{normalized_name}%",),
+                f"""
+                SELECT n.normalized AS matched_name, n.is_alias AS matched_alias, e.*
+                FROM entity_names n
+                JOIN entities e ON e.id = n.entity_id
+                WHERE n.normalized IN ({placeholders})
+                """,
+                tuple(chunk),
             ).fetchall()
+            for row in rows:
+                # Primary name beats alias; then the requested type; then oldest
+                rank = (row["matched_alias"], row["type"] != entity_type, row["id"])
+                current = best.get(row["matched_name"])
+                if current is None or rank < current[0]:
+                    best[row["matched_name"]] = (rank, self._entity_from_row(row))
+        return {name: entity for name, (_, entity) in best.items()}
 
+    def _fuzzy_match(
+        self, conn: sqlite3.Connection, normalized_name: str, entity_type: str | None
+    ) -> dict | None:
+        grams = _trigrams(normalized_name)
+        if not grams:
+            return None
+        rows = conn.execute(
+            """
+            SELECT n.normalized AS matched_name, n.is_alias AS matched_alias, e.*
+            FROM entity_names_fts f
+            JOIN entity_names n ON n.id = f.rowid
+            JOIN entities e ON e.id = n.entity_id
+            WHERE entity_names_fts MATCH ?
+            ORDER BY f.rank
+            LIMIT 20
+            """,
+            (" OR ".join(_fts_phrase(gram) for gram in sorted(grams)),),
+        ).fetchall()
+        best: tuple[tuple, dict] | None = None
         for row in rows:
-            aliases = self._decode_aliases(row["aliases"])
-            if normalized_name in {normalize_entity_name(alias) for alias in aliases}:
-                entity = dict(row)
-                entity["aliases"] = aliases
-                return entity
-        return None
+            candidate = _trigrams(row["matched_name"])
+            similarity = len(grams & candidate) / len(grams | candidate)
+            if similarity < FUZZY_MIN_SIMILARITY:
+                continue
+            rank = (-similarity, row["type"] != entity_type, row["matched_alias"], row["id"])
+            if best is None or rank < best[0]:
+                best = (rank, self._entity_from_row(row))
+        return best[1] if best else None
+
+    def _entity_from_row(self, row: sqlite3.Row) -> dict:
+        entity = {key: row[key] for key in row.keys() if not key.startswith("matched_")}
+        entity["aliases"] = self._decode_aliases(entity.get("aliases"))
+        return entity
 
     def search_entities(
         self,
@@ -251,27 +505,29 @@ class EntityStore:
         limit: int = 20,
         entity_type: str | None = None,
     ) -> list[dict]:
+        """Entities whose name or any alias contains ``query`` (normalized)."""
         normalized_query = normalize_entity_name(query)
-        like_query = f"%{normalized_query}%"
-        with wal_connect(self.db_path, row_factory=True) as conn:
-            params: list[object] = [like_query, like_query]
-            sql = """
-                SELECT * FROM entities
-                WHERE (normalized_name LIKE ? OR COALESCE(aliases, '') LIKE ?)
+        if self._fts_enabled and len(normalized_query) >= 3:
+            match_sql = """
+                SELECT n.entity_id
+                FROM entity_names_fts f
+                JOIN entity_names n ON n.id = f.rowid
+                WHERE entity_names_fts MATCH ?
             """
-            if entity_type:
-                sql += " AND type = ?"
-                params.append(entity_type)
-            sql += " ORDER BY item_count DESC, name ASC LIMIT ?"
-            params.append(limit)
+            params: list[object] = [_fts_phrase(normalized_query)]
+        else:
+            # Trigrams need three characters; short queries scan the name table
+            match_sql = "SELECT entity_id FROM entity_names WHERE normalized LIKE ?"
+            params = [f"%{normalized_query}%"]
+        sql = f"SELECT * FROM entities WHERE id IN ({match_sql})"
+        if entity_type:
+            sql += " AND type = ?"
+            params.append(entity_type)
+        sql += " ORDER BY item_count DESC, name ASC LIMIT ?"
+        params.append(limit)
+        with wal_connect(self.db_path, row_factory=True) as conn:
             rows = conn.execute(sql, tuple(params)).fetchall()
-
-        entities = []
-        for row in rows:
-            entity = dict(row)
-            entity["aliases"] = self._decode_aliases(entity.get("aliases"))
-            entities.append(entity)
-        return entities
+        return [self._entity_from_row(row) for row in rows]
 
     def get_relationships(self, entity_id: int, direction: str = "both") -> list[dict]:
         with wal_connect(self.db_path, row_factory=True) as conn:
@@ -359,17 +615,23 @@ class EntityStore:
 
     def mark_item_processed(self, item_id: int, status: str, last_error: str | None = None) -> None:
         with wal_connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO entity_item_processing (item_id, status, last_error, processed_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(item_id) DO UPDATE SET
-                    status = excluded.status,
-                    last_error = excluded.last_error,
-                    processed_at = CURRENT_TIMESTAMP
-                """,
-                (item_id, status, last_error),
-            )
+            self._mark_item_processed(conn, item_id, status, last_error)
+
+    @staticmethod
+    def _mark_item_processed(
+        conn: sqlite3.Connection, item_id: int, status: str, last_error: str | None = None
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO entity_item_processing (item_id, status, last_error, processed_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(item_id) DO UPDATE SET
+                status = excluded.status,
+                last_error = excluded.last_error,
+                processed_at = CURRENT_TIMESTAMP
+            """,
+            (item_id, status, last_error),
+        )
 
     def get_unprocessed_items(self, limit: int = 100) -> list[int]:
         with wal_connect(self.db_path) as conn:
@@ -12,6 +12,7 @@ import structlog
 from storage_paths import get_coach_home
 
 from .scraper import IntelStorage
+from .user_jobs import UserJobRunner, UserJobStateStore, run_async_with_deadline
 
 logger = structlog.get_logger().bind(source="runners")
 
@@ -25,6 +26,18 @@ class RunnerContext:
     journal_storage: Any = None
     embeddings: Any = None
     intel_embedding_mgr: Any = None
+    user_jobs: UserJobRunner | None = None
+
+    def get_user_jobs(self) -> UserJobRunner:
+        """Per-user job runner, created from ``github_monitoring`` settings on first use."""
+        if self.user_jobs is None:
+            gh_config = self.full_config.get("github_monitoring", {})
+            self.user_jobs = UserJobRunner(
+                UserJobStateStore(self.storage.db_path),
+                max_workers=gh_config.get("poll_workers", 4),
+                user_timeout=gh_config.get("poll_user_timeout_s", 120),
+            )
+        return self.user_jobs
 
 
 # ---------------------------------------------------------------------------
@@ -285,11 +298,33 @@ def refresh_capability_model(ctx: RunnerContext) -> dict:
     return {"items_scraped": len(items), "domains": len(model.domains)}
 
 
+def _cron_interval_s(expr: str) -> float:
+    """Seconds between the next two fire times of a cron expression."""
+    from datetime import timezone
+
+    from .job_registry import _parse_cron
+
+    trigger = _parse_cron(expr)
+    first = trigger.get_next_fire_time(None, datetime.now(timezone.utc))
+    second = trigger.get_next_fire_time(first, first)
+    return (second - first).total_seconds()
+
+
 def run_github_repo_poll(ctx: RunnerContext) -> dict:
     gh_config = ctx.full_config.get("github_monitoring", {})
     if not gh_config.get("enabled", False):
         return {"status": "disabled"}
 
+    # A restart or manual trigger shortly after a scheduled poll skips users
+    # that were just polled; half the cadence leaves the next scheduled run
+    # free to poll everyone.
+    min_interval = gh_config.get("poll_min_interval_s")
+    if min_interval is None:
+        try:
+            min_interval = _cron_interval_s(gh_config.get("poll_cron", "0 */4 * * *")) / 2
+        except Exception:
+            min_interval = 0.0
+
     try:
         from intelligence.github_repo_poller import GitHubRepoPoller
         from intelligence.github_repo_store import GitHubRepoStore
@@ -300,17 +335,16 @@ def run_github_repo_poll(ctx: RunnerContext) -> dict:
         if not user_ids:
             return {"status": "no_repos"}
 
-        total_snapshots = 0
-        for user_id in user_ids:
+        def poll_user(job) -> int:
             token = None
             try:
                 from user_state_store import get_user_secret
 
                 fernet_key = os.environ.get("SECRET_KEY", "")
                 if fernet_key:
-                    token = get_user_secret(user_id, "github_pat", fernet_key)
+                    token = get_user_secret(job.user_id, "github_pat", fernet_key)
                     if not token:
-                        token = get_user_secret(user_id, "github_token", fernet_key)
+                        token = get_user_secret(job.user_id, "github_token", fernet_key)
             except Exception:
                 pass
 
@@ -320,27 +354,38 @@ def run_github_repo_poll(ctx: RunnerContext) -> dict:
                 timeout=gh_config.get("request_timeout_s", 15),
             )
             poller = GitHubRepoPoller(client, store)
-            try:
-                snapshots = asyncio.run(poller.poll_user_repos(user_id))
-                total_snapshots += len(snapshots)
-            except Exception as e:
-                logger.warning(
-                    "github_repo_poll.user_failed",
-                    user_id=user_id,
-                    error=str(e),
-                )
-            finally:
-                asyncio.run(client.close())
+
+            async def _poll():
+                try:
+                    return await poller.poll_user_repos(job.user_id)
+                finally:
+                    await client.close()
+
+            return len(run_async_with_deadline(_poll(), job))
+
+        runs = ctx.get_user_jobs().run(
+            "github_repo_poll", user_ids, poll_user, min_interval=min_interval
+        )
+        total_snapshots = sum(run.result for run in runs if run.status == "ok")
+        failed = sum(1 for run in runs if run.status != "ok")
 
         retention = gh_config.get("snapshot_retention_days", 90)
         pruned = store.prune_snapshots(retention)
         logger.info(
             "github_repo_poll.complete",
             users=len(user_ids),
+            skipped=len(user_ids) - len(runs),
+            failed=failed,
             snapshots=total_snapshots,
             pruned=pruned,
         )
-        return {"users": len(user_ids), "snapshots": total_snapshots, "pruned": pruned}
+        return {
+            "users": len(user_ids),
+            "skipped": len(user_ids) - len(runs),
+            "failed": failed,
+            "snapshots": total_snapshots,
+            "pruned": pruned,
+        }
     except Exception as e:
         logger.error("github_repo_poll.failed", error=str(e))
         return {"error": str(e)}
@@ -490,8 +535,9 @@ def run_memory_consolidation(ctx: RunnerContext) -> dict:
         consolidator = ObservationConsolidator(
             store,
             min_facts_per_group=consolidation_config.get("min_facts_per_group", 2),
+            max_concurrency=consolidation_config.get("max_concurrency", 4),
         )
-        observations = consolidator.consolidate_all()
+        observations = consolidator.consolidate_since_last_run()
         logger.info("memory_consolidation.complete", observations=len(observations))
         return {"observations": len(observations)}
     except Exception as e:
@@ -230,6 +230,7 @@ class IntelScheduler:
                 max_content_chars=entity_config.get("max_content_chars", 2000),
                 entity_types=entity_config.get("entity_types"),
                 relationship_types=entity_config.get("relationship_types"),
+                max_concurrency=entity_config.get("max_concurrency", 4),
             )
             self._entity_extraction_runner = ExtractionScheduler(
                 extractor,
@@ -370,6 +371,8 @@ class IntelScheduler:
 
     def stop(self):
         self.scheduler.shutdown()
+        if self._ctx.user_jobs is not None:
+            self._ctx.user_jobs.shutdown()
 
     def _schedule_extended_jobs(self) -> None:
         company_config = self.full_config.get("company_movement", {})
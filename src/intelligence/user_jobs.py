@@ -0,0 +1,322 @@
+"""Per-user fan-out for scheduled jobs.
+
+A scheduled job that does work for every user (e.g. polling each user's
+GitHub repos) hands its user list to :class:`UserJobRunner`. The runner shards
+the users across a bounded thread pool so one slow user does not hold up the
+rest, and it gives each user a deadline. The outcome of every (user, job) run
+is persisted in ``user_job_runs``, including an optional cursor the job can
+resume from.
+
+Users are dispatched least-recently-successful first. A user that keeps
+failing or timing out therefore moves to the front of the next run rather than
+starving behind healthy users. With ``min_interval`` set, users that succeeded
+recently are skipped, so a restart resumes where the last run stopped instead
+of redoing everyone.
+
+Metrics, labelled by job:
+
+- ``user_jobs.queue_depth`` (gauge): users waiting for a worker.
+- ``user_jobs.lag``: seconds since the user's last success, taken when the user's run starts.
+- ``user_jobs.queue_wait``: time a user spent waiting for a worker.
+- ``user_jobs.duration``: wall time of each user's run.
+- ``user_jobs.run``: a counter labelled by status.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import threading
+import time
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from db import wal_connect
+from observability import metrics
+
+logger = structlog.get_logger().bind(source="user_jobs")
+
+DEFAULT_WORKERS = 4
+DEFAULT_USER_TIMEOUT_S = 120.0
+
+
+class UserJobStateStore:
+    """Last-run state per (user, job) in the intel database."""
+
+    _COLUMNS = (
+        "user_id, last_started_at, last_success_at, last_status, last_error, "
+        "duration_s, cursor_json"
+    )
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path).expanduser()
+        self._init_table()
+
+    def _init_table(self) -> None:
+        with wal_connect(self.db_path) as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS user_job_runs (
+                    user_id TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    last_started_at REAL,
+                    last_success_at REAL,
+                    last_status TEXT,
+                    last_error TEXT,
+                    duration_s REAL,
+                    cursor_json TEXT,
+                    PRIMARY KEY (user_id, job_id)
+                )"""
+            )
+
+    @staticmethod
+    def _row_to_dict(row) -> dict:
+        user_id, started, success, status, error, duration, cursor_json = row
+        return {
+            "user_id": user_id,
+            "last_started_at": started,
+            "last_success_at": success,
+            "last_status": status,
+            "last_error": error,
+            "duration_s": duration,
+            "cursor": json.loads(cursor_json) if cursor_json else None,
+        }
+
+    def get_all(self, job_id: str) -> dict[str, dict]:
+        """State for every user that has run ``job_id``, keyed by user id."""
+        with wal_connect(self.db_path) as conn:
+            rows = conn.execute(
+                f"SELECT {self._COLUMNS} FROM user_job_runs WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return {row[0]: self._row_to_dict(row) for row in rows}
+
+    def get(self, user_id: str, job_id: str) -> dict | None:
+        with wal_connect(self.db_path) as conn:
+            row = conn.execute(
+                f"SELECT {self._COLUMNS} FROM user_job_runs WHERE user_id = ? AND job_id = ?",
+                (user_id, job_id),
+            ).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def record(
+        self,
+        user_id: str,
+        job_id: str,
+        *,
+        status: str,
+        started_at: float,
+        duration_s: float,
+        error: str | None = None,
+        cursor: Any = None,
+    ) -> None:
+        """Upsert one run. Success time and cursor only advance on ``ok``."""
+        ok = status == "ok"
+        cursor_json = json.dumps(cursor) if ok and cursor is not None else None
+        with wal_connect(self.db_path) as conn:
+            conn.execute(
+                """INSERT INTO user_job_runs (user_id, job_id, last_started_at,
+                       last_success_at, last_status, last_error, duration_s, cursor_json)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(user_id, job_id) DO UPDATE SET
+                       last_started_at = excluded.last_started_at,
+                       last_success_at = COALESCE(excluded.last_success_at, last_success_at),
+                       last_status = excluded.last_status,
+                       last_error = excluded.last_error,
+                       duration_s = excluded.duration_s,
+                       cursor_json = COALESCE(excluded.cursor_json, cursor_json)""",
+                (
+                    user_id,
+                    job_id,
+                    started_at,
+                    started_at + duration_s if ok else None,
+                    status,
+                    error,
+                    duration_s,
+                    cursor_json,
+                ),
+            )
+
+
+@dataclass
+class UserJobContext:
+    """Handed to the per-user function. Set ``cursor`` to persist it on success."""
+
+    user_id: str
+    job_id: str
+    deadline: float  # time.monotonic() value
+    cursor: Any = None
+    last_success_at: float | None = None
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+
+@dataclass
+class UserJobRun:
+    user_id: str
+    status: str  # ok | error | timeout
+    duration_s: float
+    result: Any = None
+    error: str | None = None
+
+
+def run_async_with_deadline(coro: Coroutine, ctx: UserJobContext):
+    """``asyncio.run`` the coroutine, cancelling it at the user's deadline."""
+    return asyncio.run(asyncio.wait_for(coro, timeout=ctx.remaining()))
+
+
+class UserJobRunner:
+    """Run a job's per-user work on a bounded pool with per-user deadlines.
+
+    Args:
+        state_store: Where (user, job) outcomes and cursors are kept.
+        max_workers: Users processed concurrently.
+        user_timeout: Seconds each user gets once a worker picks it up.
+            Async work run through :func:`run_async_with_deadline` is
+            cancelled at the deadline. Sync work should check
+            ``ctx.remaining()``; an overrunning sync call is recorded as a
+            timeout when it returns.
+    """
+
+    def __init__(
+        self,
+        state_store: UserJobStateStore,
+        max_workers: int = DEFAULT_WORKERS,
+        user_timeout: float = DEFAULT_USER_TIMEOUT_S,
+    ):
+        self.state_store = state_store
+        self.max_workers = max_workers
+        self.user_timeout = user_timeout
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._pending: dict[str, int] = {}
+        self._pending_lock = threading.Lock()
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="user-job"
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _adjust_pending(self, job_id: str, delta: int) -> None:
+        with self._pending_lock:
+            depth = self._pending.get(job_id, 0) + delta
+            self._pending[job_id] = depth
+        metrics.gauge("user_jobs.queue_depth", depth, labels={"job": job_id})
+
+    def queue_depth(self, job_id: str) -> int:
+        with self._pending_lock:
+            return self._pending.get(job_id, 0)
+
+    def run(
+        self,
+        job_id: str,
+        user_ids: Iterable[str],
+        fn: Callable[[UserJobContext], Any],
+        min_interval: float = 0.0,
+    ) -> list[UserJobRun]:
+        """Run ``fn`` once per user and block until every user has finished.
+
+        Users whose last success is newer than ``min_interval`` seconds are
+        skipped. One user's exception is recorded and does not affect others.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        states = self.state_store.get_all(job_id)
+        now = time.time()
+        due = []
+        for user_id in user_ids:
+            last_success = (states.get(user_id) or {}).get("last_success_at")
+            if min_interval and last_success and now - last_success < min_interval:
+                continue
+            due.append(user_id)
+        # Never-run users first, then least recently successful
+        due.sort(key=lambda uid: (states.get(uid) or {}).get("last_success_at") or 0.0)
+
+        pool = self._get_pool()
+        futures = []
+        for user_id in due:
+            self._adjust_pending(job_id, 1)
+            futures.append(
+                pool.submit(
+                    self._run_one, job_id, user_id, fn, states.get(user_id), time.monotonic()
+                )
+            )
+        runs = [future.result() for future in futures]
+
+        counts: dict[str, int] = {}
+        for run in runs:
+            counts[run.status] = counts.get(run.status, 0) + 1
+        logger.info(
+            "user_jobs.complete",
+            job=job_id,
+            users=len(due),
+            skipped=len(user_ids) - len(due),
+            **counts,
+        )
+        return runs
+
+    def _run_one(
+        self,
+        job_id: str,
+        user_id: str,
+        fn: Callable[[UserJobContext], Any],
+        state: dict | None,
+        queued_at: float,
+    ) -> UserJobRun:
+        self._adjust_pending(job_id, -1)
+        labels = {"job": job_id}
+        metrics.observe("user_jobs.queue_wait", time.monotonic() - queued_at, labels=labels)
+        state = state or {}
+        started_at = time.time()
+        if state.get("last_success_at"):
+            metrics.observe("user_jobs.lag", started_at - state["last_success_at"], labels=labels)
+
+        start = time.monotonic()
+        ctx = UserJobContext(
+            user_id=user_id,
+            job_id=job_id,
+            deadline=start + self.user_timeout,
+            cursor=state.get("cursor"),
+            last_success_at=state.get("last_success_at"),
+        )
+        result = error = None
+        try:
+            result = fn(ctx)
+            status = "ok" if time.monotonic() <= ctx.deadline else "timeout"
+        except (TimeoutError, asyncio.TimeoutError):
+            status = "timeout"
+        except Exception as e:
+            status, error = "error", str(e)
+            logger.warning("user_jobs.user_failed", job=job_id, user_id=user_id, error=error)
+        duration = time.monotonic() - start
+        if status == "timeout":
+            error = f"exceeded {self.user_timeout:g}s deadline"
+            logger.warning("user_jobs.user_timeout", job=job_id, user_id=user_id)
+
+        metrics.observe("user_jobs.duration", duration, labels=labels)
+        metrics.counter("user_jobs.run", labels={"job": job_id, "status": status})
+        try:
+            self.state_store.record(
+                user_id,
+                job_id,
+                status=status,
+                started_at=started_at,
+                duration_s=duration,
+                error=error,
+                cursor=ctx.cursor,
+            )
+        except Exception as e:
+            logger.warning("user_jobs.state_save_failed", job=job_id, user_id=user_id, error=str(e))
+        return UserJobRun(user_id, status, duration, result if status == "ok" else None, error)
@@ -1,5 +1,10 @@
 """Vector embedding operations using ChromaDB."""
 
+import hashlib
+import json
+import os
+import threading
+import time
 from pathlib import Path
 
 import structlog
@@ -9,6 +14,9 @@ from embeddings.versioning import auto_migrate_collection, model_tag, versioned_
 
 logger = structlog.get_logger()
 
+# Single-entry writes batch their sync-state updates and flush at most this often
+SYNC_STATE_FLUSH_INTERVAL_S = 5.0
+
 
 class EmbeddingManager:
     """Manages vector embeddings for journal entries."""
@@ -42,6 +50,11 @@ class EmbeddingManager:
             auto_migrate_collection(self.chroma_dir, old_name, self.collection_name)
 
         self._model_name = model_tag(self.embedding_function)
+        self._sync_state_path = self.chroma_dir / f"{self.collection_name}.sync.json"
+        # Unflushed sidecar changes: entry id -> new state, or None for a removal
+        self._pending_state: dict[str, dict | None] = {}
+        self._state_lock = threading.Lock()
+        self._last_state_flush = time.monotonic()
         self.collection = LocalCollection(
             base_dir=self.chroma_dir,
             name=self.collection_name,
@@ -63,7 +76,23 @@ class EmbeddingManager:
         """Add or update entry embedding."""
         if not self.is_available:
             return
-        # Sanitize metadata - ChromaDB only accepts str, int, float, bool, None
+        clean_meta = self._clean_metadata(metadata)
+
+        # ChromaDB requires non-empty metadata or None
+        self.collection.upsert(
+            ids=[entry_id],
+            documents=[content],
+            metadatas=[clean_meta] if clean_meta else None,
+        )
+        # Record the hash so the next sync doesn't re-embed this entry; mtime is
+        # unknown here, so sync will re-parse the file once and find it unchanged.
+        self._record_sync_state(
+            {entry_id: {"mtime": None, "hash": self._content_hash(content, clean_meta)}}
+        )
+
+    @staticmethod
+    def _clean_metadata(metadata: dict | None) -> dict:
+        """Sanitize metadata - ChromaDB only accepts str, int, float, bool, None."""
         clean_meta = {}
         if metadata:
             for k, v in metadata.items():
@@ -73,13 +102,7 @@ class EmbeddingManager:
                     clean_meta[k] = v
                 else:
                     clean_meta[k] = str(v)
-
-        # ChromaDB requires non-empty metadata or None
-        self.collection.upsert(
-            ids=[entry_id],
-            documents=[content],
-            metadatas=[clean_meta] if clean_meta else None,
-        )
+        return clean_meta
 
     def remove_entry(self, entry_id: str) -> None:
         """Remove entry from vector store."""
@@ -89,6 +112,7 @@ class EmbeddingManager:
             self.collection.delete(ids=[entry_id])
         except Exception as e:
             logger.warning("embedding_remove_failed", entry_id=entry_id, error=str(e))
+        self._record_sync_state({entry_id: None})
 
     def query(
         self,
@@ -132,6 +156,9 @@ class EmbeddingManager:
     def sync_from_storage(self, entries: list[dict]) -> tuple[int, int]:
         """Sync embeddings from storage entries.
 
+        Only entries whose content hash changed since the last sync are
+        re-embedded, in a single batched upsert.
+
         Args:
             entries: List of dicts with id, content, metadata
 
@@ -140,32 +167,154 @@ class EmbeddingManager:
         """
         if not self.is_available:
             return (0, 0)
-        # Get existing IDs
+        return self._apply_sync({e["id"]: None for e in entries}, entries)
+
+    def changed_paths(self, mtimes: dict[str, float]) -> set[str]:
+        """Paths from a ``JournalStorage.scan_mtimes()`` map that need re-parsing.
+
+        The sidecar is only trusted for ids the collection actually holds, so
+        a lost or replaced collection file is re-embedded in full.
+        """
+        if not self.is_available:
+            return set()
+        state = self._current_sync_state()
+        embedded = set(self.collection.get(ids=list(mtimes), include=[])["ids"])
+        return {
+            path
+            for path, mtime in mtimes.items()
+            if path not in embedded or path not in state or state[path].get("mtime") != mtime
+        }
+
+    def sync_changes(self, mtimes: dict[str, float], entries: list[dict]) -> tuple[int, int]:
+        """Apply a stat-first change set to the collection.
+
+        Args:
+            mtimes: ``{path_str: mtime}`` for every file currently on disk.
+            entries: parsed entries for (at least) the changed paths.
+
+        Returns:
+            Tuple of (added, removed) counts
+        """
+        if not self.is_available:
+            return (0, 0)
+        return self._apply_sync(mtimes, entries)
+
+    def _apply_sync(self, mtimes: dict[str, float | None], entries: list[dict]) -> tuple[int, int]:
         existing = set()
         try:
-            existing_data = self.collection.get()
+            existing_data = self.collection.get(include=[])
             existing = set(existing_data["ids"]) if existing_data["ids"] else set()
         except Exception as e:
             logger.warning(
                 "chroma_get_existing_failed", collection=self.collection_name, error=str(e)
             )
 
-        current_ids = {e["id"] for e in entries}
-
-        # Add/update entries
+        state = self._current_sync_state()
+        updates: dict[str, dict | None] = {}
+        ids, documents, metadatas = [], [], []
         added = 0
         for entry in entries:
-            self.add_entry(entry["id"], entry["content"], entry.get("metadata"))
-            if entry["id"] not in existing:
-                added += 1
+            entry_id = entry["id"]
+            if entry_id not in mtimes:
+                continue
+            clean_meta = self._clean_metadata(entry.get("metadata"))
+            digest = self._content_hash(entry["content"], clean_meta)
+            known = state.get(entry_id)
+            if entry_id not in existing or not known or known.get("hash") != digest:
+                ids.append(entry_id)
+                documents.append(entry["content"])
+                metadatas.append(clean_meta or None)
+                if entry_id not in existing:
+                    added += 1
+            updates[entry_id] = {"mtime": mtimes[entry_id], "hash": digest}
+
+        if ids:
+            # One provider call and one collection write for the whole change set
+            self.collection.upsert(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas if any(metadatas) else None,
+            )
 
         # Remove deleted entries
-        removed = 0
-        for old_id in existing - current_ids:
-            self.remove_entry(old_id)
-            removed += 1
+        removed_ids = sorted(existing - set(mtimes))
+        if removed_ids:
+            try:
+                self.collection.delete(ids=removed_ids)
+            except Exception as e:
+                logger.warning("embedding_remove_failed", count=len(removed_ids), error=str(e))
+        for old_id in set(state) - set(mtimes):
+            updates[old_id] = None
+
+        self._record_sync_state(updates, flush=True)
+        logger.info(
+            "embedding_sync",
+            collection=self.collection_name,
+            embedded=len(ids),
+            added=added,
+            removed=len(removed_ids),
+        )
+        return added, len(removed_ids)
+
+    @staticmethod
+    def _content_hash(content: str, clean_meta: dict) -> str:
+        payload = json.dumps([content, clean_meta], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_sync_state(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self._sync_state_path.read_text(encoding="utf-8") or "{}")
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_sync_state(self, state: dict[str, dict]) -> None:
+        # Per-process temp name: writers never share a half-written file
+        tmp = self._sync_state_path.with_name(f"{self._sync_state_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self._sync_state_path)
+
+    @staticmethod
+    def _apply_state_updates(state: dict[str, dict], updates: dict[str, dict | None]) -> None:
+        for entry_id, value in updates.items():
+            if value is None:
+                state.pop(entry_id, None)
+            else:
+                state[entry_id] = value
+
+    def _current_sync_state(self) -> dict[str, dict]:
+        """Sidecar contents with unflushed updates applied."""
+        with self._state_lock:
+            state = self._load_sync_state()
+            self._apply_state_updates(state, self._pending_state)
+        return state
+
+    def _record_sync_state(self, updates: dict[str, dict | None], flush: bool = False) -> None:
+        """Queue sidecar updates; write them when asked or the flush interval has passed.
+
+        Updates still pending if the process dies only cost a re-embed of
+        those entries on the next sync.
+        """
+        with self._state_lock:
+            self._pending_state.update(updates)
+            if flush or time.monotonic() - self._last_state_flush >= SYNC_STATE_FLUSH_INTERVAL_S:
+                self._flush_sync_state_locked()
+
+    def flush_sync_state(self) -> None:
+        """Write any pending sidecar updates now."""
+        if not self.is_available:
+            return
+        with self._state_lock:
+            self._flush_sync_state_locked()
 
-        return added, removed
+    def _flush_sync_state_locked(self) -> None:
+        if self._pending_state:
+            # Re-read so updates written by another process are kept
+            state = self._load_sync_state()
+            self._apply_state_updates(state, self._pending_state)
+            self._save_sync_state(state)
+            self._pending_state.clear()
+        self._last_state_flush = time.monotonic()
 
     def count(self) -> int:
         """Get total number of embedded entries."""
@@ -205,6 +354,9 @@ class EmbeddingManager:
         if not self.is_available:
             return
         self.collection.delete_collection()
+        with self._state_lock:
+            self._pending_state.clear()
+            self._sync_state_path.unlink(missing_ok=True)
         self.collection = LocalCollection(
             base_dir=self.chroma_dir,
             name=self.collection_name,
@@ -121,45 +121,71 @@ class JournalFTSIndex:
         Returns:
             (added_or_updated, deleted) counts.
         """
-        updated = 0
-        deleted = 0
+        mtimes = {}
+        for entry in entries:
+            p = Path(entry["id"])
+            if p.exists():
+                mtimes[entry["id"]] = p.stat().st_mtime
+        return self.sync_changes(mtimes, entries)
 
-        current_paths = set()
+    def changed_paths(self, mtimes: dict[str, float]) -> set[str]:
+        """Paths from a ``JournalStorage.scan_mtimes()`` map that need re-indexing."""
+        existing = self._indexed_mtimes()
+        return {path for path, mtime in mtimes.items() if existing.get(path) != mtime}
 
-        with wal_connect(self.db_path) as conn:
-            # Build mtime cache
-            existing = {
-                row[0]: row[1]
-                for row in conn.execute("SELECT path, mtime FROM journal_fts_meta").fetchall()
-            }
+    def sync_changes(self, mtimes: dict[str, float], entries: list[dict]) -> tuple[int, int]:
+        """Apply a stat-first change set to the index.
 
+        Args:
+            mtimes: ``{path_str: mtime}`` for every file currently on disk.
+            entries: parsed entries for (at least) the changed paths; entries
+                     whose mtime already matches the index are skipped.
+
+        Returns:
+            (added_or_updated, deleted) counts.
+        """
+        existing = self._indexed_mtimes()
+        rows = []
         for entry in entries:
             path_str = entry["id"]
-            current_paths.add(path_str)
-            p = Path(path_str)
-            if not p.exists():
+            mtime = mtimes.get(path_str)
+            if mtime is None or existing.get(path_str) == mtime:
                 continue
 
-            mtime = p.stat().st_mtime
-            if path_str in existing and existing[path_str] == mtime:
-                continue  # unchanged
-
             meta = entry.get("metadata", {})
-            title = meta.get("title", p.stem)
+            title = meta.get("title", Path(path_str).stem)
             entry_type = meta.get("type", "")
             tags_list = meta.get("tags", [])
             tags = ", ".join(tags_list) if isinstance(tags_list, list) else str(tags_list or "")
-
-            self.upsert(path_str, title, entry_type, entry["content"], tags, mtime)
-            updated += 1
+            rows.append((path_str, title, entry_type, entry["content"], tags, mtime))
 
         # Remove entries no longer on disk
-        stale = set(existing.keys()) - current_paths
-        for path_str in stale:
-            self.delete(path_str)
-            deleted += 1
+        stale = [(path_str,) for path_str in set(existing) - set(mtimes)]
+
+        if rows or stale:
+            with wal_connect(self.db_path) as conn:
+                conn.executemany(
+                    "DELETE FROM journal_fts WHERE path = ?",
+                    [(row[0],) for row in rows] + stale,
+                )
+                conn.executemany("DELETE FROM journal_fts_meta WHERE path = ?", stale)
+                conn.executemany(
+                    "INSERT INTO journal_fts(path, title, entry_type, content, tags) VALUES (?, ?, ?, ?, ?)",
+                    [row[:5] for row in rows],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO journal_fts_meta(path, mtime) VALUES (?, ?)",
+                    [(row[0], row[5]) for row in rows],
+                )
 
-        return updated, deleted
+        return len(rows), len(stale)
+
+    def _indexed_mtimes(self) -> dict[str, float]:
+        with wal_connect(self.db_path) as conn:
+            return {
+                row[0]: row[1]
+                for row in conn.execute("SELECT path, mtime FROM journal_fts_meta").fetchall()
+            }
 
     # ------------------------------------------------------------------
     # Helpers
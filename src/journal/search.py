@@ -246,10 +246,21 @@ Tags: {", ".join(r["tags"]) if r["tags"] else "none"}
         return "\n".join(context_parts)
 
     def sync_embeddings(self) -> tuple[int, int]:
-        """Sync all journal entries to embedding store (and FTS index if present)."""
-        entries = self.storage.get_all_content()
+        """Sync journal entries to embedding store (and FTS index if present).
+
+        Stats files first and parses only those that either index considers
+        new or modified, so a sync costs O(change set) rather than O(journal).
+        """
+        mtimes = self.storage.scan_mtimes()
+        changed = set()
+        if self.fts:
+            changed |= self.fts.changed_paths(mtimes)
+        if self.embeddings is not None:
+            changed |= self.embeddings.changed_paths(mtimes)
+        entries = self.storage.load_entries(sorted(changed))
+
         if self.fts:
-            self.fts.sync_from_storage(entries)
+            self.fts.sync_changes(mtimes, entries)
         if self.embeddings is None:
             return (0, 0)
-        return self.embeddings.sync_from_storage(entries)
+        return self.embeddings.sync_changes(mtimes, entries)
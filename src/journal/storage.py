@@ -217,8 +217,27 @@ class JournalStorage:
 
     def get_all_content(self) -> list[dict]:
         """Get all entries with full content for embedding."""
-        entries = []
+        return self.load_entries(self.journal_dir.glob("*.md"))
+
+    def scan_mtimes(self) -> dict[str, float]:
+        """Stat every entry file without parsing it.
+
+        Returns a ``{path_str: mtime}`` map keyed like ``get_all_content()`` ids,
+        so indexes can work out which files changed before paying for a parse.
+        """
+        mtimes = {}
         for f in self.journal_dir.glob("*.md"):
+            try:
+                mtimes[str(f)] = f.stat().st_mtime
+            except OSError:
+                continue
+        return mtimes
+
+    def load_entries(self, paths) -> list[dict]:
+        """Parse only the given entry files, same shape as ``get_all_content()``."""
+        entries = []
+        for f in paths:
+            f = Path(f)
             try:
                 post = frontmatter.load(f)
                 entries.append(
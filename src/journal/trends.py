@@ -1,7 +1,10 @@
 """Topic trend detection via journal embedding clustering."""
 
+import json
+import os
 from collections import defaultdict
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import numpy as np
 import structlog
@@ -11,48 +14,110 @@ from graceful import graceful_context
 logger = structlog.get_logger()
 
 
-def _kmeans(
-    data: np.ndarray, n_clusters: int, n_init: int = 10, max_iter: int = 300, seed: int = 42
-) -> np.ndarray:
-    """Lightweight KMeans using numpy only (Lloyd's algorithm, multi-init).
-
-    Returns an int array of cluster labels with shape (n_samples,).
+# Mini-batch k-means: points per update step, and the centroid shift (relative
+# to the data's mean squared norm) below which a run is considered converged.
+MINIBATCH_SIZE = 256
+CONVERGENCE_TOL = 1e-4
+# Refit from scratch once fewer than this share of entries were in the last fit
+REFIT_MIN_KNOWN_FRACTION = 0.5
+TRENDS_STATE_VERSION = 1
+
+
+def _sq_distances(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Squared euclidean distances (N, K) via ||x||^2 - 2 x.c + ||c||^2."""
+    data_sq = np.einsum("ij,ij->i", data, data)[:, np.newaxis]
+    cent_sq = np.einsum("ij,ij->i", centroids, centroids)[np.newaxis, :]
+    dists = data_sq - 2.0 * (data @ centroids.T) + cent_sq
+    return np.maximum(dists, 0.0, out=dists)
+
+
+def _kmeans_pp_init(data: np.ndarray, n_clusters: int, rng: np.random.RandomState) -> np.ndarray:
+    """k-means++ seeding: each next centroid is drawn proportional to D(x)^2."""
+    n_samples = data.shape[0]
+    centroids = np.empty((n_clusters, data.shape[1]), dtype=data.dtype)
+    centroids[0] = data[rng.randint(n_samples)]
+    closest = _sq_distances(data, centroids[:1])[:, 0]
+    for k in range(1, n_clusters):
+        total = closest.sum()
+        if total <= 0:
+            # Fewer distinct points than clusters; any point will do
+            centroids[k] = data[rng.randint(n_samples)]
+        else:
+            centroids[k] = data[rng.choice(n_samples, p=closest / total)]
+        closest = np.minimum(closest, _sq_distances(data, centroids[k : k + 1])[:, 0])
+    return centroids
+
+
+def _minibatch_step(batch: np.ndarray, centroids: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Move centroids toward their assigned batch points; updates ``counts`` in place.
+
+    Each centroid moves by a per-centroid learning rate of (batch hits / total
+    hits so far), so it converges to the running mean of every point it has
+    been assigned.
+    """
+    labels = np.argmin(_sq_distances(batch, centroids), axis=1)
+    n_clusters = centroids.shape[0]
+    hits = np.bincount(labels, minlength=n_clusters)
+    sums = np.zeros_like(centroids)
+    np.add.at(sums, labels, batch)
+    active = hits > 0
+    counts[active] += hits[active]
+    eta = hits[active] / counts[active]
+    means = sums[active] / hits[active, np.newaxis]
+    centroids[active] += eta[:, np.newaxis] * (means - centroids[active])
+    return labels
+
+
+def _fit_centroids(
+    data: np.ndarray,
+    n_clusters: int,
+    n_init: int = 3,
+    max_iter: int = 100,
+    seed: int = 42,
+    batch_size: int = MINIBATCH_SIZE,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Mini-batch k-means with k-means++ seeding (best of ``n_init`` runs).
+
+    Returns ``(centroids, counts)`` where ``counts`` is the number of points
+    each centroid has absorbed, used as its weight for later incremental
+    updates.
     """
     rng = np.random.RandomState(seed)
-    n_samples, n_features = data.shape
-    best_labels = np.zeros(n_samples, dtype=int)
-    best_inertia = np.inf
-
-    for _ in range(n_init):
-        # Random initialization (Forgy)
-        indices = rng.choice(n_samples, size=n_clusters, replace=False)
-        centroids = data[indices].copy()
+    n_samples = data.shape[0]
+    batch_size = min(batch_size, n_samples)
+    tol = CONVERGENCE_TOL * float(np.mean(np.einsum("ij,ij->i", data, data)) or 1.0)
 
+    best: tuple[np.ndarray, np.ndarray] | None = None
+    best_inertia = np.inf
+    for _ in range(max(1, n_init)):
+        centroids = _kmeans_pp_init(data, n_clusters, rng)
+        counts = np.zeros(n_clusters)
         for _ in range(max_iter):
-            # Assign each point to nearest centroid
-            diffs = data[:, np.newaxis, :] - centroids[np.newaxis, :, :]
-            dists = np.sum(diffs**2, axis=2)
-            labels = np.argmin(dists, axis=1)
-
-            # Update centroids
-            new_centroids = np.empty_like(centroids)
-            for k in range(n_clusters):
-                members = data[labels == k]
-                if len(members) == 0:
-                    new_centroids[k] = data[rng.randint(n_samples)]
-                else:
-                    new_centroids[k] = members.mean(axis=0)
-
-            if np.allclose(centroids, new_centroids):
+            if batch_size == n_samples:
+                batch = data
+                counts[:] = 0  # full batch: plain Lloyd update to the cluster means
+            else:
+                batch = data[rng.choice(n_samples, size=batch_size, replace=False)]
+            previous = centroids.copy()
+            _minibatch_step(batch, centroids, counts)
+            if np.sum((centroids - previous) ** 2) <= tol:
                 break
-            centroids = new_centroids
 
-        inertia = sum(np.sum((data[labels == k] - centroids[k]) ** 2) for k in range(n_clusters))
-        if inertia < best_inertia:
+        dists = _sq_distances(data, centroids)
+        inertia = float(dists.min(axis=1).sum())
+        if best is None or inertia < best_inertia:
+            labels = dists.argmin(axis=1)
             best_inertia = inertia
-            best_labels = labels.copy()
+            best = (centroids, np.bincount(labels, minlength=n_clusters).astype(float))
+    return best
 
-    return best_labels
+
+def _kmeans(
+    data: np.ndarray, n_clusters: int, n_init: int = 3, max_iter: int = 100, seed: int = 42
+) -> np.ndarray:
+    """Cluster ``data`` and return an int array of labels with shape (n_samples,)."""
+    centroids, _ = _fit_centroids(data, n_clusters, n_init=n_init, max_iter=max_iter, seed=seed)
+    return np.argmin(_sq_distances(data, centroids), axis=1)
 
 
 class TrendDetector:
@@ -72,13 +137,18 @@ class TrendDetector:
         days: int = 90,
         window: str = "weekly",
         n_clusters: int = 8,
+        refit: bool = False,
     ) -> list[dict]:
         """Detect topic trends over time windows.
 
+        Cluster centroids persist between calls: entries seen before keep
+        their cluster, new entries are assigned to the nearest centroid.
+
         Args:
             days: Lookback period
             window: "weekly" or "monthly"
             n_clusters: Number of topic clusters
+            refit: Recluster every entry instead of assigning incrementally
 
         Returns:
             List of trend dicts with topic, direction, growth_rate, counts
@@ -92,14 +162,10 @@ class TrendDetector:
         if len(buckets) < 2:
             return []
 
-        # Cluster all entries
-        embeddings = np.array([e["embedding"] for e in entries])
         n_clusters = min(n_clusters, len(entries))
-        labels = _kmeans(embeddings, n_clusters=n_clusters, n_init=10, seed=42)
-
-        # Assign cluster labels to entries
-        for i, entry in enumerate(entries):
-            entry["cluster"] = int(labels[i])
+        labels = self._assign_clusters(entries, n_clusters, refit=refit)
+        for entry, label in zip(entries, labels):
+            entry["cluster"] = int(label)
 
         # Track cluster sizes per window
         window_keys = sorted(buckets.keys())
@@ -182,7 +248,7 @@ Summarize:
         cutoff = datetime.now() - timedelta(days=days)
         entries = self.search.storage.list_entries(limit=500)
 
-        result = []
+        recent = []
         for entry in entries:
             try:
                 created = entry.get("created")
@@ -193,41 +259,119 @@ Summarize:
                     dt = dt.replace(tzinfo=None)
                 if dt < cutoff:
                     continue
-
-                # Get embedding from ChromaDB
-                embedding = self._get_embedding(entry)
-                if embedding is None:
-                    continue
-
-                result.append(
-                    {
-                        "path": entry.get("path"),
-                        "title": entry.get("title", ""),
-                        "type": entry.get("type", ""),
-                        "created": created,
-                        "created_dt": dt,
-                        "tags": entry.get("tags", []),
-                        "embedding": embedding,
-                    }
-                )
+                recent.append((entry, created, dt))
             except (ValueError, OSError):
                 continue
 
+        vectors = self._get_embeddings([str(entry.get("path", "")) for entry, _, _ in recent])
+        result = []
+        for entry, created, dt in recent:
+            embedding = vectors.get(str(entry.get("path", "")))
+            if embedding is None:
+                continue
+            result.append(
+                {
+                    "path": entry.get("path"),
+                    "title": entry.get("title", ""),
+                    "type": entry.get("type", ""),
+                    "created": created,
+                    "created_dt": dt,
+                    "tags": entry.get("tags", []),
+                    "embedding": embedding,
+                }
+            )
         return result
 
-    def _get_embedding(self, entry) -> np.ndarray | None:
-        """Get embedding vector for an entry from ChromaDB."""
-        if not self.search.embeddings:
-            return None
+    def _get_embeddings(self, ids: list[str]) -> dict[str, np.ndarray]:
+        """Fetch embedding vectors for ``ids`` in one collection read."""
+        embeddings = self.search.embeddings
+        if not ids or not embeddings or getattr(embeddings, "collection", None) is None:
+            return {}
         with graceful_context("graceful.trends.embedding_lookup"):
-            path_str = str(entry.get("path", ""))
-            result = self.search.embeddings.collection.get(
-                ids=[path_str],
-                include=["embeddings"],
-            )
-            if result["embeddings"] and result["embeddings"][0]:
-                return np.array(result["embeddings"][0])
-        return None
+            result = embeddings.collection.get(ids=ids, include=["embeddings"])
+            vectors = result.get("embeddings")
+            if vectors is None:
+                return {}
+            return {
+                entry_id: np.asarray(vector, dtype=float)
+                for entry_id, vector in zip(result["ids"], vectors)
+                if vector is not None and len(vector)
+            }
+        return {}
+
+    # ── Persistent centroids ─────────────────────────────────────────
+
+    def _state_path(self) -> Path | None:
+        embeddings = self.search.embeddings
+        chroma_dir = getattr(embeddings, "chroma_dir", None)
+        collection_name = getattr(embeddings, "collection_name", None)
+        if chroma_dir is None or not collection_name:
+            return None
+        return Path(chroma_dir) / f"{collection_name}.trends.json"
+
+    def _load_state(self, n_clusters: int, dims: int) -> dict | None:
+        path = self._state_path()
+        if path is None:
+            return None
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+            centroids = np.asarray(state["centroids"], dtype=float)
+            counts = np.asarray(state["counts"], dtype=float)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if state.get("version") != TRENDS_STATE_VERSION or centroids.shape != (n_clusters, dims):
+            return None
+        return {"centroids": centroids, "counts": counts, "labels": dict(state.get("labels", {}))}
+
+    def _save_state(self, centroids: np.ndarray, counts: np.ndarray, labels: dict) -> None:
+        path = self._state_path()
+        if path is None:
+            return
+        payload = {
+            "version": TRENDS_STATE_VERSION,
+            "fitted_at": datetime.now().isoformat(),
+            "centroids": centroids.tolist(),
+            "counts": counts.tolist(),
+            "labels": labels,
+        }
+        try:
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("trends_state_save_failed", error=str(e))
+
+    def _assign_clusters(self, entries: list[dict], n_clusters: int, refit: bool) -> list[int]:
+        """Cluster labels for ``entries``, reusing persisted centroids when valid.
+
+        Entries clustered before keep their label; new ones go to the nearest
+        centroid, which then absorbs them with a mini-batch update. A full
+        refit runs when asked, when no compatible state exists, or when most
+        entries are new.
+        """
+        data = np.vstack([e["embedding"] for e in entries])
+        ids = [str(e.get("path", "")) for e in entries]
+        state = None if refit else self._load_state(n_clusters, data.shape[1])
+
+        known = [i for i, entry_id in enumerate(ids) if state and entry_id in state["labels"]]
+        if state is None or len(known) < REFIT_MIN_KNOWN_FRACTION * len(entries):
+            centroids, counts = _fit_centroids(data, n_clusters, seed=42)
+            labels = np.argmin(_sq_distances(data, centroids), axis=1)
+            saved = dict(zip(ids, (int(label) for label in labels)))
+            self._save_state(centroids, counts, saved)
+            logger.debug("trends_refit", entries=len(entries), clusters=n_clusters)
+            return [int(label) for label in labels]
+
+        centroids, counts, saved = state["centroids"], state["counts"], state["labels"]
+        known_set = set(known)
+        new = [i for i in range(len(entries)) if i not in known_set]
+        if new:
+            new_labels = _minibatch_step(data[new], centroids, counts)
+            for i, label in zip(new, new_labels):
+                saved[ids[i]] = int(label)
+            self._save_state(centroids, counts, saved)
+        logger.debug("trends_incremental", known=len(known), new=len(new))
+        return [int(saved[entry_id]) for entry_id in ids]
 
     def _bucket_entries(self, entries: list, window: str) -> dict[str, list]:
         """Group entries into time windows."""
@@ -9,6 +9,27 @@ from embeddings.versioning import auto_migrate_collection, model_tag, versioned_
 
 logger = structlog.get_logger()
 
+CHUNK_ID_SEPARATOR = "#"
+
+
+def _clean_metadata(metadata: dict | None) -> dict:
+    clean_meta = {}
+    for k, v in (metadata or {}).items():
+        if isinstance(v, list):
+            clean_meta[k] = ",".join(str(x) for x in v) if v else ""
+        elif isinstance(v, (str, int, float, bool)) or v is None:
+            clean_meta[k] = v
+        else:
+            clean_meta[k] = str(v)
+    return clean_meta
+
+
+def _parent_id(record_id: str, metadata: dict | None) -> str:
+    """Map a stored record id (whole item or ``<id>#<n>`` chunk) to its item id."""
+    if metadata and metadata.get("report_id"):
+        return str(metadata["report_id"])
+    return record_id
+
 
 class LibraryEmbeddingManager:
     """Manages vector embeddings for library documents."""
@@ -55,28 +76,51 @@ class LibraryEmbeddingManager:
         """Add or update a library item embedding."""
         if not self.is_available:
             return
-        clean_meta = {}
-        if metadata:
-            for k, v in metadata.items():
-                if isinstance(v, list):
-                    clean_meta[k] = ",".join(str(x) for x in v) if v else ""
-                elif isinstance(v, (str, int, float, bool)) or v is None:
-                    clean_meta[k] = v
-                else:
-                    clean_meta[k] = str(v)
-
+        clean_meta = _clean_metadata(metadata)
         self.collection.upsert(
             ids=[item_id],
             documents=[content],
             metadatas=[clean_meta] if clean_meta else None,
         )
 
+    def _stored_ids(self, item_id: str) -> list[str]:
+        """Record ids stored for an item: the whole-item id and any chunk ids."""
+        whole = self.collection.get(ids=[item_id], include=[])["ids"] or []
+        chunks = self.collection.get(where={"report_id": item_id}, include=[])["ids"] or []
+        return list(dict.fromkeys([*whole, *chunks]))
+
+    def add_item_chunks(
+        self,
+        item_id: str,
+        chunks: list[str],
+        metadata: dict | None = None,
+    ) -> None:
+        """Embed an item as several chunks, replacing whatever was stored for it.
+
+        Chunk records are ``<item_id>#<n>`` and carry ``report_id`` and
+        ``chunk_index`` in their metadata so query hits map back to the item.
+        """
+        if not self.is_available or not chunks:
+            return
+        base_meta = _clean_metadata(metadata)
+        ids = [f"{item_id}{CHUNK_ID_SEPARATOR}{i}" for i in range(len(chunks))]
+        stale = [rid for rid in self._stored_ids(item_id) if rid not in set(ids)]
+        self.collection.upsert(
+            ids=ids,
+            documents=chunks,
+            metadatas=[
+                {**base_meta, "report_id": item_id, "chunk_index": i} for i in range(len(ids))
+            ],
+        )
+        if stale:
+            self.collection.delete(ids=stale)
+
     def remove_item(self, item_id: str) -> None:
-        """Remove item from vector store."""
+        """Remove item (and all of its chunks) from vector store."""
         if not self.is_available:
             return
         try:
-            self.collection.delete(ids=[item_id])
+            self.collection.delete(ids=self._stored_ids(item_id))
         except Exception as e:
             logger.warning("library_embedding_remove_failed", item_id=item_id, error=str(e))
 
@@ -110,6 +154,25 @@ class LibraryEmbeddingManager:
 
         return items
 
+    def query_items(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        where: dict | None = None,
+        overfetch: int = 4,
+    ) -> list[dict]:
+        """Query chunks and collapse them to one hit per item, keeping the best chunk.
+
+        Each result has the item ``id`` plus the matching chunk's ``content``,
+        ``metadata`` and ``distance``.
+        """
+        best: dict[str, dict] = {}
+        for hit in self.query(query_text, n_results=n_results * overfetch, where=where):
+            parent = _parent_id(hit["id"], hit["metadata"])
+            if parent not in best or hit["distance"] < best[parent]["distance"]:
+                best[parent] = {**hit, "id": parent}
+        return sorted(best.values(), key=lambda hit: hit["distance"])[:n_results]
+
     def sync_from_storage(self, items: list[dict]) -> tuple[int, int]:
         """Sync embeddings from storage items.
 
@@ -123,8 +186,13 @@ class LibraryEmbeddingManager:
             return (0, 0)
         existing = set()
         try:
-            existing_data = self.collection.get()
-            existing = set(existing_data["ids"]) if existing_data["ids"] else set()
+            existing_data = self.collection.get(include=["metadatas"])
+            existing = {
+                _parent_id(rid, meta)
+                for rid, meta in zip(
+                    existing_data["ids"] or [], existing_data.get("metadatas") or [], strict=False
+                )
+            }
         except Exception as e:
             logger.warning(
                 "library_chroma_get_existing_failed",
@@ -0,0 +1,114 @@
+"""Background PDF text extraction for uploaded Library documents.
+
+Uploads are stored with ``extraction_status="pending"`` and answered right
+away; the text is pulled out of the PDF on a small shared worker pool and
+written back through ``ReportStore.set_extracted_text``. Callers pass
+``on_complete`` to reindex or post-process the finished record.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from collections.abc import Callable
+
+import structlog
+
+from thread_pools import shared_pool
+
+from .pdf_text import extract_text_from_pdf_bytes
+from .reports import ReportStore
+
+logger = structlog.get_logger()
+
+EXTRACTION_WORKERS = 2
+
+_lock = threading.Lock()
+_jobs: dict[str, concurrent.futures.Future] = {}
+
+
+def _job_key(store: ReportStore, report_id: str) -> str:
+    return f"{store.library_dir}:{report_id}"
+
+
+def _run_extraction(
+    store: ReportStore,
+    report_id: str,
+    on_complete: Callable[[dict, str], None] | None,
+) -> dict | None:
+    path = store.get_attachment_path(report_id)
+    if path is None:
+        logger.warning("library_extraction_missing_attachment", report_id=report_id)
+        return store.update_report(report_id, extraction_status="failed", index_status="failed")
+    try:
+        text = extract_text_from_pdf_bytes(path.read_bytes())
+    except OSError as exc:
+        logger.warning("library_extraction_failed", report_id=report_id, error=str(exc))
+        return store.update_report(report_id, extraction_status="failed", index_status="failed")
+
+    record = store.set_extracted_text(report_id, text)
+    if record is None:
+        return None
+    logger.info("library_extraction_done", report_id=report_id, chars=len(text))
+    if on_complete is not None:
+        try:
+            on_complete(record, text)
+        except Exception as exc:
+            logger.warning(
+                "library_extraction_callback_failed", report_id=report_id, error=str(exc)
+            )
+    return record
+
+
+def submit_pdf_extraction(
+    store: ReportStore,
+    report_id: str,
+    on_complete: Callable[[dict, str], None] | None = None,
+) -> concurrent.futures.Future:
+    """Schedule text extraction for an uploaded PDF; returns the job's future.
+
+    A report already being extracted returns the running job instead of
+    queueing a second one.
+    """
+    key = _job_key(store, report_id)
+    with _lock:
+        existing = _jobs.get(key)
+        if existing is not None and not existing.done():
+            return existing
+    future = shared_pool("library-extract", EXTRACTION_WORKERS).submit(
+        _run_extraction, store, report_id, on_complete
+    )
+    with _lock:
+        _jobs[key] = future
+    future.add_done_callback(lambda _: _forget(key, future))
+    return future
+
+
+def _forget(key: str, future: concurrent.futures.Future) -> None:
+    with _lock:
+        if _jobs.get(key) is future:
+            del _jobs[key]
+
+
+def wait_for_extraction(store: ReportStore, report_id: str, timeout: float | None = None) -> None:
+    """Block until a running extraction job for ``report_id`` (if any) finishes."""
+    with _lock:
+        future = _jobs.get(_job_key(store, report_id))
+    if future is not None:
+        concurrent.futures.wait([future], timeout=timeout)
+
+
+def resume_pending_extractions(
+    store: ReportStore,
+    on_complete: Callable[[dict, str], None] | None = None,
+) -> int:
+    """Requeue uploads left pending by a restart. Returns how many were queued."""
+    pending = [
+        record["id"]
+        for record in store.list_reports(limit=10_000, include_hidden=True)
+        if record.get("source_kind") == "uploaded_pdf"
+        and record.get("extraction_status") == "pending"
+    ]
+    for report_id in pending:
+        submit_pdf_extraction(store, report_id, on_complete)
+    return len(pending)
@@ -48,6 +48,27 @@ def _make_snippet(text: str, query: str, max_chars: int = 240) -> str:
     return snippet
 
 
+def _chunk_text(text: str, chunk_chars: int, overlap: int, max_chunks: int) -> list[str]:
+    """Split text into overlapping windows, preferring paragraph/sentence breaks."""
+    text = text.strip()
+    if not text:
+        return []
+    chunks: list[str] = []
+    start = 0
+    while start < len(text) and len(chunks) < max_chunks:
+        end = min(len(text), start + chunk_chars)
+        if end < len(text):
+            window = text[start:end]
+            cut = max(window.rfind("\n\n"), window.rfind(". "))
+            if cut > chunk_chars // 2:
+                end = start + cut + 1
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return [chunk for chunk in chunks if chunk]
+
+
 class LibraryIndex:
     """SQLite FTS5 index for Library items with optional semantic search."""
 
@@ -83,17 +104,28 @@ class LibraryIndex:
             )
 
     # Gemini/OpenAI models accept 8k+ tokens; MiniLM accepts ~256.
-    # 4000 chars is safe for all providers while capturing more content.
-    MAX_EMBED_CHARS = 4000
+    # Each chunk stays well inside every provider's window; long documents are
+    # covered by many chunks instead of being cut at the first one.
+    EMBED_CHUNK_CHARS = 1600
+    EMBED_CHUNK_OVERLAP = 200
+    MAX_EMBED_CHUNKS = 64
 
     @staticmethod
-    def _build_embed_content(title: str, body_text: str, extracted_text: str) -> str:
-        """Concatenate text fields into a single string for embedding, truncated to fit model window."""
-        parts = [p for p in (title, body_text, extracted_text) if p and p.strip()]
-        content = "\n\n".join(parts)
-        if len(content) > LibraryIndex.MAX_EMBED_CHARS:
-            content = content[: LibraryIndex.MAX_EMBED_CHARS]
-        return content
+    def _build_embed_chunks(title: str, body_text: str, extracted_text: str) -> list[str]:
+        """Chunk the document text for embedding, prefixing each chunk with the title."""
+        body = "\n\n".join(p for p in (body_text, extracted_text) if p and p.strip())
+        chunks = _chunk_text(
+            body,
+            LibraryIndex.EMBED_CHUNK_CHARS,
+            LibraryIndex.EMBED_CHUNK_OVERLAP,
+            LibraryIndex.MAX_EMBED_CHUNKS,
+        )
+        title = (title or "").strip()
+        if not chunks:
+            return [title] if title else []
+        if not title:
+            return chunks
+        return [f"{title}\n\n{chunk}" for chunk in chunks]
 
     def upsert_item(
         self,
@@ -133,11 +165,11 @@ class LibraryIndex:
             )
 
         if self.embedding_manager:
-            embed_content = self._build_embed_content(title, body_text, extracted_text)
-            if embed_content:
-                self.embedding_manager.add_item(
+            chunks = self._build_embed_chunks(title, body_text, extracted_text)
+            if chunks:
+                self.embedding_manager.add_item_chunks(
                     report_id,
-                    embed_content,
+                    chunks,
                     {
                         "source_kind": source_kind,
                         "status": status,
@@ -250,7 +282,7 @@ class LibraryIndex:
         if filters:
             where = filters
 
-        results = self.embedding_manager.query(query, n_results=n_results, where=where)
+        results = self.embedding_manager.query_items(query, n_results=n_results, where=where)
 
         enriched = []
         for r in results:
@@ -258,10 +290,11 @@ class LibraryIndex:
             if not item:
                 continue
 
-            if item.get("source_kind") == "uploaded_pdf":
-                text = item.get("extracted_text") or ""
-            else:
-                text = (item.get("body_text") or "") + "\n" + (item.get("extracted_text") or "")
+            # Snippet from the chunk that matched, minus its title prefix
+            text = r.get("content") or ""
+            title_prefix = f"{item['title']}\n\n"
+            if text.startswith(title_prefix):
+                text = text[len(title_prefix) :]
 
             enriched.append(
                 {
@@ -271,6 +304,7 @@ class LibraryIndex:
                     "file_name": item.get("file_name"),
                     "snippet": _make_snippet(text, query),
                     "score": 1 - r["distance"],
+                    "chunk_index": (r.get("metadata") or {}).get("chunk_index"),
                 }
             )
 
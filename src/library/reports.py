@@ -1,11 +1,26 @@
-"""Markdown-backed storage for Library items."""
+"""Markdown-backed storage for Library items.
 
+The markdown files stay the source of truth. A SQLite table beside them
+(``INDEX_DB_NAME``) caches each file's parsed record plus the filter and sort
+columns, so listing and lookup are indexed queries. The store writes rows
+through on every change it makes. Edits made outside the store are caught
+by comparing each file's (mtime, size) stamp, which needs a stat, not a
+parse.
+"""
+
+import json
+import os
 import re
+import sqlite3
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
 import frontmatter
+from db import wal_connect
+
+INDEX_DB_NAME = "library_meta.db"
 
 
 def _now() -> str:
@@ -42,6 +57,121 @@ class ReportStore:
         self.attachments_dir.mkdir(parents=True, exist_ok=True)
         self.extracted_dir = self._validate_path(self.library_dir / "extracted")
         self.extracted_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.library_dir / INDEX_DB_NAME
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with wal_connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS library_reports (
+                    report_id TEXT PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    status TEXT,
+                    collection_key TEXT,
+                    visibility_state TEXT,
+                    updated TEXT,
+                    search_text TEXT,
+                    record TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_library_reports_updated "
+                "ON library_reports(updated DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_library_reports_status "
+                "ON library_reports(status, updated DESC)"
+            )
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _index_post(self, conn: sqlite3.Connection, path: Path, post: frontmatter.Post) -> dict:
+        """Write one parsed file's record into the index and return it."""
+        record = self._post_to_record(path, post)
+        stamp = self._stamp(path) or (0, 0)
+        search_text = "\n".join(
+            [
+                record["title"],
+                record.get("prompt") or "",
+                record.get("collection") or "",
+                record.get("file_name") or "",
+                record.get("preview") or "",
+            ]
+        ).lower()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO library_reports (
+                report_id, path, mtime_ns, size, status, collection_key,
+                visibility_state, updated, search_text, record
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record["id"],
+                str(path),
+                stamp[0],
+                stamp[1],
+                record["status"],
+                (record.get("collection") or "").strip().lower(),
+                record.get("visibility_state"),
+                record.get("updated") or "",
+                search_text,
+                json.dumps(record, default=str),
+            ),
+        )
+        return record
+
+    def _reconcile(self, conn: sqlite3.Connection) -> None:
+        """Bring the index in line with the markdown files on disk.
+
+        Only files whose stamp changed (or that are new) are parsed; rows for
+        vanished files are dropped.
+        """
+        indexed = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute("SELECT path, mtime_ns, size FROM library_reports")
+        }
+        seen: set[str] = set()
+        with os.scandir(self.library_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                path = Path(entry.path)
+                seen.add(entry.path)
+                stamp = self._stamp(path)
+                if stamp is None or indexed.get(entry.path) == stamp:
+                    continue
+                try:
+                    post = frontmatter.load(path)
+                except (OSError, ValueError):
+                    conn.execute("DELETE FROM library_reports WHERE path = ?", (entry.path,))
+                    continue
+                self._index_post(conn, path, post)
+        vanished = [(path,) for path in indexed if path not in seen]
+        if vanished:
+            conn.executemany("DELETE FROM library_reports WHERE path = ?", vanished)
+
+    def _lookup(self, conn: sqlite3.Connection, report_id: str) -> tuple[Path, dict] | None:
+        """Indexed id lookup; reconciles once if the row is missing or stale."""
+        for attempt in range(2):
+            row = conn.execute(
+                "SELECT path, mtime_ns, size, record FROM library_reports WHERE report_id = ?",
+                (report_id,),
+            ).fetchone()
+            if row and self._stamp(Path(row[0])) == (row[1], row[2]):
+                return Path(row[0]), json.loads(row[3])
+            if attempt == 0:
+                self._reconcile(conn)
+        return None
 
     def _validate_path(self, path: Path) -> Path:
         resolved = path.resolve()
@@ -153,7 +283,8 @@ class ReportStore:
         post["updated"] = now
         post["last_generated_at"] = now
         path = self._write_new_post(title, post)
-        return self._post_to_record(path, post)
+        with wal_connect(self.db_path) as conn:
+            return self._index_post(conn, path, post)
 
     def create_uploaded_pdf(
         self,
@@ -200,7 +331,8 @@ class ReportStore:
             post["extracted_text_path"] = str(extracted_path.relative_to(self.library_dir))
 
         path = self._write_new_post(title, post)
-        return self._post_to_record(path, post)
+        with wal_connect(self.db_path) as conn:
+            return self._index_post(conn, path, post)
 
     def list_reports(
         self,
@@ -211,49 +343,32 @@ class ReportStore:
         limit: int = 50,
         include_hidden: bool = False,
     ) -> list[dict]:
-        query = (search or "").strip().lower()
+        sql = "SELECT record FROM library_reports WHERE 1 = 1"
+        params: list[object] = []
+        if not include_hidden:
+            sql += " AND COALESCE(visibility_state, '') != 'hidden'"
+        if status:
+            sql += " AND status = ?"
+            params.append(status)
         normalized_collection = (collection or "").strip().lower()
-        records: list[dict] = []
-        for path in self.library_dir.glob("*.md"):
-            try:
-                post = frontmatter.load(path)
-            except (OSError, ValueError):
-                continue
-            record = self._post_to_record(path, post)
-            if not include_hidden and record.get("visibility_state") == "hidden":
-                continue
-            if status and record["status"] != status:
-                continue
-            if (
-                normalized_collection
-                and (record.get("collection") or "").strip().lower() != normalized_collection
-            ):
-                continue
-            if query:
-                haystack = "\n".join(
-                    [
-                        record["title"],
-                        record.get("prompt") or "",
-                        record.get("collection") or "",
-                        record.get("file_name") or "",
-                        record.get("preview") or "",
-                    ]
-                ).lower()
-                if query not in haystack:
-                    continue
-            records.append(record)
-        records.sort(key=lambda item: item.get("updated") or "", reverse=True)
-        return records[:limit]
+        if normalized_collection:
+            sql += " AND collection_key = ?"
+            params.append(normalized_collection)
+        query = (search or "").strip().lower()
+        if query:
+            sql += " AND instr(search_text, ?) > 0"
+            params.append(query)
+        sql += " ORDER BY updated DESC LIMIT ?"
+        params.append(limit)
+        with wal_connect(self.db_path) as conn:
+            self._reconcile(conn)
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
 
     def get_report(self, report_id: str) -> dict | None:
-        for path in self.library_dir.glob("*.md"):
-            try:
-                post = frontmatter.load(path)
-            except (OSError, ValueError):
-                continue
-            if post.get("report_id") == report_id:
-                return self._post_to_record(path, post)
-        return None
+        with wal_connect(self.db_path) as conn:
+            found = self._lookup(conn, report_id)
+        return found[1] if found else None
 
     def get_attachment_path(self, report_id: str) -> Path | None:
         record = self.get_report(report_id)
@@ -269,14 +384,28 @@ class ReportStore:
         return path
 
     def get_extracted_text(self, report_id: str) -> str:
-        for path in self.library_dir.glob("*.md"):
+        record = self.get_report(report_id)
+        if not record:
+            return ""
+        return self._load_extracted_text(
+            frontmatter.Post("", extracted_text_path=record.get("extracted_text_path"))
+        )
+
+    def _modify(self, report_id: str, mutate: Callable[[frontmatter.Post], None]) -> dict | None:
+        """Apply ``mutate`` to a report's front matter, rewrite it and re-index it."""
+        with wal_connect(self.db_path) as conn:
+            found = self._lookup(conn, report_id)
+            if not found:
+                return None
+            path = found[0]
             try:
                 post = frontmatter.load(path)
             except (OSError, ValueError):
-                continue
-            if post.get("report_id") == report_id:
-                return self._load_extracted_text(post)
-        return ""
+                return None
+            mutate(post)
+            post["updated"] = _now()
+            path.write_text(frontmatter.dumps(post), encoding="utf-8")
+            return self._index_post(conn, path, post)
 
     def update_report(
         self,
@@ -291,13 +420,7 @@ class ReportStore:
         visibility_state: str | None = None,
         index_status: str | None = None,
     ) -> dict | None:
-        for path in self.library_dir.glob("*.md"):
-            try:
-                post = frontmatter.load(path)
-            except (OSError, ValueError):
-                continue
-            if post.get("report_id") != report_id:
-                continue
+        def _apply(post: frontmatter.Post) -> None:
             if title is not None:
                 post["title"] = title
             if collection is not None:
@@ -314,10 +437,23 @@ class ReportStore:
                 post["visibility_state"] = visibility_state
             if index_status is not None:
                 post["index_status"] = index_status
-            post["updated"] = _now()
-            path.write_text(frontmatter.dumps(post), encoding="utf-8")
-            return self._post_to_record(path, post)
-        return None
+
+        return self._modify(report_id, _apply)
+
+    def set_extracted_text(self, report_id: str, extracted_text: str) -> dict | None:
+        """Store text extracted from an uploaded PDF and mark extraction finished."""
+        has_text = bool(extracted_text.strip())
+        extracted_path = self._extracted_text_filename(report_id)
+        if has_text:
+            extracted_path.write_text(extracted_text, encoding="utf-8")
+
+        def _apply(post: frontmatter.Post) -> None:
+            if has_text:
+                post["extracted_text_path"] = str(extracted_path.relative_to(self.library_dir))
+            post["extraction_status"] = "ready" if has_text else "empty"
+            post["index_status"] = "ready" if has_text else "limited_text"
+
+        return self._modify(report_id, _apply)
 
     def archive_report(self, report_id: str) -> dict | None:
         return self.update_report(report_id, status="archived")
@@ -1,9 +1,15 @@
 """Observation consolidation — synthesize raw facts into higher-level observations."""
 
+import concurrent.futures
+import hashlib
 import json
+from datetime import datetime
 
 import structlog
 
+from db import wal_connect
+
+from .entity_extractor import extract_entities
 from .models import FactCategory, FactSource, StewardFact
 from .store import FactStore
 
@@ -24,18 +30,33 @@ Example output:
 Output ONLY the JSON object. No preamble."""
 
 
+DEFAULT_MAX_CONCURRENCY = 4
+_STATE_KEY = "consolidated_through"
+
+
+def group_signature(fact_ids) -> str:
+    """Order-independent hash of an entity group's member fact ids."""
+    return hashlib.sha256("\n".join(sorted(set(fact_ids))).encode("utf-8")).hexdigest()
+
+
 class ObservationConsolidator:
-    """Groups related facts by entity and synthesizes observations via LLM."""
+    """Groups related facts by entity and synthesizes observations via LLM.
+
+    Only the LLM calls run concurrently (up to ``max_concurrency``); store
+    writes are applied on the calling thread in group order.
+    """
 
     def __init__(
         self,
         store: FactStore,
         provider=None,
         min_facts_per_group: int = 2,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         self.store = store
         self._provider = provider
         self.min_facts_per_group = min_facts_per_group
+        self.max_concurrency = max(1, max_concurrency)
 
     @property
     def provider(self):
@@ -46,78 +67,211 @@ class ObservationConsolidator:
         return self._provider
 
     def consolidate_affected(self, fact_ids: list[str]) -> list[StewardFact]:
-        """Incremental: consolidate only entity groups containing given fact_ids."""
-        all_groups = self._group_by_entity()
-        # Find groups that contain any of the affected facts
-        affected_groups = {}
-        affected_set = set(fact_ids)
-        for entity_key, facts in all_groups.items():
-            if any(f.id in affected_set for f in facts):
-                affected_groups[entity_key] = facts
-
-        results = []
-        for entity_key, facts in affected_groups.items():
-            obs = self._synthesize(entity_key, facts)
-            if obs:
-                results.append(obs)
-        return results
+        """Incremental: consolidate only entity groups touching the given fact_ids.
+
+        Entities are looked up from the changed facts' links; superseded or
+        deleted facts have lost their links, so their entities are re-derived
+        from the fact text. Deletion also drops the fact's ``observation_sources``
+        rows, so groups touched by a deleted fact are always re-synthesized.
+        """
+        entity_keys, deleted_keys = self._entities_for_facts(fact_ids)
+        if not entity_keys:
+            return []
+        return self._consolidate_groups(self._group_by_entity(entity_keys), force=deleted_keys)
 
     def consolidate_all(self) -> list[StewardFact]:
         """Full pass: consolidate every qualifying entity group."""
-        groups = self._group_by_entity()
-        results = []
-        for entity_key, facts in groups.items():
-            obs = self._synthesize(entity_key, facts)
-            if obs:
-                results.append(obs)
-        return results
+        return self._consolidate_groups(self._group_by_entity())
 
-    def _group_by_entity(self) -> dict[str, list[StewardFact]]:
-        """Group active non-observation facts by their linked entity."""
-        from db import wal_connect
+    def consolidate_since_last_run(self) -> list[StewardFact]:
+        """Consolidate facts changed since the previous call (full pass on first run).
 
-        groups: dict[str, list[StewardFact]] = {}
+        The high-water mark lives in the memory DB, so scheduled runs scale with
+        what changed rather than total memory size.
+        """
+        started = datetime.now().isoformat()
+        with wal_connect(self.store.db_path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS consolidation_state (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            row = conn.execute(
+                "SELECT value FROM consolidation_state WHERE key = ?", (_STATE_KEY,)
+            ).fetchone()
+            changed = None
+            if row:
+                changed = [
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT id FROM steward_facts WHERE updated_at > ? AND category != ?",
+                        (row[0], FactCategory.OBSERVATION.value),
+                    )
+                ]
+
+        results = self.consolidate_all() if changed is None else self.consolidate_affected(changed)
+        with wal_connect(self.store.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO consolidation_state (key, value) VALUES (?, ?)",
+                (_STATE_KEY, started),
+            )
+        logger.info(
+            "consolidation_incremental",
+            full=changed is None,
+            changed=len(changed or []),
+            observations=len(results),
+        )
+        return results
 
+    def _entities_for_facts(self, fact_ids: list[str]) -> tuple[set[str], set[str]]:
+        """(entity keys touched by the facts, keys touched by deleted facts)."""
+        ids = list(dict.fromkeys(fact_ids))
+        if not ids:
+            return set(), set()
+        placeholders = ",".join("?" for _ in ids)
         with wal_connect(self.store.db_path) as conn:
-            rows = conn.execute("""
-                SELECT fe.normalized, l.fact_id
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT fe.normalized
                 FROM fact_entity_links l
                 JOIN fact_entities fe ON l.entity_id = fe.id
-                JOIN steward_facts f ON l.fact_id = f.id
-                WHERE f.superseded_by IS NULL AND f.category != 'observation'
-            """).fetchall()
+                WHERE l.fact_id IN ({placeholders})
+                """,
+                ids,
+            ).fetchall()
+        keys = {r[0] for r in rows}
+        deleted: set[str] = set()
+        for fact in self.store.get_many(ids).values():
+            if fact.superseded_by is not None:
+                derived = {normalized for _, normalized in extract_entities(fact.text)}
+                keys.update(derived)
+                if fact.superseded_by.startswith("DELETED:"):
+                    deleted.update(derived)
+        return keys, deleted
+
+    def _group_by_entity(self, entity_keys: set[str] | None = None) -> dict[str, list[StewardFact]]:
+        """Group active non-observation facts by their linked entity.
+
+        ``entity_keys`` restricts the scan to those entities.
+        """
+        groups: dict[str, list[StewardFact]] = {}
+
+        sql = """
+            SELECT fe.normalized, l.fact_id
+            FROM fact_entity_links l
+            JOIN fact_entities fe ON l.entity_id = fe.id
+            JOIN steward_facts f ON l.fact_id = f.id
+            WHERE f.superseded_by IS NULL AND f.category != 'observation'
+        """
+        params: list[str] = []
+        if entity_keys is not None:
+            params = sorted(entity_keys)
+            sql += f" AND fe.normalized IN ({','.join('?' for _ in params)})"
+        with wal_connect(self.store.db_path) as conn:
+            rows = conn.execute(sql, params).fetchall()
 
         # Build entity -> fact_id mapping
         entity_fact_ids: dict[str, list[str]] = {}
         for normalized, fact_id in rows:
             entity_fact_ids.setdefault(normalized, []).append(fact_id)
 
-        # Filter by min size and resolve to StewardFact objects
+        # Filter by min size, then resolve every surviving id in one bulk load
+        candidates: dict[str, list[str]] = {}
         for entity_key, fact_ids in entity_fact_ids.items():
             unique_ids = list(dict.fromkeys(fact_ids))  # preserve order, dedup
-            if len(unique_ids) < self.min_facts_per_group:
-                continue
-            facts = []
-            for fid in unique_ids:
-                fact = self.store.get(fid)
-                if fact and fact.superseded_by is None:
-                    facts.append(fact)
+            if len(unique_ids) >= self.min_facts_per_group:
+                candidates[entity_key] = unique_ids
+        loaded = self.store.get_many(fid for ids in candidates.values() for fid in ids)
+
+        for entity_key, unique_ids in candidates.items():
+            facts = [
+                loaded[fid]
+                for fid in unique_ids
+                if fid in loaded and loaded[fid].superseded_by is None
+            ]
             if len(facts) >= self.min_facts_per_group:
                 groups[entity_key] = facts
 
         return groups
 
-    def _synthesize(self, entity_key: str, facts: list[StewardFact]) -> StewardFact | None:
-        """Synthesize an observation for an entity group. Skips if unchanged."""
-        fact_ids = sorted(f.id for f in facts)
+    def _existing_observations(self, entity_keys: list[str]) -> dict[str, tuple[StewardFact, str]]:
+        """Map entity key -> (active observation, signature of every recorded source).
 
-        # Check for existing observation covering this entity
-        existing_obs = self._find_existing_observation(entity_key)
-        if existing_obs:
-            existing_source_ids = sorted(self.store.get_observation_source_ids(existing_obs.id))
-            if existing_source_ids == fact_ids:
-                return existing_obs  # no change, skip LLM call
+        Superseded or retracted sources stay in the signature, so a group that
+        lost a member no longer matches and gets re-synthesized.
+        """
+        if not entity_keys:
+            return {}
+        placeholders = ",".join("?" for _ in entity_keys)
+        with wal_connect(self.store.db_path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT o.id, o.source_id, os.fact_id
+                FROM steward_facts o
+                LEFT JOIN observation_sources os ON os.observation_id = o.id
+                WHERE o.source_type = ? AND o.category = ? AND o.superseded_by IS NULL
+                  AND o.source_id IN ({placeholders})
+                """,
+                [FactSource.CONSOLIDATION.value, FactCategory.OBSERVATION.value, *entity_keys],
+            ).fetchall()
+        obs_entity: dict[str, str] = {}
+        sources: dict[str, list[str]] = {}
+        for obs_id, entity_key, source_id in rows:
+            # First active observation per entity wins, as before
+            obs_entity.setdefault(entity_key, obs_id)
+            if source_id:
+                sources.setdefault(obs_id, []).append(source_id)
+        loaded = self.store.get_many(obs_entity.values())
+        return {
+            entity_key: (loaded[obs_id], group_signature(sources.get(obs_id, [])))
+            for entity_key, obs_id in obs_entity.items()
+            if obs_id in loaded
+        }
+
+    def _consolidate_groups(
+        self, groups: dict[str, list[StewardFact]], force: set[str] | None = None
+    ) -> list[StewardFact]:
+        """Skip unchanged groups, synthesize the rest concurrently, then write in order.
+
+        Groups in ``force`` are synthesized even when their signature matches.
+        """
+        existing = self._existing_observations(list(groups))
+        force = force or set()
+        results: dict[str, StewardFact] = {}
+        pending: list[str] = []
+        for entity_key, facts in groups.items():
+            current = existing.get(entity_key)
+            unchanged = current and current[1] == group_signature(f.id for f in facts)
+            if unchanged and entity_key not in force:
+                results[entity_key] = current[0]  # no change, skip LLM call
+            else:
+                pending.append(entity_key)
+
+        generated: dict[str, tuple[str, str | None] | None] = {}
+        if len(pending) == 1:
+            generated[pending[0]] = self._generate(pending[0], groups[pending[0]])
+        elif pending:
+            workers = min(self.max_concurrency, len(pending))
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="memory-consolidate"
+            ) as pool:
+                futures = {key: pool.submit(self._generate, key, groups[key]) for key in pending}
+                generated = {key: future.result() for key, future in futures.items()}
+
+        for entity_key in pending:
+            if generated.get(entity_key) is None:
+                continue
+            observation_text, abstract_text = generated[entity_key]
+            current = existing.get(entity_key)
+            results[entity_key] = self._apply(
+                entity_key,
+                groups[entity_key],
+                current[0] if current else None,
+                observation_text,
+                abstract_text,
+            )
+        return [results[key] for key in groups if key in results]
 
+    def _generate(self, entity_key: str, facts: list[StewardFact]) -> tuple[str, str | None] | None:
+        """Ask the LLM for (observation, abstract); None when it fails or returns nothing."""
         # Build prompt — use .replace() to avoid KeyError on curly braces in fact text
         fact_list = "\n".join(f"{i + 1}. {f.text}" for i, f in enumerate(facts))
         prompt = _SYNTHESIS_PROMPT.replace("{entity_name}", entity_key).replace(
@@ -153,7 +307,17 @@ class ObservationConsolidator:
         except (json.JSONDecodeError, KeyError, AttributeError, ValueError):
             observation_text = response
             abstract_text = None
+        return observation_text, abstract_text
 
+    def _apply(
+        self,
+        entity_key: str,
+        facts: list[StewardFact],
+        existing_obs: StewardFact | None,
+        observation_text: str,
+        abstract_text: str | None,
+    ) -> StewardFact:
+        fact_ids = sorted(f.id for f in facts)
         avg_confidence = sum(f.confidence for f in facts) / len(facts)
 
         if existing_obs:
@@ -190,11 +354,3 @@ class ObservationConsolidator:
             source_count=len(fact_ids),
         )
         return new_obs
-
-    def _find_existing_observation(self, entity_key: str) -> StewardFact | None:
-        """Find active observation for an entity key (stored as source_id)."""
-        facts = self.store.get_by_source(FactSource.CONSOLIDATION, entity_key)
-        for f in facts:
-            if f.superseded_by is None and f.category == FactCategory.OBSERVATION:
-                return f
-        return None
@@ -0,0 +1,54 @@
+"""Process-wide cache of active (non-superseded) fact IDs per memory database.
+
+Every ``FactStore.search`` needs the active-id set, and loading it costs a
+full scan that grows with fact count. The set is cached per database path and
+dropped by the store's own writes. Writes from other processes (or stores
+that bypass ``FactStore``) are caught by comparing the size and mtime of the
+database and its ``-wal`` file, which every committed transaction touches.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+_Stamp = tuple[tuple[int, int], tuple[int, int]]
+
+_entries: dict[str, tuple[_Stamp, frozenset[str]]] = {}
+_lock = threading.Lock()
+
+
+def _file_stamp(path: str) -> tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (-1, -1)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _db_stamp(key: str) -> _Stamp:
+    return (_file_stamp(key), _file_stamp(f"{key}-wal"))
+
+
+def get_active_ids(db_path: str | Path, loader: Callable[[], set[str]]) -> frozenset[str]:
+    """Return the cached active-id set for ``db_path``, reloading when stale."""
+    key = str(db_path)
+    # Stamp before loading so a write that lands mid-load invalidates the entry
+    stamp = _db_stamp(key)
+    with _lock:
+        entry = _entries.get(key)
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+
+    ids = frozenset(loader())
+    with _lock:
+        _entries[key] = (stamp, ids)
+    return ids
+
+
+def invalidate_active_ids(db_path: str | Path) -> None:
+    """Drop the cached set after a write that adds or supersedes facts."""
+    with _lock:
+        _entries.pop(str(db_path), None)
@@ -0,0 +1,52 @@
+"""Token-overlap scoring for the SQLite keyword fallback of ``FactStore.search``."""
+
+import re
+
+SEARCH_STOPWORDS = {
+    "a",
+    "an",
+    "and",
+    "are",
+    "for",
+    "from",
+    "has",
+    "have",
+    "into",
+    "is",
+    "its",
+    "now",
+    "that",
+    "the",
+    "their",
+    "then",
+    "they",
+    "this",
+    "user",
+    "with",
+}
+
+
+def search_tokens(text: str) -> list[str]:
+    """Lowercased alphanumeric tokens of 3+ chars, minus stopwords."""
+    return [
+        token
+        for token in re.findall(r"[a-z0-9]+", text.lower())
+        if len(token) >= 3 and token not in SEARCH_STOPWORDS
+    ]
+
+
+def keyword_score(query: str, text: str) -> float:
+    """Exact-substring match or the share of query tokens present in ``text``."""
+    query_lower = query.lower()
+    text_lower = text.lower()
+    exact_match = 1.0 if query_lower in text_lower else 0.0
+    query_tokens = set(search_tokens(query))
+    if not query_tokens:
+        return exact_match
+
+    text_tokens = set(search_tokens(text))
+    if not text_tokens:
+        return exact_match
+
+    overlap = len(query_tokens & text_tokens) / len(query_tokens)
+    return max(exact_match, overlap)
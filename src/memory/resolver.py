@@ -20,6 +20,20 @@ Choose ONE action:
 Respond as JSON: {"action": "ADD|UPDATE|DELETE|NOOP", "existing_id": "<id or null>", "reasoning": "<one sentence>"}
 Output ONLY JSON. No preamble."""
 
+_BATCH_RESOLUTION_SYSTEM = """You resolve conflicts between new facts and existing facts about a user.
+
+Each numbered new fact lists its own existing facts. Decide each new fact independently,
+choosing ONE action using only the existing ids listed under it:
+- ADD: The new fact is distinct from all its existing facts.
+- UPDATE <id>: The new fact replaces an existing fact (e.g. preference changed).
+- DELETE <id>: The new fact explicitly negates an existing fact.
+- NOOP: The new fact is redundant — already captured by existing facts.
+
+Respond as JSON: {"results": [{"index": <n>, "action": "ADD|UPDATE|DELETE|NOOP", "existing_id": "<id or null>", "reasoning": "<one sentence>"}]}
+Include one result per new fact. Output ONLY JSON. No preamble."""
+
+DEFAULT_BATCH_SIZE = 8
+
 
 class ConflictResolver:
     """Compares candidate facts against existing facts to prevent contradictions."""
@@ -30,11 +44,13 @@ class ConflictResolver:
         provider=None,
         similarity_threshold: float = 0.7,
         auto_noop_threshold: float = 0.95,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         self.store = fact_store
         self._provider = provider
         self.similarity_threshold = similarity_threshold
         self.auto_noop_threshold = auto_noop_threshold
+        self.batch_size = max(1, batch_size)
 
     def _get_provider(self):
         if self._provider:
@@ -44,23 +60,66 @@ class ConflictResolver:
         return create_cheap_provider()
 
     def resolve(self, candidates: list[StewardFact]) -> list[FactUpdate]:
-        """Resolve a batch of candidate facts against existing facts."""
-        results = []
+        """Resolve a batch of candidate facts against existing facts.
+
+        Similarity lookups share one ``search_many`` call. Candidates that need
+        the LLM are queued and sent together (up to ``batch_size`` per prompt).
+        The queue is flushed early when a later candidate resembles a queued
+        one, because its intra-batch similar set depends on whether that
+        earlier candidate is accepted.
+        """
+        store_hits = self.store.search_many([c.text for c in candidates], limit=3)
+        results: list[FactUpdate | None] = [None] * len(candidates)
         accepted_candidates: list[StewardFact] = []
-        for candidate in candidates:
-            similar = self.store.search(candidate.text, limit=3, use_graph=False)
+        pending: list[tuple[int, StewardFact, list[StewardFact]]] = []
+
+        def _record(index: int, candidate: StewardFact, update: FactUpdate) -> None:
+            results[index] = update
+            if update.action in ("ADD", "UPDATE"):
+                accepted_candidates.append(candidate)
+
+        def _flush() -> None:
+            updates = self._resolve_pending([(c, similar) for _, c, similar in pending])
+            for (index, candidate, _), update in zip(pending, updates, strict=True):
+                _record(index, candidate, update)
+            pending.clear()
+
+        for index, candidate in enumerate(candidates):
+            if pending and self._batch_similar(candidate, [c for _, c, _ in pending]):
+                _flush()
             # Filter out the candidate itself if it somehow got in
-            similar = [s for s in similar if s.id != candidate.id]
+            similar = [s for s in store_hits[index] if s.id != candidate.id]
             similar.extend(self._batch_similar(candidate, accepted_candidates))
             similar = self._rank_similar(candidate, similar)[:3]
-            update = self.resolve_single(candidate, similar)
-            results.append(update)
-            if update.action in ("ADD", "UPDATE"):
-                accepted_candidates.append(candidate)
+            update = self._resolve_without_llm(candidate, similar)
+            if update is not None:
+                _record(index, candidate, update)
+                continue
+            pending.append((index, candidate, similar))
+            if len(pending) >= self.batch_size:
+                _flush()
+        if pending:
+            _flush()
         return results
 
     def resolve_single(self, candidate: StewardFact, similar: list[StewardFact]) -> FactUpdate:
         """Resolve one candidate against its similar existing facts."""
+        update = self._resolve_without_llm(candidate, similar)
+        if update is not None:
+            return update
+
+        # LLM resolution
+        try:
+            return self._finalize(self._llm_resolve(candidate, similar), similar)
+        except Exception as e:
+            logger.warning("conflict_resolution_failed", error=str(e))
+            # Default to ADD on failure
+            return FactUpdate(action="ADD", candidate=candidate.text)
+
+    def _resolve_without_llm(
+        self, candidate: StewardFact, similar: list[StewardFact]
+    ) -> FactUpdate | None:
+        """ADD when nothing is similar, NOOP for near-duplicates, else None."""
         if not similar:
             return FactUpdate(action="ADD", candidate=candidate.text)
 
@@ -74,29 +133,92 @@ class ConflictResolver:
                     existing_id=top.id,
                     reasoning="Near-duplicate of existing fact",
                 )
+        return None
 
-        # LLM resolution
+    @staticmethod
+    def _finalize(update: FactUpdate, similar: list[StewardFact]) -> FactUpdate:
+        if update.action == "NOOP" and not update.existing_id and similar:
+            update.existing_id = similar[0].id
+        return update
+
+    def _resolve_pending(
+        self, items: list[tuple[StewardFact, list[StewardFact]]]
+    ) -> list[FactUpdate]:
+        """Resolve queued candidates with one prompt; unusable answers retry singly."""
+        if len(items) == 1:
+            return [self.resolve_single(*items[0])]
         try:
-            update = self._llm_resolve(candidate, similar)
-            if update.action == "NOOP" and not update.existing_id and similar:
-                update.existing_id = similar[0].id
-            return update
+            parsed = self._llm_resolve_batch(items)
         except Exception as e:
-            logger.warning("conflict_resolution_failed", error=str(e))
-            # Default to ADD on failure
-            return FactUpdate(action="ADD", candidate=candidate.text)
+            logger.warning("conflict_batch_resolution_failed", error=str(e), size=len(items))
+            parsed = {}
 
-    def _llm_resolve(self, candidate: StewardFact, similar: list[StewardFact]) -> FactUpdate:
-        """Use LLM to resolve conflict."""
+        updates: list[FactUpdate] = []
+        for position, (candidate, similar) in enumerate(items, start=1):
+            update = parsed.get(position)
+            known_ids = {s.id for s in similar}
+            if update is None or (
+                update.action in ("UPDATE", "DELETE") and update.existing_id not in known_ids
+            ):
+                # Missing or cross-wired answer — fall back to a focused call
+                updates.append(self.resolve_single(candidate, similar))
+                continue
+            updates.append(self._finalize(update, similar))
+        logger.debug("conflict_batch_resolved", size=len(items), parsed=len(parsed))
+        return updates
+
+    def _llm_resolve_batch(
+        self, items: list[tuple[StewardFact, list[StewardFact]]]
+    ) -> dict[int, FactUpdate]:
+        """Ask the LLM about several candidates at once; keyed by 1-based position."""
         provider = self._get_provider()
+        blocks = []
+        for position, (candidate, similar) in enumerate(items, start=1):
+            lines = [
+                f'{position}. New fact: "{candidate.text}" (category: {candidate.category.value})',
+                "   Existing facts:",
+            ]
+            lines.extend(f"     {line}" for line in self._describe_similar(similar))
+            blocks.append("\n".join(lines))
 
-        lines = [f'New fact: "{candidate.text}" (category: {candidate.category.value})', ""]
-        lines.append("Existing facts:")
+        response = provider.generate(
+            messages=[
+                {"role": "system", "content": _BATCH_RESOLUTION_SYSTEM},
+                {"role": "user", "content": "\n\n".join(blocks)},
+            ],
+            max_tokens=150 * len(items) + 50,
+        )
+        data = json.loads(self._strip_fences(response))
+        entries = data.get("results", []) if isinstance(data, dict) else data
+        parsed: dict[int, FactUpdate] = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                position = int(entry.get("index"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= position <= len(items):
+                parsed[position] = self._to_update(entry, items[position - 1][0].text)
+        return parsed
+
+    @staticmethod
+    def _describe_similar(similar: list[StewardFact]) -> list[str]:
+        lines = []
         for s in similar:
             date_str = s.updated_at.strftime("%Y-%m-%d") if s.updated_at else "unknown"
             lines.append(
-                f'  {s.id}: [{date_str}] "{s.text}" ({s.category.value}, confidence: {s.confidence})'
+                f'{s.id}: [{date_str}] "{s.text}" ({s.category.value}, confidence: {s.confidence})'
             )
+        return lines
+
+    def _llm_resolve(self, candidate: StewardFact, similar: list[StewardFact]) -> FactUpdate:
+        """Use LLM to resolve conflict."""
+        provider = self._get_provider()
+
+        lines = [f'New fact: "{candidate.text}" (category: {candidate.category.value})', ""]
+        lines.append("Existing facts:")
+        lines.extend(f"  {line}" for line in self._describe_similar(similar))
 
         prompt = "\n".join(lines)
         response = provider.generate(
@@ -108,21 +230,26 @@ class ConflictResolver:
         )
         return self._parse_response(response, candidate.text)
 
-    def _parse_response(self, response: str, candidate_text: str) -> FactUpdate:
-        """Parse LLM resolution response."""
+    @staticmethod
+    def _strip_fences(response: str) -> str:
         text = response.strip()
         if text.startswith("```"):
             text = text.split("\n", 1)[-1]
         if text.endswith("```"):
             text = text.rsplit("```", 1)[0]
-        text = text.strip()
+        return text.strip()
 
+    def _parse_response(self, response: str, candidate_text: str) -> FactUpdate:
+        """Parse LLM resolution response."""
         try:
-            data = json.loads(text)
+            data = json.loads(self._strip_fences(response))
         except json.JSONDecodeError:
             return FactUpdate(action="ADD", candidate=candidate_text, reasoning="Parse failed")
+        return self._to_update(data, candidate_text)
 
-        action = data.get("action", "ADD").upper()
+    @staticmethod
+    def _to_update(data: dict, candidate_text: str) -> FactUpdate:
+        action = str(data.get("action") or "ADD").upper()
         if action not in ("ADD", "UPDATE", "DELETE", "NOOP"):
             action = "ADD"
 
@@ -1,8 +1,8 @@
 """Persistent storage for Steward Facts — SQLite metadata + ChromaDB embeddings."""
 
-import re
 import sqlite3
 import uuid
+from collections.abc import Container, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -11,36 +11,17 @@ import structlog
 from db import ensure_schema_version, wal_connect
 
 from .entity_extractor import extract_entities
+from .fact_cache import get_active_ids, invalidate_active_ids
+from .keyword_search import keyword_score, search_tokens
 from .models import FactCategory, FactSource, StewardFact
 
 logger = structlog.get_logger()
 
 SCHEMA_VERSION = 4
+_GET_MANY_CHUNK = 500
 DEFAULT_REINFORCEMENT = 0.05
 DEFAULT_CONTRADICTION_DECAY = 0.15
 _MIN_ABSTRACT_WORDS = 3
-_SEARCH_STOPWORDS = {
-    "a",
-    "an",
-    "and",
-    "are",
-    "for",
-    "from",
-    "has",
-    "have",
-    "into",
-    "is",
-    "its",
-    "now",
-    "that",
-    "the",
-    "their",
-    "then",
-    "they",
-    "this",
-    "user",
-    "with",
-}
 
 
 class FactStore:
@@ -211,6 +192,7 @@ class FactStore:
                 ),
             )
 
+        invalidate_active_ids(self.db_path)
         self._upsert_embedding(fact)
         self._index_entities(fact)
 
@@ -308,6 +290,7 @@ class FactStore:
                 (decayed_confidence, now.isoformat(), new_id, fact_id),
             )
             conn.execute("DELETE FROM fact_entity_links WHERE fact_id = ?", (fact_id,))
+        invalidate_active_ids(self.db_path)
 
         # Remove old from ChromaDB
         coll = self._chroma
@@ -362,6 +345,7 @@ class FactStore:
             )
             conn.execute("DELETE FROM fact_entity_links WHERE fact_id = ?", (fact_id,))
             conn.execute("DELETE FROM observation_sources WHERE fact_id = ?", (fact_id,))
+        invalidate_active_ids(self.db_path)
 
         coll = self._chroma
         if coll:
@@ -402,6 +386,7 @@ class FactStore:
                     conn.execute(
                         "DELETE FROM observation_sources WHERE observation_id = ?", (obs_id,)
                     )
+                invalidate_active_ids(self.db_path)
                 coll = self._chroma
                 if coll:
                     try:
@@ -418,6 +403,22 @@ class FactStore:
                 return self._row_to_fact(row)
         return None
 
+    def get_many(self, fact_ids) -> dict[str, StewardFact]:
+        """Load several facts by ID in one query per chunk; missing IDs are omitted."""
+        ids = list(dict.fromkeys(fact_ids))
+        facts: dict[str, StewardFact] = {}
+        if not ids:
+            return facts
+        with wal_connect(self.db_path, row_factory=True) as conn:
+            for i in range(0, len(ids), _GET_MANY_CHUNK):
+                chunk = ids[i : i + _GET_MANY_CHUNK]
+                rows = conn.execute(
+                    f"SELECT * FROM steward_facts WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                facts.update((row["id"], self._row_to_fact(row)) for row in rows)
+        return facts
+
     def search(
         self,
         query: str,
@@ -446,6 +447,24 @@ class FactStore:
 
         return self._propagate_and_merge(scored_seeds, limit, graph_limit, categories, alpha)
 
+    def search_many(
+        self,
+        queries: list[str],
+        limit: int = 3,
+        categories: list[FactCategory] | None = None,
+    ) -> list[list[StewardFact]]:
+        """Seed-only search (no graph expansion) for several queries at once.
+
+        With ChromaDB the queries share one ``query`` call, so the provider
+        embeds them in a single batch; results align with ``queries``.
+        """
+        if not queries:
+            return []
+        if not self._chroma:
+            return [self._keyword_search(q, limit, categories) for q in queries]
+        hits = self._chroma_search_scored_many(queries, limit, categories)
+        return [[fact for fact, _ in scored] for scored in hits]
+
     def _chroma_search_scored(
         self,
         query: str,
@@ -453,9 +472,17 @@ class FactStore:
         categories: list[FactCategory] | None = None,
     ) -> list[tuple[StewardFact, float]]:
         """ChromaDB semantic search returning (fact, similarity_score) tuples."""
+        return self._chroma_search_scored_many([query], limit, categories)[0]
+
+    def _chroma_search_scored_many(
+        self,
+        queries: list[str],
+        limit: int,
+        categories: list[FactCategory] | None = None,
+    ) -> list[list[tuple[StewardFact, float]]]:
         coll = self._chroma
         if not coll:
-            return [(f, 0.0) for f in self._keyword_search(query, limit, categories)]
+            return [[(f, 0.0) for f in self._keyword_search(q, limit, categories)] for q in queries]
 
         where = None
         if categories:
@@ -468,31 +495,36 @@ class FactStore:
         try:
             active_ids = self._get_active_ids()
             if not active_ids:
-                return []
+                return [[] for _ in queries]
 
             results = coll.query(
-                query_texts=[query],
+                query_texts=list(queries),
                 n_results=min(limit * 2, len(active_ids)),
                 where=where,
                 include=["documents", "metadatas", "distances"],
             )
 
-            facts: list[tuple[StewardFact, float]] = []
-            if results["ids"] and results["ids"][0]:
-                distances = results["distances"][0] if results.get("distances") else []
-                for idx, fid in enumerate(results["ids"][0]):
-                    if fid in active_ids:
-                        fact = self.get(fid)
-                        if fact:
-                            # Cosine distance ∈ [0,2]; normalize to similarity ∈ [0,1]
-                            score = max(0.0, 1.0 - distances[idx]) if idx < len(distances) else 0.0
-                            facts.append((fact, score))
+            id_rows = results["ids"] or []
+            distance_rows = results.get("distances") or []
+            loaded = self.get_many(fid for row in id_rows for fid in row if fid in active_ids)
+            batches: list[list[tuple[StewardFact, float]]] = []
+            for qi in range(len(queries)):
+                ids = id_rows[qi] if qi < len(id_rows) else []
+                distances = distance_rows[qi] if qi < len(distance_rows) else []
+                facts: list[tuple[StewardFact, float]] = []
+                for idx, fid in enumerate(ids):
+                    fact = loaded.get(fid) if fid in active_ids else None
+                    if fact:
+                        # Cosine distance ∈ [0,2]; normalize to similarity ∈ [0,1]
+                        score = max(0.0, 1.0 - distances[idx]) if idx < len(distances) else 0.0
+                        facts.append((fact, score))
                     if len(facts) >= limit:
                         break
-            return facts
+                batches.append(facts)
+            return batches
         except Exception as e:
             logger.warning("chroma_search_failed", error=str(e))
-            return [(f, 0.0) for f in self._keyword_search(query, limit, categories)]
+            return [[(f, 0.0) for f in self._keyword_search(q, limit, categories)] for q in queries]
 
     def _keyword_search(
         self,
@@ -515,7 +547,7 @@ class FactStore:
             params.extend(cat_values)
 
         patterns = [query.lower()]
-        patterns.extend(token for token in self._search_tokens(query) if token not in patterns)
+        patterns.extend(token for token in search_tokens(query) if token not in patterns)
         placeholders = " OR ".join("LOWER(text) LIKE ?" for _ in patterns)
         sql += f" AND ({placeholders})"
         params.extend(f"%{pattern}%" for pattern in patterns)
@@ -526,7 +558,7 @@ class FactStore:
             facts = [self._row_to_fact(r) for r in rows]
 
         facts.sort(
-            key=lambda fact: (self._fallback_keyword_score(query, fact.text), fact.confidence),
+            key=lambda fact: (keyword_score(query, fact.text), fact.confidence),
             reverse=True,
         )
         return facts[:limit]
@@ -707,6 +739,7 @@ class FactStore:
             conn.execute("DELETE FROM fact_entity_links")
             conn.execute("DELETE FROM fact_entities")
             conn.execute("DELETE FROM steward_facts")
+        invalidate_active_ids(self.db_path)
 
         coll = self._chroma
         if coll:
@@ -779,16 +812,27 @@ class FactStore:
                 SELECT l2.fact_id, COUNT(DISTINCT l2.entity_id) as shared_count
                 FROM fact_entity_links l1
                 JOIN fact_entity_links l2 ON l1.entity_id = l2.entity_id
-                JOIN steward_facts f ON l2.fact_id = f.id
                 WHERE l1.fact_id IN ({placeholders})
                   AND l2.fact_id NOT IN ({exclude_ph})
-                  AND f.superseded_by IS NULL
                 GROUP BY l2.fact_id
                 ORDER BY shared_count DESC
                 """,
                 list(seed_ids) + list(exclude_all),
             ).fetchall()
-        return [(r[0], r[1]) for r in rows]
+        active_ids = self._get_active_ids()
+        return [(r[0], r[1]) for r in rows if r[0] in active_ids]
+
+    def _load_neighbors(
+        self, neighbors: list[tuple[str, int]], skip: Container[str], window: int
+    ) -> Iterator[tuple[int, StewardFact, int]]:
+        """Yield (rank, fact, shared_count), bulk-loading ``window`` neighbors at a time."""
+        pending = [(rank, n) for rank, n in enumerate(neighbors) if n[0] not in skip]
+        for start in range(0, len(pending), max(1, window)):
+            part = pending[start : start + max(1, window)]
+            loaded = self.get_many(fact_id for _, (fact_id, _) in part)
+            for rank, (fact_id, shared_count) in part:
+                if fact_id in loaded:
+                    yield rank, loaded[fact_id], shared_count
 
     def _graph_expand_and_merge(
         self,
@@ -823,26 +867,18 @@ class FactStore:
             fact_map[fact.id] = fact
 
         added = 0
-        for rank, (fact_id, shared_count) in enumerate(neighbors):
+        for rank, fact, shared_count in self._load_neighbors(neighbors, (), graph_limit * 2):
             if added >= graph_limit:
                 break
-            # Filter by category if specified
-            if cat_values and fact_id not in fact_map:
-                fact = self.get(fact_id)
-                if not fact:
-                    continue
+            fact_id = fact.id
+            if fact_id not in fact_map:
+                # Filter by category if specified
                 fact_cat = (
                     fact.category.value
                     if isinstance(fact.category, FactCategory)
                     else fact.category
                 )
-                if fact_cat not in cat_values:
-                    continue
-                fact_map[fact_id] = fact
-                added += 1
-            elif fact_id not in fact_map:
-                fact = self.get(fact_id)
-                if not fact:
+                if cat_values and fact_cat not in cat_values:
                     continue
                 fact_map[fact_id] = fact
                 added += 1
@@ -905,14 +941,12 @@ class FactStore:
 
         added = 0
         neighbor_ids: list[str] = []
-        for fact_id, _shared_count in neighbors:
+        for _rank, fact, _shared_count in self._load_neighbors(
+            neighbors, fact_map, graph_limit * 2
+        ):
             if added >= graph_limit:
                 break
-            if fact_id in fact_map:
-                continue
-            fact = self.get(fact_id)
-            if not fact:
-                continue
+            fact_id = fact.id
             if cat_values:
                 fact_cat = (
                     fact.category.value
@@ -944,20 +978,24 @@ class FactStore:
 
         # Step 6: observation → fact propagation
         obs_boost = 0.1
+        obs_sources: dict[str, list[str]] = {}
         for fid in list(final_scores.keys()):
             fact = fact_map.get(fid)
             if not fact:
                 continue
             cat = fact.category.value if isinstance(fact.category, FactCategory) else fact.category
-            if cat != FactCategory.OBSERVATION.value:
-                continue
-            source_ids = self.get_observation_source_ids(fid)
-            for sid in source_ids[:graph_limit]:
+            if cat == FactCategory.OBSERVATION.value:
+                obs_sources[fid] = self.get_observation_source_ids(fid)[:graph_limit]
+        source_facts = self.get_many(
+            sid for sids in obs_sources.values() for sid in sids if sid not in final_scores
+        )
+        for fid, source_ids in obs_sources.items():
+            for sid in source_ids:
                 boost = obs_boost * final_scores[fid]
                 if sid in final_scores:
                     final_scores[sid] += boost
                 else:
-                    source_fact = self.get(sid)
+                    source_fact = source_facts.get(sid)
                     if source_fact:
                         fact_map[sid] = source_fact
                         final_scores[sid] = boost
@@ -965,8 +1003,11 @@ class FactStore:
         ranked = sorted(final_scores.keys(), key=lambda fid: final_scores[fid], reverse=True)
         return [fact_map[fid] for fid in ranked if fid in fact_map][:limit]
 
-    def _get_active_ids(self) -> set[str]:
-        """Get set of active (non-superseded) fact IDs."""
+    def _get_active_ids(self) -> frozenset[str]:
+        """Get set of active (non-superseded) fact IDs, cached until the next write."""
+        return get_active_ids(self.db_path, self._load_active_ids)
+
+    def _load_active_ids(self) -> set[str]:
         with wal_connect(self.db_path) as conn:
             rows = conn.execute(
                 "SELECT id FROM steward_facts WHERE superseded_by IS NULL"
@@ -1017,30 +1058,6 @@ class FactStore:
         except Exception as e:
             logger.warning("chroma_upsert_failed", fact_id=fact.id, error=str(e))
 
-    @staticmethod
-    def _search_tokens(text: str) -> list[str]:
-        return [
-            token
-            for token in re.findall(r"[a-z0-9]+", text.lower())
-            if len(token) >= 3 and token not in _SEARCH_STOPWORDS
-        ]
-
-    @classmethod
-    def _fallback_keyword_score(cls, query: str, text: str) -> float:
-        query_lower = query.lower()
-        text_lower = text.lower()
-        exact_match = 1.0 if query_lower in text_lower else 0.0
-        query_tokens = set(cls._search_tokens(query))
-        if not query_tokens:
-            return exact_match
-
-        text_tokens = set(cls._search_tokens(text))
-        if not text_tokens:
-            return exact_match
-
-        overlap = len(query_tokens & text_tokens) / len(query_tokens)
-        return max(exact_match, overlap)
-
     @staticmethod
     def _row_to_fact(row: sqlite3.Row) -> StewardFact:
         d = dict(row)
@@ -1,8 +1,10 @@
 """Observability: metrics collection and run summary logging."""
 
+import math
 import re
 import threading
 import time
+from bisect import bisect_left
 from contextlib import contextmanager
 from typing import Any
 
@@ -10,9 +12,125 @@ import structlog
 
 logger = structlog.get_logger().bind(source="observability")
 
+# Timer histograms are log-linear: every decade from HISTOGRAM_MIN_S to
+# HISTOGRAM_MAX_S is split at these upper mantissas, so no bucket is more than
+# 50% wide relative to its lower bound. Memory per series is fixed.
+_UPPER_MANTISSAS = (1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0, 7.5, 10.0)
+HISTOGRAM_MIN_S = 1e-4
+HISTOGRAM_MAX_S = 1e3
+_MIN_DECADE = round(math.log10(HISTOGRAM_MIN_S))
+_DECADES = round(math.log10(HISTOGRAM_MAX_S)) - _MIN_DECADE
+# Inclusive upper bounds of the finite buckets; one more bucket catches overflow.
+_BOUNDS = tuple(
+    round(m * 10.0 ** (_MIN_DECADE + d), 12) for d in range(_DECADES) for m in _UPPER_MANTISSAS
+)
+# Subset of bounds exported as Prometheus ``le`` buckets (1, 2.5, 5 per decade).
+_EXPORT_BOUNDS = tuple(b for i, b in enumerate(_BOUNDS) if i % len(_UPPER_MANTISSAS) in (2, 5, 8))
+_EPS = 1e-9
+# Distinct label sets kept per metric name; further sets fold into "other".
+MAX_SERIES_PER_METRIC = 100
+_OVERFLOW_LABELS = (("series", "other"),)
+
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+def _bucket_index(value: float) -> int:
+    """O(1) bucket lookup: decade from log10, then a fixed 9-entry mantissa table."""
+    if value <= HISTOGRAM_MIN_S:
+        return 0
+    if value > HISTOGRAM_MAX_S:
+        return len(_BOUNDS)
+    decade = math.floor(math.log10(value))
+    mantissa = value / 10.0**decade
+    if mantissa <= 1 + _EPS:
+        # An exact power of ten closes the previous decade's last bucket
+        decade -= 1
+        mantissa = 10.0
+    slot = bisect_left(_UPPER_MANTISSAS, mantissa * (1 - _EPS))
+    index = (decade - _MIN_DECADE) * len(_UPPER_MANTISSAS) + slot
+    return min(max(index, 0), len(_BOUNDS))
+
+
+class _Histogram:
+    """Fixed-size log-linear histogram with running count/sum/min/max."""
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.buckets = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.buckets[_bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def copy(self) -> "_Histogram":
+        clone = _Histogram()
+        clone.buckets = list(self.buckets)
+        clone.count, clone.total, clone.min, clone.max = self.count, self.total, self.min, self.max
+        return clone
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside the bucket that holds it."""
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = _BOUNDS[index - 1] if index > 0 else 0.0
+                upper = _BOUNDS[index] if index < len(_BOUNDS) else self.max
+                estimate = lower + (upper - lower) * ((rank - seen) / bucket_count)
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def cumulative(self, bounds: tuple[float, ...]) -> list[int]:
+        """Cumulative counts at each of ``bounds`` (which must be bucket bounds)."""
+        out: list[int] = []
+        running = 0
+        index = 0
+        for bound in bounds:
+            while index < len(_BOUNDS) and _BOUNDS[index] <= bound * (1 + _EPS):
+                running += self.buckets[index]
+                index += 1
+            out.append(running)
+        return out
+
+
+def _label_key(labels: dict[str, Any] | None) -> _LabelKey:
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: _LabelKey, extra: str = "") -> str:
+    parts = [f'{Metrics._sanitize_name(k)}="{_escape_label(v)}"' for k, v in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _display_name(name: str, key: _LabelKey) -> str:
+    """Summary key: the bare name, or ``name{k="v",...}`` for labelled series."""
+    return name + _format_labels(key) if key else name
+
 
 class Metrics:
-    """Simple dict-based metrics collector for counters and timers."""
+    """Simple dict-based metrics collector for counters, gauges and timers.
+
+    Timers record into fixed-size histograms, so memory per series is constant
+    however long the process runs. Counters, gauges and timers accept optional
+    labels (e.g. ``{"provider": "claude", "route": "/api/advisor/ask"}``).
+    """
 
     _PRICING_PER_MILLION = (
         ("gpt-4o-mini", 0.15, 0.60),
@@ -25,27 +143,49 @@ class Metrics:
 
     def __init__(self):
         self._lock = threading.Lock()
-        self._counters: dict[str, int] = {}
-        self._timers: dict[str, list[float]] = {}
+        self._counters: dict[str, dict[_LabelKey, int]] = {}
+        self._gauges: dict[str, dict[_LabelKey, float]] = {}
+        self._timers: dict[str, dict[_LabelKey, _Histogram]] = {}
         self._tokens: dict[str, dict[str, float]] = {}
 
-    def counter(self, name: str, value: int = 1):
+    @staticmethod
+    def _series_key(series: dict, labels: dict[str, Any] | None) -> _LabelKey:
+        key = _label_key(labels)
+        if key in series or len(series) < MAX_SERIES_PER_METRIC:
+            return key
+        return _OVERFLOW_LABELS
+
+    def counter(self, name: str, value: int = 1, labels: dict[str, Any] | None = None):
         """Increment a counter by the given value."""
         with self._lock:
-            self._counters[name] = self._counters.get(name, 0) + value
+            series = self._counters.setdefault(name, {})
+            key = self._series_key(series, labels)
+            series[key] = series.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        """Set a gauge to its current value (e.g. a queue depth)."""
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            series[self._series_key(series, labels)] = value
+
+    def observe(self, name: str, seconds: float, labels: dict[str, Any] | None = None) -> None:
+        """Record one duration into the timer histogram for ``name``."""
+        with self._lock:
+            series = self._timers.setdefault(name, {})
+            key = self._series_key(series, labels)
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram()
+            histogram.record(seconds)
 
     @contextmanager
-    def timer(self, name: str):
+    def timer(self, name: str, labels: dict[str, Any] | None = None):
         """Context manager to time an operation and store duration."""
-        start = time.time()
+        start = time.perf_counter()
         try:
             yield
         finally:
-            duration = time.time() - start
-            with self._lock:
-                if name not in self._timers:
-                    self._timers[name] = []
-                self._timers[name].append(duration)
+            self.observe(name, time.perf_counter() - start, labels)
 
     def token_usage(
         self,
@@ -90,27 +230,31 @@ class Metrics:
 
     def summary(self) -> dict[str, Any]:
         """Return a summary of all collected metrics."""
-        with self._lock:
-            counters = dict(self._counters)
-            timers = {name: list(durations) for name, durations in self._timers.items()}
-            tokens = {name: dict(values) for name, values in self._tokens.items()}
+        counters, gauges, timers, tokens = self._snapshot()
 
+        counter_summary = {
+            _display_name(name, key): value
+            for name, series in counters.items()
+            for key, value in series.items()
+        }
+        gauge_summary = {
+            _display_name(name, key): value
+            for name, series in gauges.items()
+            for key, value in series.items()
+        }
         timer_summary = {}
-        for name, durations in timers.items():
-            if durations:
-                sorted_d = sorted(durations)
-                timer_summary[name] = {
-                    "count": len(sorted_d),
-                    "total": sum(sorted_d),
-                    "avg": sum(sorted_d) / len(sorted_d),
-                    "min": sorted_d[0],
-                    "max": sorted_d[-1],
-                    "p50": sorted_d[int(len(sorted_d) * 0.5)],
-                    "p95": sorted_d[min(int(len(sorted_d) * 0.95), len(sorted_d) - 1)],
-                    "p99": sorted_d[min(int(len(sorted_d) * 0.99), len(sorted_d) - 1)],
+        for name, series in timers.items():
+            for key, hist in series.items():
+                timer_summary[_display_name(name, key)] = {
+                    "count": hist.count,
+                    "total": hist.total,
+                    "avg": hist.total / hist.count,
+                    "min": hist.min,
+                    "max": hist.max,
+                    "p50": hist.quantile(0.5),
+                    "p95": hist.quantile(0.95),
+                    "p99": hist.quantile(0.99),
                 }
-            else:
-                timer_summary[name] = {"count": 0}
 
         token_summary = {}
         for model, usage in tokens.items():
@@ -129,15 +273,29 @@ class Metrics:
             }
 
         return {
-            "counters": counters,
+            "counters": counter_summary,
+            "gauges": gauge_summary,
             "timers": timer_summary,
             "token_usage": token_summary,
         }
 
+    def _snapshot(self):
+        """Copy the (fixed-size) metric state under the lock."""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+            timers = {
+                name: {key: hist.copy() for key, hist in series.items()}
+                for name, series in self._timers.items()
+            }
+            tokens = {name: dict(values) for name, values in self._tokens.items()}
+        return counters, gauges, timers, tokens
+
     def reset(self):
         """Clear all metrics."""
         with self._lock:
             self._counters.clear()
+            self._gauges.clear()
             self._timers.clear()
             self._tokens.clear()
 
@@ -148,24 +306,35 @@ class Metrics:
 
     def prometheus_text(self) -> str:
         """Return metrics in Prometheus exposition format."""
+        counters, gauges, timers, _ = self._snapshot()
         s = self.summary()
         lines: list[str] = []
 
-        for name, value in s["counters"].items():
+        for name, series in counters.items():
             safe = self._sanitize_name(name)
             lines.append(f"# TYPE coach_{safe} counter")
-            lines.append(f"coach_{safe} {value}")
+            for key, value in series.items():
+                lines.append(f"coach_{safe}{_format_labels(key)} {value}")
+
+        for name, series in gauges.items():
+            safe = self._sanitize_name(name)
+            lines.append(f"# TYPE coach_{safe} gauge")
+            for key, value in series.items():
+                lines.append(f"coach_{safe}{_format_labels(key)} {value:g}")
 
-        for name, data in s["timers"].items():
+        for name, series in timers.items():
             safe = self._sanitize_name(name)
-            if data.get("count", 0) == 0:
-                continue
-            lines.append(f"# TYPE coach_{safe} summary")
-            for q in ("0.5", "0.95", "0.99"):
-                pkey = {"0.5": "p50", "0.95": "p95", "0.99": "p99"}[q]
-                lines.append(f'coach_{safe}{{quantile="{q}"}} {data[pkey]:.6f}')
-            lines.append(f"coach_{safe}_count {data['count']}")
-            lines.append(f"coach_{safe}_sum {data['total']:.6f}")
+            lines.append(f"# TYPE coach_{safe} histogram")
+            for key, hist in series.items():
+                for bound, cumulative in zip(
+                    _EXPORT_BOUNDS, hist.cumulative(_EXPORT_BOUNDS), strict=True
+                ):
+                    le = _format_labels(key, f'le="{bound:g}"')
+                    lines.append(f"coach_{safe}_bucket{le} {cumulative}")
+                inf = _format_labels(key, 'le="+Inf"')
+                lines.append(f"coach_{safe}_bucket{inf} {hist.count}")
+                lines.append(f"coach_{safe}_sum{_format_labels(key)} {hist.total:.6f}")
+                lines.append(f"coach_{safe}_count{_format_labels(key)} {hist.count}")
 
         for model, usage in s["token_usage"].items():
             safe_model = self._sanitize_name(model)
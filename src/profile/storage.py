@@ -1,7 +1,15 @@
-"""Profile storage — Pydantic model + YAML CRUD at ~/coach/profile.yaml."""
+"""Profile storage — Pydantic model + YAML CRUD at ~/coach/profile.yaml.
 
+Parsed profiles are cached per process, keyed by path and validated against the
+file's (mtime, size), so an unchanged profile costs one ``stat`` rather than a
+YAML parse. ``save`` writes through to the cache.
+"""
+
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 
 import structlog
 import yaml
@@ -189,6 +197,43 @@ class UserProfile(BaseModel):
         return "\n\n".join(sections)
 
 
+class _CachedProfile(NamedTuple):
+    stamp: tuple[int, int]
+    profile: UserProfile | None
+    summary: str
+    structured_summary: str
+
+
+_cache: dict[str, _CachedProfile] = {}
+_cache_lock = threading.Lock()
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_put(path: Path, stamp: tuple[int, int], profile: UserProfile | None) -> _CachedProfile:
+    entry = _CachedProfile(
+        stamp=stamp,
+        profile=profile,
+        summary=profile.summary() if profile else "",
+        structured_summary=profile.structured_summary() if profile else "",
+    )
+    with _cache_lock:
+        _cache[str(path)] = entry
+    return entry
+
+
+def clear_profile_cache() -> None:
+    """Drop every cached profile (e.g. between tests)."""
+    with _cache_lock:
+        _cache.clear()
+
+
 class ProfileStorage:
     """YAML-backed profile storage."""
 
@@ -198,9 +243,39 @@ class ProfileStorage:
     def exists(self) -> bool:
         return self.path.exists()
 
+    def _cached(self) -> _CachedProfile | None:
+        """Cache entry for the file as it is now on disk; None if there is no file."""
+        stamp = _file_stamp(self.path)
+        if stamp is None:
+            return None
+        with _cache_lock:
+            entry = _cache.get(str(self.path))
+        if entry is not None and entry.stamp == stamp:
+            return entry
+        # Stamp taken before parsing, so a write landing mid-parse misses next time
+        return _cache_put(self.path, stamp, self._parse())
+
     def load(self) -> UserProfile | None:
-        if not self.path.exists():
+        """Return the profile, or None if missing or invalid.
+
+        Each call returns a fresh copy, so callers may mutate it freely.
+        """
+        entry = self._cached()
+        if entry is None or entry.profile is None:
             return None
+        return entry.profile.model_copy(deep=True)
+
+    def summary(self) -> str:
+        """Precomputed ``UserProfile.summary()``; empty when there is no profile."""
+        entry = self._cached()
+        return entry.summary if entry else ""
+
+    def structured_summary(self) -> str:
+        """Precomputed ``UserProfile.structured_summary()``; empty when there is no profile."""
+        entry = self._cached()
+        return entry.structured_summary if entry else ""
+
+    def _parse(self) -> UserProfile | None:
         try:
             with open(self.path) as f:
                 data = yaml.safe_load(f)
@@ -231,6 +306,9 @@ class ProfileStorage:
         ]
         with open(self.path, "w") as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        stamp = _file_stamp(self.path)
+        if stamp is not None:
+            _cache_put(self.path, stamp, profile.model_copy(deep=True))
         return self.path
 
     def update_field(self, field: str, value) -> UserProfile:
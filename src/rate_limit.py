@@ -1,6 +1,7 @@
 """Token-bucket rate limiter for external API calls."""
 
 import asyncio
+import threading
 import time
 from dataclasses import dataclass
 
@@ -26,6 +27,7 @@ class TokenBucketRateLimiter:
         self._tokens = float(burst)
         self._last_refill = time.monotonic()
         self._lock = asyncio.Lock()
+        self._thread_lock = threading.Lock()
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
@@ -45,13 +47,24 @@ class TokenBucketRateLimiter:
             self._tokens -= 1.0
 
     def acquire_sync(self) -> None:
-        """Synchronous version for non-async contexts."""
-        self._refill()
-        while self._tokens < 1.0:
-            wait_time = (1.0 - self._tokens) / self.rate
+        """Synchronous version for non-async contexts (thread-safe)."""
+        wait_time = self.reserve()
+        if wait_time > 0:
             time.sleep(wait_time)
+
+    def reserve(self) -> float:
+        """Take a token now and return how long the caller must wait before using it.
+
+        The balance may go negative, so concurrent callers queue up at the
+        steady-state rate. Safe to share across threads and event loops, since
+        nothing blocks while the lock is held.
+        """
+        with self._thread_lock:
             self._refill()
-        self._tokens -= 1.0
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
 
     @property
     def available_tokens(self) -> float:
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -12,12 +17,18 @@ from intelligence.scraper import IntelItem, IntelStorage
 from journal import EmbeddingManager, JournalStorage
 
 from .dossiers import ResearchDossierStore
+from .outbound import sanitize_outbound_query
+from .search_cache import SearchResultCache
 from .synthesis import ResearchSynthesizer
 from .topics import TopicSelector
 from .web_search import AsyncWebSearchClient, SearchResult, WebSearchClient
 
 logger = structlog.get_logger()
 
+# Topics or dossiers researched at once; searches still share the provider bucket
+DEFAULT_MAX_CONCURRENCY = 3
+DEFAULT_CACHE_TTL_HOURS = 24
+
 _SECTION_RE = re.compile(r"^##\s+(.+?)\s*$", re.MULTILINE)
 
 
@@ -75,6 +86,12 @@ class DeepResearchAgent:
 
         research_config = self.config.get("research", {})
         self.max_topics = int(research_config.get("max_topics_per_week", 2) or 2)
+        self.max_concurrency = max(
+            1, int(research_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY) or 1)
+        )
+        # Only search and synthesis run concurrently; journal, intel, dossier and
+        # embedding writes go through stores that are not safe to share across threads
+        self._store_lock = threading.Lock()
 
         self.topic_selector = topic_selector or self._create_topic_selector(research_config)
         self.search_client = search_client or self._create_search_client(research_config)
@@ -94,8 +111,25 @@ class DeepResearchAgent:
             api_key=research_config.get("api_key"),
             provider=research_config.get("api_provider", "tavily"),
             max_results=research_config.get("sources_per_topic", 8),
+            cache=self._create_search_cache(research_config),
         )
 
+    @staticmethod
+    def _create_search_cache(research_config: dict) -> SearchResultCache | None:
+        ttl_hours = float(research_config.get("cache_ttl_hours", DEFAULT_CACHE_TTL_HOURS) or 0)
+        if ttl_hours <= 0:
+            return None
+        cache = SearchResultCache(ttl_seconds=ttl_hours * 3600)
+        # Each research run builds a fresh agent, so this bounds the table
+        try:
+            purged = cache.purge_expired()
+        except Exception as e:
+            logger.warning("search_cache_purge_failed", error=str(e))
+        else:
+            if purged:
+                logger.info("search_cache_purged", entries=purged)
+        return cache
+
     def _create_synthesizer(self, llm_config: dict) -> ResearchSynthesizer:
         return ResearchSynthesizer(
             model=llm_config.get("model"),
@@ -168,76 +202,128 @@ class DeepResearchAgent:
         return self.topic_selector.get_topics(researched_topics=recent)
 
     def _run_topics(self, topics: list[dict]) -> list[dict]:
-        results = []
         if not topics:
             logger.info("No topics to research")
-            return results
+            return []
 
         user_context = self._get_user_context()
-        for topic_info in topics:
-            topic = topic_info["topic"]
-            logger.info("research_topic_started", topic=topic, source=topic_info.get("source"))
-            try:
-                marker = self._outbound_marker()
-                search_results = self.search_client.search(topic)
-                if not search_results:
-                    results.append(
-                        {
-                            "topic": topic,
-                            "filepath": None,
-                            "success": False,
-                            "error": "No search results",
-                        }
-                    )
-                    continue
-
-                report = self.synthesizer.synthesize(
-                    topic=topic, results=search_results, user_context=user_context
-                )
-                outbound = self._issued_queries_since(marker)
-                report = self._append_outbound_section(report, outbound)
-                filepath = self._store_journal_entry(topic, report, topic_info)
-                self._store_intel_item(topic, report, search_results)
-                self._add_embeddings(
-                    filepath,
-                    report,
-                    {"type": "research", "topic": topic, "research_kind": "report"},
-                )
-                results.append(
-                    {
-                        "topic": topic,
-                        "title": f"Research: {topic}",
-                        "summary": report[:400],
-                        "content": report,
-                        "sources": [r.url for r in search_results],
-                        "outbound_queries": outbound,
-                        "saved_path": filepath,
-                        "filepath": filepath,
-                        "success": True,
-                    }
-                )
-            except (IOError, ValueError, KeyError) as e:
-                logger.error("research_failed", topic=topic, error=str(e))
-                results.append(
-                    {"topic": topic, "filepath": None, "success": False, "error": str(e)}
-                )
+        return self._map_concurrent(
+            lambda topic_info: self._run_topic(topic_info, user_context), topics
+        )
+
+    def _map_concurrent(self, fn: Callable[[dict], dict], items: list[dict]) -> list[dict]:
+        """Apply ``fn`` to items on up to ``max_concurrency`` threads, keeping order."""
+        started = time.monotonic()
+        if len(items) <= 1 or self.max_concurrency == 1:
+            results = [fn(item) for item in items]
+        else:
+            workers = min(len(items), self.max_concurrency)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="research") as pool:
+                results = list(pool.map(fn, items))
+        logger.info(
+            "research_batch_complete",
+            runs=len(items),
+            duration_s=round(time.monotonic() - started, 3),
+        )
         return results
 
+    def _run_topic(self, topic_info: dict, user_context: str) -> dict:
+        topic = topic_info["topic"]
+        logger.info("research_topic_started", topic=topic, source=topic_info.get("source"))
+        try:
+            marker = self._outbound_marker()
+            started = time.monotonic()
+            search_results = self.search_client.search(topic)
+            search_s = time.monotonic() - started
+            if not search_results:
+                return self._no_results_topic(topic)
+            return self._complete_topic(topic_info, search_results, user_context, marker, search_s)
+        except (IOError, ValueError, KeyError) as e:
+            logger.error("research_failed", topic=topic, error=str(e))
+            return {"topic": topic, "filepath": None, "success": False, "error": str(e)}
+
+    @staticmethod
+    def _no_results_topic(topic: str) -> dict:
+        return {"topic": topic, "filepath": None, "success": False, "error": "No search results"}
+
+    def _complete_topic(
+        self,
+        topic_info: dict,
+        search_results: list[SearchResult],
+        user_context: str,
+        marker: int,
+        search_s: float,
+    ) -> dict:
+        """Synthesize and store a standalone report once its search has returned."""
+        topic = topic_info["topic"]
+        started = time.monotonic()
+        report = self.synthesizer.synthesize(
+            topic=topic, results=search_results, user_context=user_context
+        )
+        timings = self._run_timings(topic, search_s, time.monotonic() - started)
+        outbound = self._issued_queries_since(marker, query=topic)
+        report = self._append_outbound_section(report, outbound)
+        with self._store_lock:
+            filepath = self._store_journal_entry(topic, report, topic_info)
+            self._store_intel_item(topic, report, search_results)
+            self._add_embeddings(
+                filepath,
+                report,
+                {"type": "research", "topic": topic, "research_kind": "report"},
+            )
+        return {
+            "topic": topic,
+            "title": f"Research: {topic}",
+            "summary": report[:400],
+            "content": report,
+            "sources": [r.url for r in search_results],
+            "outbound_queries": outbound,
+            "saved_path": filepath,
+            "filepath": filepath,
+            "timings": timings,
+            "success": True,
+        }
+
+    @staticmethod
+    def _run_timings(topic: str, search_s: float, synthesis_s: float) -> dict:
+        timings = {"search_s": round(search_s, 3), "synthesis_s": round(synthesis_s, 3)}
+        logger.info("research_run_timing", topic=topic, **timings)
+        return timings
+
     def _run_dossier(self, dossier: dict, run_source: str) -> dict:
         topic = dossier["topic"]
         marker = self._outbound_marker()
+        started = time.monotonic()
         search_results = self.search_client.search(topic)
+        search_s = time.monotonic() - started
         if not search_results:
-            return {
-                "topic": topic,
-                "title": f"Research Update: {topic}",
-                "dossier_id": dossier["dossier_id"],
-                "filepath": None,
-                "success": False,
-                "error": "No search results",
-            }
+            return self._no_results_dossier(dossier)
+        return self._complete_dossier(dossier, search_results, run_source, marker, search_s)
 
+    @staticmethod
+    def _no_results_dossier(dossier: dict) -> dict:
+        topic = dossier["topic"]
+        return {
+            "topic": topic,
+            "title": f"Research Update: {topic}",
+            "dossier_id": dossier["dossier_id"],
+            "filepath": None,
+            "success": False,
+            "error": "No search results",
+        }
+
+    def _complete_dossier(
+        self,
+        dossier: dict,
+        search_results: list[SearchResult],
+        run_source: str,
+        marker: int,
+        search_s: float,
+    ) -> dict:
+        """Synthesize and store a dossier update once its search has returned."""
+        topic = dossier["topic"]
         user_context = self._build_dossier_user_context(dossier)
+        started = time.monotonic()
         report = self.synthesizer.synthesize_dossier_update(
             topic=topic,
             results=search_results,
@@ -245,41 +331,43 @@ class DeepResearchAgent:
             previous_change_summary=dossier.get("latest_change_summary", ""),
             user_context=user_context,
         )
-        outbound = self._issued_queries_since(marker)
+        timings = self._run_timings(topic, search_s, time.monotonic() - started)
+        outbound = self._issued_queries_since(marker, query=topic)
         report = self._append_outbound_section(report, outbound)
         metadata = self._build_update_metadata(report, search_results, run_source)
-        update = self.dossiers.append_update(dossier["dossier_id"], report, metadata)
-        refreshed = self.dossiers.get_dossier(dossier["dossier_id"]) or dossier
-
-        self._store_intel_item(
-            topic,
-            report,
-            search_results,
-            dossier_id=dossier["dossier_id"],
-            summary=metadata.get("change_summary", report[:300]),
-        )
-        self._add_embeddings(
-            update["path"],
-            report,
-            {
-                "type": "research",
-                "topic": topic,
-                "research_kind": "dossier_update",
-                "dossier_id": dossier["dossier_id"],
-                "change_summary": metadata.get("change_summary", ""),
-            },
-        )
-        self._add_embeddings(
-            refreshed["path"],
-            refreshed.get("content", ""),
-            {
-                "type": "research",
-                "topic": topic,
-                "research_kind": "dossier",
-                "dossier_id": dossier["dossier_id"],
-                "change_summary": refreshed.get("latest_change_summary", ""),
-            },
-        )
+        with self._store_lock:
+            update = self.dossiers.append_update(dossier["dossier_id"], report, metadata)
+            refreshed = self.dossiers.get_dossier(dossier["dossier_id"]) or dossier
+
+            self._store_intel_item(
+                topic,
+                report,
+                search_results,
+                dossier_id=dossier["dossier_id"],
+                summary=metadata.get("change_summary", report[:300]),
+            )
+            self._add_embeddings(
+                update["path"],
+                report,
+                {
+                    "type": "research",
+                    "topic": topic,
+                    "research_kind": "dossier_update",
+                    "dossier_id": dossier["dossier_id"],
+                    "change_summary": metadata.get("change_summary", ""),
+                },
+            )
+            self._add_embeddings(
+                refreshed["path"],
+                refreshed.get("content", ""),
+                {
+                    "type": "research",
+                    "topic": topic,
+                    "research_kind": "dossier",
+                    "dossier_id": dossier["dossier_id"],
+                    "change_summary": refreshed.get("latest_change_summary", ""),
+                },
+            )
 
         return {
             "topic": topic,
@@ -292,14 +380,14 @@ class DeepResearchAgent:
             "filepath": update["path"],
             "dossier_id": dossier["dossier_id"],
             "change_summary": metadata.get("change_summary", ""),
+            "timings": timings,
             "success": True,
         }
 
     def _run_dossier_batch(self, dossiers: list[dict], run_source: str) -> list[dict]:
-        results = []
-        for dossier in dossiers:
+        def _run_one(dossier: dict) -> dict:
             try:
-                results.append(self._run_dossier(dossier, run_source=run_source))
+                return self._run_dossier(dossier, run_source=run_source)
             except Exception as e:
                 logger.error(
                     "research_dossier_failed",
@@ -307,8 +395,9 @@ class DeepResearchAgent:
                     topic=dossier.get("topic"),
                     error=str(e),
                 )
-                results.append(self._dossier_failure_result(dossier, str(e)))
-        return results
+                return self._dossier_failure_result(dossier, str(e))
+
+        return self._map_concurrent(_run_one, dossiers)
 
     def _dossier_failure_result(self, dossier: dict, error: str) -> dict:
         topic = dossier.get("topic") or "Unknown dossier"
@@ -344,15 +433,21 @@ class DeepResearchAgent:
             "run_source": run_source,
         }
 
-    def _issued_queries_since(self, marker: int) -> list[dict]:
+    def _issued_queries_since(self, marker: int, query: str | None = None) -> list[dict]:
         """Audit entries recorded by the real search client since marker.
 
-        Injected/mocked clients without the audit list yield [] by design.
+        Concurrent runs share the client, so ``query`` narrows the entries to
+        the ones this run sent. Injected/mocked clients without the audit list
+        yield [] by design.
         """
         issued = getattr(self.search_client, "issued_queries", None)
         if not isinstance(issued, list):
             return []
-        return [entry for entry in issued[marker:] if isinstance(entry, dict)]
+        entries = [entry for entry in issued[marker:] if isinstance(entry, dict)]
+        if query is None:
+            return entries
+        sent = sanitize_outbound_query(query)
+        return [entry for entry in entries if entry.get("query") == sent]
 
     def _outbound_marker(self) -> int:
         issued = getattr(self.search_client, "issued_queries", None)
@@ -487,6 +582,7 @@ class AsyncDeepResearchAgent(DeepResearchAgent):
             api_key=research_config.get("api_key"),
             provider=research_config.get("api_provider", "tavily"),
             max_results=research_config.get("sources_per_topic", 8),
+            cache=self._create_search_cache(research_config),
         )
 
     async def run(
@@ -516,126 +612,60 @@ class AsyncDeepResearchAgent(DeepResearchAgent):
             recent = self.topic_selector.get_recent_research_topics()
             topics = self.topic_selector.get_topics(researched_topics=recent)
 
-        results = []
         user_context = self._get_user_context()
-        for topic_info in topics:
-            topic = topic_info["topic"]
-            try:
-                marker = self._outbound_marker()
-                search_results = await self.search_client.search(topic)
-                if not search_results:
-                    results.append(
-                        {
-                            "topic": topic,
-                            "filepath": None,
-                            "success": False,
-                            "error": "No search results",
-                        }
-                    )
-                    continue
-                report = self.synthesizer.synthesize(
-                    topic=topic, results=search_results, user_context=user_context
-                )
-                outbound = self._issued_queries_since(marker)
-                report = self._append_outbound_section(report, outbound)
-                filepath = self._store_journal_entry(topic, report, topic_info)
-                self._store_intel_item(topic, report, search_results)
-                self._add_embeddings(
-                    filepath,
-                    report,
-                    {"type": "research", "topic": topic, "research_kind": "report"},
-                )
-                results.append(
-                    {
-                        "topic": topic,
-                        "title": f"Research: {topic}",
-                        "summary": report[:400],
-                        "content": report,
-                        "sources": [r.url for r in search_results],
-                        "outbound_queries": outbound,
-                        "saved_path": filepath,
-                        "filepath": filepath,
-                        "success": True,
-                    }
-                )
-            except (IOError, ValueError, KeyError) as e:
-                logger.error("async_research_failed", topic=topic, error=str(e))
-                results.append(
-                    {"topic": topic, "filepath": None, "success": False, "error": str(e)}
-                )
-        return results
+        return await self._gather_bounded(
+            [self._run_topic_async(topic_info, user_context) for topic_info in topics]
+        )
+
+    async def _gather_bounded(self, coroutines: list) -> list[dict]:
+        """Await coroutines with at most ``max_concurrency`` in flight, keeping order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.monotonic()
+
+        async def _bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        results = await asyncio.gather(*(_bounded(c) for c in coroutines))
+        logger.info(
+            "research_batch_complete",
+            runs=len(results),
+            duration_s=round(time.monotonic() - started, 3),
+        )
+        return list(results)
+
+    async def _run_topic_async(self, topic_info: dict, user_context: str) -> dict:
+        topic = topic_info["topic"]
+        try:
+            marker = self._outbound_marker()
+            started = time.monotonic()
+            search_results = await self.search_client.search(topic)
+            search_s = time.monotonic() - started
+            if not search_results:
+                return self._no_results_topic(topic)
+            # Synthesis and storage are blocking; keep them off the event loop
+            return await asyncio.to_thread(
+                self._complete_topic, topic_info, search_results, user_context, marker, search_s
+            )
+        except (IOError, ValueError, KeyError) as e:
+            logger.error("async_research_failed", topic=topic, error=str(e))
+            return {"topic": topic, "filepath": None, "success": False, "error": str(e)}
 
     async def _run_dossier_async(self, dossier: dict, run_source: str) -> dict:
-        topic = dossier["topic"]
         marker = self._outbound_marker()
-        search_results = await self.search_client.search(topic)
+        started = time.monotonic()
+        search_results = await self.search_client.search(dossier["topic"])
+        search_s = time.monotonic() - started
         if not search_results:
-            return {
-                "topic": topic,
-                "title": f"Research Update: {topic}",
-                "dossier_id": dossier["dossier_id"],
-                "filepath": None,
-                "success": False,
-                "error": "No search results",
-            }
-
-        report = self.synthesizer.synthesize_dossier_update(
-            topic=topic,
-            results=search_results,
-            dossier_context=dossier.get("content", ""),
-            previous_change_summary=dossier.get("latest_change_summary", ""),
-            user_context=self._build_dossier_user_context(dossier),
-        )
-        report = self._append_outbound_section(report, self._issued_queries_since(marker))
-        metadata = self._build_update_metadata(report, search_results, run_source)
-        update = self.dossiers.append_update(dossier["dossier_id"], report, metadata)
-        refreshed = self.dossiers.get_dossier(dossier["dossier_id"]) or dossier
-        self._store_intel_item(
-            topic,
-            report,
-            search_results,
-            dossier_id=dossier["dossier_id"],
-            summary=metadata.get("change_summary"),
-        )
-        self._add_embeddings(
-            update["path"],
-            report,
-            {
-                "type": "research",
-                "topic": topic,
-                "research_kind": "dossier_update",
-                "dossier_id": dossier["dossier_id"],
-            },
-        )
-        self._add_embeddings(
-            refreshed["path"],
-            refreshed.get("content", ""),
-            {
-                "type": "research",
-                "topic": topic,
-                "research_kind": "dossier",
-                "dossier_id": dossier["dossier_id"],
-            },
+            return self._no_results_dossier(dossier)
+        return await asyncio.to_thread(
+            self._complete_dossier, dossier, search_results, run_source, marker, search_s
         )
-        return {
-            "topic": topic,
-            "title": update["title"],
-            "summary": metadata.get("change_summary", ""),
-            "content": report,
-            "sources": [r.url for r in search_results],
-            "outbound_queries": self._issued_queries_since(marker),
-            "saved_path": update["path"],
-            "filepath": update["path"],
-            "dossier_id": dossier["dossier_id"],
-            "change_summary": metadata.get("change_summary", ""),
-            "success": True,
-        }
 
     async def _run_dossier_batch_async(self, dossiers: list[dict], run_source: str) -> list[dict]:
-        results = []
-        for dossier in dossiers:
+        async def _run_one(dossier: dict) -> dict:
             try:
-                results.append(await self._run_dossier_async(dossier, run_source=run_source))
+                return await self._run_dossier_async(dossier, run_source=run_source)
             except Exception as e:
                 logger.error(
                     "async_research_dossier_failed",
@@ -643,8 +673,9 @@ class AsyncDeepResearchAgent(DeepResearchAgent):
                     topic=dossier.get("topic"),
                     error=str(e),
                 )
-                results.append(self._dossier_failure_result(dossier, str(e)))
-        return results
+                return self._dossier_failure_result(dossier, str(e))
+
+        return await self._gather_bounded([_run_one(dossier) for dossier in dossiers])
 
     async def close(self):
         await self.search_client.close()
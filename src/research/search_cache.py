@@ -0,0 +1,110 @@
+"""SQLite cache of web search results, keyed by provider and normalized query.
+
+Research runs re-issue the same topic queries week after week. Serving repeats
+from a local cache within ``ttl_seconds`` avoids the provider round trip, the
+rate-limit wait, and the outbound audit entry, since nothing leaves the machine.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import structlog
+
+from db import wal_connect
+
+logger = structlog.get_logger()
+
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive cache key for a query."""
+    return " ".join((query or "").lower().split())
+
+
+class SearchResultCache:
+    """TTL cache of search result payloads (lists of plain dicts)."""
+
+    def __init__(self, db_path: Path | None = None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._db_path = Path(db_path) if db_path else None
+        self.ttl_seconds = ttl_seconds
+        self._initialized = False
+
+    @property
+    def db_path(self) -> Path:
+        if self._db_path is None:
+            from storage_paths import get_coach_home
+
+            self._db_path = get_coach_home() / "research" / "search_cache.db"
+        return self._db_path
+
+    def _connect(self):
+        conn = wal_connect(self.db_path)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    provider TEXT NOT NULL,
+                    query_key TEXT NOT NULL,
+                    variant TEXT NOT NULL DEFAULT '',
+                    results TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (provider, query_key, variant)
+                )
+                """
+            )
+            self._initialized = True
+        return conn
+
+    def get(self, provider: str, query: str, variant: str = "") -> list[dict] | None:
+        """Return cached results younger than the TTL, or None on a miss."""
+        if self.ttl_seconds <= 0:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT results FROM search_cache
+                    WHERE provider = ? AND query_key = ? AND variant = ? AND fetched_at >= ?
+                    """,
+                    (provider, normalize_query(query), variant, time.time() - self.ttl_seconds),
+                ).fetchone()
+        except Exception as e:
+            logger.warning("search_cache_read_failed", error=str(e))
+            return None
+        return json.loads(row[0]) if row else None
+
+    def put(self, provider: str, query: str, results: list[dict], variant: str = "") -> None:
+        """Store results for a query; failures are logged, never raised."""
+        if self.ttl_seconds <= 0:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO search_cache
+                        (provider, query_key, variant, results, fetched_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        provider,
+                        normalize_query(query),
+                        variant,
+                        json.dumps(results, ensure_ascii=False),
+                        time.time(),
+                    ),
+                )
+        except Exception as e:
+            logger.warning("search_cache_write_failed", error=str(e))
+
+    def purge_expired(self) -> int:
+        """Delete entries older than the TTL and return how many were removed."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM search_cache WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+        return cursor.rowcount
@@ -1,7 +1,9 @@
 """Web search abstraction for research."""
 
+import asyncio
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass
 
 import httpx
 import structlog
@@ -9,9 +11,30 @@ import structlog
 from rate_limit import TokenBucketRateLimiter
 
 from .outbound import OutboundLogger, sanitize_outbound_query
+from .search_cache import SearchResultCache
 
 logger = structlog.get_logger()
 
+# One bucket per provider for the whole process, so concurrent research runs
+# (threads or event-loop tasks) share the provider's request budget.
+SEARCH_REQUESTS_PER_SECOND = 1.0
+SEARCH_BURST = 3
+
+_limiters: dict[str, TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_search_limiter(provider: str) -> TokenBucketRateLimiter:
+    """Return the process-wide rate limiter for a search provider."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = TokenBucketRateLimiter(
+                requests_per_second=SEARCH_REQUESTS_PER_SECOND, burst=SEARCH_BURST
+            )
+            _limiters[provider] = limiter
+        return limiter
+
 
 @dataclass
 class SearchResult:
@@ -23,6 +46,35 @@ class SearchResult:
     score: float = 0.0
 
 
+def _cache_variant(provider: str, search_depth: str, max_results: int, max_chars: int) -> str:
+    depth = search_depth if provider == "tavily" else ""
+    return f"{depth}:{max_results}:{max_chars}"
+
+
+def _load_cached(
+    cache: SearchResultCache | None, provider: str, query: str, variant: str
+) -> list[SearchResult] | None:
+    if cache is None:
+        return None
+    rows = cache.get(provider, query, variant)
+    if rows is None:
+        return None
+    logger.info("search_cache_hit", provider=provider, results=len(rows))
+    return [SearchResult(**row) for row in rows]
+
+
+def _store_cached(
+    cache: SearchResultCache | None,
+    provider: str,
+    query: str,
+    variant: str,
+    results: list[SearchResult],
+) -> None:
+    # Empty lists are what provider errors return, so they are never cached
+    if cache is not None and results:
+        cache.put(provider, query, [asdict(r) for r in results], variant)
+
+
 class WebSearchClient:
     """Abstract web search client (Tavily implementation)."""
 
@@ -33,6 +85,7 @@ class WebSearchClient:
         max_results: int = 8,
         max_content_chars: int = 3000,
         outbound_logger: OutboundLogger | None = None,
+        cache: SearchResultCache | None = None,
     ):
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         self.provider = provider
@@ -41,12 +94,10 @@ class WebSearchClient:
         self.client = httpx.Client(timeout=30.0)
         self._closed = False
         self._outbound = outbound_logger or OutboundLogger()
+        self.cache = cache
         # Audit trail of queries actually sent in this client's lifetime.
         self.issued_queries: list[dict] = []
 
-        # Rate limiting
-        self._limiter = TokenBucketRateLimiter(requests_per_second=1.0, burst=1)
-
     def _resolve_provider(self) -> str | None:
         if self.provider == "tavily" and self.api_key:
             return "tavily"
@@ -81,17 +132,25 @@ class WebSearchClient:
         if provider is None:
             return []
 
-        self._rate_limit()
+        variant = _cache_variant(provider, search_depth, self.max_results, self.max_content_chars)
+        cached = _load_cached(self.cache, provider, sanitized, variant)
+        if cached is not None:
+            return cached
+
+        self._rate_limit(provider)
         # Record before sending — an unlogged query is a bug, so IO errors abort.
         self.issued_queries.append(self._outbound.record(sanitized, provider))
 
         if provider == "tavily":
-            return self._tavily_search(sanitized, search_depth)
-        return self._duckduckgo_search(sanitized)
+            results = self._tavily_search(sanitized, search_depth)
+        else:
+            results = self._duckduckgo_search(sanitized)
+        _store_cached(self.cache, provider, sanitized, variant, results)
+        return results
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        self._limiter.acquire_sync()
+    def _rate_limit(self, provider: str):
+        """Wait for a token from the provider's process-wide bucket."""
+        get_search_limiter(provider).acquire_sync()
 
     def _tavily_search(self, query: str, search_depth: str) -> list[SearchResult]:
         """Execute Tavily API search."""
@@ -201,6 +260,7 @@ class AsyncWebSearchClient:
         max_results: int = 8,
         max_content_chars: int = 3000,
         outbound_logger: OutboundLogger | None = None,
+        cache: SearchResultCache | None = None,
     ):
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         self.provider = provider
@@ -209,6 +269,7 @@ class AsyncWebSearchClient:
         self.client = httpx.AsyncClient(timeout=30.0)
         self._closed = False
         self._outbound = outbound_logger or OutboundLogger()
+        self.cache = cache
         self.issued_queries: list[dict] = []
 
     async def search(self, query: str, search_depth: str = "advanced") -> list[SearchResult]:
@@ -218,14 +279,29 @@ class AsyncWebSearchClient:
             logger.warning("outbound_query_dropped", original_chars=len(query or ""))
             return []
         if self.provider == "tavily" and self.api_key:
-            self.issued_queries.append(self._outbound.record(sanitized, "tavily"))
-            return await self._tavily_search(sanitized, search_depth)
+            provider = "tavily"
         elif self.provider == "duckduckgo" or not self.api_key:
             if not self.api_key:
                 logger.info("No TAVILY_API_KEY, falling back to DuckDuckGo")
-            self.issued_queries.append(self._outbound.record(sanitized, "duckduckgo"))
-            return await self._duckduckgo_search(sanitized)
-        return []
+            provider = "duckduckgo"
+        else:
+            return []
+
+        variant = _cache_variant(provider, search_depth, self.max_results, self.max_content_chars)
+        cached = await asyncio.to_thread(_load_cached, self.cache, provider, sanitized, variant)
+        if cached is not None:
+            return cached
+
+        wait_time = get_search_limiter(provider).reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        self.issued_queries.append(self._outbound.record(sanitized, provider))
+        if provider == "tavily":
+            results = await self._tavily_search(sanitized, search_depth)
+        else:
+            results = await self._duckduckgo_search(sanitized)
+        await asyncio.to_thread(_store_cached, self.cache, provider, sanitized, variant, results)
+        return results
 
     async def _duckduckgo_search(self, query: str) -> list[SearchResult]:
         """Async DuckDuckGo search (no API key needed)."""
@@ -93,11 +93,15 @@ def _maybe_persist_trace(engine, trace_data_dir: Path | None) -> None:
     if trace_data_dir is None:
         return
     try:
-        orch = getattr(engine, "_orchestrator", None)
-        if orch is None:
-            return
-        trace = getattr(orch, "_trace", None)
-        session_id = getattr(orch, "_session_id", None)
+        # Engine-level trace covers every ask path (agentic, council, single-shot)
+        trace = getattr(engine, "_trace", None)
+        session_id = getattr(engine, "_session_id", None)
+        if not isinstance(trace, list) or not isinstance(session_id, str):
+            orch = getattr(engine, "_orchestrator", None)
+            if orch is None:
+                return
+            trace = getattr(orch, "_trace", None)
+            session_id = getattr(orch, "_session_id", None)
         if not trace or not session_id:
             return
         from advisor.trace_store import purge_old_traces, write_trace
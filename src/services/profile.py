@@ -28,14 +28,17 @@ def normalize_profile_value(field: str, value: Any) -> Any:
     return value
 
 
-def serialize_profile(profile) -> dict[str, Any]:
-    """Serialize a profile for web/MCP responses."""
+def serialize_profile(profile, summary: str | None = None) -> dict[str, Any]:
+    """Serialize a profile for web/MCP responses.
+
+    Pass ``summary`` when the caller already has the storage's cached one.
+    """
     data = profile.model_dump()
     data["career_stage"] = str(data["career_stage"])
     data["skills"] = [
         {"name": skill["name"], "proficiency": skill["proficiency"]} for skill in data["skills"]
     ]
-    data["summary"] = profile.summary()
+    data["summary"] = profile.summary() if summary is None else summary
     data["is_stale"] = profile.is_stale()
     return data
 
@@ -45,10 +48,11 @@ def get_profile_payload(storage) -> dict[str, Any]:
     profile = storage.load()
     if not profile:
         return {"exists": False, "profile": None}
+    summary = storage.summary()
     return {
         "exists": True,
-        "profile": serialize_profile(profile),
-        "summary": profile.summary(),
+        "profile": serialize_profile(profile, summary),
+        "summary": summary,
         "is_stale": profile.is_stale(),
     }
 
@@ -47,14 +47,10 @@ def load_profile_summary(profile_storage) -> str:
         return ""
 
     try:
-        profile = profile_storage.load()
+        return profile_storage.summary()
     except Exception:
         return ""
 
-    if not profile:
-        return ""
-    return profile.summary()
-
 
 def discover_matching_project_issues(
     intel_storage,
@@ -1,11 +1,46 @@
-"""Optional cross-encoder reranker — requires sentence-transformers."""
+"""Optional cross-encoder reranker — requires sentence-transformers.
+
+One :class:`CrossEncoderReranker` per process (see :func:`get_reranker`) owns
+the model. The model loads lazily on first use, or in the background via
+:meth:`CrossEncoderReranker.start_warmup`. Concurrent ``rerank`` calls are
+micro-batched by a single worker thread into one ``predict`` call, and scores
+are memoised per (query, passage) pair. A caller that would wait longer than
+the latency budget gets the original order back; the late scores still land in
+the cache for the next request.
+"""
 
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import importlib.util
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
 import structlog
 
+from observability import metrics
+
 logger = structlog.get_logger()
 
+BATCH_WINDOW_S = 0.005
+MAX_BATCH_PAIRS = 256
+SCORE_CACHE_SIZE = 4096
+DEFAULT_LATENCY_BUDGET_S = 0.5
+
+
+class _Request(NamedTuple):
+    pairs: list[tuple[str, str]]
+    keys: list[tuple[str, str]]
+    future: concurrent.futures.Future
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
 
 class CrossEncoderReranker:
     """Rerank passages using a cross-encoder model.
@@ -13,38 +48,212 @@ class CrossEncoderReranker:
     Requires `pip install stewardme[reranking]`. When sentence-transformers
     is not installed, `self.available` is False and `rerank()` returns
     identity ordering.
+
+    Args:
+        model_name: Cross-encoder checkpoint to load.
+        threads: CPU threads for inference (``torch.set_num_threads``);
+            None keeps the library default.
+        latency_budget: Seconds a ``rerank`` call may wait for scores before
+            falling back to the original order; None waits indefinitely.
     """
 
     MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
-    def __init__(self) -> None:
-        self.available = False
+    def __init__(
+        self,
+        model_name: str | None = None,
+        threads: int | None = None,
+        latency_budget: float | None = DEFAULT_LATENCY_BUDGET_S,
+    ) -> None:
+        self.model_name = model_name or self.MODEL
+        self.threads = threads
+        self.latency_budget = latency_budget
         self._model = None
-        try:
-            from sentence_transformers import CrossEncoder
+        self._installed = importlib.util.find_spec("sentence_transformers") is not None
+        self._load_failed = False
+        self._load_lock = threading.Lock()
+        self._scores: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._scores_lock = threading.Lock()
+        self._queue: queue.Queue[_Request] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    # ── Model lifecycle ──────────────────────────────────────────────
+
+    def _load_model(self):
+        from sentence_transformers import CrossEncoder
+
+        if self.threads:
+            import torch
+
+            torch.set_num_threads(self.threads)
+        return CrossEncoder(self.model_name)
+
+    def _ensure_model(self):
+        if self._model is not None or self._load_failed:
+            return self._model
+        with self._load_lock:
+            if self._model is None and not self._load_failed:
+                try:
+                    with metrics.timer("reranker.load"):
+                        self._model = self._load_model()
+                except ImportError:
+                    self._load_failed = True
+                    logger.debug(
+                        "cross_encoder_unavailable", reason="sentence-transformers not installed"
+                    )
+                except Exception as exc:
+                    self._load_failed = True
+                    logger.warning("cross_encoder_init_failed", error=str(exc))
+        return self._model
+
+    @property
+    def available(self) -> bool:
+        """Whether the model is loaded or loadable; never blocks on loading."""
+        if self._model is not None:
+            return True
+        return self._installed and not self._load_failed
+
+    def warmup(self) -> None:
+        """Load the model and run one prediction so first requests are fast."""
+        model = self._ensure_model()
+        if model is not None:
+            try:
+                model.predict([("warmup", "warmup")])
+            except Exception as exc:
+                logger.warning("cross_encoder_warmup_failed", error=str(exc))
 
-            self._model = CrossEncoder(self.MODEL)
-            self.available = True
-        except ImportError:
-            logger.debug("cross_encoder_unavailable", reason="sentence-transformers not installed")
-        except Exception as exc:
-            logger.warning("cross_encoder_init_failed", error=str(exc))
+    def start_warmup(self) -> None:
+        """Run :meth:`warmup` on the batch worker without blocking the caller."""
+        if self._model is None and self.available:
+            self._submit([], [])
+
+    # ── Score cache ──────────────────────────────────────────────────
+
+    def _cached_scores(self, keys: list[tuple[str, str]]) -> list[float | None]:
+        with self._scores_lock:
+            found = []
+            for key in keys:
+                score = self._scores.get(key)
+                if score is not None:
+                    self._scores.move_to_end(key)
+                found.append(score)
+            return found
+
+    def _store_scores(self, keys: list[tuple[str, str]], scores) -> None:
+        with self._scores_lock:
+            for key, score in zip(keys, scores):
+                self._scores[key] = float(score)
+                self._scores.move_to_end(key)
+            while len(self._scores) > SCORE_CACHE_SIZE:
+                self._scores.popitem(last=False)
+
+    # ── Batch worker ─────────────────────────────────────────────────
+
+    def _submit(self, pairs: list[tuple[str, str]], keys) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put(_Request(pairs, keys, future))
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="reranker-batch", daemon=True
+                )
+                self._worker.start()
+        return future
+
+    def _next_batch(self) -> list[_Request]:
+        batch = [self._queue.get()]
+        size = len(batch[0].pairs)
+        deadline = time.monotonic() + BATCH_WINDOW_S
+        while size < MAX_BATCH_PAIRS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.pairs)
+        return batch
+
+    def _run_worker(self) -> None:
+        while True:
+            batch = self._next_batch()
+            pairs = [pair for request in batch for pair in request.pairs]
+            try:
+                if not pairs:
+                    self.warmup()
+                    scores = []
+                else:
+                    model = self._ensure_model()
+                    if model is None:
+                        raise RuntimeError("cross-encoder unavailable")
+                    with metrics.timer("reranker.predict"):
+                        scores = [float(s) for s in model.predict(pairs)]
+            except Exception as exc:
+                for request in batch:
+                    request.future.set_exception(exc)
+                continue
+            offset = 0
+            for request in batch:
+                chunk = scores[offset : offset + len(request.pairs)]
+                offset += len(request.pairs)
+                self._store_scores(request.keys, chunk)
+                request.future.set_result(chunk)
+
+    # ── Public API ───────────────────────────────────────────────────
 
     def rerank(self, query: str, passages: list[str], top_k: int = 10) -> list[int]:
         """Return indices of passages sorted by relevance to query.
 
-        When cross-encoder is unavailable, returns original ordering.
+        When cross-encoder is unavailable, or scoring exceeds the latency
+        budget, returns original ordering.
         """
         if not passages:
             return []
-        if not self.available or not self._model:
-            return list(range(min(top_k, len(passages))))
-
-        try:
-            pairs = [[query, p] for p in passages]
-            scores = self._model.predict(pairs)
-            ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
-            return ranked[:top_k]
-        except Exception as exc:
-            logger.warning("cross_encoder_rerank_failed", error=str(exc))
-            return list(range(min(top_k, len(passages))))
+        identity = list(range(min(top_k, len(passages))))
+        if not self.available:
+            return identity
+
+        query_hash = _digest(query)
+        keys = [(query_hash, _digest(p)) for p in passages]
+        scores = self._cached_scores(keys)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            future = self._submit(
+                [(query, passages[i]) for i in missing], [keys[i] for i in missing]
+            )
+            try:
+                for i, score in zip(missing, future.result(timeout=self.latency_budget)):
+                    scores[i] = score
+            except concurrent.futures.TimeoutError:
+                metrics.counter("reranker.budget_exceeded")
+                logger.info("cross_encoder_budget_exceeded", budget=self.latency_budget)
+                return identity
+            except Exception as exc:
+                logger.warning("cross_encoder_rerank_failed", error=str(exc))
+                return identity
+
+        ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+        return ranked[:top_k]
+
+
+_instance: CrossEncoderReranker | None = None
+_instance_lock = threading.Lock()
+
+
+def get_reranker(
+    threads: int | None = None,
+    latency_budget: float | None = DEFAULT_LATENCY_BUDGET_S,
+) -> CrossEncoderReranker:
+    """Return the process-wide reranker, creating and warming it on first call.
+
+    Settings apply when the instance is created; later calls reuse it.
+    """
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = CrossEncoderReranker(threads=threads, latency_budget=latency_budget)
+            _instance.start_warmup()
+        return _instance
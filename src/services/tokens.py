@@ -6,8 +6,7 @@ _encoder = None
 _init_failed = False
 
 
-def count_tokens(text: str) -> int:
-    """Count tokens using tiktoken cl100k_base. Falls back to len//4 on import error."""
+def _get_encoder():
     global _encoder, _init_failed
     if _encoder is None and not _init_failed:
         try:
@@ -16,10 +15,15 @@ def count_tokens(text: str) -> int:
             _encoder = tiktoken.get_encoding("cl100k_base")
         except Exception:
             _init_failed = True
-            return len(text) // 4
-    if _encoder is None:
+    return _encoder
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens using tiktoken cl100k_base. Falls back to len//4 on import error."""
+    encoder = _get_encoder()
+    if encoder is None:
         return len(text) // 4
     try:
-        return len(_encoder.encode(text))
+        return len(encoder.encode(text))
     except Exception:
         return len(text) // 4
@@ -16,7 +16,17 @@ logger = structlog.get_logger()
 class ToolEntry:
     """Lightweight registered tool metadata."""
 
-    __slots__ = ("name", "toolset", "description", "schema", "handler", "check_fn", "is_async")
+    __slots__ = (
+        "name",
+        "toolset",
+        "description",
+        "schema",
+        "handler",
+        "check_fn",
+        "is_async",
+        "parallel_safe",
+        "timeout",
+    )
 
     def __init__(
         self,
@@ -28,6 +38,8 @@ class ToolEntry:
         handler: Callable[[dict], object],
         check_fn: Callable[[], bool] | None = None,
         is_async: bool = False,
+        parallel_safe: bool = False,
+        timeout: float | None = None,
     ) -> None:
         self.name = name
         self.toolset = toolset
@@ -36,6 +48,10 @@ class ToolEntry:
         self.handler = handler
         self.check_fn = check_fn
         self.is_async = is_async
+        # Read-only/side-effect-free tools may run concurrently with siblings
+        # requested in the same assistant turn.
+        self.parallel_safe = parallel_safe
+        self.timeout = timeout
 
 
 class ToolRegistry:
@@ -77,6 +93,8 @@ class ToolRegistry:
         handler: Callable[[dict], object],
         check_fn: Callable[[], bool] | None = None,
         is_async: bool = False,
+        parallel_safe: bool = False,
+        timeout: float | None = None,
     ) -> None:
         self._tools[name] = ToolEntry(
             name=name,
@@ -86,6 +104,8 @@ class ToolRegistry:
             handler=handler,
             check_fn=check_fn,
             is_async=is_async,
+            parallel_safe=parallel_safe,
+            timeout=timeout,
         )
 
     def _is_available(self, entry: ToolEntry) -> bool:
@@ -135,6 +155,17 @@ class ToolRegistry:
         entry = self._tools.get(name)
         return entry.toolset if entry else None
 
+    def is_parallel_safe(self, name: str) -> bool:
+        entry = self._tools.get(name)
+        return bool(entry and entry.parallel_safe)
+
+    def get_timeout(self, name: str, default: float) -> float:
+        """Per-tool timeout override, falling back to ``default``."""
+        entry = self._tools.get(name)
+        if entry is None or entry.timeout is None:
+            return default
+        return entry.timeout
+
     def get_available_toolsets(self) -> dict[str, bool]:
         toolsets = {entry.toolset for entry in self._tools.values()}
         return {
@@ -0,0 +1,29 @@
+"""Process-wide thread pools shared by name.
+
+Subsystems that fan blocking work out to threads (advisor tools, context
+retrievers, signal detectors, MCP tool calls, PDF extraction) each keep one
+lazily created pool for the life of the process rather than building and
+tearing one down per request.
+"""
+
+import concurrent.futures
+import threading
+
+_pools: dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def shared_pool(name: str, workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    """Return the pool registered as ``name``, creating it on first use.
+
+    ``name`` doubles as the worker thread-name prefix. ``workers`` only
+    applies when the pool is created.
+    """
+    with _lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=name
+            )
+            _pools[name] = pool
+        return pool
@@ -47,6 +47,11 @@ def init_db(db_path: Path | None = None) -> None:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_login TIMESTAMP
             );
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                tat REAL NOT NULL,
+                log TEXT
+            );
             CREATE TABLE IF NOT EXISTS user_secrets (
                 user_id TEXT NOT NULL REFERENCES users(id),
                 key TEXT NOT NULL,
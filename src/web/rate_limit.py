@@ -1,7 +1,8 @@
 """Per-user rate limiting for the web backend.
 
-Two layers, both in-memory sliding windows (reset on deploy, acceptable for
-single-worker):
+Two layers, both enforced through a pluggable backend
+(``web.rate_limit_backends``). Short burst and per-minute rules use GCRA;
+the daily and onboarding-session caps are exact rolling-window counts:
 
 1. Shared-key ("lite mode") limits — daily budget + burst interval for users
    on the shared API key.
@@ -9,16 +10,23 @@ single-worker):
    that trigger paid LLM calls and a general bucket for the rest of the API,
    configurable via ``web.rate_limit`` in config.yaml.
 
-Periodic pruning prevents unbounded memory growth from abandoned users.
+``web.rate_limit.backend`` selects in-process state (``memory``, resets on
+deploy, per worker) or the users database (``sqlite``, shared by every
+uvicorn worker on the host).
 """
 
 import hashlib
 import time
-from collections import defaultdict
 
 from fastapi import Depends, HTTPException, Request
 
 from web.auth import get_current_user
+from web.rate_limit_backends import (
+    MemoryRateLimiter,
+    RateLimiterBackend,
+    RateRule,
+    SqliteRateLimiter,
+)
 
 # 30 queries per rolling 24h window
 DAILY_LIMIT = 30
@@ -31,49 +39,33 @@ BURST_INTERVAL = 10.0
 # the profile interview without exhausting their daily allowance.
 ONBOARDING_BURST_INTERVAL = 3.0
 ONBOARDING_LIMIT = 20  # max turns in one onboarding session
+ONBOARDING_WINDOW_SECONDS = 3600
 
-# Pruning: evict stale entries every N checks, cap total tracked users
-_PRUNE_EVERY = 500  # calls between full prune sweeps
-_MAX_TRACKED_USERS = 10_000  # hard cap on tracked user IDs
+_backend: RateLimiterBackend | None = None
 
-# user_id -> list of timestamps
-_request_log: dict[str, list[float]] = defaultdict(list)
-_onboarding_log: dict[str, list[float]] = defaultdict(list)
-_call_counter = 0
 
+def _get_backend() -> RateLimiterBackend:
+    """Build the configured backend once; fall back to memory on any error."""
+    global _backend
+    if _backend is None:
+        kind = "memory"
+        try:
+            from web.deps_base import get_config
 
-def _prune(user_id: str, now: float) -> list[float]:
-    """Remove timestamps older than the window for a single user."""
-    cutoff = now - WINDOW_SECONDS
-    log = [t for t in _request_log[user_id] if t > cutoff]
-    _request_log[user_id] = log
-    return log
-
-
-def _periodic_prune(now: float) -> None:
-    """Sweep all logs and evict users with no recent activity."""
-    global _call_counter
-    _call_counter += 1
-    if _call_counter < _PRUNE_EVERY:
-        return
-    _call_counter = 0
-
-    cutoff = now - WINDOW_SECONDS
-    onboard_cutoff = now - 3600
+            kind = get_config().web.rate_limit.backend
+        except Exception:
+            pass
+        if kind == "sqlite":
+            from web.user_store import get_default_db_path
 
-    stale = [uid for uid, ts in _request_log.items() if not ts or ts[-1] <= cutoff]
-    for uid in stale:
-        del _request_log[uid]
+            _backend = SqliteRateLimiter(get_default_db_path)
+        else:
+            _backend = MemoryRateLimiter()
+    return _backend
 
-    stale_ob = [uid for uid, ts in _onboarding_log.items() if not ts or ts[-1] <= onboard_cutoff]
-    for uid in stale_ob:
-        del _onboarding_log[uid]
 
-    # Hard cap: if still over limit, drop oldest-activity users
-    if len(_request_log) > _MAX_TRACKED_USERS:
-        by_age = sorted(_request_log.items(), key=lambda kv: kv[1][-1] if kv[1] else 0)
-        for uid, _ in by_age[: len(_request_log) - _MAX_TRACKED_USERS]:
-            del _request_log[uid]
+def _retry_after(seconds: float) -> int:
+    return int(seconds) + 1
 
 
 def check_shared_key_rate_limit(user_id: str, *, onboarding: bool = False) -> None:
@@ -83,59 +75,45 @@ def check_shared_key_rate_limit(user_id: str, *, onboarding: bool = False) -> No
     never competes with regular usage.
     """
     now = time.time()
-    _periodic_prune(now)
-
     if onboarding:
         _check_onboarding_limit(user_id, now)
         return
 
-    log = _prune(user_id, now)
-
-    # Burst check
-    if log and (now - log[-1]) < BURST_INTERVAL:
-        retry_after = int(BURST_INTERVAL - (now - log[-1])) + 1
+    hit = _get_backend().acquire(
+        [
+            RateRule(f"shared_burst:{user_id}", 1, BURST_INTERVAL),
+            RateRule(f"shared_daily:{user_id}", DAILY_LIMIT, WINDOW_SECONDS, exact=True),
+        ],
+        now,
+    )
+    if hit is not None:
         raise HTTPException(
             status_code=429,
             detail="Lite mode limit reached — add your own API key in Settings for unlimited access",
-            headers={"Retry-After": str(retry_after)},
+            headers={"Retry-After": str(_retry_after(hit.retry_after))},
         )
 
-    # Daily limit check
-    if len(log) >= DAILY_LIMIT:
-        oldest = log[0]
-        retry_after = int(oldest + WINDOW_SECONDS - now) + 1
-        raise HTTPException(
-            status_code=429,
-            detail="Lite mode limit reached — add your own API key in Settings for unlimited access",
-            headers={"Retry-After": str(retry_after)},
-        )
-
-    # Record request
-    _request_log[user_id].append(now)
-
 
 def _check_onboarding_limit(user_id: str, now: float) -> None:
     """Separate rate limit for onboarding — generous burst, capped per session."""
-    cutoff = now - 3600  # 1h window for onboarding
-    log = [t for t in _onboarding_log[user_id] if t > cutoff]
-    _onboarding_log[user_id] = log
-
-    if log and (now - log[-1]) < ONBOARDING_BURST_INTERVAL:
-        retry_after = int(ONBOARDING_BURST_INTERVAL - (now - log[-1])) + 1
+    burst = RateRule(f"onboarding_burst:{user_id}", 1, ONBOARDING_BURST_INTERVAL)
+    session = RateRule(
+        f"onboarding:{user_id}", ONBOARDING_LIMIT, ONBOARDING_WINDOW_SECONDS, exact=True
+    )
+    hit = _get_backend().acquire([burst, session], now)
+    if hit is None:
+        return
+    if hit.rule is burst:
         raise HTTPException(
             status_code=429,
             detail="Please wait a moment before sending the next message",
-            headers={"Retry-After": str(retry_after)},
-        )
-
-    if len(log) >= ONBOARDING_LIMIT:
-        raise HTTPException(
-            status_code=429,
-            detail="Onboarding session limit reached — please try again later or add your own API key in Settings",
-            headers={"Retry-After": "60"},
+            headers={"Retry-After": str(_retry_after(hit.retry_after))},
         )
-
-    _onboarding_log[user_id].append(now)
+    raise HTTPException(
+        status_code=429,
+        detail="Onboarding session limit reached — please try again later or add your own API key in Settings",
+        headers={"Retry-After": str(_retry_after(hit.retry_after))},
+    )
 
 
 # --- Per-user route limits (all users, not just shared-key) ---------------
@@ -144,8 +122,6 @@ DEFAULT_LLM_PER_MINUTE = 20
 DEFAULT_GENERAL_PER_MINUTE = 120
 ROUTE_WINDOW_SECONDS = 60.0
 
-# (key, bucket) -> list of timestamps
-_route_log: dict[tuple[str, str], list[float]] = defaultdict(list)
 # (enabled, llm_per_minute, general_per_minute), cached after first read
 _route_limit_cache: tuple[bool, int, int] | None = None
 
@@ -165,15 +141,10 @@ def _route_limit_settings() -> tuple[bool, int, int]:
 
 
 def _check_window(key: tuple[str, str], limit: int, now: float) -> int | None:
-    """Sliding-window check. Returns Retry-After seconds when limited."""
-    cutoff = now - ROUTE_WINDOW_SECONDS
-    log = [t for t in _route_log[key] if t > cutoff]
-    if len(log) >= limit:
-        _route_log[key] = log
-        return int(log[0] + ROUTE_WINDOW_SECONDS - now) + 1
-    log.append(now)
-    _route_log[key] = log
-    return None
+    """Per-minute route check. Returns Retry-After seconds when limited."""
+    rule = RateRule(f"route:{key[1]}:{key[0]}", limit, ROUTE_WINDOW_SECONDS)
+    hit = _get_backend().acquire([rule], now)
+    return None if hit is None else _retry_after(hit.retry_after)
 
 
 def check_route_rate_limit(user_id: str, bucket: str = "llm") -> None:
@@ -220,9 +191,8 @@ def general_request_retry_after(request: Request) -> int | None:
 
 def reset_rate_limits() -> None:
     """Clear all rate limit state. Used in tests."""
-    global _call_counter, _route_limit_cache
-    _request_log.clear()
-    _onboarding_log.clear()
-    _route_log.clear()
+    global _backend, _route_limit_cache
+    if _backend is not None:
+        _backend.reset()
+    _backend = None
     _route_limit_cache = None
-    _call_counter = 0
@@ -0,0 +1,196 @@
+"""Storage backends for the web rate limiter.
+
+Both backends implement GCRA (generic cell rate algorithm): a key's whole
+state is one "theoretical arrival time" (TAT), so a check is O(1) however
+many requests the window allows. ``limit`` requests per ``window`` seconds
+may arrive back to back, after which capacity refills at one request every
+``window / limit`` seconds — a smooth approximation of a sliding window.
+
+That approximation is only safe for short windows. Because the tolerance is
+the whole window, a client that drains the burst and then keeps pace with
+the refill gets close to ``2 * limit`` requests through in any one window.
+Rules marked ``exact`` (daily and per-session caps) therefore keep a sliding
+log of their last ``limit`` admission times instead, and admit a request
+only while fewer than ``limit`` of them fall inside the trailing window.
+
+``MemoryRateLimiter`` keeps state in-process. ``SqliteRateLimiter`` keeps
+it in the users database so every uvicorn worker shares one quota.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+import structlog
+
+from db import wal_connect
+
+logger = structlog.get_logger()
+
+
+class RateRule(NamedTuple):
+    """Allow ``limit`` requests per ``window`` seconds for ``key``.
+
+    ``exact`` rules count admissions in the trailing window instead of
+    using GCRA, trading O(limit) state for a hard cap.
+    """
+
+    key: str
+    limit: int
+    window: float
+    exact: bool = False
+
+
+class RateLimitHit(NamedTuple):
+    """The first rule that rejected a request and when to retry."""
+
+    rule: RateRule
+    retry_after: float
+
+
+class RateLimiterBackend(Protocol):
+    def acquire(self, rules: Sequence[RateRule], now: float) -> RateLimitHit | None:
+        """Charge one request against every rule, or none if any rule rejects it."""
+        ...
+
+    def reset(self) -> None: ...
+
+
+# Per-key state: (expiry, admission log). For GCRA rules the expiry is the
+# TAT and the log is None; for exact rules it is when the newest admission
+# leaves the window. Either way the key carries no state once expiry <= now.
+_State = tuple[float, list[float] | None]
+
+
+def _evaluate(
+    rules: Sequence[RateRule], states: dict[str, _State], now: float
+) -> tuple[RateLimitHit | None, dict[str, _State]]:
+    """Apply each rule to its stored state; returns (hit, new states)."""
+    updated: dict[str, _State] = {}
+    for rule in rules:
+        tat, log = states.get(rule.key, (now, None))
+        if rule.exact:
+            recent = [t for t in log or () if t > now - rule.window]
+            if len(recent) >= rule.limit:
+                return RateLimitHit(rule, recent[-rule.limit] + rule.window - now), {}
+            updated[rule.key] = (now + rule.window, (recent + [now])[-rule.limit :])
+            continue
+        interval = rule.window / rule.limit
+        new_tat = max(tat, now) + interval
+        if new_tat - now > rule.window:
+            return RateLimitHit(rule, new_tat - rule.window - now), {}
+        updated[rule.key] = (new_tat, None)
+    return None, updated
+
+
+class MemoryRateLimiter:
+    """Per-process limiter; entries are evicted once their expiry has passed."""
+
+    def __init__(self, max_keys: int = 50_000):
+        self._tats: OrderedDict[str, _State] = OrderedDict()
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+
+    def acquire(self, rules: Sequence[RateRule], now: float) -> RateLimitHit | None:
+        with self._lock:
+            hit, updated = _evaluate(rules, self._tats, now)
+            for key, state in updated.items():
+                self._tats[key] = state
+                self._tats.move_to_end(key)
+            self._evict(now)
+            return hit
+
+    def _evict(self, now: float) -> None:
+        # Least recently charged keys sit at the front; an expired TAT carries
+        # no state, and the cap bounds memory for abandoned users.
+        while self._tats:
+            key, (tat, _log) = next(iter(self._tats.items()))
+            if tat > now and len(self._tats) <= self._max_keys:
+                break
+            del self._tats[key]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tats.clear()
+
+
+class SqliteRateLimiter:
+    """Limiter backed by a ``rate_limits`` table shared by all workers.
+
+    Each check runs in a ``BEGIN IMMEDIATE`` transaction, so concurrent
+    workers serialize on the write lock and never double-spend a quota.
+    """
+
+    _PRUNE_EVERY = 1000
+
+    def __init__(self, db_path: Path | Callable[[], Path]):
+        self._db_path = db_path
+        self._local = threading.local()
+        self._calls = 0
+
+    def _path(self) -> Path:
+        return Path(self._db_path() if callable(self._db_path) else self._db_path)
+
+    def _conn(self) -> sqlite3.Connection:
+        path = self._path()
+        conns: dict[Path, sqlite3.Connection] = self._local.__dict__.setdefault("conns", {})
+        conn = conns.get(path)
+        if conn is None:
+            conn = wal_connect(path)
+            conn.isolation_level = None
+            conn.execute("PRAGMA busy_timeout=5000")
+            ensure_rate_limit_table(conn)
+            conns[path] = conn
+        return conn
+
+    def acquire(self, rules: Sequence[RateRule], now: float) -> RateLimitHit | None:
+        conn = self._conn()
+        keys = [rule.key for rule in rules]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, tat, log FROM rate_limits WHERE key IN ({placeholders})", keys
+            ).fetchall()
+            states = {key: (tat, json.loads(log) if log else None) for key, tat, log in rows}
+            hit, updated = _evaluate(rules, states, now)
+            if updated:
+                conn.executemany(
+                    "INSERT INTO rate_limits (key, tat, log) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat, log = excluded.log",
+                    [
+                        (key, tat, json.dumps(log) if log is not None else None)
+                        for key, (tat, log) in updated.items()
+                    ],
+                )
+            self._calls += 1
+            if self._calls % self._PRUNE_EVERY == 0:
+                conn.execute("DELETE FROM rate_limits WHERE tat <= ?", (now,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return hit
+
+    def reset(self) -> None:
+        try:
+            self._conn().execute("DELETE FROM rate_limits")
+        except sqlite3.Error as exc:
+            logger.warning("rate_limit_reset_failed", error=str(exc))
+
+
+def ensure_rate_limit_table(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL, log TEXT)"
+    )
+    # Migration: tables created before exact rules had no log column
+    try:
+        conn.execute("ALTER TABLE rate_limits ADD COLUMN log TEXT")
+    except sqlite3.OperationalError:
+        pass  # column already exists
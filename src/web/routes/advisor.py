@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Upload
 from starlette.responses import StreamingResponse
 
 from advisor.council import CouncilMember
-from library.pdf_text import extract_text_from_pdf_bytes
+from library.extraction_jobs import submit_pdf_extraction, wait_for_extraction
 from library.reports import ReportStore
 from services.advice import (
     ConversationNotFoundError,
@@ -68,6 +68,10 @@ def _get_library_index(user_id: str):
     return get_library_index(user_id)
 
 
+# How long an ask waits for a just-uploaded attachment's text extraction
+ATTACHMENT_EXTRACTION_WAIT_S = 30.0
+
+
 def _resolve_attachment_records(user_id: str, attachment_ids: list[str] | None) -> list[dict]:
     if not attachment_ids:
         return []
@@ -82,6 +86,9 @@ def _resolve_attachment_records(user_id: str, attachment_ids: list[str] | None)
         record = store.get_report(attachment_id)
         if not record or record.get("source_kind") != "uploaded_pdf":
             raise HTTPException(status_code=404, detail=f"Attachment not found: {attachment_id}")
+        if record.get("extraction_status") == "pending":
+            wait_for_extraction(store, attachment_id, timeout=ATTACHMENT_EXTRACTION_WAIT_S)
+            record = store.get_report(attachment_id) or record
         if record.get("index_status") not in {"ready", "limited_text"}:
             raise HTTPException(status_code=422, detail=f"Attachment is not ready: {attachment_id}")
         records.append(
@@ -110,10 +117,10 @@ async def upload_chat_attachment(
 ):
     from web.routes.library import (
         _derive_document_title,
+        _extraction_callback,
         _get_index,
         _get_store,
         _index_record,
-        _process_document_memory,
     )
 
     if conversation_id and not conversation_belongs_to(conversation_id, user["id"]):
@@ -121,23 +128,22 @@ async def upload_chat_attachment(
 
     payload = await file.read()
     _validate_attachment_upload(file.filename, payload, file.content_type)
-    extracted_text = extract_text_from_pdf_bytes(payload)
-    extraction_status = "ready" if extracted_text.strip() else "empty"
-    index_status = "ready" if extracted_text.strip() else "limited_text"
     store = _get_store(user["id"])
     report = store.create_uploaded_pdf(
         title=_derive_document_title(file.filename or "document.pdf"),
         file_name=file.filename or "document.pdf",
         file_bytes=payload,
         mime_type=file.content_type or "application/pdf",
-        extracted_text=extracted_text,
-        extraction_status=extraction_status,
+        extraction_status="pending",
         origin_surface="chat",
         visibility_state="hidden",
-        index_status=index_status,
     )
     _index_record(report, store, _get_index(user["id"]))
-    _process_document_memory(user["id"], report, extracted_text)
+    # The chat composer needs the final index status to warn about scanned
+    # PDFs, so wait for the job here without blocking the event loop.
+    job = submit_pdf_extraction(store, report["id"], _extraction_callback(user["id"], store))
+    report = await asyncio.wrap_future(job) or report
+    index_status = report.get("index_status") or "failed"
     return ChatAttachmentResponse(
         attachment_id=report["id"],
         file_name=report.get("file_name"),
@@ -246,6 +252,15 @@ def _get_engine(user_id: str, use_tools: bool = False):
 
         structlog.get_logger().warning("entity_components_init_failed", error=str(exc))
 
+    reranker = None
+    if config.rag.rerank:
+        from services.reranker import get_reranker
+
+        reranker = get_reranker(
+            threads=config.rag.rerank_threads,
+            latency_budget=config.rag.rerank_budget_ms / 1000,
+        )
+
     users_db = get_default_db_path()
     rag = RAGRetriever(
         journal_search=journal_search,
@@ -261,6 +276,7 @@ def _get_engine(user_id: str, use_tools: bool = False):
         entity_store=entity_store,
         entity_retriever=entity_retriever,
         query_analyzer=query_analyzer,
+        reranker=reranker,
     )
 
     provider_name, api_key, source = resolve_llm_credentials_for_user(user_id)
@@ -323,7 +339,9 @@ async def ask_advisor(
     user_message_id: str | None = None
     try:
         user_id = user["id"]
-        attachments = _resolve_attachment_records(user_id, body.attachment_ids)
+        attachments = await asyncio.to_thread(
+            _resolve_attachment_records, user_id, body.attachment_ids
+        )
         conv_id, history, user_message_id = start_conversation_turn(
             user_id=user_id,
             conversation_id=body.conversation_id,
@@ -401,7 +419,9 @@ async def ask_advisor_stream(
     created_conversation = body.conversation_id is None
 
     try:
-        attachments = _resolve_attachment_records(user_id, body.attachment_ids)
+        attachments = await asyncio.to_thread(
+            _resolve_attachment_records, user_id, body.attachment_ids
+        )
         conv_id, history, user_message_id = start_conversation_turn(
             user_id=user_id,
             conversation_id=body.conversation_id,
@@ -8,6 +8,8 @@ from pathlib import Path
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from curriculum.catalog import CatalogSnapshot, get_catalog, invalidate_catalog
+from curriculum.catalog import build_program_lookup as _build_program_lookup
 from curriculum.content_schema import (
     derive_causal_lens,
     derive_guide_synthesis,
@@ -33,7 +35,7 @@ from curriculum.personalization import (
     score_guide_candidate,
 )
 from curriculum.question_generator import QuestionGenerator
-from curriculum.scanner import CurriculumScanner, build_tree_layout
+from curriculum.scanner import CurriculumScanner
 from curriculum.store import CurriculumStore
 from curriculum.user_content import ensure_user_curriculum_dirs, load_guide_metadata
 from llm import LLMError, create_cheap_provider, create_llm_provider
@@ -79,9 +81,19 @@ def _get_store(user_id: str) -> CurriculumStore:
     return CurriculumStore(Path(paths["data_dir"]) / "curriculum.db")
 
 
-def _get_scanner(user_id: str, store: CurriculumStore | None = None) -> CurriculumScanner:
+def _get_catalog(user_id: str | None = None) -> CatalogSnapshot:
+    """Shared catalog snapshot with the user's active directory layered on top."""
+    overlay_dir = ensure_user_curriculum_dirs(user_id)[0] if user_id else None
+    return get_catalog(_content_dirs(), overlay_dir)
+
+
+def _get_synced_catalog(user_id: str, store: CurriculumStore | None = None) -> CatalogSnapshot:
     store = store or _get_store(user_id)
-    return _ensure_catalog_initialized(store, CurriculumScanner(_content_dirs(user_id)))
+    return _ensure_catalog_initialized(store, user_id=user_id)
+
+
+def _get_scanner(user_id: str, store: CurriculumStore | None = None) -> CurriculumScanner:
+    return _get_synced_catalog(user_id, store).scanner
 
 
 def _build_question_generator(user_id: str) -> QuestionGenerator:
@@ -139,40 +151,13 @@ def _build_guide_generation_service(user_id: str) -> GuideGenerationService:
 
 def _ensure_catalog_initialized(
     store: CurriculumStore,
-    scanner: CurriculumScanner | None = None,
     user_id: str | None = None,
-) -> CurriculumScanner:
-    """Populate the curriculum catalog on first use for this user DB."""
-    scanner = scanner or CurriculumScanner(_content_dirs(user_id))
-    current_fingerprint = scanner.get_catalog_fingerprint()
-    stored_fingerprint = store.get_catalog_meta("catalog_fingerprint")
-    if not store.list_guides() or stored_fingerprint != current_fingerprint:
-        _sync_catalog(
-            store,
-            user_id=user_id,
-            scanner=scanner,
-            catalog_fingerprint=current_fingerprint,
-        )
-    return scanner
-
-
-def _build_program_lookup(programs: list[dict]) -> dict[str, list[dict]]:
-    """Map guide_id -> curated learning programs containing that guide."""
-    lookup: dict[str, list[dict]] = {}
-    for program in programs:
-        summary = {
-            "id": program["id"],
-            "title": program["title"],
-            "audience": program.get("audience", ""),
-            "description": program.get("description", ""),
-            "color": program.get("color", "#6b7280"),
-            "outcomes": list(program.get("outcomes", [])),
-            "guide_ids": list(program.get("guide_ids", [])),
-            "applied_module_ids": list(program.get("applied_module_ids", [])),
-        }
-        for guide_id in [*summary["guide_ids"], *summary["applied_module_ids"]]:
-            lookup.setdefault(guide_id, []).append(summary)
-    return lookup
+) -> CatalogSnapshot:
+    """Sync the process-wide catalog into this user DB when its fingerprint moved."""
+    catalog = _get_catalog(user_id)
+    if store.get_catalog_meta("catalog_fingerprint") != catalog.fingerprint:
+        _sync_catalog(store, user_id=user_id, catalog=catalog)
+    return catalog
 
 
 def _load_user_profile(user_id: str):
@@ -1212,12 +1197,12 @@ async def get_skill_tree(
     """Return full DAG: tracks, nodes with layout positions, edges."""
     user_id = user["id"]
     store = _get_store(user_id)
-    scanner = _get_scanner(user_id, store)
+    catalog = _get_synced_catalog(user_id, store)
+    scanner = catalog.scanner
     guide_aliases = set(scanner.get_guide_aliases())
 
     track_meta = scanner.get_track_metadata()
-    skill_tree = scanner._skill_tree
-    positions = build_tree_layout(skill_tree)
+    positions = catalog.tree_layout
 
     logger.info(
         "curriculum.tree_metadata",
@@ -1275,9 +1260,10 @@ async def list_guides(
 ):
     user_id = user["id"]
     store = _get_store(user_id)
-    scanner = _get_scanner(user_id, store)
+    catalog = _get_synced_catalog(user_id, store)
+    scanner = catalog.scanner
     guide_aliases = set(scanner.get_guide_aliases())
-    program_lookup = _build_program_lookup(scanner.get_learning_programs())
+    program_lookup = catalog.program_lookup
 
     guides = store.list_guides(category=category, user_id=user_id, origin=origin)
     visible_guides = [
@@ -1293,8 +1279,9 @@ async def list_guides(
 async def list_archived_guides(user: dict = Depends(get_current_user)):
     user_id = user["id"]
     store = _get_store(user_id)
-    scanner = _get_scanner(user_id, store)
-    program_lookup = _build_program_lookup(scanner.get_learning_programs())
+    catalog = _get_synced_catalog(user_id, store)
+    scanner = catalog.scanner
+    program_lookup = catalog.program_lookup
     guides = store.list_archived_guides(user_id=user_id)
     return [
         _decorate_guide_payload(
@@ -1340,7 +1327,7 @@ async def generate_user_guide(
         raise HTTPException(status_code=500, detail=f"Guide generation failed: {exc}") from exc
 
     scanner = _get_scanner(user_id, store)
-    _sync_catalog(store, user_id=user_id, scanner=scanner)
+    _sync_catalog(store, user_id=user_id)
     program_lookup = _build_program_lookup(scanner.get_learning_programs())
     created_guide = store.get_guide(artifact["guide_id"], user_id=user_id)
     if not created_guide:
@@ -1390,7 +1377,7 @@ async def extend_guide(
         )
         raise HTTPException(status_code=500, detail=f"Guide extension failed: {exc}") from exc
 
-    _sync_catalog(store, user_id=user_id, scanner=scanner)
+    _sync_catalog(store, user_id=user_id)
     program_lookup = _build_program_lookup(scanner.get_learning_programs())
     created_guide = store.get_guide(artifact["guide_id"], user_id=user_id)
     if not created_guide:
@@ -1471,7 +1458,7 @@ async def restore_user_guide(
 
     shutil.move(str(source_dir), str(target_dir))
     store.restore_guide(resolved_guide_id)
-    _sync_catalog(store, user_id=user_id, scanner=scanner)
+    _sync_catalog(store, user_id=user_id)
     log_event("curriculum_user_guide_restored", user_id, {"guide_id": resolved_guide_id})
     return {"restored": True, "guide_id": resolved_guide_id}
 
@@ -2224,6 +2211,7 @@ async def get_today_learning_workflow(user: dict = Depends(get_current_user)):
 async def sync_content(user: dict = Depends(get_current_user)):
     user_id = user["id"]
     store = _get_store(user_id)
+    invalidate_catalog()
     count = _sync_catalog(store, user_id=user_id)
     logger.info("curriculum.sync_completed", user_id=user_id, guide_count=count)
     return {"synced_guides": count, "message": f"Synced {count} guides with latest track data"}
@@ -2542,7 +2530,7 @@ async def submit_placement(
     """Submit placement answers and grade them."""
     config = get_config()
     user_id = user["id"]
-    scanner = CurriculumScanner(_content_dirs(user_id))
+    scanner = _get_catalog(user_id).scanner
     resolved_guide_id = _resolve_guide_id(scanner, guide_id)
 
     cache_key = (user_id, resolved_guide_id)
@@ -2618,17 +2606,19 @@ def _sync_catalog(
     store: CurriculumStore,
     *,
     user_id: str | None = None,
-    scanner: CurriculumScanner | None = None,
-    catalog_fingerprint: str | None = None,
+    catalog: CatalogSnapshot | None = None,
 ) -> int:
-    """Run scanner and sync results into store."""
-    scanner = scanner or CurriculumScanner(_content_dirs(user_id))
-    guides, chapters = scanner.scan()
-    if guides:
-        store.sync_catalog(guides, chapters)
-    store.reconcile_guide_aliases(scanner.get_guide_aliases())
-    store.set_catalog_meta(
-        "catalog_fingerprint",
-        catalog_fingerprint or scanner.get_catalog_fingerprint(),
-    )
-    return len(guides)
+    """Sync the catalog snapshot into store.
+
+    Without an explicit snapshot this follows a content write, so the user's
+    overlay is rescanned first.
+    """
+    if catalog is None:
+        if user_id:
+            invalidate_catalog(ensure_user_curriculum_dirs(user_id)[0])
+        catalog = _get_catalog(user_id)
+    if catalog.guides:
+        store.sync_catalog(catalog.guides, catalog.chapters)
+    store.reconcile_guide_aliases(catalog.get_guide_aliases())
+    store.set_catalog_meta("catalog_fingerprint", catalog.fingerprint)
+    return len(catalog.guides)
@@ -1,14 +1,25 @@
 """Flashcard deck routes — Anki .apkg import/export + SM-2 flashcard review."""
 
+import asyncio
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Literal
+from typing import BinaryIO, Literal
 
 import structlog
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
-
-from curriculum.anki import AnkiCard, AnkiFormatError, build_apkg, parse_apkg
+from starlette.background import BackgroundTask
+
+from curriculum.anki import (
+    EXPORT_CHUNK_SIZE,
+    AnkiCard,
+    AnkiFormatError,
+    ApkgReader,
+    write_apkg,
+)
 from curriculum.flashcards import FlashcardStore
 from curriculum.models import Deck, Flashcard
 from curriculum.store import CurriculumStore
@@ -149,75 +160,134 @@ async def delete_deck(deck_id: str, user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=404, detail="Deck not found")
 
 
+def _upload_size(stream: BinaryIO) -> int:
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def _card_payload(card: AnkiCard) -> dict:
+    return {
+        "front": card.front,
+        "back": card.back,
+        "tags": card.tags,
+        "anki_note_guid": card.guid,
+        "easiness_factor": card.easiness_factor,
+        "interval_days": card.interval_days,
+        "repetitions": card.repetitions,
+        "next_review": card.due_at,
+    }
+
+
+def _import_apkg(
+    store: FlashcardStore,
+    user_id: str,
+    stream: BinaryIO,
+    title: str | None,
+    filename: str | None,
+) -> tuple[Deck, ApkgReader]:
+    """Stream an uploaded .apkg into a new deck chunk by chunk (runs in a worker thread)."""
+    with ApkgReader(stream) as reader:
+        deck_name = (title or "").strip() or reader.deck_name
+        if deck_name in ("", "Default", "Imported deck") and filename:
+            stem = Path(filename).stem.strip()
+            deck_name = stem or deck_name or "Imported deck"
+
+        deck = store.create_deck(user_id, deck_name, source="imported")
+
+        def _progress(processed: int, total: int) -> None:
+            logger.debug("deck_import_progress", deck_id=deck.id, processed=processed, total=total)
+
+        try:
+            for chunk in reader.iter_chunks(progress=_progress):
+                store.add_cards_bulk(user_id, deck.id, [_card_payload(card) for card in chunk])
+        except Exception:
+            # Never leave a half-imported deck behind
+            store.delete_deck(user_id, deck.id)
+            raise
+    return store.get_deck(user_id, deck.id), reader
+
+
 @router.post("/decks/import", response_model=DeckImportResponse, status_code=201)
 async def import_deck(
     file: UploadFile = File(...),
     title: str | None = Form(default=None),
     user: dict = Depends(get_current_user),
 ):
-    payload = await file.read()
-    if len(payload) > MAX_APKG_BYTES:
+    # The upload is already spooled to disk by the server; read it in place
+    # rather than pulling the whole archive into memory.
+    stream = file.file
+    if _upload_size(stream) > MAX_APKG_BYTES:
         raise HTTPException(status_code=413, detail="Deck file exceeds the 50 MB limit")
-    if not payload.startswith(b"PK"):
+    magic = stream.read(2)
+    stream.seek(0)
+    if magic != b"PK":
         raise HTTPException(
             status_code=400, detail="Not a valid .apkg file (corrupt or not a zip archive)."
         )
 
+    store = _get_store(user["id"])
     try:
-        result = parse_apkg(payload)
+        deck, reader = await asyncio.to_thread(
+            _import_apkg, store, user["id"], stream, title, file.filename
+        )
     except AnkiFormatError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    deck_name = (title or "").strip() or result.deck_name
-    if deck_name in ("", "Default", "Imported deck") and file.filename:
-        stem = Path(file.filename).stem.strip()
-        deck_name = stem or deck_name or "Imported deck"
-
-    store = _get_store(user["id"])
-    deck = store.create_deck(user["id"], deck_name, source="imported")
-    store.add_cards_bulk(
-        user["id"],
-        deck.id,
-        [
-            {
-                "front": card.front,
-                "back": card.back,
-                "tags": card.tags,
-                "anki_note_guid": card.guid,
-                "easiness_factor": card.easiness_factor,
-                "interval_days": card.interval_days,
-                "repetitions": card.repetitions,
-                "next_review": card.due_at,
-            }
-            for card in result.cards
-        ],
-    )
-    deck = store.get_deck(user["id"], deck.id)
     log_event(user["id"], "deck_imported", {"deck_id": deck.id, "cards": deck.card_count})
     return DeckImportResponse(
         **_shape_deck(deck),
-        skipped_empty=result.skipped_empty,
-        skipped_media=result.skipped_media,
+        skipped_empty=reader.skipped_empty,
+        skipped_media=reader.skipped_media,
+    )
+
+
+async def _apkg_response(deck_name: str, cards: Iterable[AnkiCard], filename: str) -> FileResponse:
+    """Write the archive to a temp file off the event loop and stream it back."""
+    fd, name = tempfile.mkstemp(suffix=".apkg")
+    os.close(fd)
+    path = Path(name)
+    try:
+        await asyncio.to_thread(write_apkg, path, deck_name, cards)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return FileResponse(
+        path,
+        media_type="application/apkg",
+        filename=filename,
+        background=BackgroundTask(path.unlink, missing_ok=True),
     )
 
 
+def _export_cards(store: FlashcardStore, user_id: str, deck: Deck) -> Iterator[AnkiCard]:
+    """Stream a deck's cards page by page (consumed by write_apkg in a worker thread)."""
+    processed = 0
+    for page in store.iter_card_pages(user_id, deck.id, page_size=EXPORT_CHUNK_SIZE):
+        for card in page:
+            yield AnkiCard(
+                front=card.front, back=card.back, tags=card.tags, guid=card.anki_note_guid
+            )
+        processed += len(page)
+        logger.debug(
+            "deck_export_progress", deck_id=deck.id, processed=processed, total=deck.card_count
+        )
+
+
 @router.get("/decks/{deck_id}/export")
 async def export_deck(deck_id: str, user: dict = Depends(get_current_user)):
     store = _get_store(user["id"])
     deck = store.get_deck(user["id"], deck_id)
     if deck is None:
         raise HTTPException(status_code=404, detail="Deck not found")
-    cards = store.list_cards(user["id"], deck_id, limit=100_000)
-    apkg = build_apkg(
+    response = await _apkg_response(
         deck.title,
-        [AnkiCard(front=c.front, back=c.back, tags=c.tags, guid=c.anki_note_guid) for c in cards],
-    )
-    filename = f"{_safe_filename(deck.title)}.apkg"
-    return Response(
-        content=apkg,
-        media_type="application/apkg",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        _export_cards(store, user["id"], deck),
+        f"{_safe_filename(deck.title)}.apkg",
     )
+    log_event(user["id"], "deck_exported", {"deck_id": deck.id, "cards": deck.card_count})
+    return response
 
 
 @router.post("/decks/{deck_id}/cards", response_model=FlashcardResponse, status_code=201)
@@ -288,7 +358,7 @@ async def export_review_items(user: dict = Depends(get_current_user)):
     """Export the user's chapter review questions as an Anki deck."""
     store = CurriculumStore(_db_path(user["id"]))
     items = store.list_review_items(user["id"], include_pre_reading=False)
-    cards = [
+    cards = (
         AnkiCard(
             front=item["question"],
             back=item.get("expected_answer", ""),
@@ -296,13 +366,8 @@ async def export_review_items(user: dict = Depends(get_current_user)):
         )
         for item in items
         if item.get("question")
-    ]
-    apkg = build_apkg("StewardMe reviews", cards)
-    return Response(
-        content=apkg,
-        media_type="application/apkg",
-        headers={"Content-Disposition": 'attachment; filename="stewardme-reviews.apkg"'},
     )
+    return await _apkg_response("StewardMe reviews", cards, "stewardme-reviews.apkg")
 
 
 def _safe_filename(name: str) -> str:
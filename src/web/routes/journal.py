@@ -60,13 +60,15 @@ def _get_storage(user_id: str) -> JournalStorage:
 
 
 def _invalidate_greeting_cache(user_id: str, paths: dict) -> None:
+    """Drop the greeting and every journal-derived RAG context for the user."""
     try:
-        from advisor.context_cache import ContextCache
+        from advisor.context_cache import JOURNAL_CONTEXT_TYPES, ContextCache
         from advisor.greeting import invalidate_greeting
 
         cache_db = paths["intel_db"].parent / "context_cache.db"
         cache = ContextCache(cache_db)
         invalidate_greeting(user_id, cache)
+        cache.invalidate_tags(scope=user_id, context_types=JOURNAL_CONTEXT_TYPES)
     except Exception as exc:
         logger.warning("journal.greeting_invalidate_failed", error=str(exc), user=user_id)
 
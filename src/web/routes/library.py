@@ -10,8 +10,8 @@ from fastapi.responses import FileResponse
 
 from advisor.goals import GoalTracker
 from journal.storage import JournalStorage
+from library.extraction_jobs import resume_pending_extractions, submit_pdf_extraction
 from library.index import LibraryIndex
-from library.pdf_text import extract_text_from_pdf_bytes
 from library.reports import ReportStore
 from llm.factory import create_llm_provider
 from web.auth import get_current_user
@@ -58,8 +58,8 @@ def _active_goal_titles(user_id: str) -> list[str]:
 
 def _profile_summary(user_id: str) -> str | None:
     try:
-        profile = get_profile_storage(user_id).load()
-        return profile.structured_summary() or profile.summary()
+        storage = get_profile_storage(user_id)
+        return storage.structured_summary() or storage.summary() or None
     except Exception:
         return None
 
@@ -231,6 +231,28 @@ def _process_document_memory(user_id: str, report: dict, extracted_text: str) ->
         )
 
 
+def _extraction_callback(user_id: str, store: ReportStore):
+    """Reindex and feed memory once a background PDF extraction finishes."""
+
+    def _on_complete(record: dict, extracted_text: str) -> None:
+        _index_record(record, store, _get_index(user_id))
+        _process_document_memory(user_id, record, extracted_text)
+
+    return _on_complete
+
+
+_resumed_extractions: set[str] = set()
+
+
+def _resume_extractions_once(user_id: str, store: ReportStore) -> None:
+    """Requeue uploads whose extraction was interrupted by a restart."""
+    key = str(store.library_dir)
+    if key in _resumed_extractions:
+        return
+    _resumed_extractions.add(key)
+    resume_pending_extractions(store, _extraction_callback(user_id, store))
+
+
 def _validate_pdf_upload(file_name: str | None, payload: bytes, content_type: str | None) -> None:
     normalized_name = (file_name or "").lower()
     normalized_type = (content_type or "").lower()
@@ -249,6 +271,7 @@ async def list_reports(
     user: dict = Depends(get_current_user),
 ):
     store = _get_store(user["id"])
+    _resume_extractions_once(user["id"], store)
     if search and search.strip():
         reports = _search_reports(
             store,
@@ -312,10 +335,6 @@ async def upload_report_pdf(
     payload = await file.read()
     _validate_pdf_upload(file.filename, payload, file.content_type)
 
-    extracted_text = extract_text_from_pdf_bytes(payload)
-    extraction_status = "ready" if extracted_text.strip() else "empty"
-    index_status = "ready" if extracted_text.strip() else "limited_text"
-
     store = _get_store(user["id"])
     report = store.create_uploaded_pdf(
         title=_derive_document_title(file.filename or "document.pdf", title),
@@ -323,14 +342,14 @@ async def upload_report_pdf(
         file_bytes=payload,
         mime_type=file.content_type or "application/pdf",
         collection=(collection or "").strip() or None,
-        extracted_text=extracted_text,
-        extraction_status=extraction_status,
+        extraction_status="pending",
         origin_surface="library",
         visibility_state="saved",
-        index_status=index_status,
     )
+    # Title and file name are searchable immediately; the text follows once
+    # the background extraction job finishes.
     _index_record(report, store, _get_index(user["id"]))
-    _process_document_memory(user["id"], report, extracted_text)
+    submit_pdf_extraction(store, report["id"], _extraction_callback(user["id"], store))
     log_event(
         "library_pdf_uploaded",
         user["id"],
@@ -170,14 +170,14 @@ def _make_llm_caller(user_id: str):
     return caller
 
 
-def _embed_profile(user_id: str, profile) -> None:
+def _embed_profile(user_id: str, profile, summary: str) -> None:
     """Embed profile summary + narrative into ChromaDB for RAG retrieval."""
     try:
         paths = get_user_paths(user_id)
         em = EmbeddingManager(paths["chroma_dir"], base_name="profile")
 
         # Build narrative from profile fields
-        parts = [profile.summary()]
+        parts = [summary]
         if profile.goals_short_term:
             parts.append(f"Short-term goals: {profile.goals_short_term}")
         if profile.goals_long_term:
@@ -226,7 +226,7 @@ def _save_results(user_id: str, data: dict) -> int:
             logger.warning("onboarding.name_save_failed", user_id=user_id, error=str(e))
 
     # Embed profile in ChromaDB
-    _embed_profile(user_id, profile)
+    _embed_profile(user_id, profile, storage.summary())
 
     # Create goals
     goals = data.get("goals", [])
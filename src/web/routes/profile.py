@@ -13,11 +13,11 @@ logger = structlog.get_logger()
 router = APIRouter(prefix="/api/profile", tags=["profile"])
 
 
-def _embed_profile(user_id: str, profile) -> None:
+def _embed_profile(user_id: str, profile, summary: str) -> None:
     """Re-embed profile in ChromaDB after update."""
     try:
         em = get_profile_embedding_manager(user_id)
-        parts = [profile.summary()]
+        parts = [summary]
         if profile.goals_short_term:
             parts.append(f"Short-term goals: {profile.goals_short_term}")
         if profile.goals_long_term:
@@ -53,7 +53,7 @@ async def update_profile(
         profile, updated_fields = update_profile_fields(
             storage,
             updates,
-            embed_callback=lambda profile: _embed_profile(user["id"], profile),
+            embed_callback=lambda profile: _embed_profile(user["id"], profile, storage.summary()),
         )
     except ValueError as exc:
         detail = str(exc)
@@ -1,103 +1,78 @@
 """Tests for ProfileRetriever."""
 
-import time
-from unittest.mock import MagicMock, patch
+import os
+from profile.storage import ProfileStorage, UserProfile, clear_profile_cache
+from unittest.mock import patch
+
+import pytest
 
 from advisor.retrievers.profile import ProfileRetriever
 
 
-class TestProfileRetriever:
-    def test_load_missing_file(self):
-        pr = ProfileRetriever("/nonexistent/profile.yaml")
-        assert pr.load() is None
+@pytest.fixture(autouse=True)
+def _fresh_profile_cache():
+    clear_profile_cache()
+    yield
+    clear_profile_cache()
 
-    def test_load_caches_by_mtime(self, tmp_path):
-        f = tmp_path / "profile.yaml"
-        f.write_text("name: test")
-        pr = ProfileRetriever(str(f))
-
-        profile = MagicMock()
-        ps = MagicMock()
-        ps.load.return_value = profile
 
-        with patch("profile.storage.ProfileStorage", return_value=ps):
-            pr.load()
-            pr.load()
+def _write_profile(path, **fields) -> None:
+    ProfileStorage(path).save(UserProfile(**fields))
+    clear_profile_cache()
 
-        ps.load.assert_called_once()
 
-    def test_load_reloads_on_mtime_change(self, tmp_path):
-        import os
+class TestProfileRetriever:
+    def test_load_missing_file(self):
+        pr = ProfileRetriever("/nonexistent/profile.yaml")
+        assert pr.load() is None
 
+    def test_accepts_profile_storage(self, tmp_path):
         f = tmp_path / "profile.yaml"
-        f.write_text("v1")
-        pr = ProfileRetriever(str(f))
-
-        profile = MagicMock()
-        ps = MagicMock()
-        ps.load.return_value = profile
-
-        with patch("profile.storage.ProfileStorage", return_value=ps):
-            pr.load()
-            time.sleep(0.05)
-            f.write_text("v2")
-            os.utime(f, None)
-            pr.load()
-
-        assert ps.load.call_count == 2
+        _write_profile(f, location="London")
+        pr = ProfileRetriever(ProfileStorage(f))
+        assert pr.load().location == "London"
 
-    def test_get_profile_context_structured(self, tmp_path):
+    def test_summaries_come_from_storage_cache(self, tmp_path):
         f = tmp_path / "profile.yaml"
-        f.write_text("name: test")
+        _write_profile(f, location="London", interests=["AI"])
         pr = ProfileRetriever(str(f))
 
-        profile = MagicMock()
-        profile.structured_summary.return_value = "STRUCTURED"
-        ps = MagicMock()
-        ps.load.return_value = profile
+        with (
+            patch.object(UserProfile, "summary", return_value="compact") as summary,
+            patch.object(
+                UserProfile, "structured_summary", return_value="STRUCTURED"
+            ) as structured,
+        ):
+            for _ in range(3):
+                assert pr.get_profile_context(structured=True) == "\nSTRUCTURED\n"
+                assert pr.get_profile_context() == "\nUSER PROFILE: compact\n"
 
-        with patch("profile.storage.ProfileStorage", return_value=ps):
-            result = pr.get_profile_context(structured=True)
-        assert "STRUCTURED" in result
+        summary.assert_called_once()
+        structured.assert_called_once()
 
-    def test_get_profile_context_compact(self, tmp_path):
+    def test_context_follows_file_changes(self, tmp_path):
         f = tmp_path / "profile.yaml"
-        f.write_text("name: test")
+        _write_profile(f, location="London")
         pr = ProfileRetriever(str(f))
+        assert "London" in pr.get_profile_context()
 
-        profile = MagicMock()
-        profile.summary.return_value = "compact"
-        ps = MagicMock()
-        ps.load.return_value = profile
-
-        with patch("profile.storage.ProfileStorage", return_value=ps):
-            result = pr.get_profile_context(structured=False)
-        assert "USER PROFILE" in result
-        assert "compact" in result
+        _write_profile(f, location="Lisbon, Portugal")
+        os.utime(f, ns=(1, 1))
+        context = pr.get_profile_context()
+        assert "Lisbon" in context
+        assert "London" not in context
 
     def test_get_profile_context_no_profile(self):
         pr = ProfileRetriever("/nonexistent/profile.yaml")
         assert pr.get_profile_context() == ""
+        assert pr.get_profile_context(structured=True) == ""
 
     def test_get_profile_keywords_populated(self, tmp_path):
         f = tmp_path / "profile.yaml"
-        f.write_text("name: test")
-        pr = ProfileRetriever(str(f))
-
-        skill = MagicMock()
-        skill.name = "Python"
-        profile = MagicMock()
-        profile.skills = [skill]
-        profile.languages_frameworks = ["FastAPI"]
-        profile.technologies_watching = []
-        profile.industries_watching = []
-        profile.interests = []
-        profile.active_projects = []
-        ps = MagicMock()
-        ps.load.return_value = profile
-
-        with patch("profile.storage.ProfileStorage", return_value=ps):
-            kw = pr.get_profile_keywords()
+        _write_profile(
+            f, skills=[{"name": "Python", "proficiency": 4}], languages_frameworks=["FastAPI"]
+        )
+        kw = ProfileRetriever(str(f)).get_profile_keywords()
         assert "python" in kw
         assert "fastapi" in kw
 
@@ -107,11 +82,6 @@ class TestProfileRetriever:
 
     def test_load_profile_terms(self, tmp_path):
         f = tmp_path / "profile.yaml"
-        f.write_text("name: test")
-        pr = ProfileRetriever(str(f))
-
-        ps = MagicMock()
-        ps.load.return_value = None
-        with patch("profile.storage.ProfileStorage", return_value=ps):
-            terms = pr.load_profile_terms()
+        f.write_text("")
+        terms = ProfileRetriever(str(f)).load_profile_terms()
         assert terms.is_empty
@@ -1,5 +1,6 @@
 """Tests for AgenticOrchestrator and agentic engine integration."""
 
+import time
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -8,6 +9,7 @@ import pytest
 from advisor.agentic import AgenticOrchestrator
 from advisor.tools import build_tool_registry
 from llm.base import GenerateResponse, ToolCall
+from services.tool_registry import ToolRegistry
 
 
 @pytest.fixture
@@ -434,6 +436,90 @@ class TestAgenticOrchestrator:
         assert len(nudge_msgs) == 1
 
 
+def _timed_registry(calls: list, **tools) -> ToolRegistry:
+    """Registry of sleeping tools: name -> (delay, parallel_safe[, timeout])."""
+    registry = ToolRegistry()
+    for name, spec in tools.items():
+        delay, parallel_safe, *timeout = spec
+
+        def handler(_args, name=name, delay=delay):
+            calls.append(("start", name))
+            time.sleep(delay)
+            calls.append(("end", name))
+            return {"tool": name}
+
+        registry.register(
+            name=name,
+            toolset="test",
+            description=name,
+            schema={"type": "object", "properties": {}, "required": []},
+            handler=handler,
+            parallel_safe=parallel_safe,
+            timeout=timeout[0] if timeout else None,
+        )
+    return registry
+
+
+def _one_turn_llm(*names: str) -> MagicMock:
+    mock_llm = MagicMock()
+    mock_llm.generate_with_tools.side_effect = [
+        GenerateResponse(
+            content=None,
+            tool_calls=[ToolCall(id=f"t{i}", name=n, arguments={}) for i, n in enumerate(names)],
+            finish_reason="tool_calls",
+        ),
+        GenerateResponse(content="done", finish_reason="stop"),
+    ]
+    return mock_llm
+
+
+class TestParallelToolExecution:
+    def test_parallel_safe_calls_run_concurrently_in_request_order(self):
+        calls: list = []
+        registry = _timed_registry(calls, slow=(0.3, True), fast=(0.05, True), mid=(0.2, True))
+        mock_llm = _one_turn_llm("slow", "fast", "mid")
+
+        orch = AgenticOrchestrator(mock_llm, registry, "sys", min_tool_calls=0)
+        start = time.monotonic()
+        orch.run("q")
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5  # sequential would be 0.55s
+        messages = mock_llm.generate_with_tools.call_args_list[1].kwargs["messages"]
+        tool_msgs = [m for m in messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_msgs] == ["t0", "t1", "t2"]
+        assert [m["name"] for m in tool_msgs] == ["slow", "fast", "mid"]
+
+    def test_unsafe_call_is_a_barrier(self):
+        calls: list = []
+        registry = _timed_registry(calls, read=(0.1, True), write=(0.05, False))
+        mock_llm = _one_turn_llm("read", "write", "read")
+
+        orch = AgenticOrchestrator(mock_llm, registry, "sys", min_tool_calls=0)
+        orch.run("q")
+
+        write_start = calls.index(("start", "write"))
+        write_end = calls.index(("end", "write"))
+        assert calls[:write_start] == [("start", "read"), ("end", "read")]
+        assert calls[write_end + 1 :] == [("start", "read"), ("end", "read")]
+
+    def test_per_tool_timeout_does_not_block_siblings(self):
+        calls: list = []
+        registry = _timed_registry(calls, hang=(1.0, True, 0.1), quick=(0.01, True))
+        mock_llm = _one_turn_llm("hang", "quick")
+
+        orch = AgenticOrchestrator(mock_llm, registry, "sys", min_tool_calls=0, tool_timeout=30)
+        start = time.monotonic()
+        orch.run("q")
+
+        assert time.monotonic() - start < 0.8
+        messages = mock_llm.generate_with_tools.call_args_list[1].kwargs["messages"]
+        hang_msg, quick_msg = [m for m in messages if m["role"] == "tool"]
+        assert hang_msg["is_error"] is True
+        assert "timed out after 0.1s" in hang_msg["content"]
+        assert quick_msg["is_error"] is False
+
+
 class TestAgenticEngineIntegration:
     def test_engine_with_use_tools(self, mock_components):
         """AdvisorEngine routes to orchestrator when use_tools=True."""
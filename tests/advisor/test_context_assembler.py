@@ -1,8 +1,9 @@
 """Tests for ContextAssembler."""
 
+import time
 from unittest.mock import MagicMock
 
-from advisor.context_assembler import AskContext, ContextAssembler
+from advisor.context_assembler import AskContext, ContextAssembler, fan_out_retrievers
 from advisor.retrievers.intel import IntelRetriever
 from advisor.retrievers.journal import JournalRetriever
 from advisor.retrievers.memory import MemoryRetriever
@@ -86,6 +87,114 @@ class TestBuildContextForAsk:
         ctx = asm.build_context_for_ask("test", {"inject_memory": True})
         assert "<user_memory>" in ctx.memory
 
+    def test_retrievers_run_concurrently(self):
+        def slow(value):
+            def _run(*a, **kw):
+                time.sleep(0.2)
+                return value
+
+            return _run
+
+        mem = MagicMock(spec=MemoryRetriever)
+        mem.get_memory_context.side_effect = slow("facts")
+        mem.get_recurring_thoughts_context.side_effect = slow("thoughts")
+        asm = _make_assembler(memory=mem)
+
+        start = time.monotonic()
+        ctx = asm.build_context_for_ask(
+            "test", {"inject_memory": True, "inject_recurring_thoughts": True}
+        )
+        elapsed = time.monotonic() - start
+
+        assert (ctx.memory, ctx.thoughts) == ("facts", "thoughts")
+        assert elapsed < 0.35
+
+    def test_slow_retriever_yields_partial_context(self):
+        mem = MagicMock(spec=MemoryRetriever)
+        mem.get_memory_context.side_effect = lambda q: time.sleep(0.5) or "late"
+        asm = _make_assembler(memory=mem)
+
+        ctx = asm.build_context_for_ask(
+            "test", {"inject_memory": True, "retriever_deadlines": {"memory": 0.05}}
+        )
+
+        assert ctx.memory == ""
+        assert ctx.journal  # other sources still delivered
+        assert asm.last_retrieval_trace["timed_out"] == ["memory"]
+
+    def test_records_latency_breakdown(self):
+        asm = _make_assembler()
+        asm.build_context_for_ask("test")
+
+        entry = asm.last_retrieval_trace
+        assert entry["type"] == "context_retrieval"
+        assert {"enhanced", "profile"} <= set(entry["latency_ms"])
+
+
+class TestFanOutRetrievers:
+    def test_failed_retriever_is_omitted(self):
+        def boom():
+            raise RuntimeError("db locked")
+
+        results, entry = fan_out_retrievers({"ok": lambda: "x", "bad": boom})
+
+        assert results == {"ok": "x"}
+        assert entry["failed"] == ["bad"]
+        assert entry["timed_out"] == []
+
+    def test_degradations_reach_request_collector(self):
+        from degradation_collector import clear_collector, get_degradations, init_collector
+        from graceful import graceful_context
+
+        def degraded():
+            with graceful_context("graceful.advisor.memory_inject"):
+                raise RuntimeError("chroma down")
+            return ""
+
+        def slow():
+            time.sleep(0.5)
+            return "late"
+
+        init_collector()
+        try:
+            fan_out_retrievers(
+                {"memory": degraded, "slow": slow, "bad": lambda: 1 / 0},
+                deadlines={"slow": 0.05},
+            )
+            components = {d["component"] for d in get_degradations()}
+        finally:
+            clear_collector()
+
+        assert components == {
+            "graceful.advisor.memory_inject",
+            "graceful.advisor.retriever_timeout",
+            "graceful.advisor.retriever_failed",
+        }
+
+    def test_queued_retriever_past_deadline_never_runs(self, monkeypatch):
+        import concurrent.futures
+
+        import advisor.context_assembler as ca
+
+        monkeypatch.setattr(
+            ca, "shared_pool", lambda name, workers: concurrent.futures.ThreadPoolExecutor(1)
+        )
+        ran = []
+
+        def blocker():
+            time.sleep(0.2)
+            return "done"
+
+        results, entry = fan_out_retrievers(
+            {"blocker": blocker, "queued": lambda: ran.append(1)},
+            deadlines={"queued": 0.05},
+        )
+        time.sleep(0.3)
+
+        assert results == {"blocker": "done"}
+        assert entry["timed_out"] == ["queued"]
+        assert ran == []
+
 
 class TestComputeDynamicWeight:
     def test_no_user_returns_default(self):
@@ -1,6 +1,11 @@
 """Tests for context_budget utilities."""
 
+import time
+
+import pytest
+
 from advisor.context_budget import (
+    TokenBudget,
     tokens_to_chars,
     truncate_lines_to_tokens,
     truncate_to_token_budget,
@@ -8,6 +13,26 @@ from advisor.context_budget import (
 from services.tokens import count_tokens
 
 
+def _context_50k() -> str:
+    lines = []
+    i = 0
+    while sum(len(line) + 1 for line in lines) < 50_000:
+        lines.append(f"- [{i}] Shipped the retrieval refactor; noted latency regressions in p95.")
+        i += 1
+    return "\n".join(lines)
+
+
+def _quadratic_truncate(text: str, token_budget: int) -> str:
+    """Reference implementation: re-tokenize the growing candidate per line."""
+    kept: list[str] = []
+    for line in text.split("\n"):
+        candidate = "\n".join([*kept, line]) if kept else line
+        if count_tokens(candidate) > token_budget:
+            break
+        kept.append(line)
+    return "\n".join(kept)
+
+
 class TestTokensToChars:
     def test_basic(self):
         assert tokens_to_chars(100) == 400
@@ -30,6 +55,76 @@ class TestTruncateLinesToTokens:
         assert truncate_lines_to_tokens("", 10) == ""
 
 
+class TestTokenBudget:
+    def test_total_is_exact(self):
+        text = "alpha beta\ngamma\n\ndelta epsilon zeta"
+        assert TokenBudget.from_text(text).total == count_tokens(text)
+
+    def test_fit_count_binary_search(self):
+        budget = TokenBudget(["one two three", "four five six", "seven eight nine"])
+        assert budget.fit_count(0) == 0
+        assert budget.fit_count(budget.total) == 3
+        two_lines = count_tokens("one two three\nfour five six")
+        assert budget.fit_count(two_lines) == 2
+
+    def test_tokenizes_each_line_once(self, monkeypatch):
+        calls = []
+
+        def counting(text):
+            calls.append(text)
+            return len(text) // 4
+
+        monkeypatch.setattr("advisor.context_budget.count_tokens", counting)
+        text = "\n".join(f"line {i}" for i in range(500))
+        truncate_lines_to_tokens(text, 100)
+        # 500 lines + the separator, plus a handful of exact verification passes
+        assert len(calls) < 520
+
+    def test_fitting_text_is_counted_once(self, monkeypatch):
+        calls = []
+
+        def counting(text):
+            calls.append(text)
+            return len(text) // 4
+
+        monkeypatch.setattr("advisor.context_budget.count_tokens", counting)
+        text = "\n".join(f"line {i}" for i in range(500))
+        assert truncate_lines_to_tokens(text, 100_000) == text
+        assert truncate_to_token_budget(text, text, 0.5, 100_000) == (text, text)
+        assert len(calls) == 3
+
+    def test_matches_reference_on_50k_context(self):
+        text = _context_50k()
+        for budget in (50, 1_000, 5_000):
+            result = truncate_lines_to_tokens(text, budget)
+            assert count_tokens(result) <= budget
+            reference = _quadratic_truncate(text, budget)
+            # Segment estimates may be slightly conservative with a real BPE encoder
+            assert reference.startswith(result)
+            assert result.count("\n") >= reference.count("\n") - 2
+
+
+@pytest.mark.slow
+def test_benchmark_truncation_50k_chars():
+    """Microbenchmark: prefix-sum truncation vs per-line re-tokenization."""
+    text = _context_50k()
+    budget = 8_000
+
+    start = time.perf_counter()
+    fast = truncate_lines_to_tokens(text, budget)
+    fast_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _quadratic_truncate(text, budget)
+    slow_elapsed = time.perf_counter() - start
+
+    print(
+        f"50k chars: TokenBudget {fast_elapsed * 1000:.1f}ms, quadratic {slow_elapsed * 1000:.1f}ms"
+    )
+    assert count_tokens(fast) <= budget
+    assert fast_elapsed < slow_elapsed
+
+
 class TestTruncateToTokenBudget:
     def test_within_budget_unchanged(self):
         j, i = truncate_to_token_budget("journal", "intel", 0.7, 5000)
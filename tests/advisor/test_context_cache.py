@@ -49,3 +49,91 @@ class TestContextCache:
         # Both should be gone
         assert cache.get("k1") is None
         assert cache.get("k2") is None
+
+
+class TestContextCacheTiers:
+    def test_memory_tier_serves_hits_until_revalidation(self, tmp_path, monkeypatch):
+        import sqlite3
+
+        import advisor.context_cache as context_cache
+
+        cache = ContextCache(tmp_path / "cache.db")
+        cache.set("k1", "v1")
+        with sqlite3.connect(tmp_path / "cache.db") as conn:
+            conn.execute("DELETE FROM context_cache")
+
+        # Another process deleted the row; the memory tier still answers...
+        assert cache.get("k1") == "v1"
+        # ...until the entry is due for revalidation against SQLite
+        monkeypatch.setattr(context_cache, "MEMORY_REVALIDATE_S", -1.0)
+        assert cache.get("k1") is None
+
+    def test_memory_tier_is_shared_per_database(self, tmp_path):
+        ContextCache(tmp_path / "cache.db").set("k1", "v1")
+        other = ContextCache(tmp_path / "cache.db")
+        other.invalidate("k1")
+        assert ContextCache(tmp_path / "cache.db").get("k1") is None
+
+    def test_scoped_keys_do_not_collide(self, tmp_path):
+        alice = ContextCache(tmp_path / "cache.db", scope="alice")
+        bob = ContextCache(tmp_path / "cache.db", scope="bob")
+        alice.set(alice.make_key("journal", "q"), "alice context")
+
+        assert alice.make_key("journal", "q").startswith("journal:alice:")
+        assert bob.get(bob.make_key("journal", "q")) is None
+
+    def test_invalidate_tags_drops_only_matching_group(self, tmp_path):
+        from advisor.context_cache import JOURNAL_CONTEXT_TYPES
+
+        alice = ContextCache(tmp_path / "cache.db", scope="alice")
+        bob = ContextCache(tmp_path / "cache.db", scope="bob")
+        keys = {
+            "alice_journal": alice.make_key("journal", "q"),
+            "alice_combined": alice.make_key("combined", "q", weight=0.7),
+            "alice_intel": alice.make_key("intel", "q"),
+            "bob_journal": bob.make_key("journal", "q"),
+        }
+        for name, key in keys.items():
+            alice.set(key, name)
+
+        alice.invalidate_tags(scope="alice", context_types=JOURNAL_CONTEXT_TYPES)
+
+        assert alice.get(keys["alice_journal"]) is None
+        assert alice.get(keys["alice_combined"]) is None
+        assert alice.get(keys["alice_intel"]) == "alice_intel"
+        assert bob.get(keys["bob_journal"]) == "bob_journal"
+
+    def test_counts_hits_misses_and_evictions(self, tmp_path, monkeypatch):
+        import advisor.context_cache as context_cache
+        from observability import metrics
+
+        monkeypatch.setattr(context_cache, "MEMORY_MAX_ENTRIES", 2)
+        metrics.reset()
+        cache = ContextCache(tmp_path / "cache.db")
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        assert cache.get("c") == "c"
+        assert cache.get("a") == "a"  # evicted from memory, served by SQLite
+        assert cache.get("missing") is None
+
+        counters = metrics.summary()["counters"]
+        assert counters['context_cache.hit{tier="memory"}'] == 1
+        assert counters['context_cache.hit{tier="sqlite"}'] == 1
+        assert counters["context_cache.miss"] == 1
+        assert counters["context_cache.eviction"] >= 1
+        metrics.reset()
+
+    def test_legacy_table_gains_tag_columns(self, tmp_path):
+        import sqlite3
+
+        with sqlite3.connect(tmp_path / "cache.db") as conn:
+            conn.execute(
+                "CREATE TABLE context_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+
+        cache = ContextCache(tmp_path / "cache.db", scope="alice")
+        key = cache.make_key("journal", "q")
+        cache.set(key, "v")
+        cache.invalidate_tags(scope="alice")
+        assert cache.get(key) is None
@@ -63,6 +63,17 @@ class TestAdvisorEngine:
         assert result == "Mocked LLM response"
         mock_client.messages.create.assert_called_once()
 
+    def test_single_shot_trace_includes_retrieval_timings(self, engine, mock_rag):
+        mock_rag.last_retrieval_trace = {
+            "type": "context_retrieval",
+            "latency_ms": {"enhanced": 12.0, "profile": 1.5},
+        }
+        engine.ask("What should I learn?")
+
+        types = [e["type"] for e in engine._trace]
+        assert types == ["session_start", "context_retrieval", "answer"]
+        assert engine._trace[0]["session_id"] == engine._session_id
+
     def test_ask_career(self, engine, mock_client):
         result = engine.ask("Career advice?", advice_type="career")
         assert isinstance(result, str)
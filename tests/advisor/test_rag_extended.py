@@ -27,30 +27,24 @@ def rag(mock_journal_search):
 
 class TestGetProfileContext:
     def test_structured_output(self, rag):
-        profile = MagicMock()
-        profile.structured_summary.return_value = "STRUCTURED"
-
-        with patch.object(rag._profile, "load", return_value=profile):
+        with patch.object(rag._profile._storage, "structured_summary", return_value="STRUCTURED"):
             result = rag.get_profile_context(structured=True)
 
         assert "STRUCTURED" in result
 
     def test_compact_output(self, rag):
-        profile = MagicMock()
-        profile.summary.return_value = "compact summary"
-
-        with patch.object(rag._profile, "load", return_value=profile):
+        with patch.object(rag._profile._storage, "summary", return_value="compact summary"):
             result = rag.get_profile_context(structured=False)
 
         assert "USER PROFILE" in result
         assert "compact summary" in result
 
     def test_no_profile_returns_empty(self, rag):
-        with patch.object(rag._profile, "load", return_value=None):
+        with patch.object(rag._profile._storage, "summary", return_value=""):
             assert rag.get_profile_context() == ""
 
     def test_exception_returns_empty(self, rag):
-        with patch.object(rag._profile, "load", side_effect=ImportError("no module")):
+        with patch.object(rag._profile._storage, "summary", side_effect=ImportError("no module")):
             assert rag.get_profile_context() == ""
 
 
@@ -424,75 +418,57 @@ class TestCaching:
 
 
 class TestProfileCaching:
-    """Verify mtime-gated profile cache in RAGRetriever._load_profile()."""
+    """Profile summaries come from the ProfileStorage cache, keyed on file stamp."""
+
+    @pytest.fixture
+    def profile_rag(self, mock_journal_search, tmp_path):
+        from profile.storage import ProfileStorage, UserProfile, clear_profile_cache
+
+        from advisor.rag import RAGRetriever
 
-    def test_second_call_uses_cache(self, rag, tmp_path):
-        """Second get_profile_context() reuses cached profile — no second .load()."""
         profile_file = tmp_path / "profile.yaml"
-        profile_file.write_text("name: test")
-        rag._profile_path = str(profile_file)
+        ProfileStorage(profile_file).save(UserProfile(location="London", interests=["Go"]))
+        clear_profile_cache()
+        yield RAGRetriever(journal_search=mock_journal_search, profile_path=str(profile_file))
+        clear_profile_cache()
 
-        profile = MagicMock()
-        profile.summary.return_value = "cached"
-        ps_instance = MagicMock()
-        ps_instance.load.return_value = profile
+    def test_second_call_uses_cache(self, profile_rag):
+        """Repeat get_profile_context() calls render the summary once."""
+        from profile.storage import UserProfile
 
-        with patch("profile.storage.ProfileStorage", return_value=ps_instance):
-            rag.get_profile_context()
-            rag.get_profile_context()
+        with patch.object(UserProfile, "summary", return_value="cached") as summary:
+            assert "cached" in profile_rag.get_profile_context()
+            assert "cached" in profile_rag.get_profile_context()
 
-        ps_instance.load.assert_called_once()
+        summary.assert_called_once()
 
-    def test_mtime_change_triggers_reload(self, rag, tmp_path):
-        """Profile file change (new mtime) causes cache invalidation."""
+    def test_mtime_change_triggers_reload(self, profile_rag, tmp_path):
+        """Profile file change (new stamp) invalidates the cached summary."""
         import os
-        import time
+        from profile.storage import ProfileStorage, UserProfile
 
+        assert "London" in profile_rag.get_profile_context()
         profile_file = tmp_path / "profile.yaml"
-        profile_file.write_text("v1")
-        rag._profile_path = str(profile_file)
+        with patch("profile.storage._cache_put"):
+            ProfileStorage(profile_file).save(UserProfile(location="Lisbon"))
+        os.utime(profile_file, ns=(1, 1))
 
-        profile = MagicMock()
-        profile.summary.return_value = "s"
-        ps_instance = MagicMock()
-        ps_instance.load.return_value = profile
-
-        with patch("profile.storage.ProfileStorage", return_value=ps_instance):
-            rag.get_profile_context()
-            # Bump mtime
-            time.sleep(0.05)
-            profile_file.write_text("v2")
-            os.utime(profile_file, None)
-            rag.get_profile_context()
-
-        assert ps_instance.load.call_count == 2
-
-    def test_keywords_reuses_cached_profile(self, rag, tmp_path):
-        """get_profile_keywords() reuses profile cached by prior get_profile_context()."""
-        profile_file = tmp_path / "profile.yaml"
-        profile_file.write_text("name: test")
-        rag._profile_path = str(profile_file)
+        assert "Lisbon" in profile_rag.get_profile_context()
 
-        profile = MagicMock()
-        profile.summary.return_value = "s"
-        profile.skills = []
-        profile.languages_frameworks = ["Go"]
-        profile.technologies_watching = []
-        profile.industries_watching = []
-        profile.interests = []
-        profile.active_projects = []
-        ps_instance = MagicMock()
-        ps_instance.load.return_value = profile
-
-        with patch("profile.storage.ProfileStorage", return_value=ps_instance):
-            rag.get_profile_context()
-            kw = rag.get_profile_keywords()
+    def test_keywords_reuse_cached_profile(self, profile_rag):
+        """get_profile_keywords() reads the profile parsed for get_profile_context()."""
+        from profile.storage import ProfileStorage
 
-        # Only one .load() despite two method calls
-        ps_instance.load.assert_called_once()
+        profile_rag.get_profile_context()
+        with patch.object(ProfileStorage, "_parse") as parse:
+            kw = profile_rag.get_profile_keywords()
+
+        parse.assert_not_called()
         assert "go" in kw
 
     def test_missing_file_returns_none(self, rag):
         """Missing profile file returns empty string, no error."""
-        rag._profile_path = "/nonexistent/profile.yaml"
+        from advisor.retrievers.profile import ProfileRetriever
+
+        rag._profile = ProfileRetriever("/nonexistent/profile.yaml")
         assert rag.get_profile_context() == ""
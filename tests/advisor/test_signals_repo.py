@@ -237,3 +237,56 @@ class TestDetectAllWithRepoStore:
         signals = detector.detect_all()
         repo_signals = [s for s in signals if s.type.value.startswith("repo_")]
         assert len(repo_signals) == 0
+
+
+class TestDetectionSnapshot:
+    def _detector(self, tmp_path, mock_journal, mock_repo_store):
+        mock_repo_store.get_latest_snapshot = MagicMock(
+            return_value=_make_snapshot(ci_status="failure", pushed_days_ago=20)
+        )
+        mock_repo_store.get_snapshot_history = MagicMock(return_value=[])
+        return SignalDetector(
+            mock_journal,
+            tmp_path / "intel.db",
+            config={"github_monitoring": {}},
+            repo_store=mock_repo_store,
+        )
+
+    def test_data_read_once_per_run(self, tmp_path, mock_journal, mock_repo_store):
+        detector = self._detector(tmp_path, mock_journal, mock_repo_store)
+        detector.detect_all()
+        assert mock_repo_store.get_latest_snapshot.call_count == 1
+        assert mock_repo_store.get_snapshot_history.call_count == 1
+        assert mock_repo_store.list_repos.call_count == 1
+
+    def test_signals_and_insights_persisted_together(self, tmp_path, mock_journal, mock_repo_store):
+        from advisor.insights import InsightStore
+
+        detector = self._detector(tmp_path, mock_journal, mock_repo_store)
+        detector.detect_all()
+        signal_types = {s["type"] for s in detector.store.get_active()}
+        assert {"repo_stale", "repo_ci_failure"} <= signal_types
+        assert InsightStore(tmp_path / "intel.db").get_active()
+
+    def test_rerun_does_not_duplicate(self, tmp_path, mock_journal, mock_repo_store):
+        detector = self._detector(tmp_path, mock_journal, mock_repo_store)
+        detector.detect_all()
+        first = len(detector.store.get_active())
+        detector.detect_all()
+        assert len(detector.store.get_active()) == first
+
+    def test_detector_timings_recorded(self, tmp_path, mock_journal, mock_repo_store):
+        from observability import metrics
+
+        metrics.reset()
+        self._detector(tmp_path, mock_journal, mock_repo_store).detect_all()
+        timers = metrics.summary()["timers"]
+        assert 'signals.detector{detector="repo_stale"}' in timers
+        assert 'signals.detector{detector="journal_gap"}' in timers
+
+    def test_failing_detector_isolated(self, tmp_path, mock_journal, mock_repo_store):
+        detector = self._detector(tmp_path, mock_journal, mock_repo_store)
+        detector._detect_journal_gap = MagicMock(side_effect=RuntimeError("boom"))
+        detector._detect_journal_gap.__name__ = "_detect_journal_gap"
+        signals = detector.detect_all()
+        assert any(s.type == SignalType.REPO_CI_FAILURE for s in signals)
@@ -314,6 +314,31 @@ class TestEvalCommands:
         assert result.exit_code == 0
         assert seen == [False]
 
+    def test_perf_exits_nonzero_on_regression(self, runner, tmp_path):
+        from eval.perf import PerfReport, write_baseline
+
+        def fake_run(scale, iterations, seed):
+            return PerfReport(
+                scale=scale,
+                iterations=iterations,
+                timings={"fact_search": {"p50_ms": 5.0, "p95_ms": 30.0, "p99_ms": 40.0}},
+            )
+
+        baseline = write_baseline(
+            PerfReport(timings={"fact_search": {"p50_ms": 5.0, "p95_ms": 10.0, "p99_ms": 12.0}}),
+            tmp_path / "baseline.json",
+        )
+        out = tmp_path / "current.json"
+        with patch("eval.perf.run_perf_eval", side_effect=fake_run):
+            result = runner.invoke(
+                cli,
+                ["eval", "perf", "--baseline", str(baseline), "--out", str(out)],
+            )
+
+        assert result.exit_code == 1
+        assert "REGRESSION" in result.output
+        assert out.exists()
+
 
 class TestProfileCommands:
     def test_edit_reports_validation_error(self, runner, tmp_path):
@@ -387,6 +412,19 @@ Short body.
         assert "missing_objectives" in result.output
         assert "thin_chapter" in result.output
 
+    def test_snapshot_rebuilds_and_verifies(self, runner, tmp_path):
+        from curriculum.store import CurriculumStore
+
+        db_path = tmp_path / "curriculum.db"
+        store = CurriculumStore(db_path)
+        store.enroll("cli", "01-philosophy-guide")
+
+        result = runner.invoke(cli, ["curriculum", "snapshot", "--db", str(db_path)])
+
+        assert result.exit_code == 0
+        assert "Rebuilt 1 progress snapshot rows" in result.output
+        assert "matches live progress data" in result.output
+
 
 # -- Goals command --
 
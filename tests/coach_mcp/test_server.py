@@ -195,3 +195,66 @@ async def test_list_tools_async(mock_components):
     with _mock_request_context(registry):
         tools = await list_tools()
     assert len(tools) == 53
+
+
+def _slow_registry(delay: float, timeout: float | None = None):
+    import time
+
+    from services.tool_registry import ToolRegistry
+
+    registry = ToolRegistry()
+    registry.register(
+        name="slow_tool",
+        toolset="test",
+        description="slow",
+        schema={"type": "object", "properties": {}, "required": []},
+        handler=lambda _args: time.sleep(delay) or {"ok": True},
+        timeout=timeout,
+    )
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_call_tool_runs_off_the_event_loop(mock_components):
+    """Concurrent calls overlap on the worker pool instead of queuing on the loop."""
+    import asyncio
+    import time
+
+    from coach_mcp.server import call_tool
+
+    registry = _slow_registry(0.3)
+    with _mock_request_context(registry):
+        start = time.perf_counter()
+        results = await asyncio.gather(*(call_tool("slow_tool", {}) for _ in range(3)))
+        elapsed = time.perf_counter() - start
+
+    assert [json.loads(r[0].text) for r in results] == [{"ok": True}] * 3
+    assert elapsed < 0.8
+
+
+@pytest.mark.asyncio
+async def test_call_tool_times_out_and_records_latency(mock_components):
+    from coach_mcp.server import call_tool
+    from observability import metrics
+
+    metrics.reset()
+    registry = _slow_registry(0.5, timeout=0.05)
+    with _mock_request_context(registry):
+        result = await call_tool("slow_tool", {})
+
+    assert json.loads(result[0].text) == {"error": "slow_tool: timed out after 0.05s"}
+    summary = metrics.summary()
+    assert summary["counters"]['mcp_tool_calls{status="timeout",tool="slow_tool"}'] == 1
+    assert summary["timers"]['mcp_tool_latency{status="timeout",tool="slow_tool"}']["count"] == 1
+    metrics.reset()
+
+
+def test_bootstrap_stores_are_reused(mock_components):
+    from coach_mcp import bootstrap
+
+    with patch.object(bootstrap, "create_memory_store", side_effect=lambda _p: object()) as create:
+        first = bootstrap.get_memory_store()
+        second = bootstrap.get_memory_store()
+
+    assert first is second
+    create.assert_called_once()
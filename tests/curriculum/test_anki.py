@@ -12,9 +12,11 @@ import pytest
 from curriculum.anki import (
     AnkiCard,
     AnkiFormatError,
+    ApkgReader,
     build_apkg,
     html_to_text,
     parse_apkg,
+    write_apkg,
 )
 
 
@@ -230,9 +232,52 @@ def test_parse_apkg_prefers_anki21_member():
     assert parse_apkg(apkg).cards[0].front == "q21"
 
 
+def test_apkg_reader_streams_chunks_with_progress(tmp_path):
+    notes = [{"id": i, "flds": f"q{i}\x1fa{i}" if i % 5 else f"\x1fa{i}"} for i in range(1, 13)]
+    cards = [{"id": 100 + i, "nid": i} for i in range(1, 13)]
+    path = tmp_path / "deck.apkg"
+    path.write_bytes(_make_apkg(notes, cards))
+
+    progress = []
+    with ApkgReader(path) as reader:
+        assert reader.deck_name == "Spanish Vocabulary"
+        assert reader.total_cards == 12
+        chunks = list(reader.iter_chunks(chunk_size=4, progress=lambda *p: progress.append(p)))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert chunks[0][0].front == "q1"
+    assert reader.imported == 10
+    assert reader.skipped_empty == 2
+    assert progress[-1] == (12, 12)
+    assert all(done <= total for done, total in progress)
+
+
+def test_apkg_reader_accepts_file_objects_and_cleans_up_temp_collection():
+    apkg = _make_apkg(notes=[{"id": 1, "flds": "q\x1fa"}], cards=[{"id": 10, "nid": 1}])
+    with tempfile.SpooledTemporaryFile() as upload:
+        upload.write(apkg)
+        upload.seek(0)
+        reader = ApkgReader(upload)
+        with reader:
+            db_path = reader._db_path
+            assert db_path.exists()
+            assert [card.front for card in reader.iter_cards()] == ["q"]
+    assert not db_path.exists()
+
+
 # --- export + roundtrip ---
 
 
+def test_write_apkg_streams_generator_to_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("curriculum.anki.EXPORT_CHUNK_SIZE", 3)
+    dest = tmp_path / "out.apkg"
+    count = write_apkg(dest, "Big", (AnkiCard(front=f"q{i}", back=f"a{i}") for i in range(8)))
+    assert count == 8
+    with ApkgReader(dest) as reader:
+        fronts = [card.front for card in reader.iter_cards()]
+    assert fronts == [f"q{i}" for i in range(8)]
+
+
 def test_build_apkg_roundtrips_through_parse():
     cards = [
         AnkiCard(front="What is SM-2?", back="A spaced repetition algorithm", tags=["srs"]),
@@ -0,0 +1,121 @@
+"""Tests for the process-wide curriculum catalog snapshots."""
+
+import pytest
+
+from curriculum import catalog as catalog_module
+from curriculum.catalog import CatalogRegistry
+
+
+def _write_guide(base, name, chapters=("01-intro",)):
+    guide_dir = base / name
+    guide_dir.mkdir(parents=True, exist_ok=True)
+    for stem in chapters:
+        (guide_dir / f"{stem}.md").write_text(f"# {stem}\n\nBody text.\n", encoding="utf-8")
+    return guide_dir
+
+
+@pytest.fixture
+def shared_dir(tmp_path):
+    base = tmp_path / "shared"
+    _write_guide(base, "01-philosophy-guide")
+    _write_guide(base, "02-economics-guide")
+    (base / "skill_tree.yaml").write_text(
+        """
+tracks:
+  foundations:
+    title: "Foundations"
+    guides:
+      - id: "01-philosophy-guide"
+        prerequisites: []
+      - id: "02-economics-guide"
+        prerequisites: ["01-philosophy-guide"]
+""",
+        encoding="utf-8",
+    )
+    return base
+
+
+def test_snapshot_reused_until_content_changes(shared_dir):
+    registry = CatalogRegistry()
+
+    first = registry.get([shared_dir])
+    assert registry.get([shared_dir]) is first
+    assert [g.id for g in first.guides] == ["01-philosophy-guide", "02-economics-guide"]
+    assert first.tree_layout["02-economics-guide"]["depth"] == 1
+
+    _write_guide(shared_dir, "03-history-guide")
+    second = registry.get([shared_dir])
+
+    assert second is not first
+    assert "03-history-guide" in {g.id for g in second.guides}
+
+
+def test_manifest_edit_invalidates_snapshot(shared_dir):
+    registry = CatalogRegistry()
+    first = registry.get([shared_dir])
+
+    manifest = shared_dir / "skill_tree.yaml"
+    manifest.write_text(
+        manifest.read_text(encoding="utf-8").replace("Foundations", "Core"), encoding="utf-8"
+    )
+
+    second = registry.get([shared_dir])
+    assert second is not first
+    assert second.get_track_metadata()["foundations"]["title"] == "Core"
+
+
+def test_in_place_chapter_edit_caught_by_full_recheck(shared_dir, monkeypatch):
+    registry = CatalogRegistry()
+    first = registry.get([shared_dir])
+
+    chapter = shared_dir / "01-philosophy-guide" / "01-intro.md"
+    chapter.write_text("# Renamed Chapter\n\nMuch longer body text here.\n", encoding="utf-8")
+
+    assert registry.get([shared_dir]) is first
+    monkeypatch.setattr(catalog_module, "FULL_RECHECK_S", 0.0)
+    second = registry.get([shared_dir])
+    assert second is not first
+    assert any(c.title == "Renamed Chapter" for c in second.chapters)
+
+
+def test_user_overlay_merges_without_rescanning_shared(shared_dir, tmp_path, monkeypatch):
+    registry = CatalogRegistry()
+    user_dir = tmp_path / "user"
+    _write_guide(user_dir, "user-stoicism-abc123")
+    _write_guide(user_dir, "01-philosophy-guide", chapters=("01-shadow",))
+    shared = registry.get([shared_dir])
+
+    scans = []
+    original_scan = catalog_module.CurriculumScanner.scan
+
+    def counting_scan(self):
+        scans.append(list(self.content_dirs))
+        return original_scan(self)
+
+    monkeypatch.setattr(catalog_module.CurriculumScanner, "scan", counting_scan)
+    view = registry.get([shared_dir], user_dir)
+
+    assert scans == [[user_dir.resolve()]]
+    guide_ids = [g.id for g in view.guides]
+    assert guide_ids.count("01-philosophy-guide") == 1
+    assert "user-stoicism-abc123" in guide_ids
+    assert not any(c.id == "01-philosophy-guide/01-shadow" for c in view.chapters)
+    assert view.fingerprint != shared.fingerprint
+    assert view.scanner.content_dirs[-1] == user_dir.resolve()
+    assert view.get_track_metadata() == shared.get_track_metadata()
+
+    assert registry.get([shared_dir], user_dir) is view
+    assert len(scans) == 1
+
+
+def test_invalidate_overlay_keeps_shared_snapshot(shared_dir, tmp_path):
+    registry = CatalogRegistry()
+    user_dir = tmp_path / "user"
+    user_dir.mkdir()
+    shared = registry.get([shared_dir])
+    view = registry.get([shared_dir], user_dir)
+
+    registry.invalidate(user_dir)
+
+    assert registry.get([shared_dir]) is shared
+    assert registry.get([shared_dir], user_dir) is not view
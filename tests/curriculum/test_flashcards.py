@@ -64,6 +64,17 @@ def test_bulk_add_preserves_scheduling(store):
     assert later.repetitions == 7
 
 
+def test_iter_card_pages_matches_list_order(store):
+    deck = store.create_deck(USER, "Big")
+    # Bulk-added cards share a created_at, so paging must tie-break on id
+    store.add_cards_bulk(USER, deck.id, [{"front": f"q{i}", "back": ""} for i in range(5)])
+    store.add_card(USER, store.create_deck(USER, "Other").id, "elsewhere", "")
+
+    pages = list(store.iter_card_pages(USER, deck.id, page_size=2))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [c.id for page in pages for c in page] == [c.id for c in store.list_cards(USER, deck.id)]
+
+
 def test_grade_card_success_reschedules(store):
     deck = store.create_deck(USER, "Deck")
     card = store.add_card(USER, deck.id, "q", "a")
@@ -435,6 +435,24 @@ def test_reconcile_guide_aliases_merges_user_data_and_removes_alias_catalog_rows
     assert review_item is not None
     assert review_item["guide_id"] == "35-engineering-guide"
     assert review_item["chapter_id"] == "35-engineering-guide/01-introduction"
+    assert store.verify_progress_snapshot() == []
+
+
+def test_reconcile_without_alias_data_leaves_snapshot_alone(store, sample_guide, sample_chapters):
+    from db import wal_connect
+
+    store.sync_catalog([sample_guide], sample_chapters)
+    store.enroll("test-user", "01-philosophy-guide")
+    with wal_connect(store.db_path) as conn:
+        conn.execute("UPDATE user_guide_progress SET chapters_completed=5")
+        conn.commit()
+
+    stats = store.reconcile_guide_aliases({"00-old-philosophy": "01-philosophy-guide"})
+
+    assert stats["aliases_processed"] == 1
+    assert stats["enrollments_merged"] == 0
+    # No global rebuild: the unrelated (deliberately drifted) row is untouched
+    assert len(store.verify_progress_snapshot()) == 1
 
 
 def test_schema_v4_chapter_metadata_columns(store, sample_guide, sample_chapters):
@@ -968,3 +986,64 @@ def test_get_ready_guides_excludes_superseded_guides(store, sample_guide, sample
 
     ready = store.get_ready_guides(user_id, excluded_guide_ids={"02-legacy-guide"})
     assert ready == []
+
+
+def test_progress_snapshot_tracks_mutations(store, sample_guide, sample_chapters):
+    store.sync_catalog([sample_guide], sample_chapters)
+    user_id = "test-user"
+    item_id = uuid.uuid4().hex[:16]
+
+    store.enroll(user_id, "01-philosophy-guide")
+    for chapter_id in ("01-philosophy-guide/01-introduction", "01-philosophy-guide/02-logic"):
+        store.update_progress(user_id, chapter_id, "01-philosophy-guide", status="completed")
+    store.add_review_items(
+        [
+            ReviewItem(
+                id=item_id,
+                user_id=user_id,
+                chapter_id="01-philosophy-guide/01-introduction",
+                guide_id="01-philosophy-guide",
+                question="Q",
+                bloom_level=BloomLevel.REMEMBER,
+                next_review=datetime.utcnow(),
+                created_at=datetime.utcnow(),
+            )
+        ]
+    )
+    store.grade_review(item_id, 5)
+
+    assert store.verify_progress_snapshot() == []
+    node = store.get_tree_data(user_id)[0]
+    assert node["status"] == "completed"
+    assert node["chapters_completed"] == 2
+    stats = store.get_stats(user_id)
+    assert stats.guides_completed == 1
+    assert stats.reviews_completed == 1
+
+    store.delete_review_items_for_chapter(user_id, "01-philosophy-guide/01-introduction")
+    assert store.verify_progress_snapshot() == []
+    assert store.get_stats(user_id).reviews_completed == 0
+
+
+def test_progress_snapshot_rebuild_repairs_drift(store, sample_guide, sample_chapters):
+    from db import wal_connect
+
+    store.sync_catalog([sample_guide], sample_chapters)
+    user_id = "test-user"
+    store.enroll(user_id, "01-philosophy-guide")
+    with wal_connect(store.db_path) as conn:
+        conn.execute("UPDATE user_guide_progress SET chapters_completed=5")
+        conn.commit()
+
+    mismatches = store.verify_progress_snapshot(user_id)
+    assert mismatches == [
+        {
+            "user_id": user_id,
+            "guide_id": "01-philosophy-guide",
+            "field": "chapters_completed",
+            "snapshot": 5,
+            "live": 0,
+        }
+    ]
+    assert store.rebuild_progress_snapshot() == 1
+    assert store.verify_progress_snapshot() == []
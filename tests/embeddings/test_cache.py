@@ -0,0 +1,91 @@
+"""Tests for the persistent embedding cache wrapper."""
+
+from embeddings.cache import CachedEmbeddingFunction, EmbeddingCache
+from embeddings.versioning import model_tag, versioned_name
+from observability import metrics
+
+
+class FakeProvider:
+    provider_name = "fake"
+    _model = "gemini-embedding-2-preview"
+    dimensions = 3
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input):
+        texts = list(input)
+        self.calls.append(texts)
+        return [[float(len(t)), 0.5, 1.0] for t in texts]
+
+
+class TestCachedEmbeddingFunction:
+    def test_batches_misses_and_reuses_hits(self, tmp_path):
+        provider = FakeProvider()
+        fn = CachedEmbeddingFunction(provider, EmbeddingCache(tmp_path / "cache.db"))
+
+        first = fn(["alpha", "beta", "alpha"])
+        second = fn(["beta", "gamma"])
+
+        assert provider.calls == [["alpha", "beta"], ["gamma"]]
+        assert first[0] == first[2] == [5.0, 0.5, 1.0]
+        assert second[0] == first[1]
+
+    def test_persists_across_instances(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        CachedEmbeddingFunction(FakeProvider(), EmbeddingCache(db_path))(["persisted"])
+
+        provider = FakeProvider()
+        fn = CachedEmbeddingFunction(provider, EmbeddingCache(db_path))
+        assert fn(["persisted"]) == [[9.0, 0.5, 1.0]]
+        assert provider.calls == []
+
+    def test_keyed_by_model(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        CachedEmbeddingFunction(FakeProvider(), cache)(["shared text"])
+
+        other = FakeProvider()
+        other._model = "text-embedding-3-small"
+        CachedEmbeddingFunction(other, cache)(["shared text"])
+
+        assert other.calls == [["shared text"]]
+
+    def test_models_sharing_a_truncated_tag_do_not_collide(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        first = FakeProvider()
+        first._model = "gemini-embedding-001"
+        CachedEmbeddingFunction(first, cache)(["shared text"])
+
+        second = FakeProvider()
+        second._model = "gemini-embedding-exp-03-07"
+        assert model_tag(first) == model_tag(second)
+        CachedEmbeddingFunction(second, cache)(["shared text"])
+
+        assert second.calls == [["shared text"]]
+
+    def test_lru_evicts_oldest(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "cache.db", max_memory_items=2)
+        cache.put_many("m", {"a": [1.0], "b": [2.0], "c": [3.0]})
+
+        assert ("m", "a") not in cache._lru
+        # Evicted entries are still served from SQLite
+        assert cache.get_many("m", ["a"]) == {"a": [1.0]}
+
+    def test_preserves_versioning_identity(self, tmp_path):
+        provider = FakeProvider()
+        fn = CachedEmbeddingFunction(provider, EmbeddingCache(tmp_path / "cache.db"))
+
+        assert model_tag(fn) == model_tag(provider) == "gemini2"
+        assert versioned_name("journal", fn) == versioned_name("journal", provider)
+        assert fn.dimensions == 3
+
+    def test_reports_metrics(self, tmp_path):
+        metrics.reset()
+        fn = CachedEmbeddingFunction(FakeProvider(), EmbeddingCache(tmp_path / "cache.db"))
+        fn(["one", "two"])
+        fn(["one"])
+
+        counters = metrics.summary()["counters"]
+        assert counters["embedding.cache_hit"] == 1
+        assert counters["embedding.cache_miss"] == 2
+        assert counters["embedding.api_calls"] == 1
@@ -0,0 +1,72 @@
+"""Tests for the latency benchmark suite."""
+
+import pytest
+
+from eval.perf import (
+    PerfReport,
+    compare_to_baseline,
+    load_baseline,
+    percentile,
+    run_perf_eval,
+    summarize_latencies,
+    write_baseline,
+)
+
+OPERATIONS = {"journal_search", "intel_search", "fact_search", "context_assembly", "scraper_save"}
+
+
+class TestPercentiles:
+    def test_nearest_rank(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99) == 99
+        assert percentile([], 50) == 0.0
+
+    def test_summary_in_milliseconds(self):
+        summary = summarize_latencies([0.001, 0.002, 0.010])
+        assert summary["n"] == 3
+        assert summary["p50_ms"] == pytest.approx(2.0)
+        assert summary["p99_ms"] == pytest.approx(10.0)
+
+
+class TestBaseline:
+    def _report(self, p95: float) -> PerfReport:
+        return PerfReport(
+            scale=10,
+            iterations=5,
+            timings={"journal_search": {"p50_ms": 1.0, "p95_ms": p95, "p99_ms": p95}},
+        )
+
+    def test_round_trip_and_no_regression(self, tmp_path):
+        path = write_baseline(self._report(10.0), tmp_path / "perf.json")
+        baseline = load_baseline(path)
+        assert baseline["version"] == 1
+        assert baseline["timings"]["journal_search"]["p95_ms"] == 10.0
+
+        report = self._report(11.0)
+        assert compare_to_baseline(report, baseline, tolerance=0.25) == []
+        assert report.summary["passed"] is True
+
+    def test_flags_regression(self):
+        baseline = self._report(10.0).to_dict()
+        report = self._report(20.0)
+        regressions = compare_to_baseline(report, baseline, tolerance=0.25)
+        assert [r["operation"] for r in regressions] == ["journal_search"]
+        assert regressions[0]["ratio"] == 2.0
+        assert report.summary["passed"] is False
+
+    def test_operations_missing_from_baseline_are_ignored(self):
+        report = self._report(20.0)
+        assert compare_to_baseline(report, {"timings": {}}) == []
+
+
+def test_run_perf_eval_times_every_operation(tmp_path):
+    report = run_perf_eval(scale=20, iterations=3, work_dir=tmp_path)
+
+    assert set(report.timings) == OPERATIONS
+    for timing in report.timings.values():
+        assert timing["n"] == 3
+        assert 0 < timing["p50_ms"] <= timing["p95_ms"] <= timing["p99_ms"]
+    assert set(report.setup_seconds) == {"journal", "intel", "facts"}
+    assert len(list((tmp_path / "journal").glob("*.md"))) == 20
@@ -1,5 +1,8 @@
 """Tests for entity extraction and scheduling."""
 
+import threading
+import time
+
 from intelligence.entity_extractor import EntityExtractor, ExtractionScheduler
 from intelligence.entity_store import EntityStore
 from intelligence.scraper import IntelItem, IntelStorage
@@ -209,6 +212,108 @@ def test_extraction_scheduler_marks_failed_items_processed(tmp_path):
     assert store.get_unprocessed_items(limit=5) == []
 
 
+class SlowLLM(FakeLLM):
+    """Blocks each call briefly and records peak concurrency."""
+
+    def __init__(self, response: str):
+        super().__init__(response)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, messages, system=None, max_tokens=0, use_thinking=False):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return self.response
+
+
+def _save_items(storage, count):
+    return [
+        storage.save(
+            IntelItem(
+                source="rss",
+                title=f"OpenAI update {i}",
+                url=f"https://example.com/update-{i}",
+                summary="OpenAI competes with Anthropic",
+            )
+        )
+        for i in range(count)
+    ]
+
+
+def test_extract_batch_runs_llm_calls_concurrently_up_to_limit(tmp_path):
+    storage = IntelStorage(tmp_path / "intel.db")
+    item_ids = _save_items(storage, 6)
+    store = EntityStore(tmp_path / "intel.db")
+    llm = SlowLLM(
+        '{"entities": [{"name": "OpenAI", "type": "Company", "aliases": []},'
+        ' {"name": "Anthropic", "type": "Company", "aliases": []}],'
+        ' "relationships": [{"source": "OpenAI", "target": "Anthropic",'
+        ' "type": "COMPETES_WITH", "evidence": "They compete."}]}'
+    )
+    extractor = EntityExtractor(
+        llm=llm, storage=storage, entity_store=store, batch_size=10, max_concurrency=3
+    )
+
+    result = _run(extractor.extract_batch([storage.get_item_by_id(i) for i in item_ids]))
+
+    assert result.processed == 6
+    assert result.errors == 0
+    assert llm.peak == 3
+    # Entities are created once and merged for every later item
+    assert result.entities_created == 2
+    openai = store.get_entity_by_name("OpenAI")
+    assert openai["item_count"] == 6
+    assert len(store.get_relationships(openai["id"])) == 1
+    assert store.get_unprocessed_items(limit=10) == []
+
+
+def test_extraction_scheduler_reports_throughput(tmp_path):
+    storage = IntelStorage(tmp_path / "intel.db")
+    _save_items(storage, 4)
+    store = EntityStore(tmp_path / "intel.db")
+    extractor = EntityExtractor(
+        llm=SlowLLM('{"entities": [], "relationships": []}'),
+        storage=storage,
+        entity_store=store,
+        max_concurrency=4,
+    )
+    scheduler = ExtractionScheduler(extractor, store, batch_size=4)
+
+    result = _run(scheduler.run_extraction())
+
+    assert result.processed == 4
+    assert result.duration_s > 0
+    assert result.items_per_second == round(4 / result.duration_s, 2)
+
+
+def test_extractor_reused_across_event_loops(tmp_path):
+    """The scheduler calls asyncio.run() per run on one cached extractor."""
+    storage = IntelStorage(tmp_path / "intel.db")
+    item_ids = _save_items(storage, 8)
+    store = EntityStore(tmp_path / "intel.db")
+    extractor = EntityExtractor(
+        llm=SlowLLM(
+            '{"entities": [{"name": "OpenAI", "type": "Company", "aliases": []}],'
+            ' "relationships": []}'
+        ),
+        storage=storage,
+        entity_store=store,
+        batch_size=4,
+        max_concurrency=4,
+    )
+
+    first = _run(extractor.extract_batch([storage.get_item_by_id(i) for i in item_ids[:4]]))
+    second = _run(extractor.extract_batch([storage.get_item_by_id(i) for i in item_ids[4:]]))
+
+    assert (first.errors, second.errors) == (0, 0)
+    assert store.get_entity_by_name("OpenAI")["item_count"] == 8
+
+
 def _run(coro):
     import asyncio
 
@@ -26,7 +26,7 @@ def test_entity_store_migrates_schema_and_deduplicates_names(tmp_path):
     assert entity["type"] == "Company"
 
     with wal_connect(tmp_path / "intel.db") as conn:
-        assert get_schema_version(conn) == 6
+        assert get_schema_version(conn) == 7
 
 
 def test_entity_store_links_items_and_relationships(tmp_path):
@@ -87,3 +87,59 @@ def test_cross_entity_links_empty_for_unlinked(tmp_path):
     store = EntityStore(tmp_path / "intel.db")
     entity_id = store.save_entity("Go", "Technology")
     assert store.get_cross_entity_links(entity_id) == []
+
+
+def test_get_entity_by_name_prefers_names_over_aliases(tmp_path):
+    IntelStorage(tmp_path / "intel.db")
+    store = EntityStore(tmp_path / "intel.db")
+    meta_id = store.save_entity("Meta", "Company", aliases=["Facebook"])
+    facebook_id = store.save_entity("Facebook", "Product")
+
+    assert store.get_entity_by_name("facebook")["id"] == facebook_id
+    assert store.get_entity_by_name("META  ")["id"] == meta_id
+    assert store.get_entity_by_name("Meta", "Company")["aliases"] == ["Facebook"]
+    assert store.get_entity_by_name("Alphabet") is None
+
+
+def test_resolve_names_bulk_and_fuzzy(tmp_path):
+    IntelStorage(tmp_path / "intel.db")
+    store = EntityStore(tmp_path / "intel.db")
+    openai_id = store.save_entity("OpenAI", "Company", aliases=["Open AI"])
+    anthropic_id = store.save_entity("Anthropic", "Company")
+
+    resolved = store.resolve_names(["open ai", "Anthropic", "Anthropics", "Nobody"])
+    assert {name: entity["id"] for name, entity in resolved.items()} == {
+        "open ai": openai_id,
+        "Anthropic": anthropic_id,
+    }
+
+    fuzzy = store.resolve_names(["Anthropics", "Nobody"], fuzzy=True)
+    assert {name: entity["id"] for name, entity in fuzzy.items()} == {"Anthropics": anthropic_id}
+
+
+def test_search_entities_matches_name_and_alias_substrings(tmp_path):
+    IntelStorage(tmp_path / "intel.db")
+    store = EntityStore(tmp_path / "intel.db")
+    store.save_entity("Google DeepMind", "Company", aliases=["DeepMind Technologies"])
+    store.save_entity("Mistral", "Company")
+
+    assert [e["name"] for e in store.search_entities("deepmind")] == ["Google DeepMind"]
+    assert [e["name"] for e in store.search_entities("technolog")] == ["Google DeepMind"]
+    assert [e["name"] for e in store.search_entities("mi", entity_type="Company")] == [
+        "Google DeepMind",
+        "Mistral",
+    ]
+    assert store.search_entities("tesla") == []
+
+
+def test_name_index_backfills_existing_entities(tmp_path):
+    IntelStorage(tmp_path / "intel.db")
+    store = EntityStore(tmp_path / "intel.db")
+    entity_id = store.save_entity("Hugging Face", "Company", aliases=["HF"])
+    with wal_connect(tmp_path / "intel.db") as conn:
+        conn.execute("DELETE FROM entity_names")
+
+    reopened = EntityStore(tmp_path / "intel.db")
+
+    assert reopened.get_entity_by_name("hf")["id"] == entity_id
+    assert reopened.search_entities("hugging")[0]["id"] == entity_id
@@ -1,5 +1,6 @@
 """Tests for extracted runner functions."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 from intelligence.runners import (
@@ -95,3 +96,71 @@ def test_recommendation_runner_from_runners_module(
 
     result = runner.run()
     assert result == {"recommendations": 1, "brief_saved": False}
+
+
+def test_github_repo_poll_fans_out_per_user(tmp_path):
+    from intelligence.runners import run_github_repo_poll
+
+    storage = IntelStorage(tmp_path / "intel.db")
+    ctx = RunnerContext(storage=storage, full_config={"github_monitoring": {"enabled": True}})
+
+    async def poll(user_id):
+        if user_id == "bad":
+            raise RuntimeError("rate limited")
+        return ["snap1", "snap2"]
+
+    store = MagicMock()
+    store.get_all_user_ids_with_repos.return_value = ["u1", "u2", "bad"]
+    store.prune_snapshots.return_value = 0
+    poller = MagicMock()
+    poller.poll_user_repos.side_effect = poll
+    client = MagicMock()
+    client.close = MagicMock(side_effect=lambda: asyncio.sleep(0))
+
+    with (
+        patch("intelligence.github_repo_store.GitHubRepoStore", return_value=store),
+        patch("intelligence.github_repo_poller.GitHubRepoPoller", return_value=poller),
+        patch("intelligence.github_repos.GitHubRepoClient", return_value=client),
+    ):
+        result = run_github_repo_poll(ctx)
+    ctx.user_jobs.shutdown()
+
+    assert result == {"users": 3, "skipped": 0, "failed": 1, "snapshots": 4, "pruned": 0}
+    assert client.close.call_count == 3
+    assert ctx.user_jobs.state_store.get("bad", "github_repo_poll")["last_status"] == "error"
+
+
+def test_github_repo_poll_skips_users_polled_since_last_cadence(tmp_path):
+    from intelligence.runners import run_github_repo_poll
+
+    storage = IntelStorage(tmp_path / "intel.db")
+    # Every 4h by default, so users polled within the last 2h are skipped
+    ctx = RunnerContext(storage=storage, full_config={"github_monitoring": {"enabled": True}})
+
+    polled = []
+
+    async def poll(user_id):
+        polled.append(user_id)
+        return ["snap"]
+
+    store = MagicMock()
+    store.get_all_user_ids_with_repos.return_value = ["u1", "u2"]
+    store.prune_snapshots.return_value = 0
+    poller = MagicMock()
+    poller.poll_user_repos.side_effect = poll
+    client = MagicMock()
+    client.close = MagicMock(side_effect=lambda: asyncio.sleep(0))
+
+    with (
+        patch("intelligence.github_repo_store.GitHubRepoStore", return_value=store),
+        patch("intelligence.github_repo_poller.GitHubRepoPoller", return_value=poller),
+        patch("intelligence.github_repos.GitHubRepoClient", return_value=client),
+    ):
+        run_github_repo_poll(ctx)
+        store.get_all_user_ids_with_repos.return_value = ["u1", "u2", "u3"]
+        result = run_github_repo_poll(ctx)
+    ctx.user_jobs.shutdown()
+
+    assert result["users"] == 3 and result["skipped"] == 2
+    assert sorted(polled[:2]) == ["u1", "u2"]
+    assert polled[2:] == ["u3"]
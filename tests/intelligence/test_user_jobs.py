@@ -0,0 +1,132 @@
+"""Tests for per-user job fan-out."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from intelligence.user_jobs import (
+    UserJobRunner,
+    UserJobStateStore,
+    run_async_with_deadline,
+)
+from observability import metrics
+
+
+@pytest.fixture
+def runner(tmp_path):
+    r = UserJobRunner(UserJobStateStore(tmp_path / "intel.db"), max_workers=4, user_timeout=5)
+    yield r
+    r.shutdown()
+
+
+def test_runs_every_user_and_records_state(runner):
+    runs = runner.run("poll", ["a", "b", "c"], lambda ctx: ctx.user_id.upper())
+
+    assert sorted(r.result for r in runs) == ["A", "B", "C"]
+    state = runner.state_store.get("a", "poll")
+    assert state["last_status"] == "ok"
+    assert state["last_success_at"] is not None
+
+
+def test_users_run_concurrently(runner):
+    barrier = threading.Barrier(3, timeout=2)
+
+    def job(ctx):
+        barrier.wait()  # deadlocks unless all three users are in flight together
+        return True
+
+    runs = runner.run("poll", ["a", "b", "c"], job)
+    assert all(r.status == "ok" for r in runs)
+
+
+def test_one_failing_user_does_not_affect_others(runner):
+    def job(ctx):
+        if ctx.user_id == "bad":
+            raise RuntimeError("boom")
+        return 1
+
+    runs = {r.user_id: r for r in runner.run("poll", ["good", "bad"], job)}
+    assert runs["good"].status == "ok"
+    assert runs["bad"].status == "error"
+    assert runner.state_store.get("bad", "poll")["last_error"] == "boom"
+
+
+def test_async_work_cancelled_at_deadline(tmp_path):
+    runner = UserJobRunner(UserJobStateStore(tmp_path / "intel.db"), user_timeout=0.05)
+
+    async def slow():
+        await asyncio.sleep(5)
+
+    start = time.monotonic()
+    runs = runner.run("poll", ["slow"], lambda ctx: run_async_with_deadline(slow(), ctx))
+    runner.shutdown()
+
+    assert runs[0].status == "timeout"
+    assert time.monotonic() - start < 2
+    assert runner.state_store.get("slow", "poll")["last_success_at"] is None
+
+
+def test_cursor_persists_across_runners(tmp_path):
+    store = UserJobStateStore(tmp_path / "intel.db")
+
+    def job(ctx):
+        seen = ctx.cursor
+        ctx.cursor = (ctx.cursor or 0) + 1
+        return seen
+
+    first = UserJobRunner(store)
+    assert first.run("poll", ["a"], job)[0].result is None
+    first.shutdown()
+
+    restarted = UserJobRunner(UserJobStateStore(tmp_path / "intel.db"))
+    assert restarted.run("poll", ["a"], job)[0].result == 1
+    restarted.shutdown()
+
+
+def test_failed_run_keeps_previous_cursor(runner):
+    def ok(ctx):
+        ctx.cursor = "v1"
+
+    def fail(ctx):
+        ctx.cursor = "v2"
+        raise RuntimeError("boom")
+
+    runner.run("poll", ["a"], ok)
+    runner.run("poll", ["a"], fail)
+    assert runner.state_store.get("a", "poll")["cursor"] == "v1"
+
+
+def test_min_interval_skips_recent_successes(runner):
+    runner.run("poll", ["a"], lambda ctx: None)
+    runs = runner.run("poll", ["a", "b"], lambda ctx: None, min_interval=3600)
+    assert [r.user_id for r in runs] == ["b"]
+
+
+def test_least_recently_successful_users_dispatched_first(tmp_path):
+    runner = UserJobRunner(UserJobStateStore(tmp_path / "intel.db"), max_workers=1)
+    runner.run("poll", ["a"], lambda ctx: None)
+    time.sleep(0.01)
+    runner.run("poll", ["b"], lambda ctx: None)
+
+    order = []
+    runner.run("poll", ["b", "a", "new"], lambda ctx: order.append(ctx.user_id))
+    runner.shutdown()
+    assert order == ["new", "a", "b"]
+
+
+def test_records_queue_and_lag_metrics(tmp_path):
+    metrics.reset()
+    runner = UserJobRunner(UserJobStateStore(tmp_path / "intel.db"), max_workers=1)
+    runner.run("poll", ["a", "b"], lambda ctx: None)
+    runner.run("poll", ["a"], lambda ctx: None)
+    runner.shutdown()
+
+    summary = metrics.summary()
+    assert summary["gauges"]['user_jobs.queue_depth{job="poll"}'] == 0
+    assert runner.queue_depth("poll") == 0
+    assert summary["timers"]['user_jobs.lag{job="poll"}']["count"] == 1
+    assert summary["timers"]['user_jobs.queue_wait{job="poll"}']["count"] == 3
+    assert summary["counters"]['user_jobs.run{job="poll",status="ok"}'] == 3
+    metrics.reset()
@@ -143,3 +143,96 @@ class TestEmbeddingManager:
         )
 
         assert removed == 1
+
+    def test_sync_skips_unchanged_content(self, temp_dirs):
+        """Only entries whose content hash changed are re-embedded, in one batch."""
+        from journal.embeddings import EmbeddingManager
+
+        manager = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        entries = [
+            {"id": "a", "content": "Alpha entry"},
+            {"id": "b", "content": "Beta entry"},
+        ]
+        manager.sync_from_storage(entries)
+
+        calls = []
+        inner = manager.collection.embedding_function
+        manager.collection.embedding_function = lambda docs: calls.append(list(docs)) or inner(docs)
+
+        assert manager.sync_from_storage(entries) == (0, 0)
+        assert calls == []
+
+        entries[1] = {"id": "b", "content": "Beta entry, revised"}
+        entries.append({"id": "c", "content": "Gamma entry"})
+        added, removed = manager.sync_from_storage(entries)
+
+        assert (added, removed) == (1, 0)
+        assert calls == [["Beta entry, revised", "Gamma entry"]]
+
+    def test_changed_paths_uses_mtimes(self, temp_dirs):
+        """changed_paths flags unseen and modified files without parsing them."""
+        from journal.embeddings import EmbeddingManager
+
+        manager = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        manager.sync_changes({"a": 1.0}, [{"id": "a", "content": "Alpha"}])
+
+        assert manager.changed_paths({"a": 1.0}) == set()
+        assert manager.changed_paths({"a": 2.0, "b": 1.0}) == {"a", "b"}
+
+    def test_changed_paths_ignores_sidecar_for_missing_collection(self, temp_dirs):
+        """A sidecar that outlives its collection file does not hide entries."""
+        from journal.embeddings import EmbeddingManager
+
+        manager = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        manager.sync_changes({"a": 1.0}, [{"id": "a", "content": "Alpha"}])
+        manager.collection.path.unlink()
+
+        reopened = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        assert reopened.changed_paths({"a": 1.0}) == {"a"}
+        assert reopened.sync_changes({"a": 1.0}, [{"id": "a", "content": "Alpha"}]) == (1, 0)
+
+    def test_single_entry_writes_batch_sidecar_updates(self, temp_dirs, monkeypatch):
+        """add_entry/remove_entry do not rewrite the sidecar on every call."""
+        from journal.embeddings import EmbeddingManager
+
+        manager = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        saves = []
+        save = manager._save_sync_state
+        monkeypatch.setattr(
+            manager, "_save_sync_state", lambda state: saves.append(1) or save(state)
+        )
+
+        for i in range(20):
+            manager.add_entry(f"e{i}", f"Entry {i}")
+        manager.remove_entry("e0")
+        assert len(saves) <= 1
+
+        manager.flush_sync_state()
+        state = manager._load_sync_state()
+        assert sorted(state) == sorted(f"e{i}" for i in range(1, 20))
+
+    def test_concurrent_writers_keep_every_sidecar_entry(self, temp_dirs):
+        """Threads adding entries at once never drop each other's state."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from journal.embeddings import EmbeddingManager
+
+        manager = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        manager.collection.upsert = lambda **kwargs: None
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: manager.add_entry(f"e{i}", f"Entry {i}"), range(200)))
+        manager.flush_sync_state()
+
+        assert len(manager._load_sync_state()) == 200
+
+    def test_delete_collection_resets_sync_state(self, temp_dirs):
+        """A rebuild re-embeds everything even if content is unchanged."""
+        from journal.embeddings import EmbeddingManager
+
+        manager = EmbeddingManager(temp_dirs["chroma_dir"], config=HASH_CONFIG)
+        entries = [{"id": "a", "content": "Alpha"}]
+        manager.sync_from_storage(entries)
+        manager.delete_collection()
+
+        assert manager.sync_from_storage(entries) == (1, 0)
+        assert manager.count() == 1
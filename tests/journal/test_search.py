@@ -131,6 +131,37 @@ class TestJournalSearch:
         assert added >= 3  # Our sample entries
         assert embeddings.count() >= 3
 
+    def test_sync_embeddings_parses_only_changed_files(self, populated_journal, temp_dirs):
+        """Second sync stats files and re-parses only the modified one."""
+        import os
+
+        from journal.embeddings import EmbeddingManager
+        from journal.fts import JournalFTSIndex
+        from journal.search import JournalSearch
+
+        storage = populated_journal["storage"]
+        search = JournalSearch(
+            storage=storage,
+            embeddings=EmbeddingManager(temp_dirs["chroma_dir"]),
+            fts_index=JournalFTSIndex(temp_dirs["journal_dir"]),
+        )
+        search.sync_embeddings()
+
+        loaded = []
+        original = storage.load_entries
+        storage.load_entries = lambda paths: loaded.extend(paths) or original(paths)
+
+        assert search.sync_embeddings() == (0, 0)
+        assert loaded == []
+
+        target = populated_journal["paths"][0]
+        target.write_text(target.read_text() + "\nMore thoughts.")
+        os.utime(target, (target.stat().st_atime, target.stat().st_mtime + 5))
+
+        assert search.sync_embeddings() == (0, 0)
+        assert loaded == [str(target)]
+        assert search.fts.search("thoughts")[0]["path"] == str(target)
+
     def test_fallback_to_keyword_without_embeddings(self, populated_journal):
         """Test that search falls back to keyword without embeddings."""
         from journal.search import JournalSearch
@@ -134,3 +134,90 @@ class TestTrendDetector:
 
         assert len(entries) == 2
         assert {entry["title"] for entry in entries} == {"Career 0", "Career 1"}
+
+
+class TestVectorizedClustering:
+    def test_sq_distances_match_broadcast(self):
+        from journal.trends import _sq_distances
+
+        rng = np.random.RandomState(1)
+        data, centroids = rng.randn(40, 6), rng.randn(5, 6)
+        expected = ((data[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+        np.testing.assert_allclose(_sq_distances(data, centroids), expected, atol=1e-9)
+
+    def test_minibatch_fit_on_large_input(self):
+        from journal.trends import MINIBATCH_SIZE
+
+        rng = np.random.RandomState(2)
+        centers = np.array([[8, 0], [-8, 0], [0, 8]])
+        data = np.vstack([rng.randn(400, 2) + c for c in centers])
+        assert len(data) > MINIBATCH_SIZE
+
+        labels = _kmeans(data, n_clusters=3, seed=0)
+        for block in range(3):
+            assert len(set(labels[block * 400 : (block + 1) * 400])) == 1
+
+
+class TestIncrementalAssignment:
+    def _detector(self, tmp_path):
+        from types import SimpleNamespace
+
+        embeddings = SimpleNamespace(chroma_dir=tmp_path, collection_name="journal_v1_test")
+        return TrendDetector(SimpleNamespace(embeddings=embeddings))
+
+    @staticmethod
+    def _entries(start: int, count: int, rng) -> list[dict]:
+        centers = np.array([[6.0, 0.0], [-6.0, 0.0]])
+        return [
+            {"path": f"/j/{i}.md", "embedding": rng.randn(2) + centers[i % 2]}
+            for i in range(start, start + count)
+        ]
+
+    def test_new_entries_assigned_without_refit(self, tmp_path, monkeypatch):
+        import journal.trends as trends
+
+        rng = np.random.RandomState(3)
+        detector = self._detector(tmp_path)
+        history = self._entries(0, 20, rng)
+        first = detector._assign_clusters(history, 2, refit=False)
+        assert (tmp_path / "journal_v1_test.trends.json").exists()
+
+        def no_refit(*args, **kwargs):
+            raise AssertionError("history should not be reclustered")
+
+        monkeypatch.setattr(trends, "_fit_centroids", no_refit)
+        week = self._entries(20, 4, rng)
+        labels = detector._assign_clusters(history + week, 2, refit=False)
+
+        assert labels[:20] == first
+        # New points join the cluster of the history points around the same center
+        assert labels[20:] == [first[0], first[1], first[0], first[1]]
+
+    def test_refit_when_most_entries_are_new_or_requested(self, tmp_path, monkeypatch):
+        import journal.trends as trends
+
+        rng = np.random.RandomState(4)
+        detector = self._detector(tmp_path)
+        detector._assign_clusters(self._entries(0, 6, rng), 2, refit=False)
+
+        fits = []
+        real_fit = trends._fit_centroids
+        monkeypatch.setattr(
+            trends, "_fit_centroids", lambda *a, **kw: fits.append(1) or real_fit(*a, **kw)
+        )
+        detector._assign_clusters(self._entries(0, 20, rng), 2, refit=False)
+        detector._assign_clusters(self._entries(0, 20, rng), 2, refit=True)
+        assert len(fits) == 2
+
+    def test_embeddings_fetched_in_one_read(self):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        collection = MagicMock()
+        collection.get.return_value = {"ids": ["a", "c"], "embeddings": [[1.0, 0.0], [0.0, 1.0]]}
+        detector = TrendDetector(SimpleNamespace(embeddings=SimpleNamespace(collection=collection)))
+
+        vectors = detector._get_embeddings(["a", "b", "c"])
+
+        collection.get.assert_called_once_with(ids=["a", "b", "c"], include=["embeddings"])
+        assert set(vectors) == {"a", "c"}
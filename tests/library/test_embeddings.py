@@ -60,3 +60,24 @@ def test_unavailable_without_provider(tmp_path, monkeypatch):
     assert mgr.count() == 0
     assert mgr.query("anything") == []
     assert mgr.sync_from_storage([]) == (0, 0)
+
+
+def test_chunk_lookup_is_scoped_to_the_item(tmp_path):
+    mgr = LibraryEmbeddingManager(tmp_path / "chroma", config=HASH_CONFIG)
+    mgr.add_item_chunks("doc-1", ["a", "b", "c"])
+    mgr.add_item_chunks("doc-10", ["x", "y"])
+
+    calls = []
+    get = mgr.collection.get
+    mgr.collection.get = lambda **kw: calls.append(kw) or get(**kw)
+
+    mgr.add_item_chunks("doc-1", ["a2"])
+    assert sorted(get(include=[])["ids"]) == [
+        "doc-1#0",
+        "doc-10#0",
+        "doc-10#1",
+    ]
+    mgr.remove_item("doc-1")
+    assert sorted(get(include=[])["ids"]) == ["doc-10#0", "doc-10#1"]
+    # Never a whole-collection listing per item
+    assert all("ids" in kw or "where" in kw for kw in calls)
@@ -0,0 +1,45 @@
+"""Tests for background PDF text extraction."""
+
+from library.extraction_jobs import resume_pending_extractions, submit_pdf_extraction
+from library.reports import ReportStore
+
+
+def _pdf(text: str) -> bytes:
+    return b"%PDF-1.4\n" + f"BT /F1 12 Tf 40 100 Td ({text}) Tj ET\n".encode() + b"%%EOF\n"
+
+
+def test_submit_extracts_text_and_calls_back(tmp_path):
+    store = ReportStore(tmp_path / "library")
+    record = store.create_uploaded_pdf(
+        title="CV", file_name="cv.pdf", file_bytes=_pdf("Python leadership fintech")
+    )
+    seen = []
+
+    done = submit_pdf_extraction(store, record["id"], lambda r, text: seen.append(text))
+    result = done.result(timeout=10)
+
+    assert result["extraction_status"] == "ready"
+    assert "leadership" in store.get_extracted_text(record["id"])
+    assert seen and "leadership" in seen[0]
+
+
+def test_missing_attachment_marks_failed(tmp_path):
+    store = ReportStore(tmp_path / "library")
+    record = store.create_uploaded_pdf(title="CV", file_name="cv.pdf", file_bytes=_pdf("x"))
+    (store.library_dir / record["attachment_path"]).unlink()
+
+    result = submit_pdf_extraction(store, record["id"]).result(timeout=10)
+
+    assert result["extraction_status"] == "failed"
+
+
+def test_resume_requeues_pending_uploads(tmp_path):
+    store = ReportStore(tmp_path / "library")
+    pending = store.create_uploaded_pdf(
+        title="CV", file_name="cv.pdf", file_bytes=_pdf("resumed text"), visibility_state="hidden"
+    )
+    store.create(title="Memo", prompt="p" * 10, report_type="memo", content="Body")
+
+    assert resume_pending_extractions(store) == 1
+    submit_pdf_extraction(store, pending["id"]).result(timeout=10)
+    assert store.get_report(pending["id"])["extraction_status"] == "ready"
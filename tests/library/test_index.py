@@ -62,3 +62,24 @@ def test_delete_removes_embedding(tmp_path):
 
     index.delete_item("r1")
     assert embeddings.count() == 0
+
+
+def test_long_document_is_chunked_and_matched_past_first_chunk(tmp_path):
+    embeddings = LibraryEmbeddingManager(tmp_path / "chroma")
+    index = LibraryIndex(tmp_path / "library", embedding_manager=embeddings)
+
+    filler = "Quarterly planning notes about budgets and hiring. " * 200
+    body = filler + "Negotiation tactics for salary conversations with a new employer."
+    _upsert_sample(index, "r1", "Long Handbook", body)
+    assert embeddings.count() > 1
+
+    results = index.semantic_search("salary negotiation tactics", n_results=5)
+    assert [r["id"] for r in results] == ["r1"]
+    assert results[0]["chunk_index"] > 0
+    assert "negotiation" in results[0]["snippet"].lower()
+    assert not results[0]["snippet"].startswith("Long Handbook")
+
+    _upsert_sample(index, "r1", "Long Handbook", "now a short note")
+    assert embeddings.count() == 1
+    index.delete_item("r1")
+    assert embeddings.count() == 0
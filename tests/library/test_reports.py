@@ -82,3 +82,32 @@ def test_create_avoids_same_title_overwrite_under_concurrent_writes(tmp_path, mo
     assert len({record["id"] for record in records}) == 2
     assert len({record["path"] for record in records}) == 2
     assert len(list(store.library_dir.glob("*.md"))) == 2
+
+
+def test_metadata_index_tracks_store_writes_and_removed_files(tmp_path):
+    store = ReportStore(tmp_path / "library")
+    first = store.create(title="Alpha", prompt="p" * 10, report_type="memo", content="Body")
+    second = store.create(title="Beta", prompt="p" * 10, report_type="memo", content="Body")
+
+    store.update_report(first["id"], title="Alpha renamed", collection="Career")
+    assert [r["title"] for r in store.list_reports(collection="career")] == ["Alpha renamed"]
+    assert store.list_reports(search="renamed")[0]["id"] == first["id"]
+
+    store.archive_report(second["id"])
+    assert [r["id"] for r in store.list_reports(status="archived")] == [second["id"]]
+
+    Path(store.get_report(second["id"])["path"]).unlink()
+    assert store.get_report(second["id"]) is None
+    assert [r["id"] for r in store.list_reports()] == [first["id"]]
+
+
+def test_set_extracted_text_marks_upload_ready(tmp_path):
+    store = ReportStore(tmp_path / "library")
+    record = store.create_uploaded_pdf(title="CV", file_name="cv.pdf", file_bytes=b"%PDF-1.4")
+    assert record["extraction_status"] == "pending"
+
+    updated = store.set_extracted_text(record["id"], "Python leadership")
+
+    assert updated["extraction_status"] == "ready"
+    assert updated["index_status"] == "ready"
+    assert store.get_extracted_text(record["id"]) == "Python leadership"
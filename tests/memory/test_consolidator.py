@@ -261,3 +261,97 @@ class TestCurlyBracesInFactText:
         call_content = provider.generate.call_args[1]["messages"][0]["content"]
         assert "{dict}" in call_content
         assert "{**kwargs}" in call_content
+
+
+class TestIncremental:
+    def test_affected_lookup_only_hydrates_linked_entities(self, store, consolidator, monkeypatch):
+        store.add(_fact("f1", "User uses Python for data pipelines"))
+        store.add(_fact("f2", "User prefers Python over Java"))
+        store.add(_fact("f3", "User deploys on AWS Lambda"))
+        store.add(_fact("f4", "User uses AWS S3 for storage"))
+
+        requested: list[set[str]] = []
+        real_get_many = store.get_many
+
+        def _spy(ids):
+            ids = list(ids)
+            requested.append(set(ids))
+            return real_get_many(ids)
+
+        monkeypatch.setattr(store, "get_many", _spy)
+        consolidator.consolidate_affected(["f1"])
+        assert all(not ({"f3", "f4"} & ids) for ids in requested)
+
+    def test_deleted_fact_rechecks_its_entity_group(self, store, consolidator, provider):
+        store.add(_fact("f1", "User uses Python for data pipelines"))
+        store.add(_fact("f2", "User prefers Python over Java"))
+        store.add(_fact("f3", "User is learning Python async patterns"))
+        consolidator.consolidate_all()
+        assert provider.generate.call_count == 1
+
+        store.delete("f3")
+        results = consolidator.consolidate_affected(["f3"])
+        # Entity re-derived from the deleted fact's text; the observation still
+        # describes f3, so it is re-synthesized from the remaining facts.
+        assert [obs.source_id for obs in results] == ["python"]
+        assert provider.generate.call_count == 2
+        assert sorted(store.get_observation_source_ids(results[0].id)) == ["f1", "f2"]
+
+    def test_superseded_source_resynthesizes_on_full_pass(self, store, consolidator, provider):
+        store.add(_fact("f1", "User uses Python for data pipelines"))
+        store.add(_fact("f2", "User prefers Python over Java"))
+        store.add(_fact("f3", "User is learning Python async patterns"))
+        consolidator.consolidate_all()
+        assert provider.generate.call_count == 1
+
+        # f3 leaves the group without its link rows being removed
+        store.update("f3", "User gave up on async and now studies Rust", "entry-2")
+        consolidator.consolidate_all()
+        assert provider.generate.call_count == 2
+
+        # Nothing changed since: the skip still applies
+        consolidator.consolidate_all()
+        assert provider.generate.call_count == 2
+
+    def test_groups_synthesized_concurrently_under_cap(self, store):
+        import threading
+        import time
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _generate(**_kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return _DEFAULT_JSON_RESPONSE
+
+        provider = MagicMock()
+        provider.generate.side_effect = _generate
+        for i, name in enumerate(["Python", "Rust", "Kafka", "Docker"]):
+            store.add(_fact(f"a{i}", f"User uses {name} daily"))
+            store.add(_fact(f"b{i}", f"User prefers {name} for work"))
+
+        consolidator = ObservationConsolidator(store, provider=provider, max_concurrency=2)
+        results = consolidator.consolidate_all()
+
+        assert len(results) == 4
+        assert peak == 2
+
+    def test_since_last_run_only_processes_changes(self, store, consolidator, provider):
+        store.add(_fact("f1", "User uses Python for data pipelines"))
+        store.add(_fact("f2", "User prefers Python over Java"))
+        assert len(consolidator.consolidate_since_last_run()) == 1
+        assert provider.generate.call_count == 1
+
+        assert consolidator.consolidate_since_last_run() == []
+        store.add(_fact("f3", "User deploys on AWS Lambda"))
+        store.add(_fact("f4", "User uses AWS S3 for storage"))
+        results = consolidator.consolidate_since_last_run()
+        assert [obs.source_id for obs in results] == ["aws"]
+        assert provider.generate.call_count == 2
@@ -163,3 +163,75 @@ class TestTextSimilarity:
 
     def test_empty(self):
         assert ConflictResolver._text_similarity("", "hello") == 0.0
+
+
+class TestBatchedResolution:
+    def _seed(self, store):
+        store.add(_fact(id="e1", text="User prefers Python for backend services"))
+        store.add(_fact(id="e2", text="User deploys code on AWS Lambda"))
+
+    def test_candidates_share_one_llm_call(self, resolver, provider, store):
+        self._seed(store)
+        provider.generate.return_value = json.dumps(
+            {
+                "results": [
+                    {"index": 1, "action": "UPDATE", "existing_id": "e1", "reasoning": "Changed"},
+                    {"index": 2, "action": "NOOP", "existing_id": None, "reasoning": "Same"},
+                ]
+            }
+        )
+        updates = resolver.resolve(
+            [
+                _fact(id="c1", text="User prefers Rust for backend services"),
+                _fact(id="c2", text="User deploys on AWS Lambda functions"),
+            ]
+        )
+
+        provider.generate.assert_called_once()
+        assert [u.action for u in updates] == ["UPDATE", "NOOP"]
+        assert updates[0].existing_id == "e1"
+        assert updates[1].existing_id == "e2"
+
+    def test_missing_or_cross_wired_results_fall_back_to_single_calls(
+        self, resolver, provider, store
+    ):
+        self._seed(store)
+        single = json.dumps({"action": "ADD", "existing_id": None, "reasoning": "New"})
+        provider.generate.side_effect = [
+            json.dumps({"results": [{"index": 1, "action": "DELETE", "existing_id": "e2"}]}),
+            single,
+            single,
+        ]
+        updates = resolver.resolve(
+            [
+                _fact(id="c1", text="User prefers Rust for backend services"),
+                _fact(id="c2", text="User deploys on AWS Lambda functions"),
+            ]
+        )
+
+        assert provider.generate.call_count == 3
+        assert [u.action for u in updates] == ["ADD", "ADD"]
+
+    def test_batch_size_caps_prompt(self, store, provider):
+        self._seed(store)
+        provider.generate.return_value = json.dumps({"results": []})
+        resolver = ConflictResolver(store, provider=provider, batch_size=1)
+        resolver.resolve(
+            [
+                _fact(id="c1", text="User prefers Rust for backend services"),
+                _fact(id="c2", text="User deploys on AWS Lambda functions"),
+            ]
+        )
+        assert provider.generate.call_count == 2
+
+    def test_similar_lookups_share_one_search(self, resolver, provider, store, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            store,
+            "search_many",
+            lambda queries, limit: calls.append(queries) or [[]] * len(queries),
+        )
+        monkeypatch.setattr(store, "search", lambda *a, **k: pytest.fail("per-candidate search"))
+        updates = resolver.resolve([_fact(id="c1", text="User likes Go"), _fact(id="c2")])
+        assert calls == [["User likes Go", "User prefers Python"]]
+        assert [u.action for u in updates] == ["ADD", "ADD"]
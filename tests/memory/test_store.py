@@ -699,3 +699,50 @@ class TestDeleteNonexistent:
         """delete() on a non-existent ID should not raise."""
         store.delete("nonexistent_id", reason="test")
         # Should complete without error
+
+
+class TestBulkHydration:
+    def test_get_many_returns_found_facts_by_id(self, store):
+        store.add(_fact(id="m1"))
+        store.add(_fact(id="m2", text="User knows Rust"))
+        facts = store.get_many(["m2", "missing", "m1", "m2"])
+        assert set(facts) == {"m1", "m2"}
+        assert facts["m2"].text == "User knows Rust"
+        assert store.get_many([]) == {}
+
+    def test_active_ids_cached_and_invalidated_by_writes(self, store):
+        store.add(_fact(id="c1"))
+        first = store._get_active_ids()
+        assert first == {"c1"}
+        assert store._get_active_ids() is first
+
+        store.add(_fact(id="c2", text="User knows Go"))
+        assert store._get_active_ids() == {"c1", "c2"}
+        new = store.update("c1", "User prefers Python 3", "entry-2")
+        assert store._get_active_ids() == {"c2", new.id}
+        store.delete("c2")
+        assert store._get_active_ids() == {new.id}
+
+    def test_active_ids_see_writes_from_other_connections(self, store):
+        from db import wal_connect
+
+        store.add(_fact(id="o1"))
+        assert store._get_active_ids() == {"o1"}
+        with wal_connect(store.db_path) as conn:
+            conn.execute("UPDATE steward_facts SET superseded_by = 'DELETED:x' WHERE id = 'o1'")
+        assert store._get_active_ids() == set()
+
+    def test_graph_expansion_loads_neighbors_in_bulk(self, store, monkeypatch):
+        store.add(_fact(id="g1", text="User uses Python for ML"))
+        for i in range(4):
+            store.add(_fact(id=f"n{i}", text=f"User builds Python tool {i}"))
+        monkeypatch.setattr(store, "get", lambda *_: pytest.fail("per-id get in search"))
+        results = store.search("ML", limit=10, use_graph=True, graph_limit=3)
+        assert results[0].id == "g1"
+        assert len(results) == 4
+
+    def test_search_many_aligns_results_with_queries(self, store):
+        store.add(_fact(id="k1", text="User prefers Python"))
+        store.add(_fact(id="k2", text="User deploys on AWS Lambda"))
+        results = store.search_many(["Python", "Lambda", "nothing matches"], limit=3)
+        assert [[f.id for f in hits] for hits in results] == [["k1"], ["k2"], []]
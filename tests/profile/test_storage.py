@@ -239,3 +239,50 @@ class TestProfileStorage:
         assert not ps.exists()
         ps.save(UserProfile())
         assert ps.exists()
+
+
+class TestProfileCache:
+    def test_unchanged_file_not_reparsed(self, tmp_path, monkeypatch):
+        path = tmp_path / "profile.yaml"
+        ProfileStorage(path).save(UserProfile(current_role="Dev"))
+        calls = []
+        original = ProfileStorage._parse
+        monkeypatch.setattr(
+            ProfileStorage, "_parse", lambda self: calls.append(1) or original(self)
+        )
+        for _ in range(3):
+            assert ProfileStorage(path).load().current_role == "Dev"
+        assert calls == []
+
+    def test_external_edit_picked_up(self, tmp_path):
+        path = tmp_path / "profile.yaml"
+        ps = ProfileStorage(path)
+        ps.save(UserProfile(current_role="Dev"))
+        assert ps.load().current_role == "Dev"
+        path.write_text("current_role: Principal Engineer\n")
+        assert ps.load().current_role == "Principal Engineer"
+        assert "Principal Engineer" in ps.summary()
+
+    def test_load_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "profile.yaml"
+        ps = ProfileStorage(path)
+        ps.save(UserProfile(interests=["infra"]))
+        ps.load().interests.append("mutated")
+        assert ps.load().interests == ["infra"]
+
+    def test_precomputed_summaries(self, tmp_path):
+        path = tmp_path / "profile.yaml"
+        ps = ProfileStorage(path)
+        assert ps.summary() == ""
+        assert ps.structured_summary() == ""
+        ps.save(UserProfile(current_role="Dev", skills=[Skill(name="Go", proficiency=4)]))
+        profile = ps.load()
+        assert ps.summary() == profile.summary()
+        assert ps.structured_summary() == profile.structured_summary()
+
+    def test_update_field_writes_through(self, tmp_path):
+        path = tmp_path / "profile.yaml"
+        ps = ProfileStorage(path)
+        ps.save(UserProfile(current_role="Dev"))
+        ps.update_field("location", "Berlin")
+        assert "Location: Berlin" in ProfileStorage(path).summary()
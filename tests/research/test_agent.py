@@ -1,5 +1,6 @@
 """Tests for DeepResearchAgent."""
 
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
@@ -196,6 +197,67 @@ class TestDeepResearchAgent:
         agent.close()
         search_client.close.assert_called_once()
 
+    def test_scheduled_dossier_batch_runs_concurrently(self, agent_factory, mock_search_results):
+        dossiers = MagicMock()
+        dossiers.get_active_dossiers.return_value = [
+            {"dossier_id": f"dos-{i}", "topic": f"Topic {i}", "path": Path(f"/tmp/dos-{i}.md")}
+            for i in range(3)
+        ]
+        dossiers.append_update.side_effect = lambda dossier_id, report, metadata: {
+            "title": f"Research Update: {dossier_id}",
+            "path": Path(f"/tmp/{dossier_id}-update.md"),
+        }
+        dossiers.get_dossier.return_value = None
+        search_client = MagicMock()
+        search_client.search.return_value = mock_search_results
+        synthesizer = MagicMock()
+
+        def _slow_update(**kwargs):
+            time.sleep(0.2)
+            return "## What Changed\n- Something new"
+
+        synthesizer.synthesize_dossier_update.side_effect = _slow_update
+        agent = agent_factory(
+            config={"research": {"max_concurrency": 3}},
+            search_client=search_client,
+            synthesizer=synthesizer,
+            dossiers=dossiers,
+        )
+
+        started = time.monotonic()
+        results = agent.run()
+        elapsed = time.monotonic() - started
+
+        assert [r["dossier_id"] for r in results] == ["dos-0", "dos-1", "dos-2"]
+        assert all(r["success"] for r in results)
+        assert elapsed < 0.5
+        assert results[0]["timings"]["synthesis_s"] >= 0.2
+        assert "search_s" in results[0]["timings"]
+
+    def test_concurrent_topics_share_a_real_embedding_store(
+        self, agent_components, agent_factory, mock_search_results, temp_dirs
+    ):
+        """Topics finishing together must not race on the journal collection file."""
+        embeddings = EmbeddingManager(
+            temp_dirs["chroma_dir"], config={"embeddings": {"provider": "hash"}}
+        )
+        agent_components["embeddings"] = embeddings
+        search_client = MagicMock()
+        search_client.search.return_value = mock_search_results
+        synthesizer = MagicMock()
+        synthesizer.synthesize.return_value = "## Summary\nTest report"
+        agent = agent_factory(
+            config={"research": {"max_concurrency": 4}},
+            search_client=search_client,
+            synthesizer=synthesizer,
+        )
+
+        topics = [{"topic": f"Topic {i}", "source": "manual", "score": 1} for i in range(16)]
+        results = agent._run_topics(topics)
+
+        assert all(r["success"] for r in results), [r.get("error") for r in results]
+        assert embeddings.count() == len(topics)
+
     def test_scheduled_dossier_run_continues_after_failure(self, agent_factory):
         """A failed dossier should not abort the rest of the scheduled batch."""
         dossiers = MagicMock()
@@ -204,18 +266,20 @@ class TestDeepResearchAgent:
             {"dossier_id": "dos-2", "topic": "Topic Two"},
         ]
         agent = agent_factory(dossiers=dossiers)
-        agent._run_dossier = MagicMock(
-            side_effect=[
-                RuntimeError("append failed"),
-                {
-                    "topic": "Topic Two",
-                    "title": "Research Update: Topic Two",
-                    "dossier_id": "dos-2",
-                    "filepath": "/tmp/topic-two.md",
-                    "success": True,
-                },
-            ]
-        )
+
+        # Dossiers run concurrently, so key the outcome on the dossier, not call order
+        def _run_dossier(dossier, run_source):
+            if dossier["dossier_id"] == "dos-1":
+                raise RuntimeError("append failed")
+            return {
+                "topic": "Topic Two",
+                "title": "Research Update: Topic Two",
+                "dossier_id": "dos-2",
+                "filepath": "/tmp/topic-two.md",
+                "success": True,
+            }
+
+        agent._run_dossier = MagicMock(side_effect=_run_dossier)
 
         results = agent.run()
 
@@ -0,0 +1,54 @@
+"""Tests for the research search-result cache."""
+
+import time
+
+from research.search_cache import SearchResultCache, normalize_query
+
+RESULTS = [{"title": "Guide", "url": "https://example.com", "content": "Body", "score": 0.9}]
+
+
+def test_normalize_query_ignores_case_and_spacing():
+    assert normalize_query("  Rust   Async ") == normalize_query("rust async")
+
+
+def test_cache_round_trip_keyed_by_provider_and_variant(tmp_path):
+    cache = SearchResultCache(tmp_path / "cache.db")
+    cache.put("tavily", "Rust async", RESULTS, variant="advanced:8:3000")
+
+    assert cache.get("tavily", "rust  ASYNC", variant="advanced:8:3000") == RESULTS
+    assert cache.get("duckduckgo", "rust async", variant="advanced:8:3000") is None
+    assert cache.get("tavily", "rust async", variant="basic:8:3000") is None
+
+
+def test_cache_entries_expire(tmp_path, monkeypatch):
+    cache = SearchResultCache(tmp_path / "cache.db", ttl_seconds=60)
+    cache.put("tavily", "rust async", RESULTS)
+    later = time.time() + 120
+    monkeypatch.setattr("research.search_cache.time.time", lambda: later)
+
+    assert cache.get("tavily", "rust async") is None
+    assert cache.purge_expired() == 1
+
+
+def test_zero_ttl_disables_cache(tmp_path):
+    cache = SearchResultCache(tmp_path / "cache.db", ttl_seconds=0)
+    cache.put("tavily", "rust async", RESULTS)
+
+    assert cache.get("tavily", "rust async") is None
+
+
+def test_agent_purges_expired_entries_when_creating_cache(tmp_path, monkeypatch):
+    from research.agent import DeepResearchAgent
+
+    db_path = tmp_path / "cache.db"
+    monkeypatch.setattr("research.search_cache.time.time", lambda: 0.0)
+    SearchResultCache(db_path).put("tavily", "rust async", RESULTS)
+    monkeypatch.undo()
+    monkeypatch.setattr(
+        "research.agent.SearchResultCache",
+        lambda ttl_seconds: SearchResultCache(db_path, ttl_seconds=ttl_seconds),
+    )
+
+    cache = DeepResearchAgent._create_search_cache({"cache_ttl_hours": 1})
+    # The expired row is already gone, so there is nothing left to purge
+    assert cache.purge_expired() == 0
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import httpx
 import pytest
 
+from research.search_cache import SearchResultCache
 from research.web_search import AsyncWebSearchClient, SearchResult, WebSearchClient
 
 
@@ -67,6 +68,23 @@ class TestWebSearchClient:
         assert results[0].title == "Machine Learning in Healthcare"
         assert results[0].score == 0.95
 
+    def test_search_serves_repeat_queries_from_cache(self, mock_tavily_response, tmp_path):
+        """A cached query skips the provider call and the outbound audit entry."""
+        cache = SearchResultCache(tmp_path / "cache.db")
+        client = WebSearchClient(api_key="test-key", cache=cache)
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_tavily_response
+        mock_response.raise_for_status = MagicMock()
+
+        with patch.object(client.client, "post", return_value=mock_response) as post:
+            first = client.search("machine learning healthcare")
+            second = client.search("Machine  Learning healthcare")
+
+        assert post.call_count == 1
+        assert len(client.issued_queries) == 1
+        assert second == first
+
     def test_search_truncates_content(self, mock_tavily_response):
         """Test that content is truncated to max_content_chars."""
         # Add very long content
@@ -0,0 +1,99 @@
+"""Tests for the shared, micro-batched cross-encoder reranker."""
+
+import threading
+import time
+
+import pytest
+
+import services.reranker as reranker_module
+from services.reranker import CrossEncoderReranker
+
+
+class FakeCrossEncoder:
+    """Scores a passage by its length; records every predict call."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[list[tuple[str, str]]] = []
+
+    def predict(self, pairs):
+        self.calls.append(list(pairs))
+        time.sleep(self.delay)
+        return [float(len(passage)) for _query, passage in pairs]
+
+
+def _reranker(model, **kwargs) -> CrossEncoderReranker:
+    reranker = CrossEncoderReranker(**kwargs)
+    reranker._model = model
+    return reranker
+
+
+def test_ranks_by_score():
+    reranker = _reranker(FakeCrossEncoder())
+    assert reranker.rerank("q", ["aa", "aaaa", "a"], top_k=2) == [1, 0]
+
+
+def test_repeat_pairs_are_served_from_cache():
+    model = FakeCrossEncoder()
+    reranker = _reranker(model)
+    reranker.rerank("q", ["aa", "aaaa"])
+    reranker.rerank("q", ["aaaa", "aa", "aaa"])
+
+    assert len(model.calls) == 2
+    assert model.calls[1] == [("q", "aaa")]
+
+
+def test_concurrent_requests_share_one_predict(monkeypatch):
+    monkeypatch.setattr(reranker_module, "BATCH_WINDOW_S", 0.2)
+    model = FakeCrossEncoder()
+    reranker = _reranker(model, latency_budget=5.0)
+    results: dict[int, list[int]] = {}
+
+    def run(n: int) -> None:
+        results[n] = reranker.rerank(f"q{n}", ["a", "aaa", "aa"])
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(model.calls) == 1
+    assert len(model.calls[0]) == 12
+    assert all(result == [1, 2, 0] for result in results.values())
+
+
+def test_budget_exceeded_keeps_original_order():
+    model = FakeCrossEncoder(delay=0.3)
+    reranker = _reranker(model, latency_budget=0.01)
+
+    assert reranker.rerank("q", ["a", "aaa", "aa"]) == [0, 1, 2]
+
+    # The late scores still land in the cache for the next request
+    deadline = time.monotonic() + 5
+    while len(reranker._scores) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert reranker.rerank("q", ["a", "aaa", "aa"]) == [1, 2, 0]
+    assert len(model.calls) == 1
+
+
+def test_get_reranker_is_a_process_singleton(monkeypatch):
+    monkeypatch.setattr(reranker_module, "_instance", None)
+    first = reranker_module.get_reranker(threads=2)
+    assert reranker_module.get_reranker() is first
+    assert first.threads == 2
+
+
+def test_predict_failure_falls_back_to_identity():
+    class Broken:
+        def predict(self, pairs):
+            raise RuntimeError("boom")
+
+    reranker = _reranker(Broken())
+    assert reranker.rerank("q", ["a", "b"], top_k=5) == [0, 1]
+
+
+@pytest.mark.parametrize("passages", [[], ["a"]])
+def test_small_inputs(passages):
+    reranker = _reranker(FakeCrossEncoder())
+    assert reranker.rerank("q", passages) == list(range(len(passages)))
@@ -63,3 +63,26 @@ def test_execute_truncates_large_results():
     assert parsed["truncated"] is True
     assert parsed["original_length"] > registry.TOOL_RESULT_MAX_CHARS
     assert parsed["result_preview"].startswith('{"payload":')
+
+
+def test_parallel_safe_and_timeout_metadata():
+    registry = ToolRegistry()
+    schema = {"type": "object", "properties": {}, "required": []}
+    registry.register(
+        name="reader",
+        toolset="test",
+        description="read",
+        schema=schema,
+        handler=lambda _args: {},
+        parallel_safe=True,
+        timeout=5.0,
+    )
+    registry.register(
+        name="writer", toolset="test", description="write", schema=schema, handler=lambda _a: {}
+    )
+
+    assert registry.is_parallel_safe("reader") is True
+    assert registry.is_parallel_safe("writer") is False
+    assert registry.is_parallel_safe("missing") is False
+    assert registry.get_timeout("reader", 60.0) == 5.0
+    assert registry.get_timeout("writer", 60.0) == 60.0
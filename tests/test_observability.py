@@ -39,3 +39,63 @@ def test_unknown_model_reports_zero_cost():
 
     assert summary["has_pricing"] is False
     assert summary["estimated_cost_usd"] == 0.0
+
+
+def test_timer_memory_is_bounded_and_percentiles_are_close():
+    metrics = Metrics()
+    for i in range(1, 20_001):
+        metrics.observe("latency", i / 10_000)
+
+    histogram = metrics._timers["latency"][()]
+    assert len(histogram.buckets) == 64
+    summary = metrics.summary()["timers"]["latency"]
+    assert summary["count"] == 20_000
+    assert summary["min"] == 0.0001
+    assert summary["max"] == 2.0
+    assert abs(summary["p50"] - 1.0) < 0.05
+    assert abs(summary["p99"] - 1.98) < 0.05
+
+
+def test_prometheus_text_emits_labelled_histogram_series():
+    metrics = Metrics()
+    metrics.observe("llm_latency", 0.3, labels={"provider": "claude"})
+    metrics.observe("llm_latency", 4.0, labels={"provider": "claude"})
+    metrics.observe("llm_latency", 0.004, labels={"provider": "openai"})
+    metrics.counter("requests", 3, labels={"route": "/api/advisor/ask"})
+
+    text = metrics.prometheus_text()
+
+    assert text.count("# TYPE coach_llm_latency histogram") == 1
+    assert 'coach_llm_latency_bucket{provider="claude",le="0.25"} 0' in text
+    assert 'coach_llm_latency_bucket{provider="claude",le="0.5"} 1' in text
+    assert 'coach_llm_latency_bucket{provider="claude",le="5"} 2' in text
+    assert 'coach_llm_latency_bucket{provider="claude",le="+Inf"} 2' in text
+    assert 'coach_llm_latency_count{provider="openai"} 1' in text
+    assert 'coach_requests{route="/api/advisor/ask"} 3' in text
+    assert 'llm_latency{provider="claude"}' in metrics.summary()["timers"]
+
+
+def test_label_sets_beyond_the_cap_fold_into_other(monkeypatch):
+    import observability
+
+    monkeypatch.setattr(observability, "MAX_SERIES_PER_METRIC", 2)
+    metrics = Metrics()
+    for user in ("a", "b", "c", "d"):
+        metrics.counter("logins", labels={"user": user})
+
+    counters = metrics.summary()["counters"]
+    assert counters['logins{series="other"}'] == 2
+    assert len(counters) == 3
+
+
+def test_gauge_keeps_latest_value_and_exports():
+    metrics = Metrics()
+    metrics.gauge("queue_depth", 5, labels={"job": "poll"})
+    metrics.gauge("queue_depth", 2, labels={"job": "poll"})
+
+    assert metrics.summary()["gauges"]['queue_depth{job="poll"}'] == 2
+    text = metrics.prometheus_text()
+    assert "# TYPE coach_queue_depth gauge" in text
+    assert 'coach_queue_depth{job="poll"} 2' in text
+    metrics.reset()
+    assert metrics.summary()["gauges"] == {}
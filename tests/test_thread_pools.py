@@ -0,0 +1,32 @@
+"""Tests for the process-wide named thread pools."""
+
+import threading
+
+from thread_pools import shared_pool
+
+
+class TestSharedPool:
+    def test_same_name_returns_same_pool(self):
+        assert shared_pool("test-pool-a", 2) is shared_pool("test-pool-a", 2)
+
+    def test_distinct_names_get_distinct_pools(self):
+        assert shared_pool("test-pool-b", 1) is not shared_pool("test-pool-c", 1)
+
+    def test_workers_named_after_pool(self):
+        name = shared_pool("test-pool-d", 1).submit(lambda: threading.current_thread().name)
+        assert name.result(timeout=5).startswith("test-pool-d")
+
+    def test_concurrent_first_use_builds_one_pool(self):
+        barrier = threading.Barrier(8)
+        seen = []
+
+        def grab():
+            barrier.wait()
+            seen.append(shared_pool("test-pool-e", 1))
+
+        threads = [threading.Thread(target=grab) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(p) for p in seen}) == 1
@@ -166,6 +166,28 @@ def test_decks_are_user_isolated(client, auth_headers, auth_headers_b):
     assert all(d["id"] != deck["id"] for d in listing)
 
 
+def test_export_streams_cards_page_by_page(client, auth_headers, monkeypatch):
+    import web.routes.decks as decks_module
+
+    monkeypatch.setattr(decks_module, "EXPORT_CHUNK_SIZE", 2)
+    deck = _create_deck(client, auth_headers, title="Paged")
+    for i in range(5):
+        client.post(
+            f"/api/curriculum/decks/{deck['id']}/cards",
+            headers=auth_headers,
+            json={"front": f"q{i}", "back": f"a{i}"},
+        )
+
+    response = client.get(f"/api/curriculum/decks/{deck['id']}/export", headers=auth_headers)
+    assert response.status_code == 200
+    reimport = client.post(
+        "/api/curriculum/decks/import",
+        headers=auth_headers,
+        files={"file": ("paged.apkg", response.content, "application/octet-stream")},
+    )
+    assert reimport.json()["card_count"] == 5
+
+
 def test_review_export_returns_apkg(client, auth_headers):
     response = client.get("/api/curriculum/review/export", headers=auth_headers)
     assert response.status_code == 200
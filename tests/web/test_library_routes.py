@@ -1,5 +1,7 @@
 """Tests for Library report routes."""
 
+import time
+
 import web.routes.library as library_routes
 
 
@@ -14,6 +16,15 @@ def _sample_pdf_bytes(text: str) -> bytes:
     )
 
 
+def _wait_for_extraction(client, auth_headers, report_id: str) -> dict:
+    deadline = time.monotonic() + 10
+    while True:
+        report = client.get(f"/api/library/reports/{report_id}", headers=auth_headers).json()
+        if report["extraction_status"] != "pending" or time.monotonic() > deadline:
+            return report
+        time.sleep(0.05)
+
+
 def test_create_list_update_and_archive_report(client, auth_headers):
     library_routes._generate_report_content = lambda user_id, prompt, report_type: (
         f"# Generated\n\nPrompt: {prompt}\n\nType: {report_type}"
@@ -96,6 +107,9 @@ def test_upload_pdf_is_searchable_and_downloadable(client, auth_headers):
     created = response.json()
     assert created["source_kind"] == "uploaded_pdf"
     assert created["has_attachment"] is True
+    assert created["extraction_status"] == "pending"
+
+    created = _wait_for_extraction(client, auth_headers, created["id"])
     assert created["has_extracted_text"] is True
     assert created["extraction_status"] == "ready"
 
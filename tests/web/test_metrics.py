@@ -17,7 +17,9 @@ def test_metrics_endpoint(client):
     text = res.text
     assert "coach_test_requests 5" in text
     assert "coach_test_latency" in text
-    assert 'quantile="0.5"' in text
+    assert "# TYPE coach_test_latency histogram" in text
+    assert 'coach_test_latency_bucket{le="+Inf"} 1' in text
+    assert "coach_test_latency_count 1" in text
     assert "coach_token_claude_sonnet_input 100" in text
     assert "coach_token_claude_sonnet_output 50" in text
 
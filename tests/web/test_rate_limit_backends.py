@@ -0,0 +1,144 @@
+"""Tests for the GCRA rate limiter backends and shared-key limits."""
+
+import pytest
+from fastapi import HTTPException
+
+import web.rate_limit as rate_limit_module
+from web.rate_limit import check_shared_key_rate_limit, reset_rate_limits
+from web.rate_limit_backends import MemoryRateLimiter, RateRule, SqliteRateLimiter
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRateLimiter()
+    return SqliteRateLimiter(tmp_path / "users.db")
+
+
+def test_allows_burst_then_refills(backend):
+    rule = RateRule("route:llm:u1", 3, 60.0)
+    assert [backend.acquire([rule], 100.0) for _ in range(3)] == [None, None, None]
+
+    hit = backend.acquire([rule], 100.0)
+    assert hit is not None and hit.rule == rule
+    assert hit.retry_after == pytest.approx(20.0)
+    # One request's worth of capacity returns after window / limit seconds
+    assert backend.acquire([rule], 120.0) is None
+
+
+def test_rejected_request_charges_no_rule(backend):
+    burst = RateRule("burst:u1", 1, 10.0)
+    daily = RateRule("daily:u1", 5, 86400.0)
+    assert backend.acquire([burst, daily], 0.0) is None
+
+    hit = backend.acquire([burst, daily], 1.0)
+    assert hit.rule == burst
+    # The rejected call left the daily budget untouched: 4 more fit
+    for i in range(4):
+        assert backend.acquire([burst, daily], 20.0 * (i + 1)) is None
+    assert backend.acquire([burst, daily], 200.0).rule == daily
+
+
+def test_sqlite_quota_is_shared_between_workers(tmp_path):
+    worker_a = SqliteRateLimiter(tmp_path / "users.db")
+    worker_b = SqliteRateLimiter(tmp_path / "users.db")
+    rule = RateRule("route:llm:u1", 2, 60.0)
+
+    assert worker_a.acquire([rule], 0.0) is None
+    assert worker_b.acquire([rule], 0.0) is None
+    assert worker_a.acquire([rule], 0.0) is not None
+    assert worker_b.acquire([rule], 0.0) is not None
+
+
+def test_memory_backend_evicts_expired_and_caps_keys():
+    backend = MemoryRateLimiter(max_keys=2)
+    for user in ("a", "b", "c"):
+        backend.acquire([RateRule(user, 10, 60.0)], 0.0)
+    assert list(backend._tats) == ["b", "c"]
+
+    backend.acquire([RateRule("d", 10, 60.0)], 1000.0)
+    assert list(backend._tats) == ["d"]
+
+
+def test_shared_key_burst_and_daily_limits(monkeypatch):
+    reset_rate_limits()
+    monkeypatch.setattr(rate_limit_module, "_backend", MemoryRateLimiter())
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit_module.time, "time", lambda: now[0])
+
+    check_shared_key_rate_limit("u1")
+    with pytest.raises(HTTPException) as burst:
+        check_shared_key_rate_limit("u1")
+    assert burst.value.status_code == 429
+    assert burst.value.headers["Retry-After"] == "11"
+
+    for _ in range(rate_limit_module.DAILY_LIMIT - 1):
+        now[0] += rate_limit_module.BURST_INTERVAL
+        check_shared_key_rate_limit("u1")
+    now[0] += rate_limit_module.BURST_INTERVAL
+    with pytest.raises(HTTPException) as daily:
+        check_shared_key_rate_limit("u1")
+    assert int(daily.value.headers["Retry-After"]) > rate_limit_module.BURST_INTERVAL
+    reset_rate_limits()
+
+
+def _admitted(backend, rules, start, step, duration):
+    now, count = start, 0
+    while now < start + duration:
+        count += backend.acquire(rules, now) is None
+        now += step
+    return count
+
+
+def test_exact_rule_never_exceeds_limit_in_any_window(backend):
+    # A client pacing itself at the burst interval drains the daily budget,
+    # then keeps pace with the refill; GCRA would admit ~2x the limit here.
+    rules = [
+        RateRule("shared_burst:u1", 1, rate_limit_module.BURST_INTERVAL),
+        RateRule(
+            "shared_daily:u1",
+            rate_limit_module.DAILY_LIMIT,
+            rate_limit_module.WINDOW_SECONDS,
+            exact=True,
+        ),
+    ]
+    day = rate_limit_module.WINDOW_SECONDS
+    step = rate_limit_module.BURST_INTERVAL
+    assert _admitted(backend, rules, 0.0, step, day) == rate_limit_module.DAILY_LIMIT
+    # The budget comes back only as the first day's requests age out
+    assert _admitted(backend, rules, day, step, day) == rate_limit_module.DAILY_LIMIT
+
+
+def test_exact_session_cap_and_retry_after(backend):
+    session = RateRule(
+        "onboarding:u1",
+        rate_limit_module.ONBOARDING_LIMIT,
+        rate_limit_module.ONBOARDING_WINDOW_SECONDS,
+        exact=True,
+    )
+    step = rate_limit_module.ONBOARDING_BURST_INTERVAL
+    assert (
+        _admitted(backend, [session], 0.0, step, rate_limit_module.ONBOARDING_WINDOW_SECONDS)
+        == rate_limit_module.ONBOARDING_LIMIT
+    )
+    hit = backend.acquire([session], 3600.0)
+    # The oldest admission (t=0) leaves the window at t=3600
+    assert hit is None
+    hit = backend.acquire([session], 3601.0)
+    assert hit.rule == session
+    assert hit.retry_after == pytest.approx(step - 1.0)
+
+
+def test_sqlite_adds_log_column_to_existing_table(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+    conn.commit()
+    conn.close()
+
+    backend = SqliteRateLimiter(path)
+    rule = RateRule("daily:u1", 1, 60.0, exact=True)
+    assert backend.acquire([rule], 0.0) is None
+    assert backend.acquire([rule], 1.0).retry_after == pytest.approx(59.0)
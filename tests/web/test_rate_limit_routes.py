@@ -58,6 +58,18 @@ class TestLLMRouteLimit:
         with patch(_ENGINE_PATCH, side_effect=_mock_get_engine):
             assert _ask(client, auth_headers).status_code == 200
 
+    def test_sqlite_backend_enforces_limit(self, client, auth_headers, monkeypatch, tmp_path):
+        from web.rate_limit_backends import SqliteRateLimiter
+
+        _set_limits(monkeypatch, llm=2)
+        monkeypatch.setattr(
+            rate_limit_module, "_backend", SqliteRateLimiter(tmp_path / "limits.db")
+        )
+        with patch(_ENGINE_PATCH, side_effect=_mock_get_engine):
+            for _ in range(2):
+                assert _ask(client, auth_headers).status_code == 200
+            assert _ask(client, auth_headers).status_code == 429
+
 
 class TestGeneralRouteLimit:
     def test_general_limit_returns_429(self, client, auth_headers, monkeypatch):